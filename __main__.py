@@ -1,15 +1,25 @@
 import pulumi
 
+import config as cfg
+import tracing
+from cluster.autoscaler import ClusterAutoscalerManager
 from cluster.node_pool import NodePoolManager
 from cluster.oke import OKEClusterManager
+from cluster.placeholders import OverprovisioningManager
+from network.flow_logs import FlowLogManager
 from network.gateways import GatewayManager
+from network.layer import NetworkLayer, network_settings
+from network.nsg import NetworkSecurityGroupManager
 from network.routing import RouteTableManager
 from network.security import SecurityListManager
 from network.subnets import SubnetManager
 from network.vcn import VCNManager
 
 
-def main():
+def create_network_layer():
+    """
+    네트워크 계층 (VCN, 게이트웨이, 라우트 테이블, 보안 리스트/NSG, 서브넷, 흐름 로그) 생성 및 export
+    """
     # Step 1: VCN 생성
     vcn_manager = VCNManager()
     vcn = vcn_manager.create_vcn()
@@ -23,30 +33,40 @@ def main():
     route_table_private, route_table_public = route_table_manager.create_all_route_tables()
 
     # Step 4: 보안 리스트 생성 (노드, K8s API, 서비스 로드 밸런서)
+    # NSG 모드에서는 기본 보안 리스트 + 역할별 네트워크 보안 그룹 (API 엔드포인트, 워커 노드, 파드, 로드 밸런서)
     security_list_manager = SecurityListManager(vcn)
     node_security_list, k8s_api_security_list, service_lb_security_list = (
         security_list_manager.create_all_security_lists()
     )
+    network_security_groups = {}
+    if cfg.SECURITY_MODE == 'nsg':
+        network_security_groups = NetworkSecurityGroupManager(vcn).create_all_network_security_groups()
 
-    # Step 5: 서브넷 생성 (서비스 로드 밸런서, 노드, K8s API)
+    # Step 5: 서브넷 생성 (서비스 로드 밸런서, 노드, K8s API, 선택적으로 파드)
     subnet_manager = SubnetManager(
         vcn,
         route_table_private,
         route_table_public,
         node_security_list,
         k8s_api_security_list,
+        security_list_manager.pod_security_list,
+        security_list_manager.baseline_security_list,
     )
     service_lb_subnet, node_subnet, k8s_api_subnet = subnet_manager.create_all_subnets()
 
-    # Step 6: OKE 클러스터 생성
-    oke_cluster_manager = OKEClusterManager(vcn, k8s_api_subnet, service_lb_subnet)
-    oke_cluster = oke_cluster_manager.create_cluster()
-
-    # Step 7: OKE 노드 풀 생성
-    node_pool_manager = NodePoolManager(oke_cluster, node_subnet)
-    node_pool = node_pool_manager.create_node_pool()
+    # 서브넷별 VCN 흐름 로그 (선택)
+    flow_log_manager = FlowLogManager(
+        {
+            'service_lb': service_lb_subnet,
+            'node': node_subnet,
+            'k8s_api': k8s_api_subnet,
+            'pod': subnet_manager.pod_subnet,
+        }
+    )
+    if cfg.FLOW_LOGS:
+        flow_log_manager.create_all_flow_logs()
 
-    # Step 8: Pulumi로 필요한 리소스 ID를 export
+    # 네트워크 리소스 ID export (cluster 계층 스택은 이 값을 StackReference로 읽는다)
     pulumi.export('vcn_id', vcn.id)
 
     pulumi.export('internet_gateway_id', internet_gateway.id)
@@ -56,15 +76,97 @@ def main():
     pulumi.export('route_table_private_id', route_table_private.id)
     pulumi.export('route_table_public_id', route_table_public.id)
 
-    pulumi.export('node_security_list_id', node_security_list.id)
-    pulumi.export('k8s_api_security_list_id', k8s_api_security_list.id)
-    pulumi.export('service_lb_security_list_id', service_lb_security_list.id)
+    if network_security_groups:
+        pulumi.export('baseline_security_list_id', security_list_manager.baseline_security_list.id)
+        pulumi.export('network_security_group_ids', {role: nsg.id for role, nsg in network_security_groups.items()})
+    else:
+        pulumi.export('node_security_list_id', node_security_list.id)
+        pulumi.export('k8s_api_security_list_id', k8s_api_security_list.id)
+        pulumi.export('service_lb_security_list_id', service_lb_security_list.id)
+    if security_list_manager.pod_security_list:
+        pulumi.export('pod_security_list_id', security_list_manager.pod_security_list.id)
 
     pulumi.export('service_lb_subnet_id', service_lb_subnet.id)
     pulumi.export('node_subnet_id', node_subnet.id)
     pulumi.export('k8s_api_subnet_id', k8s_api_subnet.id)
-    pulumi.export('oke_cluster_id', oke_cluster.id)
+    if subnet_manager.pod_subnet:
+        pulumi.export('pod_subnet_id', subnet_manager.pod_subnet.id)
+    if cfg.DUAL_STACK:
+        pulumi.export('vcn_ipv6_cidr_block', cfg.VCN_IPV6_CIDR_BLOCK)
+        pulumi.export('subnet_ipv6_cidr_blocks', dict(cfg.get_config().subnet_ipv6_cidr_blocks))
+    if flow_log_manager.log_group:
+        pulumi.export('flow_log_group_id', flow_log_manager.log_group.id)
+        pulumi.export('flow_log_ids', {role: log.id for role, log in flow_log_manager.flow_logs.items()})
+    if cfg.LAYER == 'network':
+        pulumi.export('network_settings', network_settings())
+
+    return NetworkLayer(
+        vcn, service_lb_subnet, node_subnet, k8s_api_subnet, subnet_manager.pod_subnet, network_security_groups
+    )
+
+
+def create_cluster_layer(network):
+    """
+    클러스터 계층 (OKE 클러스터, 노드 풀, 오토스케일러 애드온, 오버프로비저닝) 생성 및 export
+    """
+    # Step 6: OKE 클러스터 생성
+    oke_cluster_manager = OKEClusterManager(
+        network.vcn, network.k8s_api_subnet, network.service_lb_subnet, network.network_security_groups
+    )
+    oke_cluster = oke_cluster_manager.create_cluster()
+
+    # Step 7: OKE 노드 풀 생성
+    node_pool_manager = NodePoolManager(
+        oke_cluster, network.node_subnet, network.pod_subnet, network.network_security_groups
+    )
+    node_pools = node_pool_manager.create_all_node_pools()
+    node_pool = node_pools[0]
+
+    # Step 8: Cluster Autoscaler 애드온 생성 (선택)
+    autoscaler_manager = ClusterAutoscalerManager(
+        oke_cluster, node_pool_manager.node_pools, node_pool_manager.pool_specs
+    )
+    autoscaler_addon = autoscaler_manager.create_addon()
+
+    # Step 9: 오버프로비저닝 placeholder 파드 생성 (선택, export하는 kubeconfig로 Kubernetes provider 생성)
+    kubeconfig = oke_cluster_manager.create_kubeconfig()
+    overprovisioning_manager = OverprovisioningManager(
+        kubeconfig, node_pool_manager.node_pools, node_pool_manager.pool_specs, autoscaler_addon
+    )
+    overprovisioning_manager.create_placeholders()
+
+    # Step 10: Pulumi로 필요한 리소스 ID를 export
     pulumi.export('node_pool_id', node_pool.id)
+    pulumi.export('node_pool_ids', {name: pool.id for name, pool in node_pool_manager.node_pools.items()})
+    pulumi.export('kubeconfig', kubeconfig)
+    if node_pool_manager.previous_node_pools:
+        pulumi.export(
+            'previous_node_pool_ids', {name: pool.id for name, pool in node_pool_manager.previous_node_pools.items()}
+        )
+    if autoscaler_addon:
+        pulumi.export('cluster_autoscaler_addon_id', autoscaler_addon.id)
+    if overprovisioning_manager.placeholders:
+        pulumi.export(
+            'overprovisioning_replicas', {plan.pool: plan.replicas for plan in overprovisioning_manager.plans}
+        )
+
+
+def main():
+    """
+    `layer` 설정에 따라 전체(all), 네트워크 계층(network), 클러스터 계층(cluster)을 생성
+    cluster 계층은 네트워크 리소스를 만들지 않고 `network_stack` 스택의 export를 StackReference로 참조한다.
+    """
+    # 단계별 타이밍/트레이싱 (trace_file 설정 시에만 활성화)
+    tracer = tracing.start()
+
+    if cfg.LAYER == 'cluster':
+        network = NetworkLayer.from_stack_reference(cfg.NETWORK_STACK)
+    else:
+        network = create_network_layer()
+    if cfg.LAYER != 'network':
+        create_cluster_layer(network)
+
+    tracing.finish(tracer)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,424 @@
+"""
+배포 엔진 이벤트 로그 분석기
+`pulumi up --event-log <파일>`(또는 `--json`) / Automation API가 남기는 엔진 이벤트 JSON Lines를 한 줄씩 읽어
+리소스 DAG와 리소스별 시작/종료 시각을 복원하고 크리티컬 패스와 리소스별 여유 시간(slack)을 계산한다.
+
+- 의존 관계: 엔진 이벤트에는 의존성 목록이 없으므로, 먼저 완료된 리소스의 ID가 다른 리소스의 입력에 나타나면
+  간선으로 보고(provider 포함), `pulumi stack export` 파일(--state)이 있으면 그 dependencies를 더한다.
+- 교체: create-replacement/replace 단계는 한 리소스로 합치고, 배포 끝에 실행되는 이전 리소스 삭제(delete-replaced)는
+  교체된 리소스와 그 리소스를 쓰던 리소스들 뒤에 오는 별도 단계(`<이름>#delete-replaced`)로 본다.
+- 메모리: 로그 줄은 하나씩 파싱하고 리소스마다 시각/타입/의존성만 보관하므로 로그 크기와 무관하다.
+- 통계: 리소스 타입/작업별 소요 시간을 로그 스케일 히스토그램으로 로컬 저장소에 누적하여 p50/p95를 계산한다.
+
+실행:
+    pulumi up --event-log /tmp/up-events.jsonl
+    python -m automation.events analyze /tmp/up-events.jsonl [--state state.json] [--no-record]
+    python -m automation.events stats
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+# 분석에 필요한 엔진 이벤트 종류
+GRAPH_EVENTS = ('preludeEvent', 'summaryEvent', 'resourcePreEvent', 'resOutputsEvent', 'resOpFailedEvent')
+DEFAULT_STORE_PATH = Path.home() / '.cache' / 'oke-infra' / 'resource_latency.json'
+# 히스토그램 버킷 비율 (2^(1/8): 상대 오차 약 4.5%)
+HISTOGRAM_GROWTH = 2 ** (1 / 8)
+# 실제로 클라우드 작업을 수행한 단계만 소요 시간 통계에 반영
+TIMED_OPS = ('create', 'update', 'replace', 'create-replacement', 'delete', 'delete-replaced', 'read', 'refresh')
+# 같은 URN이지만 별도 단계로 보는 작업 (교체된 이전 리소스 삭제)
+SEPARATE_OPS = ('delete-replaced',)
+
+
+# =============================================================================
+# 이벤트 스트림 -> 리소스 DAG
+# =============================================================================
+
+
+@dataclass(slots=True)
+class ResourceStep:
+    """리소스 하나의 단계 (같은 URN의 여러 단계는 처음 시작 ~ 마지막 종료로 합친다)"""
+
+    urn: str
+    type: str
+    op: str
+    start: float
+    finish: float | None = None
+    failed: bool = False
+    dependencies: set[str] = field(default_factory=set)
+
+    @property
+    def name(self) -> str:
+        return self.urn.rsplit('::', 1)[-1]
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, (self.finish if self.finish is not None else self.start) - self.start)
+
+
+def read_events(stream: TextIO, kinds: Iterable[str] | None = None) -> Iterator[dict[str, Any]]:
+    """
+    JSON Lines 엔진 이벤트 (빈 줄/깨진 줄은 건너뜀)
+    `kinds`를 주면 해당 이벤트 키가 없는 줄은 JSON 파싱 없이 건너뛴다 (대부분을 차지하는 진단 이벤트 등).
+    """
+    markers = tuple(f'"{kind}"' for kind in kinds) if kinds else ()
+    for line in stream:
+        line = line.strip()
+        if not line.startswith('{') or (markers and not any(marker in line for marker in markers)):
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            continue
+
+
+def _strings(value: Any) -> Iterator[str]:
+    """입력 값 안의 모든 문자열"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+
+
+def _step_key(metadata: dict[str, Any]) -> str | None:
+    """단계 키 (URN, 별도 단계로 보는 작업은 '<URN>#<작업>')"""
+    urn = metadata.get('urn')
+    if urn and metadata.get('op') in SEPARATE_OPS:
+        return f'{urn}#{metadata["op"]}'
+    return urn
+
+
+def _provider_urn(provider: str | None) -> str | None:
+    """'<provider URN>::<provider ID>' 에서 URN 부분"""
+    if not provider:
+        return None
+    return provider.rsplit('::', 1)[0]
+
+
+class DeploymentGraph:
+    """
+    엔진 이벤트로 복원한 배포 DAG
+    """
+
+    def __init__(self):
+        self.steps: dict[str, ResourceStep] = {}
+        self.ids: dict[str, str] = {}  # 리소스 ID -> URN
+        self.started: float | None = None
+        self.finished: float | None = None
+        self.events = 0
+
+    def feed(self, event: dict[str, Any]) -> None:
+        """이벤트 하나 반영"""
+        self.events += 1
+        timestamp = float(event.get('timestamp') or 0)
+        if 'preludeEvent' in event:
+            self.started = timestamp
+        elif 'summaryEvent' in event:
+            self.finished = timestamp
+        elif 'resourcePreEvent' in event:
+            self._on_pre(event['resourcePreEvent'].get('metadata') or {}, timestamp)
+        elif 'resOutputsEvent' in event:
+            self._on_done(event['resOutputsEvent'].get('metadata') or {}, timestamp, failed=False)
+        elif 'resOpFailedEvent' in event:
+            self._on_done(event['resOpFailedEvent'].get('metadata') or {}, timestamp, failed=True)
+
+    def _on_pre(self, metadata: dict[str, Any], timestamp: float) -> None:
+        urn = _step_key(metadata)
+        if not urn:
+            return
+        state = metadata.get('new') or metadata.get('old') or {}
+        if state.get('custom') is False:
+            # 스택/컴포넌트 리소스는 클라우드 작업이 없고, 출력 등록(배포 끝)에서 다시 완료 이벤트가 나온다
+            return
+        step = self.steps.get(urn)
+        if step is None:
+            step = self.steps[urn] = ResourceStep(urn, metadata.get('type', ''), metadata.get('op', ''), timestamp)
+        elif metadata.get('op') not in ('same', None):
+            step.op = metadata['op']
+        if urn != metadata['urn']:
+            # 이전 리소스 삭제는 교체된 리소스와 (새 리소스로 옮겨 간) 그 리소스의 의존 리소스가 끝난 뒤 실행된다
+            replaced = metadata['urn']
+            step.dependencies.update(
+                [other.urn for other in self.steps.values() if other.urn == replaced or replaced in other.dependencies]
+            )
+        provider = _provider_urn(metadata.get('provider') or state.get('provider'))
+        if provider in self.steps:
+            step.dependencies.add(provider)
+        step.dependencies.update(
+            self.ids[value] for value in _strings(state.get('inputs')) if value in self.ids and self.ids[value] != urn
+        )
+
+    def _on_done(self, metadata: dict[str, Any], timestamp: float, failed: bool) -> None:
+        step = self.steps.get(_step_key(metadata) or '')
+        if step is None:
+            return
+        step.finish = timestamp
+        step.failed = step.failed or failed
+        resource_id = (metadata.get('new') or {}).get('id')
+        if resource_id:
+            self.ids[resource_id] = step.urn
+
+    def add_state_dependencies(self, state: dict[str, Any]) -> None:
+        """`pulumi stack export` 결과의 명시적 의존성 추가"""
+        for resource in (state.get('deployment') or state).get('resources') or []:
+            step = self.steps.get(resource.get('urn', ''))
+            if step is None:
+                continue
+            step.dependencies.update(dep for dep in resource.get('dependencies') or [] if dep in self.steps)
+            provider = _provider_urn(resource.get('provider'))
+            if provider in self.steps:
+                step.dependencies.add(provider)
+
+    @classmethod
+    def from_events(cls, events: Iterable[dict[str, Any]]) -> 'DeploymentGraph':
+        graph = cls()
+        for event in events:
+            graph.feed(event)
+        return graph
+
+    # =============================================================================
+    # 크리티컬 패스
+    # =============================================================================
+
+    def topological_order(self) -> list[ResourceStep]:
+        """시작 시각 순서를 유지하는 위상 정렬"""
+        ordered = sorted(self.steps.values(), key=lambda step: (step.start, step.urn))
+        indegree = {step.urn: len(step.dependencies) for step in ordered}
+        dependents: dict[str, list[str]] = {urn: [] for urn in indegree}
+        for step in ordered:
+            for dep in step.dependencies:
+                dependents[dep].append(step.urn)
+        queue = deque(step.urn for step in ordered if indegree[step.urn] == 0)
+        result = []
+        while queue:
+            urn = queue.popleft()
+            result.append(self.steps[urn])
+            for child in dependents[urn]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    queue.append(child)
+        if len(result) != len(ordered):
+            raise ValueError('의존성 그래프에 순환이 있습니다.')
+        return result
+
+    def schedule(self) -> 'Schedule':
+        """
+        관측된 소요 시간으로 무한 병렬 일정을 계산
+        가장 이른 종료(EF) = 의존 리소스 EF의 최댓값 + 소요 시간, 여유 = 가장 늦은 종료(LF) - EF
+        """
+        order = self.topological_order()
+        earliest: dict[str, float] = {}
+        binding: dict[str, str | None] = {}
+        for step in order:
+            # EF가 같으면 URN 순서로 골라 크리티컬 패스가 실행마다 같게 한다
+            deps = sorted(step.dependencies, key=lambda dep: (earliest[dep], dep), reverse=True)
+            binding[step.urn] = deps[0] if deps else None
+            earliest[step.urn] = (earliest[deps[0]] if deps else 0.0) + step.duration
+        makespan = max(earliest.values(), default=0.0)
+
+        latest = dict.fromkeys(earliest, makespan)
+        for step in reversed(order):
+            for dep in step.dependencies:
+                latest[dep] = min(latest[dep], latest[step.urn] - step.duration)
+
+        path: list[ResourceStep] = []
+        urn = max(earliest, key=earliest.get, default=None)
+        while urn is not None:
+            path.append(self.steps[urn])
+            urn = binding[urn]
+        path.reverse()
+
+        observed = 0.0
+        if self.steps:
+            start = self.started if self.started is not None else min(step.start for step in self.steps.values())
+            finish = max((step.finish or step.start) for step in self.steps.values())
+            observed = (self.finished if self.finished is not None else finish) - start
+        return Schedule(
+            makespan=makespan,
+            observed=observed,
+            path=path,
+            slack={urn: latest[urn] - earliest[urn] for urn in earliest},
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Schedule:
+    makespan: float  # 의존성만으로 제한될 때의 최소 소요 시간
+    observed: float  # 실제 배포 소요 시간
+    path: list[ResourceStep]
+    slack: dict[str, float]
+
+
+# =============================================================================
+# 소요 시간 통계 저장소
+# =============================================================================
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """로그 스케일 버킷 히스토그램 (크기는 값의 범위에만 비례)"""
+
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+    buckets: dict[int, int] = field(default_factory=dict)  # 버킷 인덱스 -> 개수 (0초는 인덱스 -1)
+
+    @staticmethod
+    def bucket(value: float) -> int:
+        return -1 if value < 1 else int(math.log(value, HISTOGRAM_GROWTH))
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+        index = self.bucket(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def quantile(self, q: float) -> float:
+        """버킷 중앙값으로 근사한 분위수"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return 0.0 if index < 0 else min(self.maximum, HISTOGRAM_GROWTH ** (index + 0.5))
+        return self.maximum
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'count': self.count,
+            'total': self.total,
+            'max': self.maximum,
+            'buckets': {str(index): count for index, count in sorted(self.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> 'LatencyHistogram':
+        return cls(
+            raw['count'], raw['total'], raw['max'], {int(index): count for index, count in raw['buckets'].items()}
+        )
+
+
+class LatencyStore:
+    """
+    리소스 타입/작업별 소요 시간 히스토그램의 JSON 저장소
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_STORE_PATH):
+        self.path = Path(path)
+
+    def load(self) -> tuple[dict[str, LatencyHistogram], int]:
+        """(시리즈, 누적 실행 수) (없거나 손상된 경우 빈 저장소)"""
+        try:
+            raw = json.loads(self.path.read_text())
+            series = {key: LatencyHistogram.from_dict(value) for key, value in raw['series'].items()}
+            return series, raw.get('runs', 0)
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}, 0
+
+    def record(self, steps: Iterable[ResourceStep]) -> dict[str, LatencyHistogram]:
+        """실행 한 번의 단계 소요 시간을 누적 (임시 파일에 쓴 뒤 교체)"""
+        series, runs = self.load()
+        for step in steps:
+            if step.op in TIMED_OPS and step.finish is not None and not step.failed:
+                series.setdefault(f'{step.type} {step.op}', LatencyHistogram()).add(step.duration)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        payload = {
+            'runs': runs + 1,
+            'updated_at': time.time(),
+            'series': {key: value.to_dict() for key, value in sorted(series.items())},
+        }
+        tmp_path.write_text(json.dumps(payload, indent=1))
+        os.replace(tmp_path, self.path)
+        return series
+
+
+# =============================================================================
+# 보고서
+# =============================================================================
+
+
+def _seconds(value: float) -> str:
+    return f'{value:7.0f}s' if value >= 10 else f'{value:7.1f}s'
+
+
+def format_report(graph: DeploymentGraph, schedule: Schedule) -> str:
+    edges = sum(len(step.dependencies) for step in graph.steps.values())
+    lines = [
+        f'events {graph.events}, resources {len(graph.steps)}, dependencies {edges}',
+        f'observed {schedule.observed:.0f}s, dependency-bound minimum {schedule.makespan:.0f}s',
+        '',
+        'critical path:',
+    ]
+    previous = None
+    for step in schedule.path:
+        via = f'  <- {previous.name}' if previous else ''
+        failed = ' (failed)' if step.failed else ''
+        lines.append(f'  {_seconds(step.duration)}  {step.op:<8} {step.type} {step.name}{failed}{via}')
+        previous = step
+    lines += ['', 'slack (non-critical, largest first):']
+    slack = sorted(
+        ((value, graph.steps[urn]) for urn, value in schedule.slack.items() if value > 0),
+        key=lambda item: -item[0],
+    )
+    for value, step in slack[:20]:
+        lines.append(f'  {_seconds(value)}  {step.type} {step.name}')
+    return '\n'.join(lines)
+
+
+def format_stats(series: dict[str, LatencyHistogram], runs: int) -> str:
+    lines = [f'runs {runs}', f'{"count":>6} {"p50":>8} {"p95":>8} {"max":>8}  resource type / op']
+    for key, histogram in sorted(series.items(), key=lambda item: -item[1].quantile(0.95)):
+        lines.append(
+            f'{histogram.count:>6} {_seconds(histogram.quantile(0.5))} {_seconds(histogram.quantile(0.95))} '
+            f'{_seconds(histogram.maximum)}  {key}'
+        )
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--store', type=Path, default=DEFAULT_STORE_PATH, help='소요 시간 통계 저장소 경로')
+    commands = parser.add_subparsers(dest='command', required=True)
+    analyze = commands.add_parser('analyze', help='이벤트 로그 분석 (- 는 표준 입력)')
+    analyze.add_argument('log')
+    analyze.add_argument('--state', type=Path, help='`pulumi stack export` 결과 (명시적 의존성)')
+    analyze.add_argument('--no-record', action='store_true', help='통계 저장소에 누적하지 않음')
+    commands.add_parser('stats', help='리소스 타입별 p50/p95 소요 시간')
+    args = parser.parse_args()
+
+    store = LatencyStore(args.store)
+    if args.command == 'stats':
+        print(format_stats(*store.load()))
+        return
+
+    if args.log == '-':
+        graph = DeploymentGraph.from_events(read_events(sys.stdin, GRAPH_EVENTS))
+    else:
+        with open(args.log, encoding='utf-8') as stream:
+            graph = DeploymentGraph.from_events(read_events(stream, GRAPH_EVENTS))
+    if args.state:
+        graph.add_state_dependencies(json.loads(args.state.read_text()))
+    print(format_report(graph, graph.schedule()))
+    if not args.no_record:
+        store.record(graph.steps.values())
+
+
+if __name__ == '__main__':
+    main()
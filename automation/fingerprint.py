@@ -0,0 +1,311 @@
+"""
+원하는 상태 지문 (desired-state fingerprint)
+스택 설정(`Pulumi.<stack>.yaml`)으로 `__main__.py`의 `main()`을 Pulumi mock 위에서 평가하여 원하는 리소스 그래프
+(타입, 이름, 입력, provider)와 스택 출력을 얻고, 리소스마다 내용 해시와 스택 전체 해시를 계산한다.
+마지막으로 성공한 up의 지문과 같으면 preview/up을 건너뛰고, 다르면 바뀐 리소스를 출력한다.
+
+- Pulumi CLI와 클라우드 호출 없이 실행 (조회(invoke)는 mock 응답을 사용)
+- 비밀 값(secret 입력, `secure:` 설정)은 해시로만 다루고, 지문 파일에는 해시만 저장
+- cluster 계층 스택은 `network_stack`의 설정 파일로 네트워크 계층을 먼저 평가하여 그 출력을 StackReference 응답으로
+  사용하고, 네트워크 스택의 지문(마지막 up 기록, 없으면 계산한 지문)을 함께 해시한다.
+  네트워크 스택이 바뀌면 클러스터 스택의 지문도 바뀐다.
+- 코드/설정 변경만 감지한다. 콘솔 수동 변경 같은 클라우드 드리프트나 새 노드 이미지 릴리스는 감지하지 않으므로
+  정기적으로 `make up`/`pulumi refresh`를 실행한다.
+
+실행:
+    python -m automation.fingerprint diff --stack dev    # 같으면 종료 코드 0, 다르거나 기록이 없으면 1
+    python -m automation.fingerprint save --stack dev    # up 성공 후 지문 기록
+    python -m automation.fingerprint forget --stack dev  # destroy 후 기록 삭제
+`--stack`을 생략하면 `pulumi stack --show-name`으로 현재 스택을 사용한다.
+"""
+
+import argparse
+import hashlib
+import importlib.metadata
+import json
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pulumi
+import yaml
+from pulumi.runtime import rpc
+
+from automation.fleet import PROJECT_NAME, PROJECT_ROOT, load_program
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'oke-infra' / 'fingerprints'
+COMMANDS = ('diff', 'save', 'forget')
+DIGEST_LENGTH = 16
+# 지문에 리소스와 함께 기록하는 항목 (스택 출력, 프로젝트 외 설정, 도구 버전)
+OUTPUTS_KEY = 'pulumi:outputs'
+CONFIG_KEY = 'pulumi:config'
+VERSIONS_KEY = 'pulumi:versions'
+NETWORK_KEY = 'pulumi:network'
+VERSION_PACKAGES = ('pulumi', 'pulumi_oci')
+# 지문 평가에서 끄는 설정 (평가 부수 효과)
+EVALUATION_OVERRIDES = {'trace_file': ''}
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()[:DIGEST_LENGTH]
+
+
+def _redact(value: Any) -> Any:
+    """secret으로 표시된 값을 해시로 치환"""
+    if isinstance(value, Mapping):
+        if value.get(rpc._special_sig_key) == rpc._special_secret_sig:
+            return {'secret': _digest(value.get('value'))}
+        return {key: _redact(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_redact(item) for item in value]
+    return value
+
+
+# =============================================================================
+# 스택 설정
+# =============================================================================
+
+
+def current_stack() -> str:
+    """Pulumi CLI의 현재 선택된 스택 이름"""
+    try:
+        result = subprocess.run(
+            ['pulumi', 'stack', '--show-name'], capture_output=True, text=True, check=True, cwd=PROJECT_ROOT
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise ValueError(f'현재 스택을 확인할 수 없습니다. --stack으로 지정하세요: {e}') from e
+    return result.stdout.strip()
+
+
+def _config_value(value: Any) -> str:
+    """스택 파일의 설정 값을 Pulumi 설정 문자열로 변환 (`secure:` 값은 암호문 해시)"""
+    if isinstance(value, Mapping) and set(value) == {'secure'}:
+        return f'secure-{_digest(value["secure"])}'
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int | float):
+        return str(value)
+    return json.dumps(value)
+
+
+def load_stack_config(stack: str, root: Path = PROJECT_ROOT) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    (프로젝트 설정, 그 외 설정) - `Pulumi.<stack>.yaml`의 설정
+    프로젝트 설정은 프로그램 평가에, 그 외 설정(oci:region 등 provider 설정)은 지문에만 사용한다.
+    """
+    path = root / f'Pulumi.{stack.rsplit("/", 1)[-1]}.yaml'
+    try:
+        raw = yaml.safe_load(path.read_text()) or {}
+    except OSError as e:
+        raise ValueError(f"스택 설정 파일을 읽을 수 없습니다: '{path}' ({e})") from e
+    project, other = {}, {}
+    for key, value in (raw.get('config') or {}).items():
+        namespace, _, name = key.partition(':')
+        if namespace == PROJECT_NAME:
+            project[name] = _config_value(value)
+        else:
+            other[key] = _config_value(value)
+    return project, other
+
+
+# =============================================================================
+# 지문
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class FingerprintDiff:
+    """두 지문 사이의 변경 (리소스 키 목록)"""
+
+    added: tuple[str, ...]
+    removed: tuple[str, ...]
+    changed: tuple[str, ...]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def format(self) -> str:
+        lines = [f'  + {key}' for key in self.added]
+        lines += [f'  - {key}' for key in self.removed]
+        lines += [f'  ~ {key}' for key in self.changed]
+        return '\n'.join(lines)
+
+
+@dataclass(frozen=True, slots=True)
+class Fingerprint:
+    """스택의 원하는 상태 지문 (리소스 키 `타입::이름` -> 내용 해시)"""
+
+    stack: str
+    entries: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def digest(self) -> str:
+        """스택 전체 해시"""
+        return _digest(sorted(self.entries.items()))
+
+    @property
+    def resources(self) -> int:
+        return sum(not key.startswith('pulumi:') for key in self.entries)
+
+    def diff(self, previous: 'Fingerprint') -> FingerprintDiff:
+        return FingerprintDiff(
+            added=tuple(sorted(self.entries.keys() - previous.entries.keys())),
+            removed=tuple(sorted(previous.entries.keys() - self.entries.keys())),
+            changed=tuple(
+                sorted(
+                    key
+                    for key in self.entries.keys() & previous.entries.keys()
+                    if self.entries[key] != previous.entries[key]
+                )
+            ),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'stack': self.stack, 'digest': self.digest, 'entries': dict(sorted(self.entries.items()))}
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> 'Fingerprint':
+        return cls(raw['stack'], dict(raw['entries']))
+
+
+def _evaluate(
+    stack: str,
+    config: dict[str, str],
+    other_config: dict[str, str] | None,
+    program: Callable[[], None],
+    stack_outputs: dict[str, dict[str, Any]] | None = None,
+) -> tuple[dict[str, str], dict[str, Any]]:
+    """
+    (지문 항목, 스택 출력) - 스택 설정으로 프로그램을 mock 위에서 평가
+    스택 출력은 `pulumi.export` 호출을 가로채 확정된 값으로 모은다.
+    """
+    from benchmarks.mocks import run_program
+
+    exports: dict[str, Any] = {}
+
+    def export(name: str, value: Any) -> None:
+        pulumi.Output.from_input(value).apply(lambda resolved: exports.__setitem__(name, resolved))
+
+    with mock.patch.object(pulumi, 'export', export):
+        mocks = run_program(program, {**config, **EVALUATION_OVERRIDES}, stack=stack, stack_outputs=stack_outputs)
+    entries = {
+        f'{resource.typ}::{resource.name}': _digest([_redact(resource.inputs), resource.provider, resource.custom])
+        for resource in mocks.resources
+    }
+    if len(entries) != len(mocks.resources):
+        raise ValueError(f"스택 '{stack}'에 타입과 이름이 같은 리소스가 있습니다.")
+    # 출력 값은 secret 여부와 관계없이 해시만 남긴다
+    entries[OUTPUTS_KEY] = _digest(exports)
+    entries[CONFIG_KEY] = _digest(other_config or {})
+    entries[VERSIONS_KEY] = _digest({name: importlib.metadata.version(name) for name in VERSION_PACKAGES})
+    return entries, exports
+
+
+def compute_fingerprint(
+    stack: str,
+    config: dict[str, str],
+    other_config: dict[str, str] | None = None,
+    program: Callable[[], None] | None = None,
+    cache: 'FingerprintCache | None' = None,
+    root: Path = PROJECT_ROOT,
+) -> Fingerprint:
+    """
+    스택 설정으로 프로그램을 mock 위에서 평가하여 지문 계산
+    cluster 계층 스택은 `network_stack`의 스택 설정 파일(`root` 아래)로 네트워크 계층을 먼저 평가하여 그 출력을
+    StackReference 응답으로 넘기고, 네트워크 스택의 지문을 `pulumi:network` 항목으로 더한다.
+    네트워크 스택의 지문은 `cache`에 기록된 마지막 up의 지문이고, 기록이 없으면 방금 계산한 지문이다.
+    """
+    program = program or load_program()
+    if config.get('layer') != 'cluster':
+        return Fingerprint(stack, _evaluate(stack, config, other_config, program)[0])
+
+    network_stack = config.get('network_stack')
+    if not network_stack:
+        raise ValueError(f"cluster 계층 스택 '{stack}'에 network_stack 설정이 없습니다.")
+    network_entries, network_exports = _evaluate(network_stack, *load_stack_config(network_stack, root), program)
+    entries, _ = _evaluate(stack, config, other_config, program, {network_stack: network_exports})
+    # `make up-changed STACK=<이름>`은 짧은 스택 이름으로 지문을 기록한다
+    saved = cache and (cache.load(network_stack) or cache.load(network_stack.rsplit('/', 1)[-1]))
+    entries[NETWORK_KEY] = saved.digest if saved else Fingerprint(network_stack, network_entries).digest
+    return Fingerprint(stack, entries)
+
+
+class FingerprintCache:
+    """
+    마지막으로 성공한 up의 지문 저장소 (스택마다 JSON 파일 하나)
+    """
+
+    def __init__(self, directory: str | Path = DEFAULT_CACHE_DIR):
+        self.directory = Path(directory)
+
+    def path(self, stack: str) -> Path:
+        return self.directory / f'{PROJECT_NAME}.{stack.replace("/", ".")}.json'
+
+    def load(self, stack: str) -> Fingerprint | None:
+        """기록된 지문 (없거나 손상된 경우 None)"""
+        try:
+            return Fingerprint.from_dict(json.loads(self.path(stack).read_text()))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, fingerprint: Fingerprint) -> None:
+        """지문 기록 (임시 파일에 쓴 뒤 교체)"""
+        path = self.path(fingerprint.stack)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(json.dumps({**fingerprint.to_dict(), 'saved_at': time.time()}, indent=1))
+        os.replace(tmp_path, path)
+
+    def forget(self, stack: str) -> bool:
+        try:
+            self.path(stack).unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', choices=COMMANDS)
+    parser.add_argument('--stack', help='스택 이름 (기본: Pulumi CLI의 현재 스택)')
+    parser.add_argument('--cache', type=Path, default=DEFAULT_CACHE_DIR, help='지문 저장 디렉터리')
+    args = parser.parse_args()
+
+    stack = args.stack or current_stack()
+    cache = FingerprintCache(args.cache)
+    if args.command == 'forget':
+        print(f'{stack}: 지문 기록 {"삭제" if cache.forget(stack) else "없음"}')
+        return
+
+    started = time.perf_counter()
+    fingerprint = compute_fingerprint(stack, *load_stack_config(stack), cache=cache)
+    elapsed = time.perf_counter() - started
+    summary = f'{stack}: 리소스 {fingerprint.resources}개, 지문 {fingerprint.digest} ({elapsed:.2f}s)'
+    if args.command == 'save':
+        cache.save(fingerprint)
+        print(f'{summary} 기록')
+        return
+
+    previous = cache.load(stack)
+    if previous is None:
+        print(f'{summary} - 기록된 지문 없음')
+        sys.exit(1)
+    changes = fingerprint.diff(previous)
+    if not changes:
+        print(f'{summary} - 마지막 up 이후 변경 없음')
+        return
+    print(f'{summary} - 마지막 up({previous.digest}) 이후 변경:')
+    print(changes.format())
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,354 @@
+"""
+다중 리전/다중 스택 배포기 (Pulumi Automation API)
+`__main__.py`의 `main()`을 인라인 프로그램으로 사용하여 여러 스택의 preview/up을 제한된 작업자 풀로 동시에 실행한다.
+
+- 스택 설정은 스택마다 `set_all_config` 한 번(CLI 호출 한 번)으로 일괄 설정
+- 각 스택의 출력은 `[스택]` 접두사를 붙여 한 줄씩 실시간으로 출력
+- 모든 스택이 끝나면 결과(변경 요약, 소요 시간, 오류)를 모아 표로 출력하고, 실패한 스택이 있으면 종료 코드 1
+
+플릿 파일 예 (fleet.json, 문자열 값의 ${ENV} 는 환경 변수로 치환):
+    {
+      "project": "oke-single",
+      "backend": "file://~/.pulumi-fleet",
+      "defaults": {"compartment_id": "${OCI_COMPARTMENT_ID}", "ssh_public_key": "${OKE_SSH_PUBLIC_KEY}"},
+      "stacks": {
+        "osaka": {"region": "ap-osaka-1"},
+        "seoul": {"region": "ap-seoul-1", "node_pool_size": 3}
+      }
+    }
+
+실행: python -m automation.fleet fleet.json preview [--workers 4] [--stacks osaka seoul] [--mock]
+`--mock`은 Pulumi CLI/클라우드 없이 Pulumi mock으로 각 스택 프로그램을 평가한다.
+"""
+
+import argparse
+import asyncio
+import importlib.metadata
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from pulumi import automation as auto
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PROJECT_NAME = 'oke-single'
+SECRET_KEYS = ('compartment_id', 'ssh_public_key')
+OPERATIONS = ('preview', 'up')
+DEFAULT_WORKERS = 4
+
+# 스택 설정에서 OCI provider 설정으로 복사하는 키 (기본 provider가 스택의 리전/프로필을 사용하도록)
+PROVIDER_KEYS = {'region': 'oci:region', 'profile': 'oci:configFileProfile'}
+
+
+# =============================================================================
+# 플릿 정의
+# =============================================================================
+
+
+def _backend_url(url: str) -> str:
+    """백엔드 URL의 `~`를 홈 디렉터리로 치환 (file://~/... 지원)"""
+    if url.startswith('file://'):
+        return 'file://' + os.path.expanduser(url.removeprefix('file://'))
+    return url
+
+
+def _config_value(value: Any) -> str:
+    """Pulumi 설정 값 문자열 (객체/목록은 JSON, 문자열은 환경 변수 치환)"""
+    if isinstance(value, str):
+        return os.path.expandvars(value)
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int | float):
+        return str(value)
+    return json.dumps(value)
+
+
+@dataclass(frozen=True, slots=True)
+class StackTarget:
+    """배포 대상 스택 하나와 설정"""
+
+    name: str
+    config: tuple[tuple[str, str], ...]
+
+    def config_map(self) -> dict[str, auto.ConfigValue]:
+        """`set_all_config`에 넘길 설정 (비밀 키는 secret으로 설정)"""
+        values = dict(self.config)
+        result = {key: auto.ConfigValue(value, secret=key in SECRET_KEYS) for key, value in values.items()}
+        for key, provider_key in PROVIDER_KEYS.items():
+            if key in values and provider_key not in values:
+                result[provider_key] = auto.ConfigValue(values[key])
+        return result
+
+
+@dataclass(frozen=True, slots=True)
+class FleetSpec:
+    """플릿 파일 내용"""
+
+    project: str
+    backend: str | None
+    secrets_provider: str | None
+    stacks: tuple[StackTarget, ...]
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> 'FleetSpec':
+        stacks = raw.get('stacks') or {}
+        if not stacks:
+            raise ValueError('플릿 파일에 stacks가 없습니다.')
+        defaults = raw.get('defaults') or {}
+        targets = []
+        for name, overrides in stacks.items():
+            merged = {**defaults, **(overrides or {})}
+            missing = [key for key in SECRET_KEYS if not _config_value(merged.get(key, ''))]
+            if missing:
+                raise ValueError(f"스택 '{name}'에 필수 설정이 없습니다: {', '.join(missing)}")
+            targets.append(
+                StackTarget(name, tuple(sorted((key, _config_value(value)) for key, value in merged.items())))
+            )
+        backend = raw.get('backend')
+        return cls(
+            project=raw.get('project') or PROJECT_NAME,
+            backend=_backend_url(backend) if backend else None,
+            secrets_provider=raw.get('secrets_provider'),
+            stacks=tuple(targets),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'FleetSpec':
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+    def select(self, names: Iterable[str] | None) -> 'FleetSpec':
+        """지정한 스택만 남긴 플릿"""
+        if not names:
+            return self
+        names = list(names)
+        unknown = sorted(set(names) - {target.name for target in self.stacks})
+        if unknown:
+            raise ValueError(f'플릿에 없는 스택입니다: {", ".join(unknown)}')
+        return FleetSpec(
+            self.project, self.backend, self.secrets_provider, tuple(t for t in self.stacks if t.name in names)
+        )
+
+
+def load_program() -> Callable[[], None]:
+    """`__main__.py`의 `main()` (모듈 이름이 __main__이 아니므로 임포트 시 실행되지 않음)"""
+    spec = importlib.util.spec_from_file_location('oke_program', PROJECT_ROOT / '__main__.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.main
+
+
+# =============================================================================
+# 실행
+# =============================================================================
+
+
+@dataclass(slots=True)
+class StackResult:
+    """스택 하나의 실행 결과"""
+
+    stack: str
+    operation: str
+    succeeded: bool
+    duration: float
+    changes: dict[str, int] = field(default_factory=dict)
+    outputs: dict[str, Any] = field(default_factory=dict)
+    error: str = ''
+
+
+class ProgressPrinter:
+    """
+    여러 스택의 출력을 스택 이름 접두사를 붙여 줄 단위로 섞이지 않게 출력하는 클래스
+    """
+
+    def __init__(self, stream: TextIO = sys.stdout):
+        self.stream = stream
+        self.lock = threading.Lock()
+        self.width = 0
+
+    def for_stack(self, name: str) -> Callable[[str], None]:
+        """스택용 출력 콜백"""
+        self.width = max(self.width, len(name))
+
+        def emit(text: str) -> None:
+            lines = [line for line in text.splitlines() if line.strip()]
+            with self.lock:
+                for line in lines:
+                    self.stream.write(f'[{name:<{self.width}}] {line}\n')
+                self.stream.flush()
+
+        return emit
+
+
+class FleetDeployer:
+    """
+    플릿의 스택들을 Automation API로 동시에 preview/up 하는 클래스
+    """
+
+    def __init__(
+        self,
+        spec: FleetSpec,
+        program: Callable[[], None] | None = None,
+        workers: int = DEFAULT_WORKERS,
+        printer: ProgressPrinter | None = None,
+    ):
+        self.spec = spec
+        self.program = program or load_program()
+        self.workers = max(1, workers)
+        self.printer = printer or ProgressPrinter()
+        self.printer.width = max(len(target.name) for target in spec.stacks)
+
+    def workspace_options(self) -> auto.LocalWorkspaceOptions:
+        """
+        인라인 프로그램용 워크스페이스 옵션을 생성하는 메소드 (백엔드 URL은 프로젝트 설정으로 지정)
+        """
+        backend = auto.ProjectBackend(self.spec.backend) if self.spec.backend else None
+        return auto.LocalWorkspaceOptions(
+            project_settings=auto.ProjectSettings(name=self.spec.project, runtime='python', backend=backend),
+            secrets_provider=self.spec.secrets_provider,
+        )
+
+    def install_plugins(self) -> None:
+        """
+        OCI provider 플러그인을 미리 한 번 설치하는 메소드 (스택마다 동시에 설치하지 않도록)
+        """
+        version = importlib.metadata.version('pulumi_oci')
+        auto.LocalWorkspace(self.workspace_options()).install_plugin('oci', f'v{version}')
+
+    def select_stack(self, target: StackTarget) -> auto.Stack:
+        """
+        스택을 생성 또는 선택하고 설정을 한 번에 적용하는 메소드
+        """
+        stack = auto.create_or_select_stack(
+            target.name, self.spec.project, self.program, opts=self.workspace_options()
+        )
+        stack.set_all_config(target.config_map())
+        return stack
+
+    def run_stack(self, target: StackTarget, operation: str) -> StackResult:
+        """
+        스택 하나에 대해 preview 또는 up을 실행하는 메소드 (예외는 실패 결과로 변환)
+        """
+        emit = self.printer.for_stack(target.name)
+        started = time.perf_counter()
+        try:
+            stack = self.select_stack(target)
+            if operation == 'preview':
+                preview = stack.preview(on_output=emit, color='never')
+                changes, outputs = preview.change_summary, {}
+            else:
+                up = stack.up(on_output=emit, color='never')
+                changes = up.summary.resource_changes or {}
+                outputs = {key: value.value for key, value in up.outputs.items() if not value.secret}
+        except Exception as e:  # 한 스택의 실패가 다른 스택의 실행을 멈추지 않도록 결과로 기록
+            emit(f'실패: {e}')
+            return StackResult(target.name, operation, False, time.perf_counter() - started, error=str(e))
+        return StackResult(target.name, operation, True, time.perf_counter() - started, dict(changes), outputs)
+
+    def prepare(self) -> None:
+        """
+        실행 전 준비 (플러그인 설치)
+        """
+        self.install_plugins()
+
+    def run(self, operation: str) -> list[StackResult]:
+        """
+        모든 스택을 작업자 풀로 실행하고 플릿 순서대로 결과를 반환하는 메소드
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"지원하지 않는 작업입니다: '{operation}' (사용 가능: {', '.join(OPERATIONS)})")
+        self.prepare()
+        results: dict[str, StackResult] = {}
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='fleet') as executor:
+            futures = {executor.submit(self.run_stack, target, operation): target for target in self.spec.stacks}
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.stack] = result
+                status = '완료' if result.succeeded else '실패'
+                self.printer.for_stack(result.stack)(f'{operation} {status} ({result.duration:.1f}s)')
+        return [results[target.name] for target in self.spec.stacks]
+
+
+class MockFleetDeployer(FleetDeployer):
+    """
+    Pulumi CLI와 클라우드 없이 Pulumi mock으로 각 스택 프로그램을 평가하는 배포기 (CI/로컬 검증용)
+    mock 런타임은 프로세스 전역이므로 프로그램 평가는 한 번에 하나씩 수행한다.
+    """
+
+    _mock_lock = threading.Lock()
+
+    def prepare(self) -> None:
+        """
+        mock 실행은 플러그인이 필요 없음
+        """
+
+    def run_stack(self, target: StackTarget, operation: str) -> StackResult:
+        """
+        스택 설정으로 프로그램을 mock 위에서 평가하는 메소드 (변경 요약은 생성된 리소스 수)
+        """
+        from benchmarks.mocks import run_program
+
+        emit = self.printer.for_stack(target.name)
+        started = time.perf_counter()
+        try:
+            with self._mock_lock:
+                # mock 런타임은 현재 스레드의 이벤트 루프를 사용하므로 작업자 스레드마다 새로 만든다
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+                try:
+                    preview = operation == 'preview'
+                    mocks = run_program(self.program, dict(target.config), stack=target.name, preview=preview)
+                finally:
+                    asyncio.set_event_loop(None)
+                    loop.close()
+        except Exception as e:
+            emit(f'실패: {e}')
+            return StackResult(target.name, operation, False, time.perf_counter() - started, error=str(e))
+        emit(f'리소스 {len(mocks.resources)}개, invoke {len(mocks.calls)}회')
+        return StackResult(
+            target.name, operation, True, time.perf_counter() - started, {'create': len(mocks.resources)}
+        )
+
+
+def format_results(results: Iterable[StackResult]) -> str:
+    """결과 요약 표"""
+    lines = [f'{"stack":<16} {"operation":<9} {"result":<7} {"time(s)":>8}  changes']
+    for result in results:
+        changes = ', '.join(f'{op}={count}' for op, count in sorted(result.changes.items()) if count)
+        lines.append(
+            f'{result.stack:<16} {result.operation:<9} {"ok" if result.succeeded else "FAILED":<7} '
+            f'{result.duration:>8.1f}  {changes or result.error}'
+        )
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('fleet', help='플릿 파일 (JSON)')
+    parser.add_argument('operation', choices=OPERATIONS)
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='동시에 실행할 스택 수')
+    parser.add_argument('--stacks', nargs='*', help='실행할 스택 (기본: 전체)')
+    parser.add_argument('--backend', help='플릿 파일의 backend 대신 사용할 백엔드 URL (예: file://~/.pulumi-fleet)')
+    parser.add_argument('--mock', action='store_true', help='Pulumi mock으로 평가 (CLI/클라우드 호출 없음)')
+    args = parser.parse_args()
+
+    spec = FleetSpec.load(args.fleet).select(args.stacks)
+    if args.backend:
+        spec = FleetSpec(spec.project, _backend_url(args.backend), spec.secrets_provider, spec.stacks)
+    deployer_class = MockFleetDeployer if args.mock else FleetDeployer
+    results = deployer_class(spec, workers=args.workers).run(args.operation)
+
+    print()
+    print(format_results(results))
+    sys.exit(0 if all(result.succeeded for result in results) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,437 @@
+"""
+VCN 흐름 로그 분석기
+OCI Logging에서 내보낸 VCN 흐름 로그(JSON Lines, JSON 배열, `oci logging-search` 결과, .gz 압축)를 스트리밍으로 읽어
+일정 개수씩 NumPy 열 배열로 묶어 집계한다.
+
+- 상위 송수신 쌍: (출발지, 목적지)별 바이트를 고정 크기 Misra-Gries 요약으로 유지 (누적 감소량을 오차 한도로 보고)
+- 거부된 흐름: (출발지, 목적지, 프로토콜, 포트)별 횟수를 같은 방식으로 모으고, 상위 항목을 현재 설정으로 생성되는
+  라우트/보안 규칙(network.reachability)으로 다시 평가하여 어떤 단계/규칙 때문에 막혔는지 매칭한다.
+- 서브넷 쌍별 바이트: 출발/목적 서브넷(VCN 밖은 external, 서브넷 없는 VCN 대역은 vcn-unassigned) 쌍과
+  시간 구간(--window)별 합계
+
+메모리는 배치 크기와 표 크기(--capacity), 시간 구간 수에만 비례하므로 수십 GB 로그도 일정한 메모리로 처리한다.
+VCN 내부 흐름은 양쪽 VNIC가 각각 기록하므로 두 서브넷 모두 흐름 로그가 켜져 있으면 두 번 집계된다.
+집계와 규칙 재평가(network.reachability)는 IPv4 전용이므로, 듀얼 스택 VCN의 IPv6 흐름 레코드는 집계하지 않고
+보고서에 개수만 표시한다.
+
+실행:
+    oci logging-search search-logs --search-query "search \\"<로그 그룹 OCID>\\"" ... > flows.json
+    python -m automation.flow_logs flows.json [more.jsonl.gz ...] [--window 60] [--config key=value ...]
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import re
+import socket
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TextIO
+
+import numpy as np
+
+from network.reachability import EPHEMERAL_PORT, FlowMatrix, NetworkModel, Verdict
+
+BATCH_SIZE = 8192
+DEFAULT_CAPACITY = 4096
+DEFAULT_WINDOW_SECONDS = 60
+READ_CHUNK = 1 << 20
+EXTERNAL = 'external'
+UNASSIGNED = 'vcn-unassigned'
+
+_SEPARATORS = re.compile(r'[\s,\[\]]*')
+
+
+# =============================================================================
+# 레코드 스트림 -> 열 배열 배치
+# =============================================================================
+
+
+def open_log(path: str | Path) -> TextIO:
+    """로그 파일 열기 (.gz는 압축 해제, - 는 표준 입력)"""
+    if str(path) == '-':
+        return sys.stdin
+    if str(path).endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, encoding='utf-8')
+
+
+def iter_json(stream: TextIO) -> Iterator[Any]:
+    """
+    JSON Lines와 JSON 배열을 모두 스트리밍으로 읽는다 (최상위 값 사이의 공백/쉼표/대괄호는 건너뜀)
+    전체 파일을 메모리에 올리지 않고, 덩어리 경계에 걸린 값은 다음 덩어리를 읽은 뒤 다시 파싱한다.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position, eof = '', 0, False
+    while True:
+        position = _SEPARATORS.match(buffer, position).end()
+        if position >= len(buffer) - 1 and not eof:
+            chunk = stream.read(READ_CHUNK)
+            eof = not chunk
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        if position >= len(buffer):
+            return
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except ValueError:
+            if eof:
+                raise
+            chunk = stream.read(READ_CHUNK)
+            eof = not chunk
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        position = end
+        yield value
+
+
+def iter_records(stream: TextIO) -> Iterator[dict[str, Any]]:
+    """흐름 로그 레코드의 `data` 부분 (logging-search 결과/Logging 봉투는 벗겨낸다)"""
+    for value in iter_json(stream):
+        data = value.get('data') if isinstance(value, dict) else None
+        results = data.get('results') if isinstance(data, dict) else None
+        for record in results if isinstance(results, list) else (value,):
+            while isinstance(record, dict) and 'sourceAddress' not in record:
+                record = record.get('logContent') or record.get('data')
+            if isinstance(record, dict):
+                yield record
+
+
+def _ipv4(value: Any) -> int:
+    return int.from_bytes(socket.inet_aton(value), 'big')
+
+
+def _number(value: Any) -> int:
+    return int(value) if value not in (None, '-', '') else 0
+
+
+@dataclass(slots=True)
+class FlowBatch:
+    """흐름 로그 레코드 묶음 (열 배열, 시각은 초)"""
+
+    src: np.ndarray
+    dst: np.ndarray
+    src_port: np.ndarray
+    dst_port: np.ndarray
+    protocol: np.ndarray
+    bytes: np.ndarray
+    packets: np.ndarray
+    start: np.ndarray
+    accepted: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.src)
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple[int, ...]]) -> 'FlowBatch':
+        columns = np.array(rows, dtype=np.int64).reshape(-1, 9).T
+        return cls(*columns[:8], accepted=columns[8].astype(bool))
+
+
+def read_batches(
+    paths: Iterable[str | Path], batch_size: int = BATCH_SIZE, counters: dict[str, int] | None = None
+) -> Iterator[FlowBatch]:
+    """
+    여러 로그 파일의 흐름 레코드를 `batch_size`개씩 열 배열로 묶는다
+    데이터가 없는 레코드(NODATA/SKIPDATA)와 읽을 수 없는 레코드는 건너뛰고 `counters['skipped']`에,
+    IPv6 흐름 레코드는 열 배열(int64)에 담을 수 없으므로 건너뛰고 `counters['ipv6']`에 따로 센다.
+    """
+    counters = counters if counters is not None else {}
+    counters.setdefault('skipped', 0)
+    counters.setdefault('ipv6', 0)
+    rows: list[tuple[int, ...]] = []
+    for path in paths:
+        with open_log(path) as stream:
+            for record in iter_records(stream):
+                if ':' in str(record.get('sourceAddress')) or ':' in str(record.get('destinationAddress')):
+                    counters['ipv6'] += 1
+                    continue
+                try:
+                    rows.append(
+                        (
+                            _ipv4(record['sourceAddress']),
+                            _ipv4(record['destinationAddress']),
+                            _number(record.get('sourcePort')),
+                            _number(record.get('destinationPort')),
+                            _number(record.get('protocol')),
+                            _number(record.get('bytesOut')),
+                            _number(record.get('packets')),
+                            _number(record.get('startTime')) // 1000,
+                            record.get('action') != 'REJECT',
+                        )
+                    )
+                except (OSError, TypeError, ValueError, KeyError):
+                    counters['skipped'] += 1
+                    continue
+                if len(rows) >= batch_size:
+                    yield FlowBatch.from_rows(rows)
+                    rows = []
+    if rows:
+        yield FlowBatch.from_rows(rows)
+
+
+# =============================================================================
+# 고정 크기 집계
+# =============================================================================
+
+
+class HeavyHitters:
+    """
+    정수 키(열 여러 개)별 가중치 합의 상위 항목을 최대 `capacity`개 유지 (병합 가능한 Misra-Gries 요약)
+    배치를 표에 더한 뒤 키가 `capacity`개를 넘으면 (`capacity`+1)번째로 큰 첫 번째 가중치 합을 모든 항목에서 빼고
+    0 이하가 된 항목을 버린다. 뺀 값의 누적을 `error`로 기록하며 다음이 보장된다.
+
+    - 표에 남은 키의 첫 번째 가중치 합은 실제 합 이하이고, 실제 합과의 차이는 `error` 이하
+    - 실제 합이 `error`보다 큰 키는 반드시 표에 있다 (`error` <= 전체 합 / (`capacity` + 1))
+
+    나머지 가중치(패킷 수 등)는 빼지 않으며, 키가 표에 있는 동안 더해진 값(실제 합 이하)이다.
+    """
+
+    def __init__(self, columns: int, weights: int = 1, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.keys = np.empty((0, columns), dtype=np.int64)
+        self.totals = np.empty((0, weights), dtype=np.int64)
+        self.error = 0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, keys: np.ndarray, weights: np.ndarray) -> None:
+        if not len(keys):
+            return
+        keys = np.concatenate([self.keys, keys.reshape(len(keys), -1)])
+        weights = np.concatenate([self.totals, weights.reshape(len(weights), -1)])
+        unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        totals = np.stack(
+            [
+                np.bincount(inverse, weights=weights[:, column], minlength=len(unique))
+                for column in range(weights.shape[1])
+            ],
+            axis=1,
+        ).astype(np.int64)
+        if len(unique) > self.capacity:
+            # (capacity+1)번째로 큰 합만큼 모두 감소: 남는 항목은 최대 capacity개
+            decrement = int(
+                np.partition(totals[:, 0], len(unique) - self.capacity - 1)[len(unique) - self.capacity - 1]
+            )
+            totals[:, 0] -= decrement
+            kept = totals[:, 0] > 0
+            self.error += decrement
+            unique, totals = unique[kept], totals[kept]
+        self.keys, self.totals = unique, totals
+
+    def top(self, count: int) -> list[tuple[tuple[int, ...], tuple[int, ...]]]:
+        """첫 번째 가중치 내림차순 상위 `count`개 (키, 가중치)"""
+        order = np.argsort(-self.totals[:, 0], kind='stable')[:count]
+        return [(tuple(map(int, self.keys[i])), tuple(map(int, self.totals[i]))) for i in order]
+
+
+class SubnetTraffic:
+    """출발/목적 서브넷 쌍과 시간 구간별 바이트 합계"""
+
+    def __init__(self, model: NetworkModel, window: int = DEFAULT_WINDOW_SECONDS):
+        self.model = model
+        self.window = window
+        self.names = [EXTERNAL, UNASSIGNED] + [subnet.role for subnet in model.subnets]
+        self.bytes: dict[tuple[int, int, int], int] = {}
+
+    def _locate(self, addresses: np.ndarray) -> np.ndarray:
+        """`names` 인덱스 (서브넷이면 2부터, VCN 대역 안의 서브넷 밖 주소는 1, VCN 밖은 0)"""
+        start, end, _ = self.model.vcn
+        located = self.model.locate(addresses)
+        return np.where(located >= 0, located + 2, (addresses >= start) & (addresses <= end))
+
+    def add(self, batch: FlowBatch) -> None:
+        size = len(self.names)
+        pair = self._locate(batch.src) * size + self._locate(batch.dst)
+        keys = (batch.start // self.window) * size * size + pair
+        unique, inverse = np.unique(keys, return_inverse=True)
+        totals = np.bincount(inverse, weights=batch.bytes, minlength=len(unique))
+        for key, total in zip(unique.tolist(), totals.tolist(), strict=True):
+            window, pair = divmod(key, size * size)
+            entry = (window * self.window, pair // size, pair % size)
+            self.bytes[entry] = self.bytes.get(entry, 0) + int(total)
+
+    def pairs(self) -> list[tuple[str, str, int, int, int]]:
+        """(출발 서브넷, 목적 서브넷, 전체 바이트, 최대 구간 바이트, 최대 구간 시작 시각) - 전체 바이트 내림차순"""
+        summary: dict[tuple[int, int], list[int]] = {}
+        for (start, src, dst), total in self.bytes.items():
+            entry = summary.setdefault((src, dst), [0, 0, 0])
+            entry[0] += total
+            if total > entry[1]:
+                entry[1], entry[2] = total, start
+        rows = [(self.names[src], self.names[dst], *values) for (src, dst), values in summary.items()]
+        return sorted(rows, key=lambda row: -row[2])
+
+    def rows(self) -> Iterator[tuple[int, str, str, int]]:
+        """(구간 시작 시각, 출발 서브넷, 목적 서브넷, 바이트) - 시각순"""
+        for (start, src, dst), total in sorted(self.bytes.items()):
+            yield start, self.names[src], self.names[dst], total
+
+
+@dataclass
+class FlowLogAnalysis:
+    """흐름 로그 집계 결과"""
+
+    talkers: HeavyHitters
+    rejected: HeavyHitters
+    traffic: SubnetTraffic
+    records: int = 0
+    rejected_records: int = 0
+    bytes: int = 0
+    skipped: int = 0
+    ipv6: int = 0
+
+    @classmethod
+    def create(cls, model: NetworkModel, window: int, capacity: int) -> 'FlowLogAnalysis':
+        return cls(
+            talkers=HeavyHitters(columns=2, weights=2, capacity=capacity),
+            rejected=HeavyHitters(columns=4, weights=1, capacity=capacity),
+            traffic=SubnetTraffic(model, window),
+        )
+
+    def add(self, batch: FlowBatch) -> None:
+        self.records += len(batch)
+        self.bytes += int(batch.bytes.sum())
+        self.talkers.add(np.stack([batch.src, batch.dst], axis=1), np.stack([batch.bytes, batch.packets], axis=1))
+        denied = ~batch.accepted
+        if denied.any():
+            self.rejected_records += int(denied.sum())
+            keys = np.stack([batch.src, batch.dst, batch.protocol, batch.dst_port], axis=1)[denied]
+            self.rejected.add(keys, np.ones(len(keys), dtype=np.int64))
+        self.traffic.add(batch)
+
+    def match_rejected(self, count: int) -> list[tuple[tuple[int, ...], int, str, bool]]:
+        """
+        상위 거부 흐름을 생성된 라우트/보안 규칙으로 재평가: (키, 횟수, 판정 설명, 규칙으로 설명되는지)
+        규칙상 허용되는 흐름은 배포된 규칙이 생성 규칙과 다르거나 다른 계층(OS 방화벽, 네트워크 정책)에서 막힌 것이다.
+        """
+        top = self.rejected.top(count)
+        if not top:
+            return []
+        keys = np.array([key for key, _ in top], dtype=np.int64)
+        protocol = keys[:, 2]
+        icmp = protocol == 1
+        flows = FlowMatrix(
+            src=keys[:, 0],
+            dst=keys[:, 1],
+            protocol=protocol,
+            port=np.where(icmp, 0, keys[:, 3]),
+            src_port=np.where(icmp, 0, EPHEMERAL_PORT),
+        )
+        report = self.traffic.model.evaluate(flows)
+        return [
+            (key, totals[0], report.explain(index), report.verdict[index] != Verdict.ALLOWED)
+            for index, (key, totals) in enumerate(top)
+        ]
+
+
+def analyze(
+    paths: Iterable[str | Path],
+    model: NetworkModel,
+    window: int = DEFAULT_WINDOW_SECONDS,
+    capacity: int = DEFAULT_CAPACITY,
+    batch_size: int = BATCH_SIZE,
+) -> FlowLogAnalysis:
+    analysis = FlowLogAnalysis.create(model, window, capacity)
+    counters: dict[str, int] = {}
+    for batch in read_batches(paths, batch_size, counters):
+        analysis.add(batch)
+    analysis.skipped = counters['skipped']
+    analysis.ipv6 = counters['ipv6']
+    return analysis
+
+
+def load_network_model(config: dict[str, str] | None = None) -> NetworkModel:
+    """스택 설정으로 생성될 네트워크 모델 (설정 값은 Pulumi 런타임에서만 읽을 수 있으므로 mock 안에서 구성)"""
+    from benchmarks.mocks import run_program
+
+    models: list[NetworkModel] = []
+    run_program(lambda: models.append(NetworkModel.from_config()), config or {})
+    return models[0]
+
+
+# =============================================================================
+# 보고서
+# =============================================================================
+
+
+def _address(value: int) -> str:
+    return socket.inet_ntoa(value.to_bytes(4, 'big'))
+
+
+def _size(value: float) -> str:
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if value < 1024 or unit == 'GiB':
+            return f'{value:.1f} {unit}' if unit != 'B' else f'{value:.0f} B'
+        value /= 1024
+    return f'{value:.1f} GiB'
+
+
+def _timestamp(seconds: int) -> str:
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(seconds))
+
+
+def format_report(analysis: FlowLogAnalysis, top: int = 20) -> str:
+    ratio = analysis.rejected_records / analysis.records if analysis.records else 0.0
+    lines = [
+        f'흐름 기록 {analysis.records:,}개 (건너뜀 {analysis.skipped:,}, IPv6 제외 {analysis.ipv6:,}), '
+        f'{_size(analysis.bytes)}, 거부 {ratio:.1%}',
+        '',
+        f'상위 송수신 쌍 (바이트는 하한, 실제와 차이 최대 {_size(analysis.talkers.error)}):',
+    ]
+    for (src, dst), (total, packets) in analysis.talkers.top(top):
+        lines.append(f'  {_address(src):>15} -> {_address(dst):<15} {_size(total):>11} {packets:>12,} packets')
+
+    matched = analysis.match_rejected(top)
+    lines += [
+        '',
+        f'거부된 흐름 상위 {len(matched)}개 (생성 규칙으로 재평가, 횟수는 하한, '
+        f'실제와 차이 최대 {analysis.rejected.error}):',
+    ]
+    for (src, dst, protocol, port), count, explanation, explained in matched:
+        flag = '' if explained else '  [규칙상 허용: 배포된 규칙 불일치 또는 다른 계층에서 차단]'
+        lines.append(
+            f'  {count:>9,} {_address(src):>15} -> {_address(dst):<15} proto {protocol:<3} port {port:<5} '
+            f'{explanation}{flag}'
+        )
+
+    lines += ['', f'서브넷 쌍별 바이트 ({analysis.traffic.window}초 구간):']
+    for src, dst, total, peak, peak_start in analysis.traffic.pairs():
+        lines.append(
+            f'  {src:>14} -> {dst:<14} {_size(total):>11}  최대 {_size(peak):>11} @ {_timestamp(peak_start)} UTC'
+        )
+    return '\n'.join(lines)
+
+
+def write_windows_csv(analysis: FlowLogAnalysis, path: Path) -> None:
+    with open(path, 'w', newline='', encoding='utf-8') as stream:
+        writer = csv.writer(stream)
+        writer.writerow(['window_start', 'src_subnet', 'dst_subnet', 'bytes'])
+        writer.writerows(analysis.traffic.rows())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('logs', nargs='+', help='흐름 로그 파일 (.json, .jsonl, .gz, - 는 표준 입력)')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW_SECONDS, help='서브넷 쌍 집계 구간 (초)')
+    parser.add_argument('--top', type=int, default=20, help='출력할 상위 항목 수')
+    parser.add_argument('--capacity', type=int, default=DEFAULT_CAPACITY, help='상위 항목 집계 표 크기')
+    parser.add_argument('--windows-csv', type=Path, help='구간별 서브넷 쌍 바이트를 CSV로 저장')
+    parser.add_argument('--config', nargs='*', default=[], metavar='KEY=VALUE', help='스택 설정 덮어쓰기')
+    args = parser.parse_args()
+
+    model = load_network_model(dict(item.split('=', 1) for item in args.config))
+    analysis = analyze(args.logs, model, args.window, args.capacity)
+    print(format_report(analysis, args.top))
+    if args.windows_csv:
+        write_windows_csv(analysis, args.windows_csv)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""
+kubeconfig exec 인증 토큰 캐시 헬퍼
+OKE kubeconfig는 kubectl/클라이언트가 API를 호출할 때마다 `oci ce cluster generate-token`을 실행하므로
+호출마다 OCI CLI(Python) 시작 시간(약 1초)이 더해진다. 이 헬퍼는 원래 exec 명령을 감싸서, 받은 ExecCredential을
+만료 직전(`--refresh-before`초 전)까지 파일에 캐시해 두고 그대로 출력한다.
+
+- 동시에 실행된 여러 프로세스는 파일 잠금(flock)으로 토큰 발급을 한 번만 하고 같은 토큰을 공유한다
+  (캐시가 유효하면 잠금 없이 읽는다).
+- 캐시 키는 원래 명령과 OCI CLI 환경 변수(`OCI_CLI_*`, 프로필/인증 방식)의 해시다.
+- 캐시 파일은 토큰을 담으므로 소유자만 읽을 수 있게(0600) 만든다. 만료 시각이 없는 응답은 캐시하지 않는다.
+- POSIX 전용 (fcntl)
+
+스택의 `kubeconfig` 출력은 이 헬퍼를 exec 명령으로 사용한다 (`pip install -e .`로 `oke-kube-token` 설치):
+    users:
+    - user:
+        exec:
+          command: oke-kube-token
+          args: [--, oci, ce, cluster, generate-token, --cluster-id, <cluster_id>, --region, <region>]
+"""
+
+import argparse
+import fcntl
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Mapping, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from cluster.kubeconfig import HELPER_COMMAND
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'oke-infra' / 'tokens'
+DEFAULT_REFRESH_BEFORE_SECONDS = 30
+# 캐시 키에 포함하는 환경 변수 접두사 (프로필/인증 방식이 다르면 다른 토큰)
+KEY_ENV_PREFIXES = ('OCI_CLI_',)
+
+TokenSource = Callable[[Sequence[str]], dict[str, Any]]
+
+
+def run_command(command: Sequence[str]) -> dict[str, Any]:
+    """원래 exec 명령을 실행하여 ExecCredential을 받음 (stderr/stdin은 그대로 연결)"""
+    try:
+        result = subprocess.run(list(command), stdout=subprocess.PIPE, text=True, check=False)
+    except OSError as e:
+        raise RuntimeError(f'토큰 명령을 실행할 수 없습니다: {command[0]} ({e})') from e
+    if result.returncode:
+        raise RuntimeError(f'토큰 명령이 실패했습니다 (종료 코드 {result.returncode}): {" ".join(command[:4])}')
+    try:
+        credential = json.loads(result.stdout)
+    except ValueError as e:
+        raise RuntimeError(f'토큰 명령의 출력이 ExecCredential JSON이 아닙니다: {e}') from e
+    if not isinstance(credential, dict) or not (credential.get('status') or {}).get('token'):
+        raise RuntimeError('토큰 명령의 출력에 status.token이 없습니다.')
+    return credential
+
+
+def expires_at(credential: Mapping[str, Any]) -> float | None:
+    """ExecCredential의 만료 시각 (epoch 초, 없으면 None)"""
+    timestamp = (credential.get('status') or {}).get('expirationTimestamp')
+    if not timestamp:
+        return None
+    expiration = datetime.fromisoformat(timestamp)
+    if expiration.tzinfo is None:
+        expiration = expiration.replace(tzinfo=UTC)
+    return expiration.timestamp()
+
+
+class TokenCache:
+    """
+    exec 명령별 ExecCredential 파일 캐시 (명령마다 JSON 파일과 잠금 파일 하나)
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = DEFAULT_CACHE_DIR,
+        refresh_before: float = DEFAULT_REFRESH_BEFORE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.directory = Path(directory)
+        self.refresh_before = refresh_before
+        self.clock = clock
+
+    def path(self, command: Sequence[str], environ: Mapping[str, str]) -> Path:
+        env = sorted((key, value) for key, value in environ.items() if key.startswith(KEY_ENV_PREFIXES))
+        key = hashlib.sha256(json.dumps([list(command), env]).encode()).hexdigest()[:32]
+        return self.directory / f'{key}.json'
+
+    def load(self, path: Path) -> dict[str, Any] | None:
+        """만료 `refresh_before`초 전까지 유효한 캐시 (없거나 손상되었거나 곧 만료되면 None)"""
+        try:
+            credential = json.loads(path.read_text())
+            expiration = expires_at(credential)
+        except (OSError, ValueError, TypeError, AttributeError):
+            return None
+        if expiration is None or expiration - self.refresh_before <= self.clock():
+            return None
+        return credential
+
+    def save(self, path: Path, credential: Mapping[str, Any]) -> None:
+        """캐시 기록 (소유자 전용 임시 파일에 쓴 뒤 교체하여 잠금 없이 읽는 프로세스도 완전한 파일만 본다)"""
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as file:
+            json.dump(credential, file)
+        os.replace(tmp_path, path)
+
+    def get(
+        self, command: Sequence[str], source: TokenSource = run_command, environ: Mapping[str, str] = os.environ
+    ) -> dict[str, Any]:
+        """
+        유효한 캐시가 있으면 그대로, 없으면 잠금을 잡고 다시 확인한 뒤 `source`로 발급받아 캐시한 ExecCredential
+        """
+        path = self.path(command, environ)
+        credential = self.load(path)
+        if credential is not None:
+            return credential
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(path.with_suffix('.lock'), 'a') as lock:
+            # 잠금은 파일을 닫을 때 해제된다
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            # 기다리는 동안 다른 프로세스가 발급했으면 그 토큰을 사용
+            credential = self.load(path)
+            if credential is not None:
+                return credential
+            credential = source(command)
+            if expires_at(credential) is not None:
+                self.save(path, credential)
+        return credential
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog=HELPER_COMMAND, description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR, help='토큰 캐시 디렉터리')
+    parser.add_argument(
+        '--refresh-before',
+        type=float,
+        default=DEFAULT_REFRESH_BEFORE_SECONDS,
+        help='만료 몇 초 전에 새로 발급할지',
+    )
+    parser.add_argument('command', nargs=argparse.REMAINDER, help='-- 뒤에 원래 exec 명령과 인자')
+    args = parser.parse_args(argv)
+
+    command = args.command[1:] if args.command[:1] == ['--'] else args.command
+    if not command:
+        parser.error('-- 뒤에 토큰을 발급하는 명령을 지정하세요 (예: -- oci ce cluster generate-token ...)')
+    try:
+        credential = TokenCache(args.cache_dir, args.refresh_before).get(command)
+    except (RuntimeError, ValueError) as e:
+        print(f'{HELPER_COMMAND}: {e}', file=sys.stderr)
+        sys.exit(1)
+    json.dump(credential, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+Cluster Autoscaler 애드온 검사
+Pulumi mock 위에서 `cluster_autoscaler` 설정별로 프로그램을 평가하여 `ClusterAutoscaler` Addon의 `configurations`와
+클러스터 타입을 확인한다. 불일치가 있으면 종료 코드 1.
+
+- `nodes`: 오토스케일링 노드 풀(min_size != max_size)마다 `min:max:<노드 풀 OCID>` (고정 크기 노드 풀 제외, 선언 순서)
+- 축소 지연/불필요 시간/사용률 임계값/프로비저닝 시간 키가 설정(또는 기본값)과 같은지
+- 애드온을 켜면 클러스터 type이 ENHANCED_CLUSTER, 끄면 애드온 없이 BASIC_CLUSTER
+- 오토스케일링 노드 풀이 없으면 애드온을 만들지 않고, BASIC_CLUSTER와 함께 켜면 거부
+
+실행:
+    python -m benchmarks.autoscaler_check
+"""
+
+import argparse
+import json
+import sys
+from typing import Any
+
+from benchmarks.mocks import OCIMocks, evaluate_program
+
+CLUSTER_TYPE = 'oci:ContainerEngine/cluster:Cluster'
+NODE_POOL_TYPE = 'oci:ContainerEngine/nodePool:NodePool'
+ADDON_TYPE = 'oci:ContainerEngine/addon:Addon'
+# 여러 노드 풀의 파드가 들어가도록 파드 서브넷을 넓힌다
+POD_SUBNET_CIDR = '10.0.64.0/20'
+
+POOLS = [
+    {'name': 'system', 'size': 2},
+    {'name': 'apps', 'size': 2, 'min_size': 1, 'max_size': 5},
+    {'name': 'batch', 'size': 0, 'min_size': 0, 'max_size': 4},
+]
+FIXED_POOLS = [{'name': 'system', 'size': 2}, {'name': 'apps', 'size': 3}]
+TUNED = {
+    'enabled': True,
+    'auth_type': 'workload',
+    'scale_down_delay_after_add': '5m',
+    'scale_down_unneeded_time': '3m',
+    'scale_down_utilization_threshold': 0.65,
+    'max_node_provision_time': '20m',
+}
+# 애드온 configurations 기대값 (`nodes` 제외)
+DEFAULT_KEYS = {
+    'authType': 'instance',
+    'scaleDownDelayAfterAdd': '10m',
+    'scaleDownUnneededTime': '10m',
+    'scaleDownUtilizationThreshold': '0.5',
+    'maxNodeProvisionTime': '15m',
+    'balanceSimilarNodeGroups': 'true',
+}
+TUNED_KEYS = {
+    **DEFAULT_KEYS,
+    'authType': 'workload',
+    'scaleDownDelayAfterAdd': '5m',
+    'scaleDownUnneededTime': '3m',
+    'scaleDownUtilizationThreshold': '0.65',
+    'maxNodeProvisionTime': '20m',
+}
+
+
+def evaluate(pools: list[dict[str, Any]], autoscaler: dict[str, Any], **config: str) -> OCIMocks:
+    return evaluate_program(
+        {
+            'pod_subnet_cidr': POD_SUBNET_CIDR,
+            'node_pools': json.dumps(pools),
+            'cluster_autoscaler': json.dumps(autoscaler),
+            **config,
+        },
+    )
+
+
+def expected_nodes(mocks: OCIMocks, pools: list[dict[str, Any]]) -> str:
+    """오토스케일링 노드 풀마다 `min:max:<노드 풀 OCID>` (mock 리소스 ID는 '<리소스 이름>-id')"""
+    pool_ids = {
+        resource.inputs['name']: f'{resource.name}-id'
+        for resource in mocks.resources
+        if resource.typ == NODE_POOL_TYPE
+    }
+    return ','.join(
+        f'{pool["min_size"]}:{pool["max_size"]}:{pool_ids.get(pool["name"])}' for pool in pools if 'min_size' in pool
+    )
+
+
+def check_cluster(mocks: OCIMocks, cluster_type: str, addons: int) -> list[str]:
+    problems = []
+    clusters = [resource for resource in mocks.resources if resource.typ == CLUSTER_TYPE]
+    types = [cluster.inputs.get('type') for cluster in clusters]
+    if types != [cluster_type]:
+        problems.append(f'cluster types {types}, expected [{cluster_type}]')
+    found = [resource for resource in mocks.resources if resource.typ == ADDON_TYPE]
+    if len(found) != addons:
+        problems.append(f'{len(found)} autoscaler addons, expected {addons}')
+    return problems
+
+
+def check_addon(pools: list[dict[str, Any]], autoscaler: dict[str, Any], keys: dict[str, str]) -> list[str]:
+    mocks = evaluate(pools, autoscaler)
+    problems = check_cluster(mocks, 'ENHANCED_CLUSTER', 1)
+    addons = [resource for resource in mocks.resources if resource.typ == ADDON_TYPE]
+    if not addons:
+        return problems
+    addon = addons[0].inputs
+    cluster_ids = [f'{resource.name}-id' for resource in mocks.resources if resource.typ == CLUSTER_TYPE]
+    if (addon['addonName'], [addon['clusterId']]) != ('ClusterAutoscaler', cluster_ids):
+        problems.append(f'addon {addon["addonName"]} on {addon["clusterId"]}')
+    configurations = {item['key']: item['value'] for item in addon['configurations']}
+    if len(configurations) != len(addon['configurations']):
+        problems.append('duplicate configuration keys')
+    expected = {**keys, 'nodes': expected_nodes(mocks, pools)}
+    for key in sorted(expected.keys() | configurations.keys()):
+        if configurations.get(key) != expected.get(key):
+            problems.append(f'{key}: {configurations.get(key)!r}, expected {expected.get(key)!r}')
+    return problems
+
+
+def check_disabled() -> list[str]:
+    return check_cluster(evaluate(POOLS, {}), 'BASIC_CLUSTER', 0)
+
+
+def check_no_autoscaled_pool() -> list[str]:
+    return check_cluster(evaluate(FIXED_POOLS, {'enabled': True}), 'ENHANCED_CLUSTER', 0)
+
+
+def check_basic_cluster_rejected() -> list[str]:
+    try:
+        evaluate(POOLS, {'enabled': True}, cluster_type='BASIC_CLUSTER')
+    except ValueError:
+        return []
+    return ['autoscaler accepted on BASIC_CLUSTER']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    checks = {
+        'default settings': lambda: check_addon(POOLS, {'enabled': True}, DEFAULT_KEYS),
+        'tuned settings': lambda: check_addon(POOLS, TUNED, TUNED_KEYS),
+        'disabled: no addon, BASIC_CLUSTER': check_disabled,
+        'no autoscaled pool: no addon': check_no_autoscaled_pool,
+        'BASIC_CLUSTER rejected': check_basic_cluster_rejected,
+    }
+    failures = 0
+    for name, check in checks.items():
+        problems = check()
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems:
+            print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
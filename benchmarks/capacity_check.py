@@ -0,0 +1,174 @@
+"""
+워크로드 기반 용량 계획 검사
+- 빈 패킹: 무작위 파드 묶음마다 벡터화한 `pack_nodes` 결과가 파드를 하나씩 배치하는 단순 First-Fit-Decreasing과 같은지
+- 노드당 파드 수 한도: 작은 파드가 많을 때 노드 수가 `max_pods_per_node`로 결정되는지
+- 목표 선택: `plan_capacity`가 하한 가지치기 없이 모든 후보를 패킹한 최적값과 같은 계획을 고르는지 (cost, nodes)
+- 프로그램: Pulumi mock 위에서 워크로드 프로필로 만든 노드 풀이 노드 풀의 maxPodsPerNode로 모든 파드를 수용하는지
+불일치가 있으면 종료 코드 1.
+
+실행:
+    python -m benchmarks.capacity_check --seeds 200
+"""
+
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from benchmarks.mocks import evaluate_program
+from cluster.capacity import (
+    DEFAULT_MEMORY_RATIOS,
+    DEFAULT_OCPU_OPTIONS,
+    FLEX_SHAPES,
+    PodRequest,
+    _group_pods,
+    kube_reserved,
+    pack_nodes,
+    plan_capacity,
+)
+from cluster.pod_network import max_pods_for_shape
+
+NODE_POOL_TYPE = 'oci:ContainerEngine/nodePool:NodePool'
+SHAPES = ('VM.Standard.A1.Flex', 'VM.Standard.E4.Flex')
+
+
+def reference_pack(pods: list[PodRequest], node_cpu: int, node_memory: int, max_pods: int) -> int | None:
+    """파드를 하나씩 첫 번째로 들어가는 노드에 넣는 First-Fit-Decreasing (`pack_nodes`와 같은 순서)"""
+    cpu, memory, replicas = _group_pods(pods)
+    if len(cpu) and (cpu.max() > node_cpu or memory.max() > node_memory):
+        return None
+    order = np.argsort(-np.maximum(cpu / node_cpu, memory / node_memory), kind='stable')
+    nodes: list[list[int]] = []
+    for index in order:
+        for _ in range(int(replicas[index])):
+            for node in nodes:
+                if node[0] >= cpu[index] and node[1] >= memory[index] and node[2] > 0:
+                    break
+            else:
+                node = [node_cpu, node_memory, max_pods]
+                nodes.append(node)
+            node[0] -= int(cpu[index])
+            node[1] -= int(memory[index])
+            node[2] -= 1
+    return len(nodes)
+
+
+def random_pods(rng: np.random.Generator) -> list[PodRequest]:
+    return [
+        PodRequest(
+            f'pod{i}',
+            int(rng.choice([50, 100, 250, 500, 1000, 2000])),
+            int(rng.choice([64, 128, 512, 1024, 4096])),
+            int(rng.integers(1, 60)),
+        )
+        for i in range(int(rng.integers(1, 8)))
+    ]
+
+
+def check_packing(seeds: int) -> list[str]:
+    problems = []
+    for seed in range(seeds):
+        rng = np.random.default_rng(seed)
+        pods = random_pods(rng)
+        node_cpu, node_memory = int(rng.integers(1000, 8000)), int(rng.integers(2048, 32768))
+        max_pods = int(rng.integers(4, 111))
+        expected = reference_pack(pods, node_cpu, node_memory, max_pods)
+        actual = pack_nodes(*_group_pods(pods), node_cpu, node_memory, max_pods)
+        if actual != expected:
+            problems.append(f'seed {seed}: pack_nodes {actual} != reference {expected}')
+    return problems
+
+
+def check_pod_limit() -> list[str]:
+    """작은 파드 300개: 노드당 31개 한도면 최소 10노드, 2 OCPU 노드는 110을 요청해도 VNIC 한도(31)로 제한"""
+    pods = [PodRequest('small', 50, 64, 300)]
+    problems = []
+    plan = plan_capacity(pods, max_pods_per_node=31)
+    if plan.node_count * plan.max_pods_per_node < 300:
+        problems.append(f'{plan.node_count} nodes x {plan.max_pods_per_node} pods cannot hold 300 pods')
+    if plan.node_count < 10:
+        problems.append(f'31 pods per node needs at least 10 nodes, planned {plan.node_count}')
+    # 2 OCPU 노드는 VNIC 한도가 31이므로 110을 요청해도 31로 제한된다
+    limited = plan_capacity(pods, max_pods_per_node=110, ocpu_options=(2,))
+    if limited.max_pods_per_node != max_pods_for_shape(2) or limited.node_count < 10:
+        problems.append(f'2 OCPU plan used {limited.max_pods_per_node} pods per node x {limited.node_count} nodes')
+    return problems
+
+
+def exhaustive_plan(pods: list[PodRequest], objective: str, max_pods_per_node: int) -> tuple[float, float]:
+    """가지치기 없이 모든 후보를 패킹한 최적 점수"""
+    grouped = _group_pods(pods)
+    best = None
+    for name in SHAPES:
+        shape = FLEX_SHAPES[name]
+        for ocpus in DEFAULT_OCPU_OPTIONS:
+            if not shape.min_ocpus <= ocpus <= shape.max_ocpus:
+                continue
+            for memory_gbs in shape.memory_options(ocpus, DEFAULT_MEMORY_RATIOS):
+                reserved_cpu, reserved_memory = kube_reserved(ocpus * shape.vcpus_per_ocpu, memory_gbs * 1024)
+                node_cpu = ocpus * shape.vcpus_per_ocpu * 1000 - reserved_cpu
+                node_memory = memory_gbs * 1024 - reserved_memory
+                max_pods = min(max_pods_per_node, max_pods_for_shape(ocpus))
+                packed = pack_nodes(*grouped, node_cpu, node_memory, max_pods)
+                if packed is None:
+                    continue
+                nodes = max(packed, 1)
+                cost = round(nodes * shape.hourly_cost(ocpus, memory_gbs), 4)
+                score = (cost, nodes) if objective == 'cost' else (nodes, cost)
+                best = score if best is None else min(best, score)
+    return best
+
+
+def check_objectives(seeds: int) -> list[str]:
+    problems = []
+    for seed in range(seeds):
+        pods = random_pods(np.random.default_rng(seed))
+        for objective in ('cost', 'nodes'):
+            plan = plan_capacity(pods, SHAPES, objective, max_pods_per_node=31)
+            score = (plan.hourly_cost, plan.node_count) if objective == 'cost' else (plan.node_count, plan.hourly_cost)
+            expected = exhaustive_plan(pods, objective, 31)
+            if score != expected:
+                problems.append(f'seed {seed} {objective}: planned {score}, exhaustive best {expected}')
+        cheapest = plan_capacity(pods, SHAPES, 'cost', max_pods_per_node=31)
+        fewest = plan_capacity(pods, SHAPES, 'nodes', max_pods_per_node=31)
+        if fewest.node_count > cheapest.node_count or cheapest.hourly_cost > fewest.hourly_cost:
+            problems.append(f'seed {seed}: cost plan {cheapest} and nodes plan {fewest} are not ordered')
+    return problems
+
+
+def check_program() -> list[str]:
+    """워크로드 프로필로 만든 노드 풀의 노드 수 x maxPodsPerNode가 모든 파드를 수용하는지"""
+    profile = [{'name': 'small', 'cpu': '50m', 'memory': '64Mi', 'replicas': 300}]
+    # 노드가 많아지므로 노드 서브넷과 분리한 파드 서브넷을 사용
+    mocks = evaluate_program({'workload_profile': json.dumps(profile), 'pod_subnet_cidr': '10.0.128.0/18'})
+    pool = next(resource for resource in mocks.resources if resource.typ == NODE_POOL_TYPE)
+    details = pool.inputs['nodeConfigDetails']
+    slots = details['size'] * details['nodePoolPodNetworkOptionDetails']['maxPodsPerNode']
+    return [] if slots >= 300 else [f'node pool holds {slots} pods, profile has 300']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seeds', type=int, default=200, help='무작위 워크로드 수')
+    args = parser.parse_args()
+
+    checks = {
+        'packing matches reference FFD': lambda: check_packing(args.seeds),
+        'pods per node limit': check_pod_limit,
+        'objective choice matches exhaustive search': lambda: check_objectives(args.seeds // 4),
+        'program node pool holds the workload': check_program,
+    }
+    failures = 0
+    for name, check in checks.items():
+        problems = check()
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems[:10]:
+            print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+CIDR 겹침 검사 스케일링 벤치마크
+정렬 구간 인덱스(`network.cidr.CidrIndex`)와 기존 방식(ipaddress 쌍별 비교)을 10 ~ 100k 프리픽스에서 비교한다.
+
+실행: python -m benchmarks.cidr_bench
+"""
+
+import argparse
+import ipaddress
+import random
+import time
+
+from network.cidr import CidrIndex
+
+SCALES = (10, 100, 1_000, 10_000, 100_000)
+PAIRWISE_LIMIT = 2_000  # 쌍별 비교는 O(n²)이므로 이 이하에서만 측정
+
+
+def make_prefixes(count: int, seed: int = 42) -> list[tuple[str, str]]:
+    """10.0.0.0/8 안의 무작위 /20 ~ /28 프리픽스 (여러 스택/VCN의 서브넷을 흉내)"""
+    rng = random.Random(seed)
+    prefixes = []
+    for i in range(count):
+        prefixlen = rng.randint(20, 28)
+        host_bits = 32 - prefixlen
+        start = (10 << 24) | (rng.getrandbits(prefixlen - 8) << host_bits)
+        prefixes.append((f'stack-{i // 8}/subnet-{i % 8}', str(ipaddress.IPv4Network((start, prefixlen)))))
+    return prefixes
+
+
+def index_overlaps(prefixes: list[tuple[str, str]]) -> int:
+    return len(CidrIndex(prefixes).find_overlaps())
+
+
+def pairwise_overlaps(prefixes: list[tuple[str, str]]) -> int:
+    """기존 validate_cidr_blocks와 같은 O(n²) 비교"""
+    networks = [ipaddress.IPv4Network(cidr) for _, cidr in prefixes]
+    count = 0
+    for i, first in enumerate(networks):
+        for second in networks[i + 1 :]:
+            if first.overlaps(second):
+                count += 1
+    return count
+
+
+def timed(func, prefixes: list[tuple[str, str]]) -> tuple[float, int]:
+    started = time.perf_counter()
+    result = func(prefixes)
+    return time.perf_counter() - started, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=int, nargs='+', default=list(SCALES))
+    args = parser.parse_args()
+
+    print(f'{"prefixes":>9} {"overlaps":>9} {"index(s)":>10} {"pairwise(s)":>12}')
+    for count in args.scales:
+        prefixes = make_prefixes(count)
+        index_time, overlaps = timed(index_overlaps, prefixes)
+        if count <= PAIRWISE_LIMIT:
+            pairwise_time, pairwise = timed(pairwise_overlaps, prefixes)
+            assert pairwise == overlaps, f'겹침 수 불일치: index={overlaps}, pairwise={pairwise}'
+            pairwise_column = f'{pairwise_time:>12.4f}'
+        else:
+            pairwise_column = f'{"skipped":>12}'
+        print(f'{count:>9} {overlaps:>9} {index_time:>10.4f} {pairwise_column}')
+
+
+if __name__ == '__main__':
+    main()
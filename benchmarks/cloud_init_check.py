@@ -0,0 +1,104 @@
+"""
+노드 성능 프로필 cloud-init 골든 파일 검사
+프로필별로 렌더링한 cloud-init 스크립트를 `benchmarks/golden/cloud_init/*.sh`와 비교하고 `bash -n`으로 문법을 확인한다.
+잘못된 프로필 설정이 검증에서 거부되는지도 확인한다. 클라우드나 Pulumi 호출 없이 실행되며, 불일치가 있으면 종료 코드 1.
+렌더러를 의도적으로 바꾼 경우 `--update`로 골든 파일을 다시 쓰고 diff를 리뷰한다.
+
+실행:
+    python -m benchmarks.cloud_init_check
+    python -m benchmarks.cloud_init_check --update
+"""
+
+import argparse
+import difflib
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from cluster.performance import PerformanceProfile, encode_user_data, parse_performance_profiles, render_user_data
+
+GOLDEN_DIR = Path(__file__).parent / 'golden' / 'cloud_init'
+TAINTS = ('dedicated=latency:NoSchedule',)
+CUSTOM_PROFILES = {
+    'latency-hp': {'base': 'low-latency', 'hugepages_2mi': 1024, 'sysctls': {'net.core.somaxconn': 65535}},
+}
+# 골든 파일 이름 -> (프로필 이름, taint, 루트 파일 시스템 확장 여부)
+CASES = {
+    'taints-only': (None, TAINTS, False),
+    'grow-root-fs': (None, (), True),
+    'throughput': ('throughput', (), False),
+    'low-latency': ('low-latency', TAINTS, False),
+    'batch': ('batch', (), False),
+    'latency-hp': ('latency-hp', TAINTS, False),
+}
+# 검증에서 거부되어야 하는 프로필 설정
+INVALID = {
+    'static without reserved cpu': {'cpu_manager_policy': 'static'},
+    'unknown topology policy': {'topology_manager_policy': 'numa'},
+    'shell in sysctl value': {'sysctls': {'net.core.somaxconn': '1; reboot'}},
+    'hugepages via sysctl': {'sysctls': {'vm.nr_hugepages': '128'}},
+    'managed kubelet flag': {'kubelet_args': ['--cpu-manager-policy=static']},
+    'bad reserved quantity': {'kube_reserved': {'memory': '1GB'}},
+    'unknown thp mode': {'transparent_hugepages': 'off'},
+}
+
+
+def render(profiles: dict[str, PerformanceProfile], profile: str | None, taints: tuple[str, ...], grow: bool) -> str:
+    script = render_user_data(profiles[profile] if profile else None, taints, grow)
+    encode_user_data(script)
+    return script
+
+
+def check_syntax(path: Path) -> str | None:
+    """bash -n 오류 메시지 (bash가 없으면 건너뜀)"""
+    if not shutil.which('bash'):
+        return None
+    result = subprocess.run(['bash', '-n', str(path)], capture_output=True, text=True, check=False)
+    return result.stderr.strip() or None
+
+
+def check_invalid(raw: dict[str, Any]) -> bool:
+    try:
+        PerformanceProfile.from_dict('invalid', raw, PerformanceProfile('invalid'))
+    except ValueError:
+        return True
+    return False
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--update', action='store_true', help='렌더링 결과로 골든 파일을 다시 쓴다')
+    args = parser.parse_args()
+
+    profiles = parse_performance_profiles(CUSTOM_PROFILES)
+    failures = 0
+    GOLDEN_DIR.mkdir(parents=True, exist_ok=True)
+    for name, (profile, taints, grow) in CASES.items():
+        path = GOLDEN_DIR / f'{name}.sh'
+        script = render(profiles, profile, taints, grow)
+        if args.update:
+            path.write_text(script, encoding='utf-8')
+        expected = path.read_text(encoding='utf-8') if path.exists() else ''
+        problems = list(
+            difflib.unified_diff(expected.splitlines(), script.splitlines(), str(path), 'rendered', lineterm='')
+        )
+        error = check_syntax(path) if path.exists() else f'{path} 없음 (--update로 생성)'
+        if error:
+            problems.append(error)
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems:
+            print(f'      {problem}')
+
+    for name, raw in INVALID.items():
+        rejected = check_invalid(raw)
+        failures += not rejected
+        print(f'{"ok" if rejected else "FAIL":<5} rejects {name}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""
+Pulumi 프로그램 콜드 스타트 검사 및 import 시간 프로파일
+새 인터프리터에서 `__main__.py`를 import하고 Pulumi mock 위에서 `main()`을 한 번 평가하는 시간을 측정하여
+예산을 넘으면 종료 코드 1. `pulumi preview`마다 반복되는 import 비용이 다시 늘어나지 않도록 다음도 확인한다.
+
+- 로드된 pulumi_oci 하위 패키지가 실제로 쓰는 패키지(core, containerengine, 흐름 로그 사용 시 logging)뿐인지
+- 용량 계획 전용 모듈(numpy)이 기본 설정에서 로드되지 않는지
+
+`-X importtime` 실행 한 번으로 패키지별 self 시간과 누적 시간이 큰 모듈을 `-X importtime` 형식으로 출력한다.
+(provider 하위 패키지는 처음 접근할 때 로드되므로 평가 중의 import도 포함된다)
+
+실행:
+    python -m benchmarks.cold_start --budget 2.5
+    python -m benchmarks.cold_start --runs 1 --budget 0 --top 40   # 프로파일만
+    python -m benchmarks.cold_start --set flow_logs=true
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BUDGET_SECONDS = 2.5
+DEFAULT_RUNS = 5
+LOCAL_PACKAGES = ('__main__', 'config', 'tracing', 'network', 'cluster', 'automation', 'benchmarks', 'oke_program')
+# 기본 설정에서 로드되면 안 되는 모듈 (필요할 때만 함수 안에서 import, 토큰 헬퍼는 프로그램과 별도 프로세스)
+LAZY_MODULES = ('numpy', 'automation.kube_token')
+
+# 새 인터프리터에서 실행하는 측정 코드 (argv[1]: 설정 JSON, 결과는 stdout 마지막 줄 JSON)
+CHILD = """
+import importlib.util, json, sys, time
+started = time.perf_counter()
+spec = importlib.util.spec_from_file_location('oke_program', 'PROJECT_ROOT/__main__.py')
+program = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(program)
+imported = time.perf_counter()
+from benchmarks.mocks import run_program
+run_program(program.main, json.loads(sys.argv[1]))
+evaluated = time.perf_counter()
+print(json.dumps({
+    'import': imported - started,
+    'evaluate': evaluated - imported,
+    'provider_packages': sorted(
+        {name.split('.')[1] for name in sys.modules if name.startswith('pulumi_oci.') and name.count('.') >= 2}
+    ),
+    'lazy_modules': [name for name in LAZY_MODULES if name in sys.modules],
+}))
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class ColdStart:
+    """새 인터프리터 한 번의 측정 결과 (초)"""
+
+    wall: float
+    imports: float
+    evaluate: float
+    provider_packages: tuple[str, ...]
+    lazy_modules: tuple[str, ...]
+    importtime: str = ''
+
+
+def run_child(config: dict[str, str], importtime: bool = False) -> ColdStart:
+    code = CHILD.replace('PROJECT_ROOT', str(PROJECT_ROOT)).replace('LAZY_MODULES', repr(LAZY_MODULES))
+    command = [sys.executable, *(['-X', 'importtime'] if importtime else []), '-c', code, json.dumps(config)]
+    started = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True, cwd=PROJECT_ROOT, check=False)
+    wall = time.perf_counter() - started
+    if result.returncode:
+        raise RuntimeError(f'프로그램 평가 실패:\n{result.stderr[-2000:]}')
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return ColdStart(
+        wall,
+        report['import'],
+        report['evaluate'],
+        tuple(report['provider_packages']),
+        tuple(report['lazy_modules']),
+        result.stderr if importtime else '',
+    )
+
+
+def parse_importtime(stderr: str) -> list[tuple[int, int, str]]:
+    """`-X importtime` 출력의 (self us, cumulative us, 들여쓴 모듈 이름) 목록"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix('import time:').split('|', 2)
+        entries.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return entries
+
+
+def _group(module: str) -> str:
+    """패키지별 집계 키 (pulumi_oci는 하위 패키지, 이 저장소 모듈은 local)"""
+    parts = module.split('.')
+    if parts[0] == 'pulumi_oci' and len(parts) > 1:
+        return f'pulumi_oci.{parts[1]}'
+    return 'local' if parts[0] in LOCAL_PACKAGES else parts[0]
+
+
+def format_profile(entries: list[tuple[int, int, str]], top: int) -> str:
+    total = sum(self_us for self_us, _, _ in entries) or 1
+    groups: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+    for self_us, _, name in entries:
+        group = groups[_group(name.strip())]
+        group[0] += self_us
+        group[1] += 1
+    lines = [f'{"package":<28} {"modules":>8} {"self(ms)":>9} {"share":>6}']
+    for name, (self_us, count) in sorted(groups.items(), key=lambda item: -item[1][0])[:top]:
+        lines.append(f'{name:<28} {count:>8} {self_us / 1000:>9.1f} {self_us / total:>6.1%}')
+    lines += ['', 'import time: self [us] | cumulative | imported package (largest cumulative)']
+    for self_us, cumulative_us, name in sorted(entries, key=lambda entry: -entry[1])[:top]:
+        lines.append(f'import time: {self_us:>9} | {cumulative_us:>10} | {name}')
+    return '\n'.join(lines)
+
+
+def check(sample: ColdStart, config: dict[str, str]) -> list[str]:
+    """로드되면 안 되는 모듈 검사"""
+    expected = {'core', 'containerengine'} | ({'logging'} if config.get('flow_logs') == 'true' else set())
+    problems = []
+    unexpected = sorted(set(sample.provider_packages) - expected)
+    if unexpected:
+        problems.append(f'unexpected pulumi_oci packages loaded: {", ".join(unexpected)}')
+    if sample.lazy_modules:
+        problems.append(f'lazy modules loaded at cold start: {", ".join(sample.lazy_modules)}')
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--budget', type=float, default=DEFAULT_BUDGET_SECONDS, help='콜드 스타트 예산 (초, 0은 검사 안 함)'
+    )
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help='측정 횟수 (중앙값 사용)')
+    parser.add_argument('--top', type=int, default=20, help='출력할 패키지/모듈 수')
+    parser.add_argument('--set', dest='settings', action='append', default=[], help='설정 (key=value, 반복 가능)')
+    args = parser.parse_args()
+
+    config = dict(setting.split('=', 1) for setting in args.settings)
+    profile = run_child(config, importtime=True)
+    print(format_profile(parse_importtime(profile.importtime), args.top))
+    # -X importtime은 측정 자체가 느리므로 시간은 별도 실행으로 잰다
+    samples = [run_child(config) for _ in range(max(1, args.runs))]
+    wall = statistics.median(sample.wall for sample in samples)
+    print()
+    print(f'{"":<10} {"wall(s)":>8} {"import(s)":>10} {"evaluate(s)":>12}')
+    print(
+        f'{"median":<10} {wall:>8.3f} {statistics.median(sample.imports for sample in samples):>10.3f} '
+        f'{statistics.median(sample.evaluate for sample in samples):>12.3f}'
+    )
+    print(f'provider packages: {", ".join(profile.provider_packages)}')
+
+    problems = check(profile, config)
+    if args.budget and wall > args.budget:
+        problems.append(f'cold start {wall:.3f}s exceeds budget {args.budget:.3f}s')
+    for problem in problems:
+        print(f'FAIL  {problem}')
+    if problems:
+        sys.exit(1)
+    print('ok')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+설정 조회 마이크로 벤치마크
+config에서 읽는 노드 풀/서브넷 수가 늘어날 때 프로그램 평가 시간을 비교한다.
+
+- snapshot: `config.get_config()` 스냅샷 속성 조회 (현재 방식)
+- per-access: 속성마다 `pulumi.Config().get()` 호출 + 리전 테이블 재생성 (기존 방식)
+
+실행: python -m benchmarks.config_bench
+"""
+
+import argparse
+import dataclasses
+import time
+
+import pulumi
+import pulumi_oci as oci
+
+import config as cfg
+from benchmarks.mocks import run_program
+
+SCALES = (1, 10, 100, 1000)
+
+
+def _legacy_get(key: str, default: str) -> str:
+    """기존 OCIConfig 프로퍼티와 같은 방식의 조회"""
+    return pulumi.Config().get(key) or default
+
+
+def _legacy_region_value(field: str) -> str:
+    """기존 region_config 프로퍼티처럼 매 조회마다 리전 테이블을 다시 만든다"""
+    region_configs = {name: dataclasses.asdict(value) for name, value in cfg.REGION_CONFIGS.items()}
+    region = _legacy_get('region', cfg.DEFAULT_REGION)
+    value: str = region_configs.get(region, region_configs[cfg.DEFAULT_REGION])[field]
+    return value
+
+
+def _snapshot_values() -> tuple[str, str, str, str, str]:
+    settings = cfg.get_config()
+    return (
+        settings.node_subnet_cidr_block,
+        settings.node_shape,
+        settings.kubernetes_version,
+        settings.availability_domain,
+        settings.image_id,
+    )
+
+
+def _per_access_values() -> tuple[str, str, str, str, str]:
+    return (
+        _legacy_get('node_subnet_cidr', '10.0.10.0/24'),
+        _legacy_get('node_shape', 'VM.Standard.A1.Flex'),
+        _legacy_get('kubernetes_version', 'v1.32.1'),
+        _legacy_region_value('availability_domain'),
+        _legacy_region_value('image_id'),
+    )
+
+
+def make_program(count: int, mode: str):
+    """`count`개의 서브넷과 노드 풀을 만드는 합성 프로그램"""
+    read_values = _snapshot_values if mode == 'snapshot' else _per_access_values
+
+    def program():
+        settings = cfg.get_config()
+        vcn = oci.core.Vcn('vcn', cidr_block='10.0.0.0/16', compartment_id=settings.compartment_id)
+        for i in range(count):
+            cidr_block, shape, version, availability_domain, image_id = read_values()
+            subnet = oci.core.Subnet(
+                f'subnet-{i}',
+                cidr_block=cidr_block,
+                compartment_id=settings.compartment_id,
+                vcn_id=vcn.id,
+            )
+            cidr_block, shape, version, availability_domain, image_id = read_values()
+            oci.containerengine.NodePool(
+                f'pool-{i}',
+                cluster_id='cluster-id',
+                compartment_id=settings.compartment_id,
+                kubernetes_version=version,
+                node_shape=shape,
+                node_config_details=oci.containerengine.NodePoolNodeConfigDetailsArgs(
+                    placement_configs=[
+                        oci.containerengine.NodePoolNodeConfigDetailsPlacementConfigArgs(
+                            availability_domain=availability_domain, subnet_id=subnet.id
+                        )
+                    ],
+                    size=1,
+                ),
+                node_source_details=oci.containerengine.NodePoolNodeSourceDetailsArgs(
+                    image_id=image_id, source_type='IMAGE'
+                ),
+            )
+
+    return program
+
+
+def measure(count: int, mode: str, repeat: int) -> float:
+    """가장 빠른 실행 시간(초) 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run_program(make_program(count, mode))
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=int, nargs='+', default=list(SCALES))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    # pulumi_oci 모듈 로딩 등 첫 실행 비용 제외
+    run_program(make_program(1, 'snapshot'))
+
+    print(f'{"pools+subnets":>14} {"snapshot(s)":>12} {"per-access(s)":>14} {"speedup":>8}')
+    for count in args.scales:
+        snapshot = measure(count, 'snapshot', args.repeat)
+        per_access = measure(count, 'per-access', args.repeat)
+        print(f'{count:>14} {snapshot:>12.4f} {per_access:>14.4f} {per_access / snapshot:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
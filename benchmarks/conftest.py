@@ -0,0 +1,84 @@
+"""
+프로그램 평가 벤치마크(`benchmarks/test_program_bench.py`) pytest 옵션
+규모는 `--bench-scales`로 매개변수화하고, 결과는 세션이 끝날 때 저장(`--bench-save`)하며,
+기준 결과(`--bench-compare`)보다 임계값 넘게 느려지거나 메모리를 더 쓰는 규모는 테스트 실패로 보고한다.
+
+실행:
+    python -m pytest benchmarks --bench-scales 1 10 100 1000 --bench-save benchmarks/baseline.json
+    python -m pytest benchmarks --bench-scales 1 10 100 1000 --bench-compare benchmarks/baseline.json
+"""
+
+import json
+import platform
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from benchmarks.program_bench import Measurement
+
+# 옵션 없이 실행하는 pytest는 작은 규모만 측정한다 (전체 규모는 make bench-program)
+DEFAULT_SCALES = (1, 10)
+
+RESULTS = pytest.StashKey[list[Measurement]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup('bench', '프로그램 평가 벤치마크')
+    group.addoption('--bench-scales', type=int, nargs='+', default=list(DEFAULT_SCALES), help='시나리오 규모')
+    group.addoption('--bench-repeat', type=int, default=3, help='시간 측정 반복 횟수 (최솟값 사용)')
+    group.addoption('--bench-save', type=Path, help='결과를 저장할 JSON 경로')
+    group.addoption('--bench-compare', type=Path, help='비교할 기준 결과 JSON 경로')
+    group.addoption('--bench-threshold', type=float, default=0.25, help='허용하는 성능 저하 비율 (0.25 = 25%%)')
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[RESULTS] = []
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if 'scale' in metafunc.fixturenames:
+        metafunc.parametrize('scale', metafunc.config.getoption('bench_scales'))
+
+
+@pytest.fixture(scope='session')
+def bench_baseline(pytestconfig: pytest.Config) -> dict[str, dict[str, Any]] | None:
+    """`--bench-compare`로 지정한 기준 결과 (없으면 None)"""
+    path = pytestconfig.getoption('bench_compare')
+    return json.loads(path.read_text())['results'] if path else None
+
+
+@pytest.fixture
+def bench_results(pytestconfig: pytest.Config) -> list[Measurement]:
+    return pytestconfig.stash[RESULTS]
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    results = session.config.stash.get(RESULTS, [])
+    path = session.config.getoption('bench_save')
+    if not path or not results:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': {result.key: asdict(result) for result in results},
+    }
+    path.write_text(json.dumps(payload, indent=2) + '\n')
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config) -> None:
+    results = config.stash.get(RESULTS, [])
+    if not results:
+        return
+    terminalreporter.section('program benchmark')
+    terminalreporter.write_line(f'{"scenario":<16} {"scale":>6} {"time(s)":>9} {"peak(MiB)":>10} {"resources":>10}')
+    for result in results:
+        terminalreporter.write_line(
+            f'{result.scenario:<16} {result.scale:>6} {result.wall_time:>9.4f} '
+            f'{result.peak_memory / 2**20:>10.2f} {result.resources:>10}'
+        )
+    path = config.getoption('bench_save')
+    if path:
+        terminalreporter.write_line(f'saved {len(results)} results to {path}')
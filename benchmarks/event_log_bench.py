@@ -0,0 +1,157 @@
+"""
+배포 이벤트 로그 분석기 벤치마크
+Pulumi mock으로 만든 리소스 그래프에서 리소스 타입별 소요 시간을 가정한 `pulumi up` 엔진 이벤트 로그를 합성하고
+(진단 이벤트로 크기를 키움) 로그 크기에 따른 분석 시간과 최대 메모리(tracemalloc)를 측정한다.
+메모리가 로그 크기와 무관하게 일정하고, 합성한 의존성 체인이 크리티컬 패스로 복원되는지 확인한다.
+복원한 크리티컬 패스가 다르면(MISMATCH) 종료 코드 1.
+
+실행:
+    python -m benchmarks.event_log_bench --sizes 1 10 100   # MiB
+    python -m benchmarks.event_log_bench --write /tmp/up-events.jsonl --sizes 1
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+from automation.events import GRAPH_EVENTS, DeploymentGraph, read_events
+from benchmarks.mocks import PROJECT_NAME, evaluate_program
+
+STACK = 'bench'
+STARTED_AT = 1_700_000_000
+# 리소스 타입별 가정 소요 시간 (초, 실제 OCI 배포에서 흔한 크기)
+DURATIONS = {
+    'oci:ContainerEngine/cluster:Cluster': 420,
+    'oci:ContainerEngine/nodePool:NodePool': 300,
+    'oci:Core/vcn:Vcn': 3,
+    'oci:Core/natGateway:NatGateway': 20,
+    'oci:Core/internetGateway:InternetGateway': 5,
+    'oci:Core/serviceGateway:ServiceGateway': 25,
+    'oci:Core/subnet:Subnet': 4,
+}
+DEFAULT_DURATION = 2
+NOISE = {'diagnosticEvent': {'severity': 'info', 'color': 'never', 'message': 'x' * 400 + '\n', 'ephemeral': True}}
+
+
+def _urn(typ: str, name: str) -> str:
+    return f'urn:pulumi:{STACK}::{PROJECT_NAME}::{typ}::{name}'
+
+
+def _strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+
+
+def synthesize_events() -> tuple[list[dict[str, Any]], list[str]]:
+    """
+    mock 리소스 그래프로 (시간순 엔진 이벤트, 기대 크리티컬 패스 리소스 이름 목록) 생성
+    각 리소스는 입력에 ID가 나타나는 리소스가 모두 끝난 뒤 시작한다.
+    """
+    mocks = evaluate_program(stack=STACK, preview=False)
+    finish: dict[str, int] = {}
+    ids: dict[str, str] = {}
+    binding: dict[str, str | None] = {}
+    timeline: list[tuple[int, int, dict[str, Any]]] = []
+    for order, resource in enumerate(mocks.resources):
+        urn = _urn(resource.typ, resource.name)
+        deps = {ids[value] for value in _strings(resource.inputs) if value in ids}
+        last = max(deps, key=lambda dep: finish[dep], default=None)
+        start = STARTED_AT + (finish[last] if last else 0)
+        binding[urn] = last
+        finish[urn] = start - STARTED_AT + DURATIONS.get(resource.typ, DEFAULT_DURATION)
+        ids[f'{resource.name}-id'] = urn
+        state = {'type': resource.typ, 'urn': urn, 'custom': True, 'inputs': resource.inputs}
+        metadata = {'op': 'create', 'urn': urn, 'type': resource.typ, 'old': None, 'new': state}
+        timeline.append((start, order, {'resourcePreEvent': {'metadata': metadata}}))
+        done = {**metadata, 'new': {**state, 'id': f'{resource.name}-id', 'outputs': resource.inputs}}
+        timeline.append((STARTED_AT + finish[urn], order, {'resOutputsEvent': {'metadata': done}}))
+
+    timeline.sort(key=lambda item: (item[0], item[1]))
+    events = [{'timestamp': STARTED_AT, 'preludeEvent': {'config': {}}}]
+    events += [{'timestamp': timestamp, **event} for timestamp, _, event in timeline]
+    events.append({'timestamp': STARTED_AT + max(finish.values()), 'summaryEvent': {'durationSeconds': 0}})
+
+    path = []
+    urn = max(finish, key=finish.get)
+    while urn is not None:
+        path.append(urn.rsplit('::', 1)[-1])
+        urn = binding[urn]
+    return events, path[::-1]
+
+
+def write_log(stream: TextIO, events: list[dict[str, Any]], size: int) -> None:
+    """리소스 이벤트 사이사이에 진단 이벤트를 넣어 로그를 약 `size` 바이트로 만든다"""
+    noise = json.dumps(NOISE)
+    per_gap = max(0, (size // (len(noise) + 1)) // len(events))
+    for sequence, event in enumerate(events):
+        stream.write(json.dumps({'sequence': sequence, **event}) + '\n')
+        for _ in range(per_gap):
+            stream.write(noise + '\n')
+
+
+def analyze(path: Path) -> tuple[DeploymentGraph, float, int]:
+    """(그래프, 분석 시간, 최대 메모리)"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        with open(path, encoding='utf-8') as stream:
+            graph = DeploymentGraph.from_events(read_events(stream, GRAPH_EVENTS))
+        graph.schedule()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return graph, time.perf_counter() - started, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 10, 100], help='합성 로그 크기 (MiB)')
+    parser.add_argument('--write', type=Path, help='합성 로그를 저장할 경로 (마지막 크기)')
+    args = parser.parse_args()
+
+    events, expected = synthesize_events()
+    mismatches = 0
+    print(f'{"size(MiB)":>10} {"parsed":>10} {"time(s)":>9} {"peak(MiB)":>10} {"MiB/s":>8}  critical path')
+    for size in args.sizes:
+        if args.write:
+            path = args.write
+        else:
+            handle, name = tempfile.mkstemp(suffix='.jsonl')
+            os.close(handle)
+            path = Path(name)
+        try:
+            with open(path, 'w', encoding='utf-8') as stream:
+                write_log(stream, events, size * 2**20)
+            graph, elapsed, peak = analyze(path)
+            actual = [step.name for step in graph.schedule().path]
+            megabytes = path.stat().st_size / 2**20
+            mismatches += actual != expected
+            print(
+                f'{megabytes:>10.1f} {graph.events:>10} {elapsed:>9.3f} {peak / 2**20:>10.2f} '
+                f'{megabytes / elapsed:>8.1f}  {"ok" if actual == expected else "MISMATCH"}'
+            )
+            if actual != expected:
+                print(f'{"":>53}actual: {" -> ".join(actual)}')
+        finally:
+            if not args.write:
+                path.unlink()
+    print(f'\nexpected critical path: {" -> ".join(expected)}')
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
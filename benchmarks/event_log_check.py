@@ -0,0 +1,163 @@
+"""
+배포 이벤트 로그 분석기 검사
+`benchmarks/golden/events/up-replace.jsonl`(`pulumi up --continue-on-error --event-log` 형식의 작은 로그)을 분석하여
+크리티컬 패스, 리소스별 여유 시간, 소요 시간 통계(p50/p95)를 기대값과 비교한다. 불일치가 있으면 종료 코드 1.
+
+로그 내용 (초, 배포 시작 기준):
+- provider/VCN은 변경 없음(same), 서브넷 4개 생성(4/6/8/30초), NAT 게이트웨이 수정(12초)
+- 프라이빗 라우트 테이블 교체(create-replacement + replace, 3초) 뒤 노드 서브넷이 새 라우트 테이블로 수정(4초)
+- 클러스터 수정(300초) 뒤 노드 풀 수정(69초), 흐름 로그 생성 실패(409)
+- 배포 끝에 이전 라우트 테이블 삭제(delete-replaced, 3초)와 스택 출력 등록
+
+실행:
+    python -m benchmarks.event_log_check
+"""
+
+import argparse
+import math
+import sys
+import tempfile
+from pathlib import Path
+
+from automation.events import GRAPH_EVENTS, HISTOGRAM_GROWTH, DeploymentGraph, LatencyStore, read_events
+
+FIXTURE = Path(__file__).parent / 'golden' / 'events' / 'up-replace.jsonl'
+
+CRITICAL_PATH = ['default_5_3_1', 'oke-vcn', 'oke-k8s-api-subnet', 'oke-cluster', 'oke-node-pool']
+MAKESPAN = 400
+OBSERVED = 403
+SLACK = {
+    'default_5_3_1': 0,
+    'oke-vcn': 0,
+    'oke-k8s-api-subnet': 0,
+    'oke-cluster': 0,
+    'oke-node-pool': 0,
+    'oke-svc-lb-subnet': 26,
+    'oke-pod-subnet': 324,
+    'oke-bastion-subnet': 391,
+    'oke-pod-subnet-flow-log': 391,
+    'oke-nat-gateway': 311,
+    'oke-route-table-private': 311,
+    'oke-node-subnet': 311,
+    # 이전 라우트 테이블 삭제는 라우트 테이블과 노드 서브넷 수정 뒤 (EF 23초)
+    'oke-route-table-private#delete-replaced': 377,
+}
+# 리소스 타입/작업별 성공한 단계의 소요 시간 (same 단계와 실패한 단계는 제외)
+DURATIONS = {
+    'oci:Core/subnet:Subnet create': [4, 6, 8, 30],
+    'oci:Core/subnet:Subnet update': [4],
+    'oci:Core/natGateway:NatGateway update': [12],
+    'oci:Core/routeTable:RouteTable replace': [3],
+    'oci:Core/routeTable:RouteTable delete-replaced': [3],
+    'oci:ContainerEngine/cluster:Cluster update': [300],
+    'oci:ContainerEngine/nodePool:NodePool update': [69],
+}
+
+
+def load_graph() -> DeploymentGraph:
+    with open(FIXTURE, encoding='utf-8') as stream:
+        return DeploymentGraph.from_events(read_events(stream, GRAPH_EVENTS))
+
+
+def check_critical_path() -> list[str]:
+    schedule = load_graph().schedule()
+    problems = []
+    path = [step.name for step in schedule.path]
+    if path != CRITICAL_PATH:
+        problems.append(f'critical path {" -> ".join(path)}')
+    if (schedule.makespan, schedule.observed) != (MAKESPAN, OBSERVED):
+        problems.append(
+            f'makespan {schedule.makespan}s / observed {schedule.observed}s, expected {MAKESPAN}s / {OBSERVED}s'
+        )
+    return problems
+
+
+def check_slack() -> list[str]:
+    graph = load_graph()
+    slack = {graph.steps[urn].name: value for urn, value in graph.schedule().slack.items()}
+    return [
+        f'{name}: slack {slack.get(name)}, expected {expected}'
+        for name, expected in sorted({**dict.fromkeys(slack), **SLACK}.items())
+        if slack.get(name) != expected
+    ]
+
+
+def check_steps() -> list[str]:
+    """교체 단계 병합, 이전 리소스 삭제 단계, 실패한 단계, 스택 리소스 제외"""
+    graph = load_graph()
+    steps = {step.name: step for step in graph.steps.values()}
+    problems = []
+    route_table = steps.get('oke-route-table-private')
+    if not route_table or (route_table.op, route_table.duration) != ('replace', 3):
+        problems.append(f'route table replacement {route_table}')
+    cleanup = steps.get('oke-route-table-private#delete-replaced')
+    if not cleanup or (cleanup.op, cleanup.duration) != ('delete-replaced', 3):
+        problems.append(f'route table cleanup {cleanup}')
+    elif not {'oke-route-table-private', 'oke-node-subnet'} <= {graph.steps[urn].name for urn in cleanup.dependencies}:
+        problems.append(f'route table cleanup dependencies {sorted(cleanup.dependencies)}')
+    failed = sorted(name for name, step in steps.items() if step.failed)
+    if failed != ['oke-pod-subnet-flow-log']:
+        problems.append(f'failed steps {failed}')
+    if 'oke-single-prod' in steps:
+        problems.append('stack resource counted as a step')
+    return problems
+
+
+def expected_quantile(values: list[float], q: float) -> float:
+    """`LatencyHistogram.quantile`과 같은 순위(q x 개수 이상인 첫 값)의 정확한 분위수"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def check_latency_store() -> list[str]:
+    """같은 로그를 두 번 누적한 저장소의 시리즈와 p50/p95"""
+    graph = load_graph()
+    with tempfile.TemporaryDirectory() as directory:
+        store = LatencyStore(Path(directory) / 'resource_latency.json')
+        for _ in range(2):
+            store.record(graph.steps.values())
+        series, runs = store.load()
+    problems = []
+    if runs != 2:
+        problems.append(f'{runs} runs recorded, expected 2')
+    if sorted(series) != sorted(DURATIONS):
+        problems.append(f'series {sorted(series)}, expected {sorted(DURATIONS)}')
+    # 버킷 중앙값 근사: 실제 분위수와의 비율은 버킷 폭의 절반(HISTOGRAM_GROWTH ** 0.5) 이내
+    tolerance = math.log(HISTOGRAM_GROWTH) / 2 + 1e-9
+    for key, durations in DURATIONS.items():
+        histogram = series.get(key)
+        if histogram is None:
+            continue
+        values = durations * 2
+        if histogram.count != len(values) or histogram.maximum != max(values):
+            problems.append(f'{key}: count {histogram.count}, max {histogram.maximum}')
+        for q in (0.5, 0.95):
+            estimate, exact = histogram.quantile(q), expected_quantile(values, q)
+            if abs(math.log(estimate / exact)) > tolerance:
+                problems.append(f'{key}: p{q * 100:.0f} {estimate:.2f}s, expected about {exact}s')
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    checks = {
+        'critical path and makespan': check_critical_path,
+        'slack per resource': check_slack,
+        'replace, delete-replaced and failed steps': check_steps,
+        'latency store p50/p95': check_latency_store,
+    }
+    failures = 0
+    for name, check in checks.items():
+        problems = check()
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems:
+            print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
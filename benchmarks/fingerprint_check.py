@@ -0,0 +1,136 @@
+"""
+원하는 상태 지문(automation.fingerprint) 검사
+임시 디렉터리의 스택 설정 파일로 Pulumi mock 위에서 지문을 계산하여 다음을 확인한다. 불일치가 있으면 종료 코드 1.
+
+- 같은 설정은 같은 지문, 노드 풀 크기 변경은 노드 풀 리소스 하나의 변경(`~ 타입::이름`)으로 보고
+- 비밀 값: `secure:` 설정과 secret 입력은 해시로만 남고(지문 파일에 원문 없음), 값이 바뀌면 해당 리소스만 변경
+- cluster 계층: 네트워크 스택 설정 파일로 StackReference 출력을 채워 평가하고, 네트워크 스택의 설정이나
+  기록된 지문이 바뀌면 `pulumi:network` 항목이 바뀜
+
+실행:
+    python -m benchmarks.fingerprint_check
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+import yaml
+
+from automation.fingerprint import (
+    NETWORK_KEY,
+    Fingerprint,
+    FingerprintCache,
+    compute_fingerprint,
+    load_stack_config,
+)
+from automation.fleet import PROJECT_NAME
+from benchmarks.mocks import DEFAULT_CONFIG
+
+NODE_POOL_KEY = 'oci:ContainerEngine/nodePool:NodePool::oke-node-pool'
+NETWORK_STACK = 'bench-org/oke-single/bench-network'
+CIPHERTEXT = 'v1:Zm9vYmFyYmF6:c2VjcmV0LWNpcGhlcnRleHQ='
+
+
+def write_stack(root: Path, stack: str, config: dict[str, str | dict[str, str]]) -> None:
+    """`Pulumi.<stack>.yaml` (프로젝트 설정)"""
+    path = root / f'Pulumi.{stack.rsplit("/", 1)[-1]}.yaml'
+    path.write_text(yaml.safe_dump({'config': {f'{PROJECT_NAME}:{key}': value for key, value in config.items()}}))
+
+
+def compute(root: Path, stack: str, cache: FingerprintCache | None = None) -> Fingerprint:
+    return compute_fingerprint(stack, *load_stack_config(stack, root), cache=cache, root=root)
+
+
+def check_stable(root: Path) -> list[str]:
+    write_stack(root, 'dev', DEFAULT_CONFIG)
+    first, second = compute(root, 'dev'), compute(root, 'dev')
+    problems = []
+    if first.entries != second.entries:
+        problems.append(f'same config, different fingerprints: {second.diff(first).format()}')
+    if NODE_POOL_KEY not in first.entries:
+        problems.append(f'{NODE_POOL_KEY} missing from {sorted(first.entries)}')
+    write_stack(root, 'dev', {**DEFAULT_CONFIG, 'node_pool_size': '3'})
+    changes = compute(root, 'dev').diff(first)
+    if changes.format() != f'  ~ {NODE_POOL_KEY}':
+        problems.append(f'node_pool_size change reported as:\n{changes.format()}')
+    return problems
+
+
+def check_secrets(root: Path) -> list[str]:
+    """`secure:` 설정은 암호문 해시, secret 입력(ssh_public_key)은 해시로만 지문에 반영"""
+    problems = []
+    write_stack(root, 'dev', {**DEFAULT_CONFIG, 'kubeconfig_token_helper': {'secure': CIPHERTEXT}})
+    project, _ = load_stack_config('dev', root)
+    if CIPHERTEXT in project['kubeconfig_token_helper']:
+        problems.append(f'secure config value kept its ciphertext: {project["kubeconfig_token_helper"]}')
+
+    write_stack(root, 'dev', DEFAULT_CONFIG)
+    cache = FingerprintCache(root / 'fingerprints')
+    first = compute(root, 'dev')
+    cache.save(first)
+    saved = cache.path('dev').read_text()
+    for key in ('ssh_public_key', 'compartment_id'):
+        if DEFAULT_CONFIG[key] in saved:
+            problems.append(f'{key} written to the fingerprint file')
+    write_stack(root, 'dev', {**DEFAULT_CONFIG, 'ssh_public_key': 'ssh-ed25519 AAAAC3NzaC1lZDI1NTE5Other other@local'})
+    changes = compute(root, 'dev').diff(first)
+    if changes.changed != (NODE_POOL_KEY,) or changes.added or changes.removed:
+        problems.append(f'ssh_public_key change reported as:\n{changes.format()}')
+    return problems
+
+
+def check_cluster_layer(root: Path) -> list[str]:
+    network = {**DEFAULT_CONFIG, 'layer': 'network'}
+    write_stack(root, NETWORK_STACK, network)
+    write_stack(root, 'dev-cluster', {**DEFAULT_CONFIG, 'layer': 'cluster', 'network_stack': NETWORK_STACK})
+    cache = FingerprintCache(root / 'fingerprints')
+    try:
+        first = compute(root, 'dev-cluster', cache)
+    except Exception as e:
+        return [f'cluster layer fingerprint failed: {e!r}']
+    problems = []
+    if NODE_POOL_KEY not in first.entries or NETWORK_KEY not in first.entries:
+        problems.append(f'cluster layer entries {sorted(first.entries)}')
+    if compute(root, 'dev-cluster', cache).entries != first.entries:
+        problems.append('same config, different cluster layer fingerprints')
+
+    # 네트워크 스택 설정 변경 (클러스터 리소스 입력은 그대로)
+    write_stack(root, NETWORK_STACK, {**network, 'flow_logs': 'true'})
+    changes = compute(root, 'dev-cluster', cache).diff(first)
+    if changes.format() != f'  ~ {NETWORK_KEY}':
+        problems.append(f'network stack config change reported as:\n{changes.format()}')
+
+    # 네트워크 스택의 up 기록 (짧은 스택 이름으로 기록)
+    write_stack(root, NETWORK_STACK, network)
+    cache.save(Fingerprint('bench-network', {'pulumi:outputs': 'recorded'}))
+    changes = compute(root, 'dev-cluster', cache).diff(first)
+    if changes.format() != f'  ~ {NETWORK_KEY}':
+        problems.append(f'recorded network fingerprint reported as:\n{changes.format()}')
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    checks = {
+        'stable digest and node pool change': check_stable,
+        'secret redaction': check_secrets,
+        'cluster layer with network stack': check_cluster_layer,
+    }
+    failures = 0
+    for name, check in checks.items():
+        with tempfile.TemporaryDirectory() as directory:
+            problems = check(Path(directory))
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems:
+            print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+다중 스택 배포기(automation.fleet) 검사
+- 설정: 스택마다 `config_map`이 비밀 키를 secret으로 설정하고, 스택의 region/profile을 OCI provider 설정
+  (`oci:region`, `oci:configFileProfile`)으로 복사하는지 (스택이 직접 지정한 provider 설정은 유지)
+- mock: `MockFleetDeployer`로 모든 스택 프로그램이 평가되는지
+- 파일 백엔드: Pulumi CLI가 있으면 임시 `file://` 백엔드에서 `FleetDeployer`로 스택을 만들고 설정을 적용한 뒤,
+  저장된 설정의 값/secret 여부와 프로그램이 읽은 `oci:region`을 확인한다 (CLI가 없으면 건너뜀을 표시)
+불일치가 있으면 종료 코드 1.
+
+실행:
+    python -m benchmarks.fleet_check
+"""
+
+import argparse
+import io
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pulumi
+
+from automation.fleet import (
+    SECRET_KEYS,
+    FleetDeployer,
+    FleetSpec,
+    MockFleetDeployer,
+    ProgressPrinter,
+    StackTarget,
+)
+from benchmarks.mocks import DEFAULT_CONFIG
+
+FLEET = {
+    'project': 'oke-single',
+    'defaults': {key: DEFAULT_CONFIG[key] for key in SECRET_KEYS},
+    'stacks': {
+        'osaka': {'region': 'ap-osaka-1'},
+        'seoul': {'region': 'ap-seoul-1', 'profile': 'SEOUL', 'node_pool_size': 3},
+        # 스택이 provider 리전을 직접 지정하면 그대로 둔다
+        'tokyo': {'region': 'ap-tokyo-1', 'oci:region': 'ap-tokyo-1'},
+    },
+}
+# 스택별로 `config_map`이 더해야 하는 OCI provider 설정
+PROVIDER_CONFIG = {
+    'osaka': {'oci:region': 'ap-osaka-1'},
+    'seoul': {'oci:region': 'ap-seoul-1', 'oci:configFileProfile': 'SEOUL'},
+    'tokyo': {},
+}
+
+
+def expected_config(target: StackTarget) -> dict[str, tuple[str, bool]]:
+    """설정 키 -> (값, secret 여부)"""
+    expected = {key: (value, key in SECRET_KEYS) for key, value in target.config}
+    expected.update((key, (value, False)) for key, value in PROVIDER_CONFIG[target.name].items())
+    return expected
+
+
+def check_config_map(spec: FleetSpec) -> list[str]:
+    problems = []
+    for target in spec.stacks:
+        actual = {key: (value.value, value.secret) for key, value in target.config_map().items()}
+        if actual != expected_config(target):
+            problems.append(f'{target.name}: {actual}')
+        region = dict(target.config)['region']
+        if actual.get('oci:region') != (region, False):
+            problems.append(f'{target.name}: oci:region {actual.get("oci:region")}, expected {region}')
+        for key in SECRET_KEYS:
+            if not actual.get(key, ('', False))[1]:
+                problems.append(f'{target.name}: {key} is not a secret')
+    return problems
+
+
+def check_mock(spec: FleetSpec) -> list[str]:
+    results = MockFleetDeployer(spec, printer=ProgressPrinter(io.StringIO())).run('preview')
+    return [f'{result.stack}: {result.error}' for result in results if not result.succeeded]
+
+
+def export_provider_region() -> None:
+    """프로그램이 보는 OCI provider 리전"""
+    pulumi.export('oci_region', pulumi.Config('oci').get('region'))
+
+
+def check_file_backend(spec: FleetSpec, directory: Path) -> list[str]:
+    """임시 파일 백엔드에 스택을 만들고 저장된 설정과 프로그램이 읽은 provider 리전 확인"""
+    backend = FleetSpec(spec.project, f'file://{directory}', spec.secrets_provider, spec.stacks)
+    deployer = FleetDeployer(backend, program=export_provider_region, printer=ProgressPrinter(io.StringIO()))
+    problems = []
+    for target in backend.stacks:
+        stored = deployer.select_stack(target).get_all_config()
+        actual = {key.removeprefix(f'{spec.project}:'): (value.value, value.secret) for key, value in stored.items()}
+        if actual != expected_config(target):
+            problems.append(f'{target.name}: stored config {actual}')
+        # 플러그인 설치(prepare)는 네트워크가 필요하므로 리소스가 없는 프로그램을 스택별로 직접 실행
+        result = deployer.run_stack(target, 'up')
+        region = dict(target.config)['region']
+        if not result.succeeded or result.outputs.get('oci_region') != region:
+            problems.append(f'{target.name}: up {result.error or result.outputs}, expected oci_region {region}')
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    spec = FleetSpec.from_dict(FLEET)
+    checks = {
+        'config map secrets and provider settings': lambda: check_config_map(spec),
+        'mock fleet preview': lambda: check_mock(spec),
+    }
+    failures = 0
+    for name, check in checks.items():
+        problems = check()
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems:
+            print(f'      {problem}')
+
+    if not shutil.which('pulumi'):
+        print('skip  file backend (pulumi CLI not found on PATH)')
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            os.environ.setdefault('PULUMI_CONFIG_PASSPHRASE', 'fleet-check')
+            os.environ.setdefault('PULUMI_SKIP_UPDATE_CHECK', 'true')
+            problems = check_file_backend(spec, Path(directory))
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} file backend')
+        for problem in problems:
+            print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
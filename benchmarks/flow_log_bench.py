@@ -0,0 +1,163 @@
+"""
+VCN 흐름 로그 분석기 벤치마크
+현재 설정의 서브넷 대역으로 합성한 흐름 로그(배경 트래픽 + 알려진 대용량 송수신 쌍 + 거부 흐름)를
+JSON Lines / JSON 배열 / gzip 형식으로 써서 분석하고, 로그 크기에 따른 처리 속도와 최대 메모리(tracemalloc)를 측정한다.
+대용량 쌍이 순서대로 상위에 복원되는지, 거부 흐름이 생성 규칙으로 설명되는지, 메모리가 로그 크기와 무관한지 확인한다.
+
+실행:
+    python -m benchmarks.flow_log_bench --sizes 1 10 100   # MiB
+    python -m benchmarks.flow_log_bench --write /tmp/flows.jsonl --sizes 10
+"""
+
+import argparse
+import gzip
+import ipaddress
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TextIO
+
+import numpy as np
+
+from automation.flow_logs import FlowLogAnalysis, analyze, load_network_model
+from network.reachability import NetworkModel
+
+STARTED_AT = 1_700_000_000
+DURATION_SECONDS = 3600
+FORMATS = ('jsonl', 'json', 'jsonl.gz')
+# 알려진 대용량 쌍 (출발 역할, 목적 역할, 목적 포트, 흐름당 바이트) - 바이트 내림차순
+HEAVY = (
+    ('node', 'node', 8472, 4_000_000),
+    ('node', 'k8s_api', 6443, 2_000_000),
+    ('service_lb', 'node', 31080, 1_000_000),
+)
+HEAVY_SHARE = 0.02
+# 거부되어야 하는 흐름 (출발지, 목적 역할, 프로토콜, 포트)
+REJECTED = (('198.51.100.7', 'node', 6, 22), ('198.51.100.8', 'k8s_api', 17, 53))
+REJECTED_SHARE = 0.01
+RECORD = (
+    '{{"datetime":{time},"logContent":{{"data":{{"action":"{action}","bytesOut":{bytes},"destinationAddress":"{dst}",'
+    '"destinationPort":{dport},"endTime":{end},"flowid":"{flow}","packets":{packets},"protocol":{protocol},'
+    '"protocolName":"TCP","sourceAddress":"{src}","sourcePort":{sport},"startTime":{time},"status":"OK","version":"2"}},'
+    '"id":"{flow}","oracle":{{"compartmentid":"ocid1.compartment.oc1..bench","loggroupid":"ocid1.loggroup.oc1..bench"}},'
+    '"source":"-","type":"com.oraclecloud.vcn.flowlogs.DataEvent"}}}}'
+)
+
+
+def _host(model: NetworkModel, role: str, index: int) -> str:
+    network = ipaddress.IPv4Network(model.roles[role])
+    return str(network.network_address + 2 + index % 200)
+
+
+def write_log(stream: TextIO, model: NetworkModel, size: int, array: bool, seed: int = 7) -> None:
+    """약 `size` 바이트의 합성 흐름 로그 (배경 흐름은 무작위 VCN 주소 사이의 작은 흐름)"""
+    rng = np.random.default_rng(seed)
+    vcn = ipaddress.IPv4Network(f'{ipaddress.IPv4Address(model.vcn[0])}/{model.vcn[2]}')
+    written, sequence = 0, 0
+    stream.write('[\n' if array else '')
+    while written < size:
+        draw = rng.random()
+        if draw < HEAVY_SHARE:
+            src_role, dst_role, dport, size_bytes = HEAVY[sequence % len(HEAVY)]
+            src, dst = _host(model, src_role, 0), _host(model, dst_role, 1)
+            action, protocol, total = 'ACCEPT', 17 if dport == 8472 else 6, size_bytes
+        elif draw < HEAVY_SHARE + REJECTED_SHARE:
+            src, dst_role, protocol, dport = REJECTED[sequence % len(REJECTED)]
+            dst, action, total = _host(model, dst_role, 3), 'REJECT', 60
+        else:
+            src = str(vcn.network_address + int(rng.integers(2, vcn.num_addresses - 2)))
+            dst = str(vcn.network_address + int(rng.integers(2, vcn.num_addresses - 2)))
+            dport, protocol, action, total = int(rng.integers(1, 65536)), 6, 'ACCEPT', int(rng.integers(60, 20000))
+        moment = (STARTED_AT + sequence % DURATION_SECONDS) * 1000
+        line = RECORD.format(
+            time=moment,
+            end=moment + 60000,
+            action=action,
+            bytes=total,
+            dst=dst,
+            dport=dport,
+            flow=f'flow-{sequence}',
+            packets=max(1, total // 1500),
+            protocol=protocol,
+            src=src,
+            sport=int(rng.integers(1024, 65536)),
+        )
+        stream.write((',\n' if array and sequence else '') + line + ('' if array else '\n'))
+        written += len(line) + 2
+        sequence += 1
+    stream.write('\n]\n' if array else '')
+
+
+def check(analysis: FlowLogAnalysis, model: NetworkModel) -> list[str]:
+    """대용량 쌍 순서와 거부 흐름 매칭 검사"""
+    problems = []
+    expected = [(_host(model, src, 0), _host(model, dst, 1)) for src, dst, _, _ in HEAVY]
+    actual = [
+        (str(ipaddress.IPv4Address(src)), str(ipaddress.IPv4Address(dst)))
+        for (src, dst), _ in analysis.talkers.top(len(HEAVY))
+    ]
+    if actual != expected:
+        problems.append(f'top talkers {actual} != {expected}')
+    for key, _, explanation, explained in analysis.match_rejected(len(REJECTED)):
+        if not explained:
+            problems.append(f'rejected flow {key} not explained by generated rules: {explanation}')
+    return problems
+
+
+def measure(path: Path, model: NetworkModel) -> tuple[FlowLogAnalysis, float, int]:
+    """(분석 결과, 시간, 최대 메모리) - tracemalloc은 느리므로 시간과 메모리는 따로 잰다"""
+    started = time.perf_counter()
+    analysis = analyze([path], model)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    try:
+        analyze([path], model)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return analysis, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 10, 100], help='합성 로그 크기 (MiB)')
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=list(FORMATS), help='로그 형식')
+    parser.add_argument('--write', type=Path, help='합성 로그를 저장할 경로 (마지막 크기, JSON Lines)')
+    args = parser.parse_args()
+
+    model = load_network_model()
+    failures = 0
+    print(f'{"format":>9} {"size(MiB)":>10} {"records":>10} {"time(s)":>9} {"peak(MiB)":>10} {"MiB/s":>8}  check')
+    for size in args.sizes:
+        for fmt in [FORMATS[0]] if args.write else args.formats:
+            if args.write:
+                path = args.write
+            else:
+                handle, name = tempfile.mkstemp(suffix=f'.{fmt}')
+                os.close(handle)
+                path = Path(name)
+            try:
+                opener = gzip.open if fmt.endswith('.gz') else open
+                with opener(path, 'wt', encoding='utf-8') as stream:
+                    write_log(stream, model, size * 2**20, array=fmt == 'json')
+                analysis, elapsed, peak = measure(path, model)
+                problems = check(analysis, model)
+                failures += bool(problems)
+                print(
+                    f'{fmt:>9} {size:>10} {analysis.records:>10} {elapsed:>9.3f} {peak / 2**20:>10.2f} '
+                    f'{size / elapsed:>8.1f}  {"ok" if not problems else "FAIL"}'
+                )
+                for problem in problems:
+                    print(f'      {problem}')
+            finally:
+                if not args.write:
+                    path.unlink()
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""
+VCN 흐름 로그 상위 항목 요약 검사
+합성 흐름 로그 파일을 작은 배치와 작은 표 크기로 분석하여, 상위 송수신 쌍(바이트)과 거부 흐름(횟수) 요약이
+정확한 합계에 대해 Misra-Gries 보장을 지키는지 확인한다. 불일치가 있으면 종료 코드 1.
+
+- 표에 남은 키: 추정값 <= 실제 합 <= 추정값 + error
+- 실제 합이 error보다 큰 키는 표에 있다
+- error <= 전체 합 / (표 크기 + 1)
+
+여러 배치에 나뉘어 들어오는 대용량 쌍(배치마다는 작지만 합계는 가장 큰 쌍)과 무작위(Zipf) 트래픽을 사용한다.
+듀얼 스택 VCN의 IPv6 흐름 레코드는 집계에 섞이지 않고 `ipv6` 개수로만 보고되는지도 확인한다.
+
+실행:
+    python -m benchmarks.flow_log_check --seeds 20
+"""
+
+import argparse
+import ipaddress
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from automation.flow_logs import HeavyHitters, analyze, load_network_model
+from benchmarks.flow_log_bench import RECORD
+
+BASE_ADDRESS = int(ipaddress.IPv4Address('10.0.10.0'))
+
+
+def write_records(path: Path, flows: list[tuple[int, int, int, str]]) -> None:
+    """(출발 호스트 번호, 목적 호스트 번호, 바이트, action) 목록을 흐름 로그 JSON Lines로 기록"""
+    with path.open('w') as stream:
+        for sequence, (src, dst, size, action) in enumerate(flows):
+            stream.write(
+                RECORD.format(
+                    time=1_700_000_000_000 + sequence,
+                    end=1_700_000_060_000 + sequence,
+                    action=action,
+                    bytes=size,
+                    dst=ipaddress.IPv4Address(BASE_ADDRESS + dst),
+                    dport=443,
+                    flow=f'flow-{sequence}',
+                    packets=1,
+                    protocol=6,
+                    src=ipaddress.IPv4Address(BASE_ADDRESS + src),
+                    sport=40000,
+                )
+                + '\n'
+            )
+
+
+def check_summary(name: str, summary: HeavyHitters, exact: Counter) -> list[str]:
+    """요약과 정확한 합계 비교"""
+    problems = []
+    estimates = {key: totals[0] for key, totals in summary.top(len(summary))}
+    for key, estimate in estimates.items():
+        if not estimate <= exact[key] <= estimate + summary.error:
+            problems.append(f'{name}: {key} estimate {estimate}, true {exact[key]}, error {summary.error}')
+    missing = [key for key, total in exact.items() if total > summary.error and key not in estimates]
+    if missing:
+        problems.append(f'{name}: keys above error {summary.error} missing from the table: {missing[:3]}')
+    bound = sum(exact.values()) / (summary.capacity + 1)
+    if summary.error > bound:
+        problems.append(f'{name}: error {summary.error} exceeds total / (capacity + 1) = {bound:.1f}')
+    if len(summary) > summary.capacity:
+        problems.append(f'{name}: {len(summary)} keys kept, capacity {summary.capacity}')
+    return problems
+
+
+def run_case(directory: Path, flows: list[tuple[int, int, int, str]], capacity: int, batch_size: int) -> list[str]:
+    path = directory / 'flows.jsonl'
+    write_records(path, flows)
+    analysis = analyze([path], load_network_model(), capacity=capacity, batch_size=batch_size)
+    talkers, rejected = Counter(), Counter()
+    for src, dst, size, action in flows:
+        key = (BASE_ADDRESS + src, BASE_ADDRESS + dst)
+        talkers[key] += size
+        if action == 'REJECT':
+            rejected[(*key, 6, 443)] += 1
+    return check_summary('talkers', analysis.talkers, talkers) + check_summary('rejected', analysis.rejected, rejected)
+
+
+def check_ipv6(directory: Path) -> list[str]:
+    """IPv4 흐름 사이에 섞인 IPv6 흐름은 집계하지 않고 따로 센다"""
+    path = directory / 'dual-stack.jsonl'
+    write_records(path, [(1, 2, 100, 'ACCEPT'), (3, 4, 50, 'REJECT')])
+    ipv6_flows = [('fd00:10:0:10::5', 'fd00:10:0:20::9'), ('10.0.10.5', 'fd00:10:0:20::9')]
+    with path.open('a') as stream:
+        for sequence, (src, dst) in enumerate(ipv6_flows):
+            stream.write(
+                RECORD.format(
+                    time=1_700_000_000_000,
+                    end=1_700_000_060_000,
+                    action='ACCEPT',
+                    bytes=999,
+                    dst=dst,
+                    dport=443,
+                    flow=f'ipv6-{sequence}',
+                    packets=1,
+                    protocol=6,
+                    src=src,
+                    sport=40000,
+                )
+                + '\n'
+            )
+    analysis = analyze([path], load_network_model(), batch_size=1)
+    counts = (analysis.records, analysis.ipv6, analysis.skipped, analysis.bytes, analysis.rejected_records)
+    if counts != (2, len(ipv6_flows), 0, 150, 1):
+        return [f'(records, ipv6, skipped, bytes, rejected) = {counts}, expected (2, {len(ipv6_flows)}, 0, 150, 1)']
+    return []
+
+
+def spread_case() -> tuple[list[tuple[int, int, int, str]], int, int]:
+    """한 배치의 큰 쌍(100) 뒤에 작은 흐름(5)이 100개 배치에 나뉘어 들어오는 쌍 - 합계는 뒤의 쌍이 가장 크다"""
+    flows = [(1, 101, 100, 'ACCEPT'), (2, 102, 6, 'ACCEPT'), (3, 103, 5, 'ACCEPT')]
+    flows += [(3, 103, 5, 'REJECT')] * 100
+    return flows, 2, 3
+
+
+def random_case(seed: int) -> tuple[list[tuple[int, int, int, str]], int, int]:
+    """Zipf 분포 쌍과 무작위 배치/표 크기"""
+    rng = np.random.default_rng(seed)
+    count = int(rng.integers(500, 3000))
+    hosts = np.minimum(rng.zipf(1.3, size=(count, 2)), 250)
+    sizes = rng.integers(60, 20000, size=count)
+    actions = np.where(rng.random(count) < 0.2, 'REJECT', 'ACCEPT')
+    flows = [
+        (int(src), int(dst) + 1, int(size), str(action))
+        for (src, dst), size, action in zip(hosts, sizes, actions, strict=True)
+    ]
+    return flows, int(rng.integers(2, 64)), int(rng.integers(1, 256))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seeds', type=int, default=20, help='무작위 트래픽 검사 횟수')
+    args = parser.parse_args()
+
+    cases = {'spread across batches': spread_case()}
+    cases.update({f'random seed {seed}': random_case(seed) for seed in range(args.seeds)})
+    failures = 0
+    with tempfile.TemporaryDirectory() as directory:
+        problems = check_ipv6(Path(directory))
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} IPv6 records counted and excluded')
+        for problem in problems:
+            print(f'      {problem}')
+        for name, (flows, capacity, batch_size) in cases.items():
+            problems = run_case(Path(directory), flows, capacity, batch_size)
+            failures += bool(problems)
+            print(f'{"FAIL" if problems else "ok":<5} {name} (capacity {capacity}, batch {batch_size})')
+            for problem in problems:
+                print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+#!/bin/bash
+# OKE 성능 프로필: batch
+set -o errexit -o pipefail
+
+cat >/etc/sysctl.d/90-oke-performance.conf <<'EOF'
+vm.max_map_count = 262144
+fs.file-max = 2097152
+fs.inotify.max_user_watches = 524288
+EOF
+sysctl --system >/dev/null
+
+cat >/etc/tmpfiles.d/90-oke-thp.conf <<'EOF'
+w /sys/kernel/mm/transparent_hugepage/enabled - - - - always
+w /sys/kernel/mm/transparent_hugepage/defrag - - - - always
+EOF
+systemd-tmpfiles --create /etc/tmpfiles.d/90-oke-thp.conf
+
+curl --fail -H "Authorization: Bearer Oracle" -L0 \
+  http://169.254.169.254/opc/v2/instance/metadata/oke_init_script | base64 --decode >/var/run/oke-init.sh
+bash /var/run/oke-init.sh --kubelet-extra-args "--kube-reserved=cpu=200m,memory=1Gi --system-reserved=cpu=100m,memory=512Mi --serialize-image-pulls=false"
@@ -0,0 +1,8 @@
+#!/bin/bash
+set -o errexit -o pipefail
+
+/usr/libexec/oci-growfs -y >/dev/null
+
+curl --fail -H "Authorization: Bearer Oracle" -L0 \
+  http://169.254.169.254/opc/v2/instance/metadata/oke_init_script | base64 --decode >/var/run/oke-init.sh
+bash /var/run/oke-init.sh --kubelet-extra-args ""
@@ -0,0 +1,30 @@
+#!/bin/bash
+# OKE 성능 프로필: latency-hp
+set -o errexit -o pipefail
+
+cat >/etc/modules-load.d/90-oke-performance.conf <<'EOF'
+nf_conntrack
+EOF
+modprobe nf_conntrack
+
+cat >/etc/sysctl.d/90-oke-performance.conf <<'EOF'
+net.core.somaxconn = 65535
+net.ipv4.tcp_max_syn_backlog = 16384
+net.core.netdev_max_backlog = 16384
+net.netfilter.nf_conntrack_max = 1048576
+net.ipv4.ip_local_port_range = 10240 65535
+net.core.busy_read = 50
+net.core.busy_poll = 50
+vm.nr_hugepages = 1024
+EOF
+sysctl --system >/dev/null
+
+cat >/etc/tmpfiles.d/90-oke-thp.conf <<'EOF'
+w /sys/kernel/mm/transparent_hugepage/enabled - - - - never
+w /sys/kernel/mm/transparent_hugepage/defrag - - - - never
+EOF
+systemd-tmpfiles --create /etc/tmpfiles.d/90-oke-thp.conf
+
+curl --fail -H "Authorization: Bearer Oracle" -L0 \
+  http://169.254.169.254/opc/v2/instance/metadata/oke_init_script | base64 --decode >/var/run/oke-init.sh
+bash /var/run/oke-init.sh --kubelet-extra-args "--cpu-manager-policy=static --topology-manager-policy=single-numa-node --kube-reserved=cpu=500m,memory=1Gi --system-reserved=cpu=500m,memory=1Gi --register-with-taints=dedicated=latency:NoSchedule"
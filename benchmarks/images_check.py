@@ -0,0 +1,135 @@
+"""
+노드 이미지 해석 검사
+`get_node_pool_option` invoke를 Pulumi mock으로 바꿔(정상 응답, 오류, 빈 목록) `resolve_node_image`의
+선택/캐시/대체 경로를 확인한다. 불일치가 있으면 종료 코드 1.
+
+- 모양 아키텍처(ARM/x86/GPU)별 최신 이미지 선택, TTL 안의 캐시는 invoke 없이 사용
+- 조회 오류나 빈 목록이면 만료된 캐시를 사용하고, 빈 목록은 캐시에 저장하지 않음
+- 캐시도 없으면 ARM 모양만 리전 기본 이미지를 사용하고 x86/GPU 모양은 ValueError (오프라인 포함)
+
+실행:
+    python -m benchmarks.images_check
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pulumi
+
+from benchmarks.mocks import GET_NODE_POOL_OPTION_TOKEN, PROJECT_NAME, OCIMocks, node_pool_option_result
+from cluster.images import resolve_node_image
+
+REGION = 'ap-osaka-1'
+VERSION = 'v1.32.1'
+FALLBACK_IMAGE_ID = f'ocid1.image.oc1.{REGION}.region-default'
+SHAPES = {
+    'VM.Standard.A1.Flex': f'ocid1.image.oc1.{REGION}.aarch64-2025.01.31',
+    'VM.Standard.E4.Flex': f'ocid1.image.oc1.{REGION}.x86-2025.01.31',
+    'VM.GPU.A10.1': f'ocid1.image.oc1.{REGION}.Gen2-GPU-2025.01.31',
+}
+ARM_SHAPE = 'VM.Standard.A1.Flex'
+
+Response = Callable[[dict[str, Any]], dict[str, Any]]
+AVAILABLE: Response = node_pool_option_result(REGION)
+
+
+def failing(_: dict[str, Any]) -> dict[str, Any]:
+    raise RuntimeError('NotAuthenticated (401)')
+
+
+def empty(_: dict[str, Any]) -> dict[str, Any]:
+    return {'nodePoolOptionId': 'all', 'sources': []}
+
+
+def resolve(
+    cache_dir: Path, response: Response, shape: str, ttl: float = 3600, offline: bool = False
+) -> tuple[str | None, int]:
+    """(이미지 ID, ValueError면 None), invoke 호출 수"""
+    mocks = OCIMocks({GET_NODE_POOL_OPTION_TOKEN: response})
+    pulumi.runtime.set_mocks(mocks, project=PROJECT_NAME, stack='bench', preview=True)
+    resolve_node_image.cache_clear()
+    try:
+        image_id = resolve_node_image(REGION, VERSION, shape, FALLBACK_IMAGE_ID, str(cache_dir), ttl, offline)
+    except ValueError:
+        image_id = None
+    return image_id, len(mocks.calls)
+
+
+def expect(problems: list[str], name: str, actual: tuple[str | None, int], image_id: str | None, invokes: int) -> None:
+    if actual != (image_id, invokes):
+        problems.append(f'{name}: got {actual}, expected ({image_id}, {invokes} invokes)')
+
+
+def check_select(cache_dir: Path) -> list[str]:
+    problems: list[str] = []
+    for shape, image_id in SHAPES.items():
+        # x86과 GPU 모양은 같은 조회(X86_64)를 공유하므로 모양마다 캐시 디렉터리를 나눈다
+        shape_cache_dir = cache_dir / shape
+        expect(problems, f'{shape} fetch', resolve(shape_cache_dir, AVAILABLE, shape), image_id, 1)
+        # TTL 안의 캐시는 invoke 없이 사용 (조회가 실패해도 영향 없음)
+        expect(problems, f'{shape} cached', resolve(shape_cache_dir, failing, shape), image_id, 0)
+    return problems
+
+
+def check_stale_on_error(cache_dir: Path) -> list[str]:
+    problems: list[str] = []
+    for shape, image_id in SHAPES.items():
+        resolve(cache_dir, AVAILABLE, shape)
+        expect(problems, f'{shape} fetch error', resolve(cache_dir, failing, shape, ttl=0), image_id, 1)
+        expect(problems, f'{shape} empty result', resolve(cache_dir, empty, shape, ttl=0), image_id, 1)
+    # 빈 목록이 만료된 캐시를 덮어쓰지 않았는지
+    for path in cache_dir.glob('*.json'):
+        if not json.loads(path.read_text())['sources']:
+            problems.append(f'cache file {path.name} lost its image list')
+    return problems
+
+
+def check_empty_not_cached(cache_dir: Path) -> list[str]:
+    problems: list[str] = []
+    expect(problems, 'empty result', resolve(cache_dir, empty, ARM_SHAPE), FALLBACK_IMAGE_ID, 1)
+    if list(cache_dir.glob('*.json')):
+        problems.append('empty image list was written to the cache')
+    expect(problems, 'fetch after empty result', resolve(cache_dir, AVAILABLE, ARM_SHAPE), SHAPES[ARM_SHAPE], 1)
+    return problems
+
+
+def check_no_cache(cache_dir: Path) -> list[str]:
+    """캐시가 없으면 ARM 모양만 리전 기본 이미지, x86/GPU는 ValueError"""
+    problems: list[str] = []
+    for shape in SHAPES:
+        expected = FALLBACK_IMAGE_ID if shape == ARM_SHAPE else None
+        expect(problems, f'{shape} fetch error', resolve(cache_dir, failing, shape), expected, 1)
+        expect(problems, f'{shape} empty result', resolve(cache_dir, empty, shape), expected, 1)
+        expect(problems, f'{shape} offline', resolve(cache_dir, AVAILABLE, shape, offline=True), expected, 0)
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    checks = {
+        'select by architecture and reuse the cache': check_select,
+        'stale cache on fetch error or empty result': check_stale_on_error,
+        'empty result is not cached': check_empty_not_cached,
+        'fallback only for ARM without a cache': check_no_cache,
+    }
+    failures = 0
+    for name, check in checks.items():
+        with tempfile.TemporaryDirectory() as directory:
+            problems = check(Path(directory))
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems:
+            print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
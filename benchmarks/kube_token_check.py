@@ -0,0 +1,281 @@
+"""
+kubeconfig 토큰 캐시 헬퍼 검사
+`oci ce cluster generate-token` 대신 발급 횟수를 기록하는 가짜 토큰 명령을 `automation.kube_token`으로 감싸 실행하여
+캐시 적중, 만료 전 재발급, 만료 시각이 없는 응답, 토큰 명령 실패, 동시 실행(파일 잠금)을 확인하고
+캐시 적중 호출과 토큰 발급 호출의 시간을 출력한다. 패키지 메타데이터를 빌드하여 kubeconfig가 가리키는 console script
+(`HELPER_COMMAND`)가 헬퍼의 `main`으로 연결되는지도 확인한다. 불일치가 있으면 종료 코드 1.
+
+실행:
+    python -m benchmarks.kube_token_check --concurrency 16
+"""
+
+import argparse
+import importlib.metadata
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from automation import kube_token
+from cluster.kubeconfig import HELPER_COMMAND, wrap_exec
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 가짜 토큰 명령 (argv: 발급 기록 파일, 유효 시간(초, 음수면 만료 시각 없음), 발급 지연(초), 종료 코드)
+STUB = """
+import datetime, json, os, sys, time, uuid
+log, ttl, delay, code = sys.argv[1], float(sys.argv[2]), float(sys.argv[3]), int(sys.argv[4])
+with open(log, 'a') as file:
+    file.write(f'{os.getpid()}\\n')
+time.sleep(delay)
+if code:
+    sys.exit(code)
+status = {'token': f'token-{uuid.uuid4().hex}'}
+if ttl >= 0:
+    expiration = datetime.datetime.now(datetime.UTC) + datetime.timedelta(seconds=ttl)
+    status['expirationTimestamp'] = expiration.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+print(json.dumps({'apiVersion': 'client.authentication.k8s.io/v1beta1', 'kind': 'ExecCredential', 'status': status}))
+"""
+
+OKE_KUBECONFIG = """
+apiVersion: v1
+kind: ''
+clusters:
+- name: cluster-c1
+  cluster: {server: 'https://192.0.2.10:6443', certificate-authority-data: LS0t}
+users:
+- name: user-c1
+  user:
+    exec:
+      apiVersion: client.authentication.k8s.io/v1beta1
+      command: oci
+      args: [ce, cluster, generate-token, --cluster-id, ocid1.cluster.oc1.ap-osaka-1.c1, --region, ap-osaka-1]
+      env: []
+contexts:
+- name: context-c1
+  context: {cluster: cluster-c1, user: user-c1}
+current-context: context-c1
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Stub:
+    """가짜 토큰 명령 설정"""
+
+    ttl: float = 240
+    delay: float = 0.0
+    code: int = 0
+
+
+class Helper:
+    """임시 캐시 디렉터리에서 헬퍼를 새 프로세스로 실행"""
+
+    def __init__(self, directory: Path, refresh_before: float = 30):
+        self.directory = directory
+        self.log = directory / 'issued.log'
+        self.refresh_before = refresh_before
+
+    def command(self, stub: Stub) -> list[str]:
+        return [
+            sys.executable,
+            '-m',
+            'automation.kube_token',
+            '--cache-dir',
+            str(self.directory / 'cache'),
+            '--refresh-before',
+            str(self.refresh_before),
+            '--',
+            sys.executable,
+            '-c',
+            STUB,
+            str(self.log),
+            str(stub.ttl),
+            str(stub.delay),
+            str(stub.code),
+        ]
+
+    def start(self, stub: Stub) -> subprocess.Popen:
+        return subprocess.Popen(
+            self.command(stub), stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=PROJECT_ROOT
+        )
+
+    def run(self, stub: Stub) -> tuple[int, str | None]:
+        """(종료 코드, 토큰)"""
+        process = self.start(stub)
+        stdout, _ = process.communicate()
+        return process.returncode, json.loads(stdout)['status']['token'] if process.returncode == 0 else None
+
+    @property
+    def issued(self) -> int:
+        """가짜 토큰 명령이 실행된 횟수"""
+        return len(self.log.read_text().splitlines()) if self.log.exists() else 0
+
+    @property
+    def cached(self) -> list[Path]:
+        return sorted((self.directory / 'cache').glob('*.json'))
+
+
+def check_hit(helper: Helper) -> list[str]:
+    _, first = helper.run(Stub())
+    _, second = helper.run(Stub())
+    problems = []
+    if first is None or first != second:
+        problems.append(f'second call returned a different token: {first} != {second}')
+    if helper.issued != 1:
+        problems.append(f'token command ran {helper.issued} times, expected 1')
+    if [oct(path.stat().st_mode & 0o777) for path in helper.cached] != ['0o600']:
+        problems.append('cache file missing or readable by others')
+    return problems
+
+
+def check_expiry(helper: Helper) -> list[str]:
+    """유효 3초, 만료 1초 전 재발급: 곧바로 다시 호출하면 적중, 2초가 지나면 재발급"""
+    helper.refresh_before = 1
+    stub = Stub(ttl=3)
+    _, first = helper.run(stub)
+    _, hit = helper.run(stub)
+    time.sleep(2.2)
+    _, renewed = helper.run(stub)
+    problems = []
+    if first != hit:
+        problems.append('token was not reused before the refresh window')
+    if renewed == first:
+        problems.append('expired token was reused')
+    if helper.issued != 2:
+        problems.append(f'token command ran {helper.issued} times, expected 2')
+    return problems
+
+
+def check_refresh_window(helper: Helper) -> list[str]:
+    """남은 유효 시간이 refresh_before보다 짧은 토큰은 캐시하더라도 사용하지 않음"""
+    helper.refresh_before = 60
+    first = helper.run(Stub(ttl=30))[1]
+    second = helper.run(Stub(ttl=30))[1]
+    return [] if first != second and helper.issued == 2 else [f'token command ran {helper.issued} times, expected 2']
+
+
+def check_no_expiration(helper: Helper) -> list[str]:
+    helper.run(Stub(ttl=-1))
+    helper.run(Stub(ttl=-1))
+    problems = []
+    if helper.issued != 2:
+        problems.append(f'token without expiration was cached ({helper.issued} issued)')
+    if helper.cached:
+        problems.append('cache file written for a token without expiration')
+    return problems
+
+
+def check_failure(helper: Helper) -> list[str]:
+    code, token = helper.run(Stub(code=3))
+    problems = []
+    if code == 0 or token is not None:
+        problems.append('helper succeeded although the token command failed')
+    if helper.cached:
+        problems.append('cache file written for a failed token command')
+    return problems
+
+
+def check_concurrency(helper: Helper, concurrency: int) -> list[str]:
+    """동시에 시작한 프로세스가 토큰 발급 한 번을 공유"""
+    processes = [helper.start(Stub(delay=0.3)) for _ in range(concurrency)]
+    tokens = set()
+    for process in processes:
+        stdout, stderr = process.communicate()
+        if process.returncode:
+            return [f'helper failed: {stderr.strip()[-200:]}']
+        tokens.add(json.loads(stdout)['status']['token'])
+    problems = []
+    if helper.issued != 1:
+        problems.append(f'{concurrency} concurrent calls ran the token command {helper.issued} times, expected 1')
+    if len(tokens) != 1:
+        problems.append(f'{concurrency} concurrent calls returned {len(tokens)} different tokens')
+    return problems
+
+
+def check_kubeconfig(_: Helper) -> list[str]:
+    wrapped = wrap_exec(OKE_KUBECONFIG, HELPER_COMMAND)
+    exec_config = yaml.safe_load(wrapped)['users'][0]['user']['exec']
+    original = yaml.safe_load(OKE_KUBECONFIG)['users'][0]['user']['exec']
+    problems = []
+    if exec_config['command'] != HELPER_COMMAND or exec_config['args'] != ['--', 'oci', *original['args']]:
+        problems.append(f'unexpected exec config: {exec_config}')
+    if wrap_exec(wrapped, HELPER_COMMAND) != wrapped:
+        problems.append('wrapping an already wrapped kubeconfig changed it')
+    return problems
+
+
+def check_console_script(helper: Helper) -> list[str]:
+    """setuptools로 패키지 메타데이터(egg_info)를 만들고 `HELPER_COMMAND` entry point를 로드"""
+    build = subprocess.run(
+        [sys.executable, 'setup.py', '-q', 'egg_info', '--egg-base', str(helper.directory)],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+    )
+    metadata = next(helper.directory.glob('*.egg-info'), None)
+    if build.returncode or metadata is None:
+        return [f'metadata build failed: {" ".join(build.stderr.strip().splitlines()[-1:])}']
+    scripts = importlib.metadata.PathDistribution(metadata).entry_points.select(group='console_scripts')
+    if HELPER_COMMAND not in scripts.names:
+        return [f'no {HELPER_COMMAND} console script: {sorted(scripts.names)}']
+    entry_point = scripts[HELPER_COMMAND]
+    return [] if entry_point.load() is kube_token.main else [f'{HELPER_COMMAND} points at {entry_point.value}']
+
+
+def timed(helper: Helper, stub: Stub, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        helper.run(stub)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, default=16, help='동시에 실행할 헬퍼 프로세스 수')
+    parser.add_argument('--repeat', type=int, default=5, help='호출 시간 측정 반복 횟수')
+    args = parser.parse_args()
+
+    checks = {
+        'cache hit': check_hit,
+        'expiry': check_expiry,
+        'refresh window': check_refresh_window,
+        'no expiration': check_no_expiration,
+        'token command failure': check_failure,
+        f'{args.concurrency} concurrent calls': lambda helper: check_concurrency(helper, args.concurrency),
+        'kubeconfig exec': check_kubeconfig,
+        f'{HELPER_COMMAND} console script': check_console_script,
+    }
+    failures = 0
+    for name, check in checks.items():
+        with tempfile.TemporaryDirectory() as directory:
+            problems = check(Helper(Path(directory)))
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems:
+            print(f'      {problem}')
+
+    # 토큰 발급 시간은 실제 OCI CLI(약 1초) 대신 가짜 명령의 시작 시간만 포함한다
+    with tempfile.TemporaryDirectory() as directory:
+        helper = Helper(Path(directory))
+        helper.run(Stub())
+        hit = timed(helper, Stub(), args.repeat)
+        helper.refresh_before = 600
+        issue = timed(helper, Stub(), args.repeat)
+    print()
+    print(f'{"call":<10} {"wall(ms)":>9}')
+    print(f'{"cached":<10} {hit * 1000:>9.1f}')
+    print(f'{"issued":<10} {issue * 1000:>9.1f}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+계층 스택 검사
+Pulumi mock 위에서 설정마다 전체(all), 네트워크(network), 클러스터(cluster) 계층을 평가한다.
+네트워크 계층의 export를 가짜 StackReference 응답으로 클러스터 계층에 넘겨, 두 계층이 만든 리소스
+(StackReference 제외)가 전체 스택과 같은지 확인하고, 클러스터 계층만 평가하는 시간을 전체 평가와 비교한다.
+네트워크 계층과 설정(보안 모드, 서브넷 CIDR)이 다른 클러스터 계층은 실패해야 한다. 불일치가 있으면 종료 코드 1.
+
+실행:
+    python -m benchmarks.layer_check --repeat 5
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+import warnings
+from typing import Any
+from unittest import mock
+
+import pulumi
+
+from automation.fleet import load_program
+from benchmarks.mocks import STACK_REFERENCE_TYPE, OCIMocks, run_program
+
+NETWORK_STACK = 'bench-org/oke-single/bench-network'
+# 검사 이름 -> 설정
+CASES = {
+    'default': {},
+    'nsg': {'security_mode': 'nsg'},
+    'pod subnet': {'pod_subnet_cidr': '10.0.128.0/18'},
+    'dual stack': {'dual_stack': 'true'},
+}
+# 네트워크 계층과 다르면 클러스터 계층이 실패해야 하는 설정
+MISMATCHED = {
+    'security mode': {'security_mode': 'nsg'},
+    'node subnet': {'node_subnet_cidr': '10.0.11.0/24'},
+}
+
+
+def resources(mocks: OCIMocks) -> list[str]:
+    """비교용 리소스 목록 (타입, 이름, 입력) - 등록 순서는 비동기 해석 순서에 따라 달라지므로 정렬"""
+    return sorted(
+        json.dumps([resource.typ, resource.name, resource.inputs], sort_keys=True, default=str)
+        for resource in mocks.resources
+        if resource.typ != STACK_REFERENCE_TYPE
+    )
+
+
+def run_network(program, config: dict[str, str]) -> tuple[OCIMocks, dict[str, Any]]:
+    """네트워크 계층을 평가하고 export 값을 모음"""
+    exports: dict[str, Any] = {}
+
+    def export(name: str, value: Any) -> None:
+        pulumi.Output.from_input(value).apply(lambda resolved: exports.__setitem__(name, resolved))
+
+    with mock.patch.object(pulumi, 'export', export):
+        mocks = run_program(program, {**config, 'layer': 'network'})
+    return mocks, exports
+
+
+def run_cluster(program, config: dict[str, str], exports: dict[str, Any]) -> OCIMocks:
+    return run_program(
+        program,
+        {**config, 'layer': 'cluster', 'network_stack': NETWORK_STACK},
+        stack_outputs={NETWORK_STACK: exports},
+    )
+
+
+def timed(run, repeat: int) -> float:
+    """중앙값 평가 시간 (초)"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def check(program, config: dict[str, str]) -> list[str]:
+    """계층 분리 결과가 전체 스택과 다른 점 목록"""
+    whole = resources(run_program(program, config))
+    network_mocks, exports = run_network(program, config)
+    cluster_mocks = run_cluster(program, config, exports)
+    problems = []
+    if 'network_settings' not in exports:
+        problems.append('network layer did not export network_settings')
+    if not any(resource.typ == STACK_REFERENCE_TYPE for resource in cluster_mocks.resources):
+        problems.append('cluster layer did not read the network stack')
+    layered = sorted(resources(network_mocks) + resources(cluster_mocks))
+    if layered != whole:
+        missing = sorted(set(whole) - set(layered))
+        extra = sorted(set(layered) - set(whole))
+        problems.append(f'layered resources differ from all: missing {missing[:3]}, extra {extra[:3]}')
+    return problems
+
+
+def check_mismatch(program, exports: dict[str, Any], config: dict[str, str]) -> str | None:
+    """설정이 다른 클러스터 계층이 실패하지 않으면 문제 설명"""
+    # 실패한 리소스 등록이 남긴 future/코루틴은 종료 시 asyncio 로그와 경고로 출력되므로 기대한 실패에서는 숨긴다
+    logging.getLogger('asyncio').setLevel(logging.CRITICAL)
+    warnings.filterwarnings('ignore', 'coroutine .* was never awaited', RuntimeWarning)
+    try:
+        run_cluster(program, config, exports)
+    except Exception as error:  # Pulumi가 apply 오류를 감싸서 다시 던진다
+        if '네트워크 계층 스택' in str(error):
+            return None
+        return f'failed with an unexpected error: {str(error)[:200]}'
+    return 'cluster layer accepted mismatched network settings'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='평가 시간 측정 반복 횟수')
+    args = parser.parse_args()
+
+    program = load_program()
+    failures = 0
+    for name, config in CASES.items():
+        problems = check(program, config)
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems:
+            print(f'      {problem}')
+
+    _, exports = run_network(program, {})
+    for name, config in MISMATCHED.items():
+        problem = check_mismatch(program, exports, config)
+        failures += bool(problem)
+        print(f'{"FAIL" if problem else "ok":<5} mismatched {name}')
+        if problem:
+            print(f'      {problem}')
+
+    print()
+    whole = timed(lambda: run_program(program), args.repeat)
+    cluster = timed(lambda: run_cluster(program, {}, exports), args.repeat)
+    print(f'{"layer":<8} {"eval(ms)":>9}')
+    print(f'{"all":<8} {whole * 1000:>9.1f}')
+    print(f'{"cluster":<8} {cluster * 1000:>9.1f}  ({cluster / whole:.0%} of all)')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+Pulumi mock 실행 도구
+클라우드 호출 없이 Pulumi 프로그램을 평가하기 위한 공통 mock 및 실행 함수
+"""
+
+import os
+import tempfile
+from collections.abc import Callable
+from typing import Any
+
+import pulumi
+
+import config as cfg
+from network.service_catalog import service_cidr_label
+
+PROJECT_NAME = 'oke-single'
+SECRET_KEYS = ('compartment_id', 'ssh_public_key')
+
+DEFAULT_CONFIG: dict[str, str] = {
+    'compartment_id': 'ocid1.compartment.oc1..benchmark',
+    'ssh_public_key': 'ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIBenchmarkKeyBenchmarkKeyBenchmarkKey bench@local',
+    'region': 'ap-osaka-1',
+    # 사용자 캐시를 건드리지 않도록 조회 결과 캐시는 임시 디렉터리에 둔다
+    'service_catalog_cache': os.path.join(tempfile.gettempdir(), 'oke-bench-service-catalog.json'),
+    'image_cache_dir': os.path.join(tempfile.gettempdir(), 'oke-bench-node-images'),
+}
+
+STACK_REFERENCE_TYPE = 'pulumi:pulumi:StackReference'
+GET_SERVICES_TOKEN = 'oci:Core/getServices:getServices'
+GET_NODE_POOL_OPTION_TOKEN = 'oci:ContainerEngine/getNodePoolOption:getNodePoolOption'
+
+
+def services_result(region: str) -> dict[str, Any]:
+    """리전의 `oci.core.get_services` 응답 (Object Storage + All Services)"""
+    return {
+        'services': [
+            {
+                'id': f'ocid1.service.oc1.{region}.objectstorage',
+                'cidrBlock': f'oci-{region}-objectstorage',
+                'name': 'OCI Object Storage',
+                'description': 'OCI Object Storage',
+            },
+            {
+                'id': f'ocid1.service.oc1.{region}.all',
+                'cidrBlock': service_cidr_label(region),
+                'name': 'All Services In Oracle Services Network',
+                'description': 'All Services In Oracle Services Network',
+            },
+        ]
+    }
+
+
+class OCIMocks(pulumi.runtime.Mocks):
+    """
+    모든 리소스를 입력 그대로 생성하고, 생성된 리소스를 기록하는 mock
+    `StackReference`는 `stack_outputs`에 등록한 스택 이름별 export를 돌려준다.
+    """
+
+    def __init__(
+        self,
+        call_results: dict[str, dict[str, Any] | Callable[[dict], dict]] | None = None,
+        stack_outputs: dict[str, dict[str, Any]] | None = None,
+    ):
+        self.call_results = call_results or {}
+        self.stack_outputs = stack_outputs or {}
+        self.resources: list[pulumi.runtime.MockResourceArgs] = []
+        self.calls: list[pulumi.runtime.MockCallArgs] = []
+
+    def new_resource(self, args: pulumi.runtime.MockResourceArgs):
+        self.resources.append(args)
+        if args.typ == STACK_REFERENCE_TYPE:
+            name = args.inputs['name']
+            return [name, {'name': name, 'outputs': self.stack_outputs.get(name, {}), 'secretOutputNames': []}]
+        return [f'{args.name}-id', args.inputs]
+
+    def call(self, args: pulumi.runtime.MockCallArgs):
+        self.calls.append(args)
+        result = self.call_results.get(args.token, {})
+        # 인자에 따라 응답이 달라지는 invoke는 함수로 등록할 수 있다
+        return result(args.args) if callable(result) else result
+
+
+def node_pool_option_result(region: str) -> Callable[[dict], dict[str, Any]]:
+    """요청한 Kubernetes 버전/아키텍처의 `get_node_pool_option` 응답 (최신/이전 릴리스, GPU 이미지 포함)"""
+
+    def result(args: dict[str, Any]) -> dict[str, Any]:
+        version = args['nodePoolK8sVersion'].lstrip('v')
+        arch = args['nodePoolOsArch']
+        variants = ['aarch64'] if arch == 'AARCH64' else ['', 'Gen2-GPU']
+        sources = [
+            {
+                'imageId': f'ocid1.image.oc1.{region}.{variant or "x86"}-{release}',
+                'sourceName': '-'.join(
+                    filter(None, ['Oracle-Linux-8.10', variant, release, f'0-OKE-{version}-{build}'])
+                ),
+                'sourceType': 'IMAGE',
+            }
+            for variant in variants
+            for release, build in (('2025.01.31', 765), ('2024.12.20', 740))
+        ]
+        return {'nodePoolOptionId': 'all', 'sources': sources}
+
+    return result
+
+
+def run_program(
+    program: Callable[[], Any],
+    config: dict[str, str] | None = None,
+    mocks: OCIMocks | None = None,
+    stack: str = 'bench',
+    preview: bool = True,
+    stack_outputs: dict[str, dict[str, Any]] | None = None,
+) -> OCIMocks:
+    """
+    Pulumi mock 위에서 프로그램을 실행하고 모든 리소스 등록이 끝날 때까지 대기
+    """
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    mocks = mocks or OCIMocks(
+        {
+            GET_SERVICES_TOKEN: services_result(config['region']),
+            GET_NODE_POOL_OPTION_TOKEN: node_pool_option_result(config['region']),
+        },
+        stack_outputs,
+    )
+    pulumi.runtime.set_mocks(mocks, project=PROJECT_NAME, stack=stack, preview=preview)
+    pulumi.runtime.set_all_config(
+        {f'{PROJECT_NAME}:{key}': value for key, value in config.items()},
+        secret_keys=[f'{PROJECT_NAME}:{key}' for key in SECRET_KEYS],
+    )
+    cfg.reset_config()
+    pulumi.runtime.test(program)()
+    return mocks
+
+
+def evaluate_program(
+    config: dict[str, str] | None = None,
+    mocks: OCIMocks | None = None,
+    stack: str = 'bench',
+    preview: bool = True,
+    stack_outputs: dict[str, dict[str, Any]] | None = None,
+) -> OCIMocks:
+    """
+    `__main__.py` 프로그램을 mock 위에서 실행 (검사 스크립트 공통, 인자는 run_program과 같음)
+    """
+    # automation.fleet이 이 모듈을 함수 안에서 임포트하므로 순환 임포트를 피해 여기서도 지연 임포트
+    from automation.fleet import load_program
+
+    return run_program(load_program(), config, mocks, stack, preview, stack_outputs)
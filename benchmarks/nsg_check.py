@@ -0,0 +1,191 @@
+"""
+NSG 모드(`security_mode=nsg`) 검사
+Pulumi mock 위에서 프로그램을 평가하여 등록된 NSG와 `NetworkSecurityGroupSecurityRule` 리소스를 확인한다
+(IPv4 / 듀얼 스택). 불일치가 있으면 종료 코드 1.
+
+- 역할마다 NSG 하나 (API 엔드포인트, 워커 노드, 파드, 로드 밸런서)
+- 모든 규칙이 자기 역할의 NSG에 속하고, NSG 대상 규칙은 상대 역할의 NSG ID를 가리킴 (역할 간 허용 관계가 기대값과 같음)
+- NSG마다 규칙 수가 OCI 한도(120개) 이하, 한도를 넘는 리스너 포트 설정은 거부
+- 모든 서브넷은 기본 보안 리스트만 사용
+- 클러스터 API 엔드포인트(`nsgIds`), 로드 밸런서 백엔드(`backendNsgIds`), 노드 풀의 노드/파드 VNIC
+  (`nsgIds`/`podNsgIds`)에 역할의 NSG 연결
+- 듀얼 스택에서도 NSG 규칙은 IPv4와 같음 (NSG 대상 규칙은 IP 패밀리와 무관, `::/0` 규칙 없음)
+
+실행:
+    python -m benchmarks.nsg_check
+"""
+
+import argparse
+import json
+import sys
+from typing import Any
+
+from benchmarks.mocks import OCIMocks, evaluate_program
+from network.nsg import NSG_ROLES, NSG_TARGET_TYPE
+from network.rules import IPV6_ANYWHERE
+
+NSG_TYPE = 'oci:Core/networkSecurityGroup:NetworkSecurityGroup'
+NSG_RULE_TYPE = 'oci:Core/networkSecurityGroupSecurityRule:NetworkSecurityGroupSecurityRule'
+SUBNET_TYPE = 'oci:Core/subnet:Subnet'
+CLUSTER_TYPE = 'oci:ContainerEngine/cluster:Cluster'
+NODE_POOL_TYPE = 'oci:ContainerEngine/nodePool:NodePool'
+BASELINE_SECURITY_LIST_ID = 'oke-baseline-security-list-id'
+# OCI NSG당 보안 규칙 한도 (Ingress + Egress)
+MAX_RULES_PER_NSG = 120
+NSG_IDS = {role: f'oke-{role.replace("_", "-")}-nsg-id' for role in NSG_ROLES}
+
+CONFIG = {
+    'security_mode': 'nsg',
+    'pod_subnet_cidr': '10.0.64.0/20',
+    'node_pools': json.dumps([{'name': 'system', 'size': 2}, {'name': 'apps', 'size': 2}]),
+}
+# (NSG 역할, 방향) -> NSG 대상 규칙이 가리키는 상대 역할
+PEERS = {
+    ('k8s_api', 'INGRESS'): {'node', 'pod'},
+    ('k8s_api', 'EGRESS'): {'node', 'pod'},
+    ('node', 'INGRESS'): {'k8s_api', 'node', 'pod', 'service_lb'},
+    ('node', 'EGRESS'): {'k8s_api', 'node', 'pod'},
+    ('pod', 'INGRESS'): {'k8s_api', 'node', 'pod'},
+    ('pod', 'EGRESS'): {'k8s_api', 'node', 'pod'},
+    ('service_lb', 'INGRESS'): set(),
+    ('service_lb', 'EGRESS'): {'node'},
+}
+# 로드 밸런서 NSG의 Egress 규칙 수 (NodePort, kube-proxy 헬스 체크) - 리스너 포트마다 Ingress 규칙 하나
+SERVICE_LB_EGRESS_RULES = 2
+
+
+def of_type(mocks: OCIMocks, typ: str) -> list[Any]:
+    return [resource for resource in mocks.resources if resource.typ == typ]
+
+
+def rule_target(rule: dict[str, Any]) -> tuple[str, str]:
+    """(대상 타입, 대상)"""
+    if rule['direction'] == 'INGRESS':
+        return rule['sourceType'], rule['source']
+    return rule['destinationType'], rule['destination']
+
+
+def nsg_rules(mocks: OCIMocks) -> list[str]:
+    """비교용 규칙 목록 (리소스 이름 + 입력)"""
+    return sorted(
+        json.dumps([resource.name, resource.inputs], sort_keys=True) for resource in of_type(mocks, NSG_RULE_TYPE)
+    )
+
+
+def check_rules(mocks: OCIMocks) -> list[str]:
+    problems = []
+    names = sorted(resource.inputs['displayName'] for resource in of_type(mocks, NSG_TYPE))
+    if names != sorted(nsg_id.removesuffix('-id') for nsg_id in NSG_IDS.values()):
+        problems.append(f'NSGs {names}')
+
+    roles = {nsg_id: role for role, nsg_id in NSG_IDS.items()}
+    peers: dict[tuple[str, str], set[str]] = {key: set() for key in PEERS}
+    counts = dict.fromkeys(NSG_ROLES, 0)
+    for resource in of_type(mocks, NSG_RULE_TYPE):
+        rule = resource.inputs
+        role = roles.get(rule['networkSecurityGroupId'])
+        if role is None:
+            problems.append(f'{resource.name} belongs to {rule["networkSecurityGroupId"]}')
+            continue
+        counts[role] += 1
+        target_type, target = rule_target(rule)
+        if target_type == NSG_TARGET_TYPE:
+            if target not in roles:
+                problems.append(f'{resource.name} targets unknown NSG {target}')
+            else:
+                peers[role, rule['direction']].add(roles[target])
+        elif target == IPV6_ANYWHERE:
+            problems.append(f'{resource.name} targets {IPV6_ANYWHERE}')
+    for key, expected in PEERS.items():
+        if peers[key] != expected:
+            problems.append(f'{key[0]} {key[1]} peers {sorted(peers[key])}, expected {sorted(expected)}')
+    problems += [f'{role}: {count} rules' for role, count in counts.items() if not 0 < count <= MAX_RULES_PER_NSG]
+    return problems
+
+
+def check_attachments(mocks: OCIMocks) -> list[str]:
+    problems = []
+    for subnet in of_type(mocks, SUBNET_TYPE):
+        if subnet.inputs.get('securityListIds') != [BASELINE_SECURITY_LIST_ID]:
+            problems.append(f'{subnet.name} security lists {subnet.inputs.get("securityListIds")}')
+
+    clusters = of_type(mocks, CLUSTER_TYPE)
+    attached = [
+        (cluster.inputs['endpointConfig'].get('nsgIds'), cluster.inputs['options']['serviceLbConfig']['backendNsgIds'])
+        for cluster in clusters
+    ]
+    if attached != [([NSG_IDS['k8s_api']], [NSG_IDS['node']])]:
+        problems.append(f'cluster endpoint / load balancer backend NSGs {attached}')
+
+    node_pools = of_type(mocks, NODE_POOL_TYPE)
+    if len(node_pools) != len(json.loads(CONFIG['node_pools'])):
+        problems.append(f'{len(node_pools)} node pools')
+    for pool in node_pools:
+        details = pool.inputs['nodeConfigDetails']
+        attached = (details.get('nsgIds'), details['nodePoolPodNetworkOptionDetails'].get('podNsgIds'))
+        if attached != ([NSG_IDS['node']], [NSG_IDS['pod']]):
+            problems.append(f'{pool.name} node / pod NSGs {attached}')
+    return problems
+
+
+def check_mode(config: dict[str, str]) -> list[str]:
+    mocks = evaluate_program(config)
+    return check_rules(mocks) + check_attachments(mocks)
+
+
+def check_dual_stack() -> list[str]:
+    """듀얼 스택: NSG 규칙과 연결은 IPv4 스택과 같음"""
+    dual_stack = evaluate_program({**CONFIG, 'dual_stack': 'true'})
+    problems = check_rules(dual_stack) + check_attachments(dual_stack)
+    if nsg_rules(dual_stack) != nsg_rules(evaluate_program(CONFIG)):
+        problems.append('dual stack NSG rules differ from IPv4 NSG rules')
+    return problems
+
+
+def check_rule_limit() -> list[str]:
+    """리스너 포트마다 로드 밸런서 NSG 규칙이 하나씩 (병합되지 않도록 떨어진 포트): 한도까지는 허용, 넘으면 거부"""
+    problems = []
+    for listeners, accepted in (
+        (MAX_RULES_PER_NSG - SERVICE_LB_EGRESS_RULES, True),
+        (MAX_RULES_PER_NSG - SERVICE_LB_EGRESS_RULES + 1, False),
+    ):
+        ports = json.dumps(list(range(20000, 20000 + 2 * listeners, 2)))
+        try:
+            mocks = evaluate_program({**CONFIG, 'load_balancer_ports': ports})
+        except ValueError as e:
+            if accepted:
+                problems.append(f'{listeners} listener ports rejected: {e}')
+            continue
+        if not accepted:
+            problems.append(f'{listeners} listener ports accepted')
+            continue
+        count = sum(
+            rule.inputs['networkSecurityGroupId'] == NSG_IDS['service_lb'] for rule in of_type(mocks, NSG_RULE_TYPE)
+        )
+        if count != MAX_RULES_PER_NSG:
+            problems.append(f'service_lb NSG has {count} rules, expected {MAX_RULES_PER_NSG}')
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    checks = {
+        'NSG rules and attachments': lambda: check_mode(CONFIG),
+        'dual stack': check_dual_stack,
+        f'{MAX_RULES_PER_NSG} rules per NSG': check_rule_limit,
+    }
+    failures = 0
+    for name, check in checks.items():
+        problems = check()
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems:
+            print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""
+오버프로비저닝 (placeholder 파드) 검사
+노드 풀 설정마다 헤드룸 계획(placeholder 수와 크기)이 기대와 같은지, 렌더링한 매니페스트가 placeholder 조건
+(오토스케일러가 노드를 늘리는 낮은 우선순위, 선점하지 않음, requests == limits, 대상 노드 풀 nodeSelector와
+taint toleration)을 만족하는지 확인한다.
+Pulumi mock 위에서 프로그램을 평가하여 노드 풀 레이블과 ConfigGroup도 확인한다. pulumi_kubernetes는 필수 의존성이므로
+설치되어 있지 않으면 이 검사는 건너뛰지 않고 실패한다. 불일치가 있으면 종료 코드 1.
+
+실행:
+    python -m benchmarks.overprovisioning_check
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+from dataclasses import dataclass, field, replace
+
+from benchmarks.mocks import evaluate_program
+from cluster.overprovisioning import (
+    NAMESPACE,
+    POOL_LABEL,
+    PRIORITY_CLASS,
+    OverprovisioningSpec,
+    plan_headroom,
+    render_manifests,
+)
+from cluster.pool_spec import NodePoolSpec
+
+NODE_POOL_TYPE = 'oci:ContainerEngine/nodePool:NodePool'
+CONFIG_GROUP_TYPE = 'kubernetes:yaml/v2:ConfigGroup'
+# 클러스터 오토스케일러가 Pending 파드를 무시하는 우선순위 기준 (--expendable-pods-priority-cutoff 기본값)
+EXPENDABLE_PRIORITY_CUTOFF = -10
+
+ARM_POOL = NodePoolSpec(name='pool1', size=2, shape='VM.Standard.A1.Flex', ocpus=2, memory_in_gbs=12)
+X86_POOL = NodePoolSpec(
+    name='batch',
+    size=10,
+    shape='VM.Standard.E4.Flex',
+    ocpus=4,
+    memory_in_gbs=32,
+    taints=('dedicated=batch:NoSchedule',),
+)
+EMPTY_POOL = replace(ARM_POOL, name='spare', size=0)
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    name: str
+    pool: NodePoolSpec
+    settings: dict[str, object]
+    # (placeholder 수, 밀리코어, MiB)
+    expected: tuple[int, int, int]
+
+
+CASES = (
+    Case('default 10%', ARM_POOL, {}, (1, 400, 2432)),
+    Case('25%', ARM_POOL, {'fraction': 0.25}, (3, 400, 2432)),
+    Case('50%', ARM_POOL, {'fraction': 0.5}, (5, 400, 2432)),
+    Case('100% (capped)', ARM_POOL, {'fraction': 1.0}, (8, 400, 2432)),
+    Case('explicit pod size', ARM_POOL, {'fraction': 0.2, 'pod_cpu': '500m', 'pod_memory': '1Gi'}, (4, 500, 1024)),
+    Case('x86 tainted pool', X86_POOL, {}, (5, 1900, 7168)),
+    Case('empty pool', EMPTY_POOL, {}, (0, 400, 2432)),
+)
+
+
+@dataclass
+class Report:
+    problems: list[str] = field(default_factory=list)
+
+    def expect(self, condition: bool, message: str) -> None:
+        if not condition:
+            self.problems.append(message)
+
+
+def check_plan(case: Case) -> list[str]:
+    plan = plan_headroom(case.pool, OverprovisioningSpec.from_dict({'enabled': True, **case.settings}))
+    actual = (plan.replicas, plan.pod_cpu, plan.pod_memory)
+    if actual != case.expected:
+        return [f'plan {actual} != expected {case.expected} ({plan.summary()})']
+    return []
+
+
+def check_manifests() -> list[str]:
+    """렌더링한 매니페스트의 placeholder 조건"""
+    settings = OverprovisioningSpec(enabled=True)
+    pools = {pool.name: pool for pool in (ARM_POOL, X86_POOL, EMPTY_POOL)}
+    plans = [plan_headroom(pool, settings) for pool in pools.values()]
+    manifests = render_manifests(plans, pools, settings)
+    report = Report()
+    kinds = {manifest['kind']: manifest for manifest in manifests}
+    priority_class = kinds.get('PriorityClass', {})
+    report.expect(
+        EXPENDABLE_PRIORITY_CUTOFF < priority_class.get('value', EXPENDABLE_PRIORITY_CUTOFF) < 0,
+        f'priority {priority_class.get("value")} must be between {EXPENDABLE_PRIORITY_CUTOFF} and 0',
+    )
+    report.expect(priority_class.get('preemptionPolicy') == 'Never', 'placeholders must not preempt other pods')
+    report.expect(not priority_class.get('globalDefault'), 'placeholder priority class must not be the default')
+
+    deployments = {
+        manifest['metadata']['name']: manifest['spec'] for manifest in manifests if manifest['kind'] == 'Deployment'
+    }
+    expected_names = {f'overprovisioning-{plan.pool}' for plan in plans if plan.replicas}
+    report.expect(set(deployments) == expected_names, f'deployments {sorted(deployments)} != {sorted(expected_names)}')
+    for name, spec in deployments.items():
+        pod = spec['template']['spec']
+        pool = pools[pod['nodeSelector'][POOL_LABEL]]
+        container = pod['containers'][0]
+        report.expect(pod['priorityClassName'] == PRIORITY_CLASS, f'{name}: priority class')
+        report.expect(
+            container['resources']['requests'] == container['resources']['limits'], f'{name}: requests != limits'
+        )
+        report.expect(
+            [toleration['key'] for toleration in pod['tolerations']] == [taint.split('=')[0] for taint in pool.taints],
+            f'{name}: tolerations {pod["tolerations"]} do not match taints {pool.taints}',
+        )
+        report.expect(spec['selector']['matchLabels'] == spec['template']['metadata']['labels'], f'{name}: selector')
+    return report.problems
+
+
+def check_program() -> list[str]:
+    """Pulumi mock 위에서 기본 설정(생성 안 함)과 오버프로비저닝 설정을 평가"""
+    if not importlib.util.find_spec('pulumi_kubernetes'):
+        return ['pulumi_kubernetes is not installed (pip install -e .)']
+    report = Report()
+    default = evaluate_program()
+    report.expect(
+        not any(
+            resource.typ.startswith(('kubernetes:', 'pulumi:providers:kubernetes')) for resource in default.resources
+        ),
+        'default config created Kubernetes resources',
+    )
+    overprovisioning = {'enabled': True, 'fraction': 0.25}
+    config = {
+        'cluster_autoscaler': json.dumps({'enabled': True}),
+        'node_pool_min_size': '1',
+        'node_pool_max_size': '5',
+        'overprovisioning': json.dumps(overprovisioning),
+    }
+    mocks = evaluate_program(config)
+    pools = [resource for resource in mocks.resources if resource.typ == NODE_POOL_TYPE]
+    for pool in pools:
+        labels = {label['key']: label['value'] for label in pool.inputs.get('initialNodeLabels', [])}
+        report.expect(labels.get(POOL_LABEL) == pool.inputs['name'], f'{pool.name}: missing {POOL_LABEL} label')
+    groups = [resource for resource in mocks.resources if resource.typ == CONFIG_GROUP_TYPE]
+    report.expect(len(groups) == 1, f'expected one ConfigGroup, found {len(groups)}')
+    if groups:
+        expected = render_manifests(
+            [plan_headroom(ARM_POOL, OverprovisioningSpec.from_dict(overprovisioning))],
+            {ARM_POOL.name: ARM_POOL},
+            OverprovisioningSpec.from_dict(overprovisioning),
+        )
+        objs = groups[0].inputs.get('objs')
+        report.expect(objs == expected, f'ConfigGroup objs differ from rendered manifests: {str(objs)[:200]}')
+        namespaces = [obj['metadata']['name'] for obj in objs or [] if obj['kind'] == 'Namespace']
+        report.expect(namespaces == [NAMESPACE], f'namespaces {namespaces}')
+    return report.problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    failures = 0
+    for case in CASES:
+        problems = check_plan(case)
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} plan {case.name}')
+        for problem in problems:
+            print(f'      {problem}')
+
+    checks = {'manifests': check_manifests, 'program': check_program}
+    for name, run in checks.items():
+        problems = run()
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems:
+            print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+노드 배치(placement) 검사
+`getAvailabilityDomains` invoke를 Pulumi mock으로 바꿔 노드 풀 배치 설정이 조회된 모든 AD와
+세 장애 도메인에 분산되는지 확인한다. 불일치가 있으면 종료 코드 1.
+
+- AD 3개 응답: 모든 노드 풀이 AD 3개(이름 순) x FD 3개에 배치되고, 노드 서브넷을 사용
+- AD 목록 조회는 노드 풀 수와 관계없이 한 번만 호출
+- 빈 응답(빈 목록 / 키 없음): 리전 설정의 기본 AD(`availability_domain`) 하나로 대체
+
+실행:
+    python -m benchmarks.placement_check
+"""
+
+import argparse
+import json
+import sys
+from typing import Any
+
+import config as cfg
+from benchmarks.mocks import (
+    DEFAULT_CONFIG,
+    GET_NODE_POOL_OPTION_TOKEN,
+    GET_SERVICES_TOKEN,
+    OCIMocks,
+    evaluate_program,
+    node_pool_option_result,
+    services_result,
+)
+from cluster.placement import FAULT_DOMAINS, GET_AVAILABILITY_DOMAINS_TOKEN, _availability_domains
+
+NODE_POOL_TYPE = 'oci:ContainerEngine/nodePool:NodePool'
+NODE_SUBNET_ID = 'oke-node-subnet-id'
+NODE_POOLS = [{'name': 'system', 'size': 2}, {'name': 'apps', 'size': 3}]
+
+
+def availability_domains_result(region: str, count: int) -> dict[str, Any]:
+    """리전의 `get_availability_domains` 응답 (이름 역순)"""
+    tenancy_prefix = cfg.REGION_CONFIGS[region].availability_domain.split(':')[0]
+    names = [f'{tenancy_prefix}:{region.upper()}-AD-{index}' for index in range(count, 0, -1)]
+    return {
+        'availabilityDomains': [{'name': name, 'compartmentId': DEFAULT_CONFIG['compartment_id']} for name in names]
+    }
+
+
+def check_placement(region: str, result: dict[str, Any], expected_domains: list[str]) -> list[str]:
+    mocks = OCIMocks(
+        {
+            GET_SERVICES_TOKEN: services_result(region),
+            GET_NODE_POOL_OPTION_TOKEN: node_pool_option_result(region),
+            GET_AVAILABILITY_DOMAINS_TOKEN: result,
+        }
+    )
+    # AD 목록은 설정 스냅샷을 키로 캐시되므로 실행마다 비운다 (같은 설정의 이전 응답 재사용 방지)
+    _availability_domains.cache_clear()
+    evaluate_program({'region': region, 'node_pools': json.dumps(NODE_POOLS)}, mocks=mocks)
+
+    problems = []
+    invokes = [call for call in mocks.calls if call.token == GET_AVAILABILITY_DOMAINS_TOKEN]
+    if [call.args for call in invokes] != [{'compartmentId': DEFAULT_CONFIG['compartment_id']}]:
+        problems.append(
+            f'{len(invokes)} getAvailabilityDomains invokes, expected 1: {[call.args for call in invokes]}'
+        )
+
+    expected = [
+        {'availabilityDomain': name, 'faultDomains': list(FAULT_DOMAINS), 'subnetId': NODE_SUBNET_ID}
+        for name in expected_domains
+    ]
+    node_pools = {
+        resource.inputs['name']: resource.inputs['nodeConfigDetails']['placementConfigs']
+        for resource in mocks.resources
+        if resource.typ == NODE_POOL_TYPE
+    }
+    if sorted(node_pools) != sorted(pool['name'] for pool in NODE_POOLS):
+        problems.append(f'node pools {sorted(node_pools)}')
+    for name, placement_configs in node_pools.items():
+        if placement_configs != expected:
+            problems.append(f'{name} placement {placement_configs}, expected {expected}')
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--regions', nargs='+', default=sorted(cfg.REGION_CONFIGS), help='검사할 리전')
+    args = parser.parse_args()
+
+    failures = 0
+    for region in args.regions:
+        three_domains = availability_domains_result(region, 3)
+        default_domain = cfg.REGION_CONFIGS[region].availability_domain
+        cases = {
+            '3 ADs x 3 FDs': (three_domains, sorted(ad['name'] for ad in three_domains['availabilityDomains'])),
+            'empty list falls back to the region AD': ({'availabilityDomains': []}, [default_domain]),
+            'missing list falls back to the region AD': ({}, [default_domain]),
+        }
+        for name, (result, expected_domains) in cases.items():
+            problems = check_placement(region, result, expected_domains)
+            failures += bool(problems)
+            print(f'{"FAIL" if problems else "ok":<5} {region} {name}')
+            for problem in problems:
+                print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""
+VCN-native CNI 파드 IP 계획 검사
+- prefix 길이: 무작위 노드 풀 수요마다 `prefix_length`가 (최대 노드 + 서지) x (노드당 파드 + 공용 서브넷이면 노드 IP)
+  합을 담는 가장 작은 서브넷인지, `check`가 그 서브넷은 통과시키고 한 단계 작은 서브넷은 거부하는지
+- 서지 노드와 노드/파드 공용 서브넷의 노드당 IP 1개가 경계에서 서브넷 크기를 바꾸는지
+- 모양의 VNIC 한도를 넘는 노드당 파드 수 거부
+- 프로그램: 노드 풀별 `max_pods_per_node`가 노드 풀의 maxPodsPerNode와 'auto' 파드 서브넷 크기에 반영되고,
+  노드 풀별 합이 파드 서브넷을 넘으면 preview에서 거부되는지
+불일치가 있으면 종료 코드 1.
+
+실행:
+    python -m benchmarks.pod_network_check --seeds 500
+"""
+
+import argparse
+import ipaddress
+import json
+import sys
+
+import numpy as np
+
+from benchmarks.mocks import evaluate_program
+from cluster.pod_network import (
+    MAX_PODS_PER_NODE_LIMIT,
+    OCI_RESERVED_IPS_PER_SUBNET,
+    combine_pod_networks,
+    max_pods_for_shape,
+    plan_pod_network,
+)
+
+NODE_POOL_TYPE = 'oci:ContainerEngine/nodePool:NodePool'
+SUBNET_TYPE = 'oci:Core/subnet:Subnet'
+
+
+def rejects(cidr_block: str, plan) -> bool:
+    try:
+        plan.check(cidr_block)
+    except ValueError:
+        return True
+    return False
+
+
+def check_prefix_length(seeds: int) -> list[str]:
+    """무작위 노드 풀 수요의 합과 가장 작은 서브넷을 직접 계산한 값 비교"""
+    problems = []
+    for seed in range(seeds):
+        rng = np.random.default_rng(seed)
+        pools = [
+            (int(rng.integers(0, 40)), int(rng.integers(0, 4)), int(rng.integers(1, MAX_PODS_PER_NODE_LIMIT + 1)))
+            for _ in range(int(rng.integers(1, 5)))
+        ]
+        shares = bool(rng.integers(2))
+        plan = combine_pod_networks(
+            (plan_pod_network(nodes, max_pods, surge) for nodes, surge, max_pods in pools), shares
+        )
+        required = sum((nodes + surge) * (max_pods + shares) for nodes, surge, max_pods in pools)
+        prefix = next(
+            prefix for prefix in range(32, -1, -1) if 2 ** (32 - prefix) - OCI_RESERVED_IPS_PER_SUBNET >= required
+        )
+        if (plan.required_ips, plan.prefix_length) != (required, prefix):
+            problems.append(
+                f'seed {seed}: {plan.required_ips} IPs /{plan.prefix_length}, expected {required} /{prefix}'
+            )
+            continue
+        if rejects(f'10.0.0.0/{prefix}', plan):
+            problems.append(f'seed {seed}: /{prefix} rejected for {required} IPs')
+        if prefix < 32 and required and not rejects(f'10.0.0.0/{prefix + 1}', plan):
+            problems.append(f'seed {seed}: /{prefix + 1} accepted for {required} IPs')
+    return problems
+
+
+def check_boundaries() -> list[str]:
+    """서지 노드와 공용 서브넷의 노드 IP가 서브넷 크기를 한 단계 바꾸는 경계"""
+    cases = [
+        # (설명, 계획, 통과해야 하는 CIDR, 거부해야 하는 CIDR)
+        ('2 nodes x 30 pods', plan_pod_network(2, 30), '10.0.0.0/26', None),
+        ('2 nodes + 1 surge x 30 pods', plan_pod_network(2, 30, 1), '10.0.0.0/25', '10.0.0.0/26'),
+        ('1 node x 29 pods', plan_pod_network(1, 29), '10.0.0.0/27', None),
+        ('1 node x 29 pods + node IP', plan_pod_network(1, 29, shares_node_subnet=True), '10.0.0.0/26', '10.0.0.0/27'),
+        (
+            'pools of 31 and 110 pods per node',
+            # (2 + 1) x 31 + (1 + 1) x 110 = 313 IP (전역 31개로 계산하면 155 IP, /24)
+            combine_pod_networks([plan_pod_network(2, 31, 1), plan_pod_network(1, 110, 1)]),
+            '10.0.0.0/23',
+            '10.0.0.0/24',
+        ),
+    ]
+    problems = []
+    for name, plan, fits, too_small in cases:
+        expected = ipaddress.ip_network(fits).prefixlen
+        if plan.prefix_length != expected:
+            problems.append(f'{name}: prefix /{plan.prefix_length}, expected /{expected}')
+        if rejects(fits, plan):
+            problems.append(f'{name}: {fits} rejected')
+        if too_small and not rejects(too_small, plan):
+            problems.append(f'{name}: {too_small} accepted')
+    return problems
+
+
+def check_vnic_limits() -> list[str]:
+    problems = []
+    for ocpus in range(1, 30):
+        limit = max_pods_for_shape(ocpus)
+        plan_pod_network(1, limit, ocpus=ocpus)
+        try:
+            plan_pod_network(1, limit + 1, ocpus=ocpus)
+        except ValueError:
+            continue
+        if limit < MAX_PODS_PER_NODE_LIMIT:
+            problems.append(f'{ocpus} OCPU accepted {limit + 1} pods per node (limit {limit})')
+    return problems
+
+
+def pool(name: str, size: int, ocpus: int, max_pods: int | None = None) -> dict:
+    spec = {'name': name, 'size': size, 'ocpus': ocpus, 'memory_in_gbs': ocpus * 8}
+    return spec if max_pods is None else {**spec, 'max_pods_per_node': max_pods}
+
+
+def check_program() -> list[str]:
+    """기본 31개와 110개 노드 풀: 노드 풀별 maxPodsPerNode와 'auto' 파드 서브넷 크기"""
+    pools = [pool('system', 2, 2), pool('dense', 3, 8, 110)]
+    config = {'node_pools': json.dumps(pools), 'subnet_prefix_lengths': json.dumps({'pod': 'auto'})}
+    mocks = evaluate_program(config)
+    problems = []
+    max_pods = {
+        resource.inputs['nodeConfigDetails']['freeformTags']['oke_node_pool_name']: resource.inputs[
+            'nodeConfigDetails'
+        ]['nodePoolPodNetworkOptionDetails']['maxPodsPerNode']
+        for resource in mocks.resources
+        if resource.typ == NODE_POOL_TYPE
+    }
+    if max_pods != {'system': 31, 'dense': 110}:
+        problems.append(f'maxPodsPerNode by pool: {max_pods}')
+    # (2 + 1) x 31 + (3 + 1) x 110 = 533 IP -> /22 (전역 31개로 계산하면 /24)
+    pod_cidrs = [
+        resource.inputs['cidrBlock']
+        for resource in mocks.resources
+        if resource.typ == SUBNET_TYPE and resource.inputs['displayName'] == 'oke-pod'
+    ]
+    if [ipaddress.ip_network(cidr).prefixlen for cidr in pod_cidrs] != [22]:
+        problems.append(f'auto pod subnet {pod_cidrs}, expected one /22')
+
+    # 같은 노드 풀을 /22 파드 서브넷에 두면 통과, /23(509 IP)이면 노드 풀별 합(533)이 넘쳐 거부
+    for cidr, accepted in (('10.0.128.0/22', True), ('10.0.132.0/23', False)):
+        try:
+            evaluate_program({'node_pools': json.dumps(pools), 'pod_subnet_cidr': cidr})
+        except ValueError as e:
+            if accepted:
+                problems.append(f'{cidr} rejected: {e}')
+            continue
+        if not accepted:
+            problems.append(f'{cidr} accepted for 533 pod IPs')
+
+    # 2 OCPU 노드 풀은 VNIC 한도(31)를 넘는 110개를 거부
+    try:
+        evaluate_program({'node_pools': json.dumps([pool('narrow', 2, 2, 110)])})
+    except ValueError:
+        pass
+    else:
+        problems.append('2 OCPU node pool accepted 110 pods per node')
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seeds', type=int, default=500, help='무작위 노드 풀 수요 수')
+    args = parser.parse_args()
+
+    checks = {
+        'prefix length and subnet check': lambda: check_prefix_length(args.seeds),
+        'surge and shared subnet boundaries': check_boundaries,
+        'per-shape VNIC limits': check_vnic_limits,
+        'per-pool max pods in the program': check_program,
+    }
+    failures = 0
+    for name, check in checks.items():
+        problems = check()
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems[:10]:
+            print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+"""
+프로그램 평가 / 리소스 그래프 구성 벤치마크
+Pulumi mock 위에서 합성 설정으로 프로그램을 평가하며 시나리오별 규모(기본 1 ~ 1,000)에 따른
+실행 시간, 최대 메모리(tracemalloc), 생성된 리소스 수를 기록한다.
+
+시나리오:
+- node_pools: `node_pools` 설정의 노드 풀 수를 늘려 `main()` 평가
+- regions: 리전을 돌아가며 스택 N개에 대해 `main()` 평가 (플릿 배포와 같은 순차 평가 비용)
+- subnets: 매니저 메소드로 VCN 안에 /28 서브넷 N개 생성
+- security_rules: 규칙 N개를 컴파일하여 보안 리스트(100개 규칙 단위) 생성
+
+측정은 pytest 벤치마크(`benchmarks/test_program_bench.py`, 옵션은 `benchmarks/conftest.py`)로 실행하며,
+시나리오 x 규모가 테스트 하나다. 결과는 JSON으로 저장(--save)하고, 기준 결과와 비교(--compare)하여
+임계값을 넘는 성능 저하가 있는 규모는 테스트 실패(종료 코드 1)로 보고한다.
+
+실행:
+    python -m benchmarks.program_bench --save benchmarks/baseline.json
+    python -m benchmarks.program_bench --compare benchmarks/baseline.json --threshold 0.25
+    python -m pytest benchmarks/test_program_bench.py --bench-scales 1 10 --bench-compare benchmarks/baseline.json
+"""
+
+import argparse
+import gc
+import ipaddress
+import json
+import math
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import config as cfg
+from automation.fleet import load_program
+from benchmarks.mocks import run_program
+from network.gateways import GatewayManager
+from network.routing import RouteTableManager
+from network.security import SecurityListManager
+from network.subnets import SubnetManager
+from network.vcn import VCNManager
+
+SCALES = (1, 10, 100, 1000)
+RULES_PER_SECURITY_LIST = 100
+# 비교 시 이 값보다 작은 차이는 측정 잡음으로 보고 무시
+MIN_TIME_DELTA = 0.005  # 초
+MIN_MEMORY_DELTA = 256 * 1024  # 바이트
+
+# 하나의 시나리오 실행 = (프로그램, 설정, 스택 이름) 목록
+Run = tuple[Callable[[], None], dict[str, str], str]
+
+
+# =============================================================================
+# 시나리오
+# =============================================================================
+
+
+def node_pools_runs(count: int) -> list[Run]:
+    """노드 풀 N개 (파드 서브넷을 두고 노드당 파드 수를 줄여 1,000개 풀도 IP 계획을 통과하도록 함)"""
+    pools = [{'name': f'pool{index:04d}', 'size': 1} for index in range(count)]
+    config = {'node_pools': json.dumps(pools), 'pod_subnet_cidr': '10.0.128.0/17', 'max_pods_per_node': '8'}
+    return [(load_program(), config, 'bench')]
+
+
+def regions_runs(count: int) -> list[Run]:
+    """리전을 돌아가며 스택 N개"""
+    main = load_program()
+    regions = sorted(cfg.REGION_CONFIGS)
+    return [(main, {'region': regions[index % len(regions)]}, f'region-{index}') for index in range(count)]
+
+
+def subnets_runs(count: int) -> list[Run]:
+    """VCN 안의 /28 서브넷 N개"""
+
+    def program() -> None:
+        vcn = VCNManager().create_vcn()
+        gateways = GatewayManager(vcn).create_all_gateways()
+        route_table, _ = RouteTableManager(vcn, *gateways).create_all_route_tables()
+        security_list = SecurityListManager(vcn).create_node_security_list()
+        manager = SubnetManager(vcn, route_table, route_table, security_list, security_list)
+        blocks = islice(ipaddress.IPv4Network(cfg.VCN_CIDR_BLOCK).subnets(new_prefix=28), count)
+        for index, block in enumerate(blocks):
+            manager.create_subnet(str(block), f'bench-{index}', f'bench{index}', route_table, True, [security_list])
+
+    return [(program, {}, 'bench')]
+
+
+def security_rules_runs(count: int) -> list[Run]:
+    """서로 병합되지 않는 Ingress 규칙 N개 (출발지 /32와 포트가 모두 다름)"""
+    rules = [
+        {
+            'protocol': '6',
+            'source': str(ipaddress.IPv4Address(0x0A000000 + index * 7 + 1)) + '/32',
+            'source_type': 'CIDR_BLOCK',
+            'stateless': False,
+            'tcp_options': {'min': 1024 + index * 2, 'max': 1024 + index * 2},
+            'description': f'bench rule {index}',
+        }
+        for index in range(count)
+    ]
+
+    def program() -> None:
+        vcn = VCNManager().create_vcn()
+        manager = SecurityListManager(vcn)
+        for index in range(math.ceil(count / RULES_PER_SECURITY_LIST)):
+            chunk = rules[index * RULES_PER_SECURITY_LIST : (index + 1) * RULES_PER_SECURITY_LIST]
+            manager.create_security_list(f'bench-sl-{index}', chunk, [])
+
+    return [(program, {}, 'bench')]
+
+
+SCENARIOS: dict[str, Callable[[int], list[Run]]] = {
+    'node_pools': node_pools_runs,
+    'regions': regions_runs,
+    'subnets': subnets_runs,
+    'security_rules': security_rules_runs,
+}
+
+
+# =============================================================================
+# 측정
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class Measurement:
+    scenario: str
+    scale: int
+    wall_time: float  # 초 (반복 중 최솟값)
+    peak_memory: int  # 바이트 (tracemalloc)
+    resources: int
+
+    @property
+    def key(self) -> str:
+        return f'{self.scenario}/{self.scale}'
+
+
+def execute(runs: list[Run]) -> int:
+    """모든 실행을 평가하고 생성된 리소스 수 합계를 반환"""
+    return sum(len(run_program(program, config, stack=stack).resources) for program, config, stack in runs)
+
+
+def measure(scenario: str, scale: int, repeat: int) -> Measurement:
+    """시간은 tracemalloc 없이 반복 측정한 최솟값, 메모리는 별도 한 번의 tracemalloc 실행으로 측정"""
+    runs = SCENARIOS[scenario](scale)
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        resources = execute(runs)
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        execute(runs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Measurement(scenario, scale, best, peak, resources)
+
+
+def compare(
+    current: list[Measurement], baseline: dict[str, dict[str, Any]], threshold: float
+) -> tuple[list[str], list[str]]:
+    """(성능 저하 목록, 비교 결과 줄 목록)"""
+    regressions, lines = [], []
+    for item in current:
+        base = baseline.get(item.key)
+        if base is None:
+            lines.append(f'{item.key:<22} 기준 결과 없음')
+            continue
+        checks = (
+            ('time', item.wall_time, base['wall_time'], MIN_TIME_DELTA),
+            ('memory', item.peak_memory, base['peak_memory'], MIN_MEMORY_DELTA),
+        )
+        parts = []
+        for name, value, reference, min_delta in checks:
+            ratio = value / reference if reference else 1.0
+            parts.append(f'{name} {ratio:>6.2f}x')
+            if ratio > 1 + threshold and value - reference > min_delta:
+                regressions.append(f'{item.key} {name}: {reference:.4g} -> {value:.4g} ({ratio:.2f}x)')
+        if item.resources != base['resources']:
+            parts.append(f'resources {base["resources"]} -> {item.resources}')
+        lines.append(f'{item.key:<22} ' + '  '.join(parts))
+    return regressions, lines
+
+
+def main() -> None:
+    """기존 명령행 옵션을 pytest 벤치마크 옵션으로 바꿔 실행"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenarios', nargs='+', choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--scales', type=int, nargs='+', default=list(SCALES))
+    parser.add_argument('--repeat', type=int, default=3, help='시간 측정 반복 횟수 (최솟값 사용)')
+    parser.add_argument('--save', type=Path, help='결과를 저장할 JSON 경로')
+    parser.add_argument('--compare', type=Path, help='비교할 기준 결과 JSON 경로')
+    parser.add_argument('--threshold', type=float, default=0.25, help='허용하는 성능 저하 비율 (0.25 = 25%%)')
+    args = parser.parse_args()
+
+    argv = [
+        str(Path(__file__).with_name('test_program_bench.py')),
+        '-q',
+        '-k',
+        ' or '.join(args.scenarios),
+        '--bench-scales',
+        *map(str, args.scales),
+        '--bench-repeat',
+        str(args.repeat),
+        '--bench-threshold',
+        str(args.threshold),
+    ]
+    if args.save:
+        argv += ['--bench-save', str(args.save)]
+    if args.compare:
+        argv += ['--bench-compare', str(args.compare)]
+    sys.exit(pytest.main(argv))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+흐름 도달성 시뮬레이터 검사 및 벤치마크
+현재 설정으로 생성될 라우트/보안 리스트에 대해 필수 OKE 흐름을 검사하고(회귀 검사),
+무작위 흐름 행렬(기본 100만 개)을 평가하는 시간을 측정한다.
+
+실행: python -m benchmarks.reachability_bench [--flows 1000000] [--config key=value ...]
+"""
+
+import argparse
+import ipaddress
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.mocks import run_program
+from network.reachability import (
+    PROTOCOL_NUMBERS,
+    SERVICE_NETWORK_ADDRESS,
+    FlowMatrix,
+    NetworkModel,
+    check_required_flows,
+    required_flows,
+)
+
+
+def random_flows(model: NetworkModel, count: int, seed: int = 42) -> FlowMatrix:
+    """VCN 서브넷/인터넷/서비스 네트워크 사이의 무작위 흐름"""
+    rng = np.random.default_rng(seed)
+    endpoints = [(subnet.start, subnet.end) for subnet in model.subnets]
+    for cidr in ('203.0.113.0/24', SERVICE_NETWORK_ADDRESS):
+        network = ipaddress.IPv4Network(cidr)
+        endpoints.append((int(network.network_address), int(network.broadcast_address)))
+    bounds = np.array(endpoints, dtype=np.int64)
+
+    def addresses() -> np.ndarray:
+        picked = bounds[rng.integers(0, len(bounds), count)]
+        return picked[:, 0] + (rng.random(count) * (picked[:, 1] - picked[:, 0] + 1)).astype(np.int64)
+
+    protocol = rng.choice(np.array(list(PROTOCOL_NUMBERS.values()), dtype=np.int64), count, p=[0.1, 0.7, 0.2])
+    return FlowMatrix(
+        src=addresses(),
+        dst=addresses(),
+        protocol=protocol,
+        port=np.where(protocol == 1, rng.integers(0, 16, count), rng.integers(1, 65536, count)),
+        src_port=np.where(protocol == 1, rng.integers(0, 16, count), rng.integers(1024, 65536, count)),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--flows', type=int, default=1_000_000, help='무작위 흐름 수 (0이면 필수 흐름 검사만)')
+    parser.add_argument('--config', nargs='*', default=[], metavar='KEY=VALUE', help='스택 설정 덮어쓰기')
+    args = parser.parse_args()
+
+    config = dict(item.split('=', 1) for item in args.config)
+    models: list[NetworkModel] = []
+    # 설정 값은 Pulumi 런타임에서만 읽을 수 있으므로 mock 프로그램 안에서 모델을 구성한다
+    run_program(lambda: models.append(NetworkModel.from_config()), config)
+    model = models[0]
+
+    cases = required_flows(model)
+    failures = check_required_flows(model)
+    print(f'required flows: {len(cases) - len(failures)}/{len(cases)} passed')
+    for failure in failures:
+        print(f'  FAIL {failure}')
+
+    if args.flows:
+        flows = random_flows(model, args.flows)
+        started = time.perf_counter()
+        report = model.evaluate(flows)
+        elapsed = time.perf_counter() - started
+        print(f'{args.flows} flows in {elapsed:.3f}s ({args.flows / elapsed:,.0f} flows/s)')
+        for verdict, count in sorted(report.summary().items()):
+            print(f'  {verdict:<15} {count:>9}')
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
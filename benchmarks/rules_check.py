@@ -0,0 +1,343 @@
+"""
+보안 규칙 컴파일러 무작위 동치 검사
+작은 주소/포트/ICMP 공간에서 무작위 규칙 목록(중복, 가려진 규칙, 인접 포트 범위와 CIDR, ICMP, stateless,
+서비스 CIDR 대상)을 만들고, 공간의 모든 점을 직접 열거하는 오라클로 다음을 확인한다. 불일치가 있으면 종료 코드 1.
+
+- `compile_rules` 결과가 원본과 정확히 같은 트래픽을 허용한다 (IPv4/IPv6, 모든 프로토콜/포트/ICMP 값)
+- 결과에 중복, 다른 규칙 하나에 가려진 규칙, 병합할 수 있는 포트 범위나 CIDR이 남지 않고, 다시 컴파일해도 같다
+- 규칙 수 한도: 결과가 `limit`을 넘으면 ValueError, 병합으로 한도 안에 들어오면 통과
+- `find_mismatch`: 오라클이 같다고 하면 None, 다르다고 하면 오라클로도 허용 여부가 다른 점을 돌려준다
+
+생성하는 규칙의 모든 경계가 열거 공간 안에 있으므로(범위 밖은 대표점 하나) 오라클 비교는 완전한 검사다.
+
+실행:
+    python -m benchmarks.rules_check --seeds 300
+"""
+
+import argparse
+import copy
+import ipaddress
+import itertools
+import random
+import sys
+from typing import Any
+
+from network.rules import (
+    MAX_RULES_PER_DIRECTION,
+    TARGET_KEYS,
+    compile_rules,
+    find_mismatch,
+    normalize_rule,
+)
+
+# 열거 공간: 규칙 경계가 모두 이 안에 있고, 밖의 값은 대표점 하나로 충분하다
+IPV4_SPACE = ipaddress.ip_network('10.0.0.0/28')
+IPV6_SPACE = ipaddress.ip_network('fd00::/126')
+OUTSIDE = (ipaddress.ip_address('192.0.2.1'), ipaddress.ip_address('2001:db8::1'))
+SERVICES = ('all-icn-services-in-oracle-services-network', 'oci-icn-objectstorage')
+MAX_PORT = 8
+PORTS = (*range(1, MAX_PORT + 2), 65535)
+ICMP_TYPES, ICMP_CODES = range(5), range(4)
+PROTOCOLS = (1, 6, 17, 47, 50, 58)
+PORT_OPTIONS = {6: 'tcp_options', 17: 'udp_options'}
+
+TARGETS = (
+    *(('CIDR_BLOCK', address) for address in (*IPV4_SPACE, *IPV6_SPACE, *OUTSIDE)),
+    *(('SERVICE_CIDR_BLOCK', service) for service in SERVICES),
+)
+TRAFFIC = tuple(
+    (protocol, fields)
+    for protocol in PROTOCOLS
+    for fields in (
+        itertools.product(PORTS, PORTS)
+        if protocol in PORT_OPTIONS
+        else itertools.product(ICMP_TYPES, ICMP_CODES)
+        if protocol in (1, 58)
+        else [()]
+    )
+)
+
+
+# =============================================================================
+# 오라클 (규칙 딕셔너리를 직접 해석)
+# =============================================================================
+
+
+def _in_range(options: dict[str, Any] | None, port: int) -> bool:
+    if not options or options.get('min') is None:
+        return True
+    return int(options['min']) <= port <= int(options.get('max', options['min']))
+
+
+def target_matches(rule: dict[str, Any], direction: str, target: tuple[str, Any]) -> bool:
+    target_key, type_key = TARGET_KEYS[direction]
+    target_type, value = target
+    if (rule.get(type_key) or 'CIDR_BLOCK') != target_type:
+        return False
+    if target_type == 'CIDR_BLOCK':
+        network = ipaddress.ip_network(rule[target_key])
+        return network.version == value.version and value in network
+    return rule[target_key] == value
+
+
+def traffic_matches(rule: dict[str, Any], protocol: int, fields: tuple[int, ...]) -> bool:
+    if str(rule['protocol']).lower() == 'all':
+        return True
+    if int(rule['protocol']) != protocol:
+        return False
+    if protocol in PORT_OPTIONS:
+        options = rule.get(PORT_OPTIONS[protocol]) or {}
+        dst_port, src_port = fields
+        return _in_range(options, dst_port) and _in_range(options.get('source_port_range'), src_port)
+    if protocol in (1, 58) and rule.get('icmp_options'):
+        icmp = rule['icmp_options']
+        icmp_type, icmp_code = fields
+        return icmp['type'] == icmp_type and icmp.get('code', icmp_code) == icmp_code
+    return True
+
+
+def allowed(rule: dict[str, Any], direction: str) -> frozenset:
+    """규칙 하나가 허용하는 열거 공간의 점 (stateless, 대상, 프로토콜, 옵션 값)"""
+    targets = [target for target in TARGETS if target_matches(rule, direction, target)]
+    traffic = [item for item in TRAFFIC if traffic_matches(rule, *item)]
+    stateless = bool(rule.get('stateless', False))
+    return frozenset((stateless, target, protocol, fields) for target in targets for protocol, fields in traffic)
+
+
+def allows(rules: list[dict[str, Any]], direction: str, point: tuple) -> bool:
+    """열거 공간 밖의 점도 받는 단일 점 오라클"""
+    stateless, target, protocol, fields = point
+    return any(
+        bool(rule.get('stateless', False)) == stateless
+        and target_matches(rule, direction, target)
+        and traffic_matches(rule, protocol, fields)
+        for rule in rules
+    )
+
+
+def allowed_all(rules: list[dict[str, Any]], direction: str) -> frozenset:
+    return frozenset().union(*(allowed(rule, direction) for rule in rules))
+
+
+# =============================================================================
+# 무작위 규칙
+# =============================================================================
+
+
+def random_cidr(rng: random.Random) -> str:
+    space = rng.choice((IPV4_SPACE, IPV4_SPACE, IPV6_SPACE))
+    roll = rng.random()
+    if roll < 0.1:
+        return '0.0.0.0/0' if space.version == 4 else '::/0'
+    prefixlen = rng.randint(space.prefixlen, space.max_prefixlen)
+    return str(rng.choice(list(space.subnets(new_prefix=prefixlen))))
+
+
+def random_ports(rng: random.Random, high: int) -> dict[str, int]:
+    low = rng.randint(1, high)
+    ports = {'min': low, 'max': rng.randint(low, high)}
+    if rng.random() < 0.1:
+        del ports['max']
+    return ports
+
+
+def random_rule(rng: random.Random, direction: str) -> dict[str, Any]:
+    target_key, type_key = TARGET_KEYS[direction]
+    rule: dict[str, Any] = {
+        'protocol': rng.choice(('all', '6', '6', '17', '1', '58', '47')),
+        'description': rng.choice(('', 'api', 'kubelet', 'nodes', 'pods')),
+    }
+    if rng.random() < 0.1:
+        rule[target_key], rule[type_key] = rng.choice(SERVICES), 'SERVICE_CIDR_BLOCK'
+    else:
+        rule[target_key] = random_cidr(rng)
+        if direction == 'egress' or rng.random() < 0.5:
+            rule[type_key] = 'CIDR_BLOCK'
+    if rng.random() < 0.2:
+        rule['stateless'] = True
+    protocol = rule['protocol']
+    if protocol in ('6', '17') and rng.random() < 0.8:
+        options = random_ports(rng, MAX_PORT) if rng.random() < 0.9 else {'min': 1, 'max': 65535}
+        if rng.random() < 0.2:
+            options['source_port_range'] = random_ports(rng, MAX_PORT)
+        rule[PORT_OPTIONS[int(protocol)]] = options
+    if protocol in ('1', '58') and rng.random() < 0.7:
+        rule['icmp_options'] = {'type': rng.randint(0, 3)}
+        if rng.random() < 0.5:
+            rule['icmp_options']['code'] = rng.randint(0, 2)
+    return rule
+
+
+def random_rules(rng: random.Random, direction: str) -> list[dict[str, Any]]:
+    rules = [random_rule(rng, direction) for _ in range(rng.randint(1, 25))]
+    # 같은 규칙(설명만 다를 수 있음)을 섞어 중복 제거를 검사
+    for _ in range(rng.randint(0, 4)):
+        twin = copy.deepcopy(rng.choice(rules))
+        twin['description'] = rng.choice(('', 'copy', twin['description']))
+        rules.insert(rng.randint(0, len(rules)), twin)
+    return rules
+
+
+def mutate(rng: random.Random, rules: list[dict[str, Any]], direction: str) -> list[dict[str, Any]]:
+    """규칙 하나를 빼거나, 바꾸거나, 새 규칙을 더한 목록"""
+    rules = copy.deepcopy(rules)
+    roll = rng.random()
+    if roll < 0.3 and rules:
+        rules.pop(rng.randrange(len(rules)))
+    elif roll < 0.6 and rules:
+        rule = rng.choice(rules)
+        choice = rng.random()
+        if choice < 0.3:
+            rule['stateless'] = not rule.get('stateless', False)
+        elif choice < 0.6 and rule['protocol'] in ('6', '17'):
+            rule[PORT_OPTIONS[int(rule['protocol'])]] = random_ports(rng, MAX_PORT)
+        elif rule['protocol'] in ('1', '58'):
+            rule['icmp_options'] = {'type': rng.randint(0, 3), 'code': rng.randint(0, 2)}
+        else:
+            rule[TARGET_KEYS[direction][0]] = random_cidr(rng)
+            rule[TARGET_KEYS[direction][1]] = 'CIDR_BLOCK'
+    else:
+        rules.append(random_rule(rng, direction))
+    return rules
+
+
+# =============================================================================
+# 검사
+# =============================================================================
+
+
+def check_minimal(compiled: list[dict[str, Any]], direction: str) -> list[str]:
+    """결과에 중복, 가려진 규칙, 병합 가능한 포트 범위/CIDR이 남지 않았는지"""
+    problems = []
+    rules = [normalize_rule(rule, direction) for rule in compiled]
+    points = [allowed(rule, direction) for rule in compiled]
+    for (i, first), (j, second) in itertools.permutations(enumerate(rules), 2):
+        if points[i] <= points[j]:
+            problems.append(f'rule {compiled[i]} is covered by {compiled[j]}')
+        if i > j:
+            continue
+        # 포트 범위(key[5])만 다른 규칙: 겹치거나 인접하면 병합되어야 한다
+        same_but_ports = first.key[:5] == second.key[:5] and first.key[6:] == second.key[6:]
+        if same_but_ports and first.dst_ports and second.dst_ports:
+            lower, upper = sorted([first.dst_ports, second.dst_ports])
+            if upper[0] <= lower[1] + 1:
+                problems.append(f'port ranges {first.dst_ports} and {second.dst_ports} were not merged')
+        # 대상(key[3])만 다른 CIDR 규칙: 더 적은 CIDR로 합칠 수 있으면 병합되어야 한다
+        if (
+            first.target_type == second.target_type == 'CIDR_BLOCK'
+            and first.key[:3] == second.key[:3]
+            and first.key[4:] == second.key[4:]
+        ):
+            networks = [ipaddress.ip_network(first.target), ipaddress.ip_network(second.target)]
+            if networks[0].version == networks[1].version and len(list(ipaddress.collapse_addresses(networks))) < 2:
+                problems.append(f'CIDRs {first.target} and {second.target} were not merged')
+    return problems
+
+
+def check_mismatch(
+    original: list[dict[str, Any]], other: list[dict[str, Any]], direction: str, label: str
+) -> list[str]:
+    """`find_mismatch` 결과를 오라클과 비교"""
+    expected_equal = allowed_all(original, direction) == allowed_all(other, direction)
+    mismatch = find_mismatch(
+        [normalize_rule(rule, direction) for rule in original], [normalize_rule(rule, direction) for rule in other]
+    )
+    if mismatch is None:
+        return [] if expected_equal else [f'{label}: find_mismatch found no difference, oracle disagrees']
+    if expected_equal:
+        return [f'{label}: find_mismatch reported {mismatch}, oracle says equal']
+    # (방향, stateless, 대상 종류, 대상, 프로토콜, *옵션 값, 원본 허용, 비교 대상 허용)
+    _, stateless, target_type, target, protocol, *fields, before, after = mismatch
+    if target_type == 'CIDR_BLOCK':
+        version, address = target
+        target = ipaddress.IPv4Address(address) if version == 4 else ipaddress.IPv6Address(address)
+    point = (stateless, (target_type, target), protocol, tuple(fields))
+    if (allows(original, direction, point), allows(other, direction, point)) != (before, after) or before == after:
+        return [f'{label}: find_mismatch point {mismatch} is not a real difference']
+    return []
+
+
+def check_case(seed: int) -> list[str]:
+    rng = random.Random(seed)
+    direction = rng.choice(('ingress', 'egress'))
+    original = random_rules(rng, direction)
+    compiled = compile_rules(original, direction, verify=False) or []
+    problems = []
+    if allowed_all(original, direction) != allowed_all(compiled, direction):
+        problems.append(f'seed {seed}: compiled {direction} rules allow different traffic')
+    if len(compiled) > len({normalize_rule(rule, direction).key for rule in original}):
+        problems.append(f'seed {seed}: {len(compiled)} compiled rules from {len(original)}')
+    problems += [f'seed {seed}: {problem}' for problem in check_minimal(compiled, direction)]
+    recompiled = compile_rules(compiled, direction, verify=False) or []
+    if [normalize_rule(rule, direction).key for rule in recompiled] != [
+        normalize_rule(rule, direction).key for rule in compiled
+    ]:
+        problems.append(f'seed {seed}: compiling the compiled rules changed them')
+
+    # 한도: 결과 규칙 수까지는 통과, 하나 적으면 ValueError
+    compile_rules(original, direction, limit=len(compiled), verify=False)
+    try:
+        compile_rules(original, direction, limit=len(compiled) - 1, verify=False)
+    except ValueError:
+        pass
+    else:
+        problems.append(f'seed {seed}: {len(compiled)} rules accepted with limit {len(compiled) - 1}')
+
+    problems += check_mismatch(original, compiled, direction, f'seed {seed} compiled')
+    problems += check_mismatch(original, mutate(rng, compiled, direction), direction, f'seed {seed} mutated')
+    problems += check_mismatch(original, random_rules(rng, direction), direction, f'seed {seed} unrelated')
+    return problems
+
+
+def check_limit() -> list[str]:
+    """떨어진 포트 규칙은 한도를 넘으면 거부, 인접 포트 규칙은 하나로 병합되어 통과"""
+    apart = [
+        {'protocol': '6', 'source': '10.0.0.0/16', 'tcp_options': {'min': port, 'max': port}}
+        for port in range(1, 2 * MAX_RULES_PER_DIRECTION + 3, 2)
+    ]
+    adjacent = [{**rule, 'tcp_options': {'min': port, 'max': port}} for port, rule in enumerate(apart, start=1)]
+    problems = []
+    try:
+        if len(compile_rules(apart[:MAX_RULES_PER_DIRECTION], 'ingress')) != MAX_RULES_PER_DIRECTION:
+            problems.append(f'{MAX_RULES_PER_DIRECTION} separate port rules were merged')
+    except ValueError as e:
+        problems.append(f'{MAX_RULES_PER_DIRECTION} separate port rules rejected: {e}')
+    try:
+        compile_rules(apart[: MAX_RULES_PER_DIRECTION + 1], 'ingress')
+    except ValueError:
+        pass
+    else:
+        problems.append(f'{MAX_RULES_PER_DIRECTION + 1} separate port rules accepted')
+    try:
+        merged = compile_rules(adjacent, 'ingress')
+    except ValueError as e:
+        return [*problems, f'{len(adjacent)} adjacent port rules rejected: {e}']
+    if [rule.get('tcp_options') for rule in merged] != [{'min': 1, 'max': len(adjacent)}]:
+        problems.append(f'{len(adjacent)} adjacent port rules compiled to {merged[:2]}...')
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seeds', type=int, default=300, help='무작위 규칙 목록 수')
+    args = parser.parse_args()
+
+    checks = {
+        f'compile_rules and find_mismatch against the oracle ({args.seeds} seeds)': lambda: [
+            problem for seed in range(args.seeds) for problem in check_case(seed)
+        ],
+        f'per-list limit ({MAX_RULES_PER_DIRECTION} rules)': check_limit,
+    }
+    failures = 0
+    for name, check in checks.items():
+        problems = check()
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems[:10]:
+            print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
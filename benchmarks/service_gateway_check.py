@@ -0,0 +1,157 @@
+"""
+리전별 서비스 게이트웨이 경로/보안 규칙 검사
+`REGION_CONFIGS`의 리전마다 빈 서비스 카탈로그 캐시로 프로그램을 Pulumi mock 위에서 실행하여
+`get_services` invoke 응답(`benchmarks.mocks.services_result`)이 다음에 반영되는지 확인한다.
+불일치가 있으면 종료 코드 1.
+
+- 서비스 게이트웨이가 리전의 'All Services' 서비스 ID를 사용
+- 프라이빗 라우트 테이블에 리전 서비스 CIDR 레이블(`service_cidr_label`) -> 서비스 게이트웨이 경로
+- SERVICE_CIDR_BLOCK 대상 보안 규칙(보안 리스트 / NSG 모드)이 모두 리전 레이블을 사용하고, 노드/API 엔드포인트에 존재
+- 만료된 캐시 항목이 있을 때 `get_services` 조회가 실패(인증 오류)하면 프로그램이 실패하지 않고 만료된 항목을 사용
+
+실행:
+    python -m benchmarks.service_gateway_check
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import config as cfg
+from benchmarks.mocks import (
+    GET_NODE_POOL_OPTION_TOKEN,
+    GET_SERVICES_TOKEN,
+    OCIMocks,
+    evaluate_program,
+    node_pool_option_result,
+    services_result,
+)
+from network.service_catalog import ServiceEntry, resolve_service, service_cidr_label
+
+ROUTE_TABLE_TYPE = 'oci:Core/routeTable:RouteTable'
+SERVICE_GATEWAY_TYPE = 'oci:Core/serviceGateway:ServiceGateway'
+SECURITY_LIST_TYPE = 'oci:Core/securityList:SecurityList'
+NSG_RULE_TYPE = 'oci:Core/networkSecurityGroupSecurityRule:NetworkSecurityGroupSecurityRule'
+PRIVATE_ROUTE_TABLE = 'oke-route-table-private'
+# 서비스 CIDR 대상 Egress 규칙이 있어야 하는 보안 리스트 / NSG
+SECURITY_LISTS = ('oke-node-security-list', 'oke-k8s-api-security-list')
+NSGS = ('oke-node-nsg-id', 'oke-k8s-api-nsg-id')
+
+
+def failing(_: dict[str, Any]) -> tuple[dict[str, Any], list[tuple[str, str]]]:
+    """provider가 오류를 돌려준 invoke (Pulumi mock의 (결과, 실패 목록) 응답)"""
+    return {}, [('', 'NotAuthenticated (401)')]
+
+
+def service_rules(mocks: OCIMocks) -> list[tuple[str, dict[str, Any]]]:
+    """(보안 리스트 이름 또는 NSG ID, SERVICE_CIDR_BLOCK 대상 규칙)"""
+    rules = []
+    for resource in mocks.resources:
+        if resource.typ == SECURITY_LIST_TYPE:
+            for key in ('ingressSecurityRules', 'egressSecurityRules'):
+                rules += [(resource.name, rule) for rule in resource.inputs.get(key) or []]
+        elif resource.typ == NSG_RULE_TYPE:
+            rules.append((resource.inputs['networkSecurityGroupId'], resource.inputs))
+    return [
+        (owner, rule)
+        for owner, rule in rules
+        if 'SERVICE_CIDR_BLOCK' in (rule.get('destinationType'), rule.get('sourceType'))
+    ]
+
+
+def check_region(region: str, security_mode: str, cache_dir: Path) -> list[str]:
+    label = service_cidr_label(region)
+    service = next(item for item in services_result(region)['services'] if item['cidrBlock'] == label)
+    mocks = evaluate_program(
+        {
+            'region': region,
+            'security_mode': security_mode,
+            'service_catalog_cache': str(cache_dir / f'{region}-{security_mode}.json'),
+        },
+    )
+    problems = []
+    if not any(call.token == GET_SERVICES_TOKEN for call in mocks.calls):
+        problems.append('get_services was not invoked')
+
+    gateways = [resource for resource in mocks.resources if resource.typ == SERVICE_GATEWAY_TYPE]
+    if [gateway.inputs['services'] for gateway in gateways] != [[{'serviceId': service['id']}]]:
+        problems.append(f'service gateway services {[gateway.inputs["services"] for gateway in gateways]}')
+    gateway_ids = {f'{gateway.name}-id' for gateway in gateways}
+
+    route_table = next(
+        (
+            resource
+            for resource in mocks.resources
+            if resource.typ == ROUTE_TABLE_TYPE and resource.inputs['displayName'] == PRIVATE_ROUTE_TABLE
+        ),
+        None,
+    )
+    routes = [
+        rule
+        for rule in (route_table.inputs['routeRules'] if route_table else [])
+        if rule['destinationType'] == 'SERVICE_CIDR_BLOCK'
+    ]
+    if [(rule['destination'], rule['networkEntityId'] in gateway_ids) for rule in routes] != [(label, True)]:
+        problems.append(f'private route table service routes {routes}, expected {label} via the service gateway')
+
+    rules = service_rules(mocks)
+    wrong = sorted({rule.get('destination') or rule.get('source') for _, rule in rules} - {label})
+    if wrong:
+        problems.append(f'security rules use other service labels: {wrong}')
+    owners = SECURITY_LISTS if security_mode == 'security_list' else NSGS
+    missing = [owner for owner in owners if not any(rule_owner == owner for rule_owner, _ in rules)]
+    if missing:
+        problems.append(f'no {label} security rule for {", ".join(missing)}')
+    return problems
+
+
+def check_stale_on_error(region: str, cache_dir: Path) -> list[str]:
+    """만료된 캐시 항목 + 실패하는 `get_services`: 만료된 항목의 서비스 ID로 서비스 게이트웨이를 만든다"""
+    stale = ServiceEntry(region, f'ocid1.service.oc1.{region}.stale', service_cidr_label(region))
+    cache_path = cache_dir / f'{region}-stale.json'
+    cache_path.write_text(json.dumps({'regions': {region: asdict(stale)}}))
+    mocks = OCIMocks({GET_SERVICES_TOKEN: failing, GET_NODE_POOL_OPTION_TOKEN: node_pool_option_result(region)})
+    # 해석 결과는 프로세스 안에서 캐시되므로 비운다 (같은 인자의 이전 해석 재사용 방지)
+    resolve_service.cache_clear()
+    try:
+        evaluate_program({'region': region, 'service_catalog_cache': str(cache_path)}, mocks=mocks)
+    except Exception as e:
+        return [f'program failed: {e}']
+    problems = []
+    if not any(call.token == GET_SERVICES_TOKEN for call in mocks.calls):
+        problems.append('get_services was not invoked for the stale entry')
+    services = [resource.inputs['services'] for resource in mocks.resources if resource.typ == SERVICE_GATEWAY_TYPE]
+    if services != [[{'serviceId': stale.service_id}]]:
+        problems.append(f'service gateway services {services}, expected the stale {stale.service_id}')
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--regions', nargs='+', default=sorted(cfg.REGION_CONFIGS), help='검사할 리전')
+    args = parser.parse_args()
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as directory:
+        for region in args.regions:
+            for security_mode in ('security_list', 'nsg'):
+                problems = check_region(region, security_mode, Path(directory))
+                failures += bool(problems)
+                print(f'{"FAIL" if problems else "ok":<5} {region} {security_mode} ({service_cidr_label(region)})')
+                for problem in problems:
+                    print(f'      {problem}')
+            problems = check_stale_on_error(region, Path(directory))
+            failures += bool(problems)
+            print(f'{"FAIL" if problems else "ok":<5} {region} stale cache on get_services error')
+            for problem in problems:
+                print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
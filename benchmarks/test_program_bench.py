@@ -0,0 +1,28 @@
+"""
+프로그램 평가 / 리소스 그래프 구성 벤치마크 (pytest)
+시나리오(`benchmarks.program_bench.SCENARIOS`) x 규모(`--bench-scales`)마다 실행 시간, 최대 메모리,
+리소스 수를 측정하고, `--bench-compare`로 준 기준 결과보다 임계값(`--bench-threshold`)을 넘게 나빠지면 실패한다.
+
+실행:
+    python -m pytest benchmarks/test_program_bench.py --bench-scales 1 10 100
+"""
+
+import pytest
+
+from benchmarks.program_bench import SCENARIOS, compare, execute, measure, regions_runs
+
+
+@pytest.fixture(scope='module', autouse=True)
+def warm_up() -> None:
+    """첫 실행의 임포트 및 조회 캐시 초기화 비용이 측정에 섞이지 않도록 한 번 먼저 실행"""
+    execute(regions_runs(1))
+
+
+@pytest.mark.parametrize('scenario', list(SCENARIOS))
+def test_program(scenario, scale, pytestconfig, bench_baseline, bench_results):
+    result = measure(scenario, scale, pytestconfig.getoption('bench_repeat'))
+    bench_results.append(result)
+    assert result.resources > 0
+    if bench_baseline is not None:
+        regressions, lines = compare([result], bench_baseline, pytestconfig.getoption('bench_threshold'))
+        assert not regressions, f'{lines[0]}: ' + ', '.join(regressions)
@@ -0,0 +1,224 @@
+"""
+단계별 트레이싱(tracing) 검사
+Pulumi mock 위에서 `trace_file`을 설정하고 프로그램을 평가하여 저장된 트레이스를 확인한다
+(`trace_format` chrome / otel). 불일치가 있으면 종료 코드 1.
+
+- 스팬 트리: 루트 'pulumi program' 하나, 모든 스팬의 부모 ID가 트레이스 안에 존재, 매니저 메소드와 조회 함수의 중첩
+- resolve: 반환된 리소스(VCN, 서브넷, 클러스터, 노드 풀 등)마다 `id` 확정 스팬이 있고, 평가한 리소스와 일치
+- 형식: Chrome trace event(메타데이터 트랙, 'X' 이벤트) / OTLP JSON(resourceSpans, 16진수 ID, 나노초 문자열)
+- 비활성: 새 프로세스에서 `trace_file` 없이 평가하면 어떤 함수도 감싸지 않음
+
+실행:
+    python -m benchmarks.tracing_check
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from automation.fleet import PROJECT_ROOT
+from benchmarks.mocks import OCIMocks, evaluate_program
+from tracing import CATEGORIES, SERVICE_NAME
+
+ROOT_SPAN = 'pulumi program'
+# 반환된 Output이 확정될 때까지의 스팬 (부모 스팬이 끝난 뒤에 끝날 수 있음)
+RESULT_SUFFIX = ' (result)'
+# (자식 스팬, 부모 스팬)
+NESTING = [
+    ('VCNManager.create_vcn', ROOT_SPAN),
+    ('GatewayManager.create_nat_gateway', 'GatewayManager.create_all_gateways'),
+    ('SubnetManager.create_subnet', 'SubnetManager.create_all_subnets'),
+    ('OKEClusterManager.create_endpoint_config', 'OKEClusterManager.create_cluster'),
+    ('NodePoolManager.create_node_pool', 'NodePoolManager.create_all_node_pools'),
+    ('placement.get_availability_domains', 'NodePoolManager.create_node_config_details'),
+]
+# resolve 스팬이 있어야 하는 리소스 ('<리소스 클래스> <리소스 이름>')
+RESOLVED = {
+    'Vcn vcn',
+    'NatGateway natGateway',
+    'RouteTable oke-route-table-private',
+    'Subnet oke-node-subnet',
+    'Subnet oke-api-subnet',
+    'Cluster oke-cluster',
+    'NodePool oke-node-pool',
+}
+HEX_ID = {'traceId': re.compile(r'[0-9a-f]{32}'), 'spanId': re.compile(r'[0-9a-f]{16}')}
+CHROME_EVENT_KEYS = {'name', 'cat', 'ph', 'ts', 'dur', 'pid', 'tid', 'args'}
+# 새 프로세스에서 트레이싱 없이 평가한 뒤 감싸진 함수 목록 출력
+UNTRACED_PROGRAM = """
+import inspect, json, sys
+from benchmarks.mocks import evaluate_program
+evaluate_program()
+owners = [
+    (module_name, module)
+    for module_name, module in list(sys.modules.items())
+    if module_name.split('.')[0] in ('network', 'cluster')
+]
+owners += [
+    (f'{module_name}.{name}', owner)
+    for module_name, module in owners
+    for name, owner in inspect.getmembers(module, inspect.isclass)
+]
+traced = [
+    f'{name}.{attribute}'
+    for name, owner in owners
+    for attribute, value in vars(owner).items()
+    if getattr(getattr(value, '__func__', value), '__traced__', False)
+]
+print(json.dumps(traced))
+"""
+
+
+def trace(trace_format: str, directory: Path) -> tuple[OCIMocks, dict[str, Any]]:
+    mocks = evaluate_program({'trace_file': str(directory / '{stack}.json'), 'trace_format': trace_format})
+    return mocks, json.loads((directory / 'bench.json').read_text())
+
+
+def chrome_spans(payload: dict[str, Any]) -> tuple[list[dict[str, Any]], list[str]]:
+    """(스팬 목록, 형식 문제)"""
+    problems = []
+    events = payload.get('traceEvents', [])
+    tracks = {event['args']['name']: event['tid'] for event in events if event.get('name') == 'thread_name'}
+    if sorted(tracks) != sorted(CATEGORIES):
+        problems.append(f'thread tracks {tracks}')
+    spans = []
+    for event in events:
+        if event['ph'] == 'M':
+            continue
+        if event['ph'] != 'X' or set(event) != CHROME_EVENT_KEYS or tracks.get(event['cat']) != event['tid']:
+            problems.append(f'unexpected event {event}')
+            continue
+        if event['dur'] < 0:
+            problems.append(f'{event["name"]}: negative duration')
+        spans.append(
+            {
+                'name': event['name'],
+                'category': event['cat'],
+                'span_id': event['args']['span_id'],
+                'parent_id': event['args']['parent_id'],
+                'start': event['ts'] * 1000,
+                'end': (event['ts'] + event['dur']) * 1000,
+            }
+        )
+    return spans, problems
+
+
+def otel_spans(payload: dict[str, Any]) -> tuple[list[dict[str, Any]], list[str]]:
+    problems = []
+    resource_spans = payload.get('resourceSpans', [])
+    if len(resource_spans) != 1:
+        return [], [f'{len(resource_spans)} resourceSpans']
+    resource = {item['key']: item['value']['stringValue'] for item in resource_spans[0]['resource']['attributes']}
+    if resource != {'service.name': SERVICE_NAME, 'pulumi.stack': 'bench'}:
+        problems.append(f'resource attributes {resource}')
+    scope_spans = resource_spans[0]['scopeSpans']
+    if [scope['scope']['name'] for scope in scope_spans] != [f'{SERVICE_NAME}.tracing']:
+        problems.append(f'scopes {[scope["scope"] for scope in scope_spans]}')
+    spans = []
+    trace_ids = set()
+    for span in scope_spans[0]['spans']:
+        trace_ids.add(span['traceId'])
+        attributes = {item['key']: item['value']['stringValue'] for item in span['attributes']}
+        ids = [span[key] for key in ('traceId', 'spanId')] + ([span['parentSpanId']] if 'parentSpanId' in span else [])
+        patterns = [HEX_ID['traceId'], HEX_ID['spanId'], HEX_ID['spanId']]
+        if not all(pattern.fullmatch(value) for pattern, value in zip(patterns, ids, strict=False)):
+            problems.append(f'{span["name"]}: malformed ids {ids}')
+        if span['kind'] != 1 or not all(span[key].isdigit() for key in ('startTimeUnixNano', 'endTimeUnixNano')):
+            problems.append(f'{span["name"]}: kind {span["kind"]}, times {span["startTimeUnixNano"]}')
+            continue
+        spans.append(
+            {
+                'name': span['name'],
+                'category': attributes.get('oke.category'),
+                'span_id': span['spanId'],
+                'parent_id': span.get('parentSpanId'),
+                'start': int(span['startTimeUnixNano']),
+                'end': int(span['endTimeUnixNano']),
+            }
+        )
+    if len(trace_ids) != 1:
+        problems.append(f'{len(trace_ids)} trace ids')
+    return spans, problems
+
+
+def check_tree(spans: list[dict[str, Any]], mocks: OCIMocks) -> list[str]:
+    problems = []
+    by_id = {span['span_id']: span for span in spans}
+    if len(by_id) != len(spans):
+        problems.append('duplicate span ids')
+    roots = [span['name'] for span in spans if span['parent_id'] is None]
+    if roots != [ROOT_SPAN]:
+        problems.append(f'root spans {roots}')
+    for span in spans:
+        parent = by_id.get(span['parent_id'])
+        if span['parent_id'] is not None and parent is None:
+            problems.append(f'{span["name"]}: parent {span["parent_id"]} not in the trace')
+        elif parent and not parent['start'] <= span['start']:
+            problems.append(f'{span["name"]} starts before its parent {parent["name"]}')
+        elif (
+            parent
+            and span['category'] == 'evaluate'
+            and not span['name'].endswith(RESULT_SUFFIX)
+            and span['end'] > parent['end']
+        ):
+            problems.append(f'{span["name"]} ends after its parent {parent["name"]}')
+        if span['category'] not in CATEGORIES or span['end'] < span['start']:
+            problems.append(f'{span["name"]}: category {span["category"]}, {span["start"]}..{span["end"]}')
+
+    edges = {(span['name'], by_id[span['parent_id']]['name']) for span in spans if span['parent_id'] in by_id}
+    problems += [f'no {child} span under {parent}' for child, parent in NESTING if (child, parent) not in edges]
+    invokes = {span['name'] for span in spans if span['category'] == 'invoke'}
+    if 'placement.get_availability_domains' not in invokes:
+        problems.append(f'invoke spans {sorted(invokes)}')
+
+    resolved = {span['name'] for span in spans if span['category'] == 'resolve'}
+    resources = {f'{resource.typ.rsplit(":", 1)[-1]} {resource.name}' for resource in mocks.resources}
+    if not RESOLVED <= resolved:
+        problems.append(f'no resolve span for {sorted(RESOLVED - resolved)}')
+    if resolved - resources:
+        problems.append(f'resolve spans for unknown resources {sorted(resolved - resources)}')
+    return problems
+
+
+def check_format(trace_format: str) -> list[str]:
+    with tempfile.TemporaryDirectory() as directory:
+        mocks, payload = trace(trace_format, Path(directory))
+    spans, problems = (otel_spans if trace_format == 'otel' else chrome_spans)(payload)
+    return problems + check_tree(spans, mocks)
+
+
+def check_disabled() -> list[str]:
+    result = subprocess.run([sys.executable, '-c', UNTRACED_PROGRAM], capture_output=True, text=True, cwd=PROJECT_ROOT)
+    if result.returncode:
+        return [f'program failed: {" ".join(result.stderr.strip().splitlines()[-1:])}']
+    traced = json.loads(result.stdout.strip().splitlines()[-1])
+    return [f'wrapped without trace_file: {", ".join(traced)}'] if traced else []
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    checks = {
+        'chrome trace': lambda: check_format('chrome'),
+        'otel trace': lambda: check_format('otel'),
+        'disabled: nothing wrapped': check_disabled,
+    }
+    failures = 0
+    for name, check in checks.items():
+        problems = check()
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {name}')
+        for problem in problems:
+            print(f'      {problem}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+"""
+노드 풀 업그레이드 전략 검사
+Pulumi mock 위에서 업그레이드 전략(default, surge, blue_green 단계별)마다 프로그램을 평가하여
+생성되는 노드 풀 리소스(이름, 버전, 크기, 사이클링 설정)가 기대와 같은지 확인하고,
+지정한 노드 풀 크기에 대한 업그레이드 계획(소요 시간, 최소 용량)을 출력한다. 불일치가 있으면 종료 코드 1.
+
+실행:
+    python -m benchmarks.upgrade_check --size 50
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+from benchmarks.mocks import (
+    GET_NODE_POOL_OPTION_TOKEN,
+    GET_SERVICES_TOKEN,
+    OCIMocks,
+    evaluate_program,
+    node_pool_option_result,
+    services_result,
+)
+from cluster.upgrade import UpgradeStrategy, plan_upgrade
+
+NODE_POOL_TYPE = 'oci:ContainerEngine/nodePool:NodePool'
+CURRENT_VERSION = 'v1.33.1'
+PREVIOUS_VERSION = 'v1.32.1'
+POOL_SIZE = 3
+
+
+class NodePoolMocks(OCIMocks):
+    """green 노드 풀이 `ready`개의 ACTIVE 노드를 가진 것처럼 응답하는 mock"""
+
+    def __init__(self, region: str, ready: int):
+        super().__init__(
+            {GET_SERVICES_TOKEN: services_result(region), GET_NODE_POOL_OPTION_TOKEN: node_pool_option_result(region)}
+        )
+        self.ready = ready
+
+    def new_resource(self, args):
+        resource_id, state = super().new_resource(args)
+        if args.typ == NODE_POOL_TYPE and args.name.endswith('-green'):
+            state = {**state, 'nodes': [{'state': 'ACTIVE'}] * self.ready}
+        return resource_id, state
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    name: str
+    upgrade: dict[str, Any]
+    # 리소스 이름 -> (노드 풀 이름, Kubernetes 버전, 크기)
+    expected: dict[str, tuple[str, str, int]]
+    cycling: dict[str, Any] | None = None
+    ready: int = POOL_SIZE
+
+
+def _blue_green(phase: str) -> dict[str, Any]:
+    return {
+        'strategy': 'blue_green',
+        'active_color': 'green',
+        'phase': phase,
+        'previous_kubernetes_version': PREVIOUS_VERSION,
+    }
+
+
+CASES = (
+    Case('default', {}, {'oke-node-pool': ('pool1', CURRENT_VERSION, POOL_SIZE)}),
+    Case(
+        'surge',
+        {'strategy': 'surge', 'max_surge': '50%', 'max_unavailable': '1'},
+        {'oke-node-pool': ('pool1', CURRENT_VERSION, POOL_SIZE)},
+        {'isNodeCyclingEnabled': True, 'maximumSurge': '50%', 'maximumUnavailable': '1'},
+    ),
+    Case(
+        'blue_green rollout',
+        _blue_green('rollout'),
+        {
+            'oke-node-pool-green': ('pool1-green', CURRENT_VERSION, POOL_SIZE),
+            'oke-node-pool': ('pool1', PREVIOUS_VERSION, POOL_SIZE),
+        },
+    ),
+    Case(
+        'blue_green cutover',
+        _blue_green('cutover'),
+        {
+            'oke-node-pool-green': ('pool1-green', CURRENT_VERSION, POOL_SIZE),
+            'oke-node-pool': ('pool1', PREVIOUS_VERSION, 0),
+        },
+    ),
+    Case(
+        'blue_green cutover (not ready)',
+        _blue_green('cutover'),
+        {
+            'oke-node-pool-green': ('pool1-green', CURRENT_VERSION, POOL_SIZE),
+            'oke-node-pool': ('pool1', PREVIOUS_VERSION, POOL_SIZE),
+        },
+        ready=POOL_SIZE - 1,
+    ),
+    Case(
+        'blue_green complete',
+        {'strategy': 'blue_green', 'active_color': 'green', 'phase': 'complete'},
+        {'oke-node-pool-green': ('pool1-green', CURRENT_VERSION, POOL_SIZE)},
+    ),
+)
+
+
+def check(case: Case) -> list[str]:
+    """기대와 다른 점 목록"""
+    config = {
+        'kubernetes_version': CURRENT_VERSION,
+        'node_pool_size': str(POOL_SIZE),
+        'node_pool_upgrade': json.dumps(case.upgrade),
+    }
+    mocks = NodePoolMocks('ap-osaka-1', case.ready)
+    # cutover의 준비 상태 확인은 노드 목록이 확정되어야 하므로 preview가 아닌 update로 평가
+    evaluate_program(config, mocks, preview=False)
+    pools = {resource.name: resource.inputs for resource in mocks.resources if resource.typ == NODE_POOL_TYPE}
+    problems = []
+    if sorted(pools) != sorted(case.expected):
+        problems.append(f'node pools {sorted(pools)} != {sorted(case.expected)}')
+    for name, (pool_name, version, size) in case.expected.items():
+        inputs = pools.get(name)
+        if inputs is None:
+            continue
+        actual = (inputs['name'], inputs['kubernetesVersion'], int(inputs['nodeConfigDetails']['size']))
+        if actual != (pool_name, version, size):
+            problems.append(f'{name}: {actual} != {(pool_name, version, size)}')
+        if inputs.get('nodePoolCyclingDetails') != case.cycling:
+            problems.append(f'{name}: cycling {inputs.get("nodePoolCyclingDetails")} != {case.cycling}')
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=50, help='업그레이드 계획을 출력할 노드 풀 크기')
+    args = parser.parse_args()
+
+    failures = 0
+    for case in CASES:
+        problems = check(case)
+        failures += bool(problems)
+        print(f'{"FAIL" if problems else "ok":<5} {case.name}')
+        for problem in problems:
+            print(f'      {problem}')
+
+    print()
+    # 전략별 첫 번째 검사 설정으로 계획 출력
+    strategies = {}
+    for case in CASES:
+        strategies.setdefault(case.upgrade.get('strategy', 'default'), UpgradeStrategy.from_dict(case.upgrade))
+    for strategy in strategies.values():
+        print(plan_upgrade(f'size-{args.size}', args.size, strategy).summary())
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
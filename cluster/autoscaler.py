@@ -0,0 +1,68 @@
+import pulumi
+import pulumi_oci as oci
+from pulumi import Output
+
+import config as cfg
+
+
+class ClusterAutoscalerManager:
+    """
+    OKE Cluster Autoscaler 애드온 생성 및 관리 클래스
+    """
+
+    def __init__(self, oke_cluster, node_pools, pool_specs):
+        self.oke_cluster = oke_cluster
+        self.node_pools = node_pools
+        self.pool_specs = pool_specs
+        self.addon = None
+
+    def create_node_groups(self):
+        """
+        오토스케일링 노드 풀의 `min:max:노드풀OCID` 목록을 생성하는 메소드
+        """
+        groups = [
+            node_pool.id.apply(
+                lambda node_pool_id, bounds=self.pool_specs[name].bounds: f'{bounds[0]}:{bounds[1]}:{node_pool_id}'
+            )
+            for name, node_pool in self.node_pools.items()
+            if self.pool_specs[name].autoscaled
+        ]
+        return Output.all(*groups).apply(','.join)
+
+    def create_addon_configurations(self):
+        """
+        Cluster Autoscaler 애드온 설정 목록을 생성하는 메소드
+        """
+        settings = cfg.CLUSTER_AUTOSCALER
+        configurations = {
+            'authType': settings.auth_type,
+            'nodes': self.create_node_groups(),
+            'scaleDownDelayAfterAdd': settings.scale_down_delay_after_add,
+            'scaleDownUnneededTime': settings.scale_down_unneeded_time,
+            'scaleDownUtilizationThreshold': str(settings.scale_down_utilization_threshold),
+            'maxNodeProvisionTime': settings.max_node_provision_time,
+            'balanceSimilarNodeGroups': 'true',
+        }
+        return [
+            oci.containerengine.AddonConfigurationArgs(key=key, value=value) for key, value in configurations.items()
+        ]
+
+    def create_addon(self):
+        """
+        Cluster Autoscaler 애드온을 생성하는 메소드 (오토스케일링 노드 풀이 없으면 생성하지 않음)
+        """
+        if not cfg.CLUSTER_AUTOSCALER.enabled:
+            return None
+        if not any(self.pool_specs[name].autoscaled for name in self.node_pools):
+            pulumi.log.warn('min_size/max_size가 다른 노드 풀이 없어 Cluster Autoscaler 애드온을 생성하지 않습니다.')
+            return None
+
+        self.addon = oci.containerengine.Addon(
+            'oke-cluster-autoscaler',
+            addon_name='ClusterAutoscaler',
+            cluster_id=self.oke_cluster.id,
+            remove_addon_resources_on_delete=True,
+            configurations=self.create_addon_configurations(),
+            opts=pulumi.ResourceOptions(depends_on=list(self.node_pools.values())),
+        )
+        return self.addon
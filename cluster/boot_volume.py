@@ -0,0 +1,167 @@
+"""
+노드 부트 볼륨 크기/성능 계획
+이미지 풀과 컨테이너 로그 I/O는 부트 볼륨 처리량에 묶이므로, 노드 풀마다 예상 이미지 캐시 크기와 IOPS/처리량 목표에서
+부트 볼륨 크기를 계산하고 모양(shape)에서 낼 수 없는 조합은 preview 단계에서 거부한다.
+
+OKE 노드 풀 API(pulumi-oci `NodePoolNodeSourceDetailsArgs`)는 부트 볼륨 크기만 받고 VPU(성능 단위)는 받지 않으므로
+노드는 항상 Balanced(10 VPU/GB) 등급이며, 성능은 크기에 비례해 늘어난다. 따라서 성능 목표는 크기로 맞춘다.
+
+설정 예:
+    pulumi config set --path 'node_pools[0].boot_volume.image_cache_gbs' 60
+    pulumi config set --path 'node_pools[0].boot_volume.iops' 6000
+    pulumi config set --path 'node_pools[0].boot_volume.encrypt_in_transit' true
+"""
+
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+# OCI 부트 볼륨 크기 한도 (GB)와 OKE 노드 이미지 기본 크기
+MIN_BOOT_VOLUME_GBS = 50
+MAX_BOOT_VOLUME_GBS = 32768
+DEFAULT_BOOT_VOLUME_GBS = 50
+# Balanced 등급 성능: GB당 60 IOPS / 480 KB/s, 볼륨당 최대 25,000 IOPS / 480 MB/s
+VPUS_PER_GB = 10
+IOPS_PER_GB = 60
+MAX_IOPS = 25000
+THROUGHPUT_MBPS_PER_GB = 0.48
+MAX_THROUGHPUT_MBPS = 480
+# OS, kubelet, 로그가 차지하는 크기와 kubelet 이미지 GC 상한 (기본 85%를 넘으면 이미지 삭제 시작)
+OS_FOOTPRINT_GBS = 20
+IMAGE_GC_HIGH_THRESHOLD = 0.85
+# Flex VM 모양의 OCPU당 네트워크 대역폭 (Gbps)과 상한 - 블록 볼륨 트래픽도 이 대역폭을 함께 쓴다
+NETWORK_GBPS = {
+    'VM.Standard.A1.Flex': (1, 40),
+    'VM.Standard.E4.Flex': (1, 40),
+    'VM.Standard.E5.Flex': (1, 40),
+    'VM.Standard3.Flex': (1, 32),
+}
+
+
+def network_mbps(shape: str, ocpus: float) -> float | None:
+    """모양의 네트워크 대역폭 (MB/s, 알 수 없는 모양이면 None)"""
+    if shape not in NETWORK_GBPS:
+        return None
+    per_ocpu, limit = NETWORK_GBPS[shape]
+    return min(ocpus * per_ocpu, limit) * 125
+
+
+@dataclass(frozen=True, slots=True)
+class BootVolumeSpec:
+    """노드 풀 부트 볼륨 설정 (`boot_volume` config 객체, 크기를 지정하지 않으면 목표에서 계산)"""
+
+    size_in_gbs: int | None = None
+    image_cache_gbs: float = 0.0
+    iops: int = 0
+    throughput_mbps: float = 0.0
+    encrypt_in_transit: bool = False
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> 'BootVolumeSpec':
+        spec = cls(
+            size_in_gbs=int(raw['size_in_gbs']) if raw.get('size_in_gbs') is not None else None,
+            image_cache_gbs=float(raw.get('image_cache_gbs', 0)),
+            iops=int(raw.get('iops', 0)),
+            throughput_mbps=float(raw.get('throughput_mbps', 0)),
+            encrypt_in_transit=bool(raw.get('encrypt_in_transit', False)),
+        )
+        spec.validate()
+        return spec
+
+    def validate(self) -> None:
+        if self.size_in_gbs is not None and not MIN_BOOT_VOLUME_GBS <= self.size_in_gbs <= MAX_BOOT_VOLUME_GBS:
+            raise ValueError(
+                f'부트 볼륨 크기는 {MIN_BOOT_VOLUME_GBS} ~ {MAX_BOOT_VOLUME_GBS}GB 사이여야 합니다: {self.size_in_gbs}'
+            )
+        if self.image_cache_gbs < 0 or self.iops < 0 or self.throughput_mbps < 0:
+            raise ValueError('부트 볼륨의 image_cache_gbs/iops/throughput_mbps는 0 이상이어야 합니다.')
+        if self.iops > MAX_IOPS:
+            raise ValueError(f'부트 볼륨 IOPS 목표 {self.iops}가 Balanced 등급 볼륨 최대 {MAX_IOPS}를 넘습니다.')
+        if self.throughput_mbps > MAX_THROUGHPUT_MBPS:
+            raise ValueError(
+                f'부트 볼륨 처리량 목표 {self.throughput_mbps:g}MB/s가 Balanced 등급 볼륨 최대 '
+                f'{MAX_THROUGHPUT_MBPS}MB/s를 넘습니다.'
+            )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'size_in_gbs': self.size_in_gbs,
+            'image_cache_gbs': self.image_cache_gbs,
+            'iops': self.iops,
+            'throughput_mbps': self.throughput_mbps,
+            'encrypt_in_transit': self.encrypt_in_transit,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class BootVolumePlan:
+    """노드 풀 하나의 부트 볼륨 크기와 그 크기에서 나오는 성능"""
+
+    pool: str
+    size_in_gbs: int
+    required_gbs: int  # 이미지 캐시/IOPS/처리량 목표를 맞추는 최소 크기
+    encrypt_in_transit: bool
+
+    @property
+    def vpus_per_gb(self) -> int:
+        return VPUS_PER_GB
+
+    @property
+    def iops(self) -> int:
+        return min(self.size_in_gbs * IOPS_PER_GB, MAX_IOPS)
+
+    @property
+    def throughput_mbps(self) -> float:
+        return min(self.size_in_gbs * THROUGHPUT_MBPS_PER_GB, MAX_THROUGHPUT_MBPS)
+
+    @property
+    def grows_root_fs(self) -> bool:
+        """이미지 기본 크기보다 크면 루트 파일 시스템을 늘려야 한다"""
+        return self.size_in_gbs > DEFAULT_BOOT_VOLUME_GBS
+
+    def summary(self) -> str:
+        return (
+            f"노드 풀 '{self.pool}' 부트 볼륨: {self.size_in_gbs}GB ({self.vpus_per_gb} VPU/GB, "
+            f'{self.iops} IOPS, {self.throughput_mbps:.0f}MB/s, 전송 중 암호화 '
+            f'{"사용" if self.encrypt_in_transit else "미사용"})'
+        )
+
+
+def required_size(spec: BootVolumeSpec) -> int:
+    """이미지 캐시가 GC 상한 아래에 들어가고 IOPS/처리량 목표를 내는 최소 부트 볼륨 크기 (GB)"""
+    sizes = (
+        MIN_BOOT_VOLUME_GBS,
+        (OS_FOOTPRINT_GBS + spec.image_cache_gbs) / IMAGE_GC_HIGH_THRESHOLD if spec.image_cache_gbs else 0,
+        spec.iops / IOPS_PER_GB,
+        spec.throughput_mbps / THROUGHPUT_MBPS_PER_GB,
+    )
+    return math.ceil(max(sizes))
+
+
+def plan_boot_volume(pool: str, spec: BootVolumeSpec, shape: str, ocpus: float) -> BootVolumePlan:
+    """
+    부트 볼륨 크기를 결정하고 모양과의 조합을 검증
+    - 크기를 지정했으면 목표를 만족하는지 확인하고, 지정하지 않았으면 목표를 만족하는 최소 크기를 사용한다.
+    - 처리량 목표는 모양의 네트워크 대역폭을 넘을 수 없다.
+    - 전송 중 암호화는 반가상화(paravirtualized) 부착을 쓰는 VM 모양에서만 지원된다.
+    """
+    required = required_size(spec)
+    size = required if spec.size_in_gbs is None else spec.size_in_gbs
+    if size < required:
+        raise ValueError(
+            f"노드 풀 '{pool}'의 부트 볼륨 {size}GB가 이미지 캐시/성능 목표에 필요한 {required}GB보다 작습니다."
+        )
+    if size > MAX_BOOT_VOLUME_GBS:
+        raise ValueError(f"노드 풀 '{pool}'의 부트 볼륨 필요 크기 {size}GB가 최대 {MAX_BOOT_VOLUME_GBS}GB를 넘습니다.")
+    bandwidth = network_mbps(shape, ocpus)
+    if bandwidth is not None and spec.throughput_mbps > bandwidth:
+        raise ValueError(
+            f"노드 풀 '{pool}'의 부트 볼륨 처리량 목표 {spec.throughput_mbps:g}MB/s가 {shape} {ocpus:g} OCPU의 "
+            f'네트워크 대역폭 {bandwidth:g}MB/s를 넘습니다.'
+        )
+    if spec.encrypt_in_transit and not shape.startswith('VM.'):
+        raise ValueError(
+            f"노드 풀 '{pool}'의 모양 {shape}은 부트 볼륨 전송 중 암호화를 지원하지 않습니다 (VM 모양만 지원)."
+        )
+    return BootVolumePlan(pool, size, required, spec.encrypt_in_transit)
@@ -0,0 +1,335 @@
+"""
+워크로드 기반 노드 풀 용량 계획
+파드 CPU/메모리 요청과 레플리카 수를 Flex 모양(shape)에 빈 패킹(First-Fit-Decreasing)하여
+비용이 가장 낮거나 노드 수가 가장 적은 노드 풀 크기와 모양 설정을 산출
+numpy는 용량 계획을 실제로 수행할 때만 로드한다 (이 모듈은 설정 파싱 때문에 항상 import되므로 콜드 스타트에서 제외).
+"""
+
+import math
+import re
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from cluster.pod_network import DEFAULT_MAX_PODS_PER_NODE, max_pods_for_shape
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# =============================================================================
+# 워크로드 프로필
+# =============================================================================
+
+_CPU_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)(m?)$')
+_MEMORY_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)(Ki|Mi|Gi|Ti|K|M|G|T)?$')
+_MEMORY_UNITS_MIB = {
+    None: 1 / (1024 * 1024),
+    'Ki': 1 / 1024,
+    'Mi': 1,
+    'Gi': 1024,
+    'Ti': 1024 * 1024,
+    'K': 1000 / (1024 * 1024),
+    'M': 1000**2 / (1024 * 1024),
+    'G': 1000**3 / (1024 * 1024),
+    'T': 1000**4 / (1024 * 1024),
+}
+
+
+def parse_cpu(value: str | float) -> int:
+    """Kubernetes CPU 수량을 밀리코어로 변환 ('500m', '0.5', 2)"""
+    match = _CPU_PATTERN.match(str(value).strip())
+    if not match:
+        raise ValueError(f'올바르지 않은 CPU 요청입니다: {value}')
+    number = float(match.group(1))
+    return math.ceil(number if match.group(2) else number * 1000)
+
+
+def parse_memory(value: str | float) -> int:
+    """Kubernetes 메모리 수량을 MiB로 변환 ('512Mi', '1Gi', '1G')"""
+    match = _MEMORY_PATTERN.match(str(value).strip())
+    if not match:
+        raise ValueError(f'올바르지 않은 메모리 요청입니다: {value}')
+    return math.ceil(float(match.group(1)) * _MEMORY_UNITS_MIB[match.group(2)])
+
+
+@dataclass(frozen=True, slots=True)
+class PodRequest:
+    """파드 한 종류의 리소스 요청 (CPU 밀리코어, 메모리 MiB)"""
+
+    name: str
+    cpu_millicores: int
+    memory_mib: int
+    replicas: int = 1
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> 'PodRequest':
+        request = cls(
+            name=str(raw.get('name', 'pod')),
+            cpu_millicores=parse_cpu(raw['cpu']),
+            memory_mib=parse_memory(raw['memory']),
+            replicas=int(raw.get('replicas', 1)),
+        )
+        if request.cpu_millicores <= 0 or request.memory_mib <= 0 or request.replicas < 0:
+            raise ValueError(f"파드 '{request.name}'의 요청값은 0보다 커야 합니다.")
+        return request
+
+
+def parse_workload_profile(raw: Iterable[Mapping[str, Any]]) -> tuple[PodRequest, ...]:
+    """`[{name, cpu, memory, replicas}, ...]` 형식의 워크로드 프로필 파싱"""
+    return tuple(PodRequest.from_dict(item) for item in raw)
+
+
+# =============================================================================
+# Flex 모양 카탈로그 및 예약 리소스
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class FlexShape:
+    """Flex 모양의 OCPU/메모리 한도와 시간당 단가 (USD, 공시 가격 기준 근사치)"""
+
+    name: str
+    min_ocpus: int
+    max_ocpus: int
+    min_memory_per_ocpu_gbs: int
+    max_memory_per_ocpu_gbs: int
+    max_memory_gbs: int
+    vcpus_per_ocpu: int
+    ocpu_price: float
+    memory_price: float
+
+    def memory_options(self, ocpus: int, ratios: Sequence[int]) -> list[int]:
+        """OCPU 수에 대해 허용되는 메모리 후보(GB)"""
+        low = ocpus * self.min_memory_per_ocpu_gbs
+        high = min(ocpus * self.max_memory_per_ocpu_gbs, self.max_memory_gbs)
+        return sorted({min(max(ocpus * ratio, low), high) for ratio in ratios})
+
+    def hourly_cost(self, ocpus: int, memory_gbs: int) -> float:
+        return ocpus * self.ocpu_price + memory_gbs * self.memory_price
+
+
+FLEX_SHAPES: dict[str, FlexShape] = {
+    shape.name: shape
+    for shape in (
+        FlexShape('VM.Standard.A1.Flex', 1, 80, 1, 64, 512, 1, 0.01, 0.0015),
+        FlexShape('VM.Standard.E4.Flex', 1, 64, 1, 64, 1024, 2, 0.025, 0.0015),
+        FlexShape('VM.Standard.E5.Flex', 1, 94, 1, 64, 1049, 2, 0.03, 0.002),
+        FlexShape('VM.Standard3.Flex', 1, 32, 1, 64, 512, 2, 0.04, 0.0015),
+    )
+}
+
+DEFAULT_OCPU_OPTIONS = (1, 2, 4, 8, 16, 32, 64)
+DEFAULT_MEMORY_RATIOS = (1, 2, 4, 6, 8, 16)  # OCPU당 메모리(GB)
+
+
+def kube_reserved(vcpus: int, memory_mib: int) -> tuple[int, int]:
+    """
+    kube-reserved + system-reserved + eviction 임계값 (밀리코어, MiB)
+    관리형 Kubernetes에서 널리 쓰이는 누진 공식을 따른다.
+    """
+    remaining_cpu = vcpus * 1000
+    cpu = 0.0
+    for size, rate in ((1000, 0.06), (1000, 0.01), (2000, 0.005), (math.inf, 0.0025)):
+        portion = min(remaining_cpu, size)
+        cpu += portion * rate
+        remaining_cpu -= portion
+
+    remaining_memory = memory_mib
+    memory = 0.0
+    for size, rate in ((4096, 0.25), (4096, 0.20), (8192, 0.10), (114688, 0.06), (math.inf, 0.02)):
+        portion = min(remaining_memory, size)
+        memory += portion * rate
+        remaining_memory -= portion
+
+    system_cpu, system_memory, eviction_memory = 100, 100, 100
+    return math.ceil(cpu) + system_cpu, math.ceil(memory) + system_memory + eviction_memory
+
+
+# =============================================================================
+# 빈 패킹
+# =============================================================================
+
+
+def _group_pods(pods: Iterable[PodRequest]) -> tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """같은 (CPU, 메모리) 요청을 묶고 큰 파드부터 정렬 (FFD 순서)"""
+    import numpy as np
+
+    counts: dict[tuple[int, int], int] = {}
+    for pod in pods:
+        if pod.replicas:
+            key = (pod.cpu_millicores, pod.memory_mib)
+            counts[key] = counts.get(key, 0) + pod.replicas
+    if not counts:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty
+
+    keys = np.array(list(counts), dtype=np.int64).reshape(-1, 2)
+    replicas = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    return keys[:, 0], keys[:, 1], replicas
+
+
+def pack_nodes(
+    cpu: 'np.ndarray',
+    memory: 'np.ndarray',
+    replicas: 'np.ndarray',
+    node_cpu: int,
+    node_memory: int,
+    max_pods: int,
+) -> int | None:
+    """
+    First-Fit-Decreasing으로 필요한 노드 수 계산 (들어가지 않는 파드가 있으면 None)
+    동일한 파드 묶음은 노드 순서대로 채우는 것이 FFD와 동일하므로,
+    묶음마다 전체 노드의 수용 가능 개수를 벡터 연산으로 구해 한 번에 배치한다.
+    """
+    import numpy as np
+
+    if len(cpu) and (cpu.max() > node_cpu or memory.max() > node_memory):
+        return None
+
+    # 정규화된 지배 자원 크기 기준 내림차순
+    order = np.argsort(-np.maximum(cpu / node_cpu, memory / node_memory), kind='stable')
+    # 남은 파드 중 가장 작은 요청 (이보다 여유가 적은 노드는 더 이상 파드를 받을 수 없다)
+    min_cpu = np.minimum.accumulate(cpu[order][::-1])[::-1]
+    min_memory = np.minimum.accumulate(memory[order][::-1])[::-1]
+    free_cpu = np.zeros(0, dtype=np.int64)
+    free_memory = np.zeros(0, dtype=np.int64)
+    free_slots = np.zeros(0, dtype=np.int64)
+    closed = 0  # 어떤 파드도 더 받을 수 없어 배열에서 제외한 노드 수
+    compact_at = 64
+
+    for position, index in enumerate(order):
+        pod_cpu, pod_memory, remaining = int(cpu[index]), int(memory[index]), int(replicas[index])
+        if len(free_cpu) and remaining == 1:
+            # 단일 파드는 첫 번째로 들어가는 노드만 찾으면 된다
+            fits = (free_cpu >= pod_cpu) & (free_memory >= pod_memory) & (free_slots > 0)
+            first = int(fits.argmax())
+            if fits[first]:
+                free_cpu[first] -= pod_cpu
+                free_memory[first] -= pod_memory
+                free_slots[first] -= 1
+                remaining = 0
+        elif len(free_cpu):
+            counts = np.minimum(np.minimum(free_cpu // pod_cpu, free_memory // pod_memory), free_slots)
+            placed = np.minimum(counts, np.maximum(remaining - (np.cumsum(counts) - counts), 0))
+            free_cpu -= placed * pod_cpu
+            free_memory -= placed * pod_memory
+            free_slots -= placed
+            remaining -= int(placed.sum())
+        if remaining <= 0:
+            continue
+
+        per_node = min(node_cpu // pod_cpu, node_memory // pod_memory, max_pods)
+        new_nodes = -(-remaining // per_node)
+        placed_new = np.full(new_nodes, per_node, dtype=np.int64)
+        placed_new[-1] = remaining - per_node * (new_nodes - 1)
+        free_cpu = np.concatenate([free_cpu, node_cpu - placed_new * pod_cpu])
+        free_memory = np.concatenate([free_memory, node_memory - placed_new * pod_memory])
+        free_slots = np.concatenate([free_slots, max_pods - placed_new])
+
+        if len(free_cpu) >= compact_at and position + 1 < len(order):
+            # 남은 가장 작은 파드도 들어가지 않는 노드는 닫고, 열린 노드의 순서는 유지한다
+            open_nodes = (
+                (free_cpu >= min_cpu[position + 1]) & (free_memory >= min_memory[position + 1]) & (free_slots > 0)
+            )
+            closed += len(free_cpu) - int(open_nodes.sum())
+            free_cpu, free_memory, free_slots = free_cpu[open_nodes], free_memory[open_nodes], free_slots[open_nodes]
+            compact_at = max(64, 2 * len(free_cpu))
+
+    return closed + len(free_cpu)
+
+
+@dataclass(frozen=True, slots=True)
+class CapacityPlan:
+    """용량 계획 결과"""
+
+    shape: str
+    ocpus: int
+    memory_in_gbs: int
+    node_count: int
+    hourly_cost: float
+    cpu_utilization: float
+    memory_utilization: float
+    # 패킹에 사용한 노드당 최대 파드 수 (설정값을 모양의 VNIC 한도로 제한한 값)
+    max_pods_per_node: int = DEFAULT_MAX_PODS_PER_NODE
+
+    def shape_config(self) -> dict[str, int]:
+        """`NodePoolNodeShapeConfigArgs`에 그대로 전달할 인자"""
+        return {'ocpus': self.ocpus, 'memory_in_gbs': self.memory_in_gbs}
+
+
+def plan_capacity(
+    pods: Sequence[PodRequest],
+    shapes: Iterable[str] = ('VM.Standard.A1.Flex',),
+    objective: str = 'cost',
+    ocpu_options: Sequence[int] = DEFAULT_OCPU_OPTIONS,
+    memory_ratios: Sequence[int] = DEFAULT_MEMORY_RATIOS,
+    max_pods_per_node: int = DEFAULT_MAX_PODS_PER_NODE,
+    min_nodes: int = 1,
+) -> CapacityPlan:
+    """
+    후보 모양/크기마다 빈 패킹을 수행해 최적 계획 선택
+    objective='cost'는 시간당 비용, 'nodes'는 노드 수를 우선으로 비교한다.
+    노드당 파드 수는 노드 풀의 `max_pods_per_node`를 후보 OCPU 수의 VNIC 한도(`max_pods_for_shape`)로 제한한 값이다.
+    하한(총 요청량 / 노드 할당 가능량)이 현재 최적보다 나쁜 후보는 패킹 없이 건너뛴다.
+    """
+    if objective not in ('cost', 'nodes'):
+        raise ValueError(f"objective는 'cost' 또는 'nodes'여야 합니다: {objective}")
+    cpu, memory, replicas = _group_pods(pods)
+    total_cpu = int((cpu * replicas).sum())
+    total_memory = int((memory * replicas).sum())
+    total_pods = int(replicas.sum())
+
+    candidates = []
+    for shape_name in shapes:
+        shape = FLEX_SHAPES.get(shape_name)
+        if shape is None:
+            raise ValueError(f"지원하지 않는 Flex 모양입니다: '{shape_name}' (지원: {', '.join(FLEX_SHAPES)})")
+        for ocpus in ocpu_options:
+            if not shape.min_ocpus <= ocpus <= shape.max_ocpus:
+                continue
+            for memory_gbs in shape.memory_options(ocpus, memory_ratios):
+                reserved_cpu, reserved_memory = kube_reserved(ocpus * shape.vcpus_per_ocpu, memory_gbs * 1024)
+                node_cpu = ocpus * shape.vcpus_per_ocpu * 1000 - reserved_cpu
+                node_memory = memory_gbs * 1024 - reserved_memory
+                if node_cpu <= 0 or node_memory <= 0:
+                    continue
+                max_pods = min(max_pods_per_node, max_pods_for_shape(ocpus))
+                lower_bound = max(
+                    min_nodes,
+                    -(-total_cpu // node_cpu),
+                    -(-total_memory // node_memory),
+                    -(-total_pods // max_pods),
+                )
+                node_cost = shape.hourly_cost(ocpus, memory_gbs)
+                candidates.append((shape, ocpus, memory_gbs, node_cpu, node_memory, max_pods, lower_bound, node_cost))
+
+    def score(node_count: int, node_cost: float) -> tuple[float, float]:
+        cost = node_count * node_cost
+        return (cost, node_count) if objective == 'cost' else (node_count, cost)
+
+    candidates.sort(key=lambda item: score(item[6], item[7]))
+    best: tuple[tuple[float, float], CapacityPlan] | None = None
+    for shape, ocpus, memory_gbs, node_cpu, node_memory, max_pods, lower_bound, node_cost in candidates:
+        if best is not None and score(lower_bound, node_cost) >= best[0]:
+            break  # 하한 기준 정렬이므로 이후 후보는 더 나아질 수 없다
+        packed = pack_nodes(cpu, memory, replicas, node_cpu, node_memory, max_pods)
+        if packed is None:
+            continue
+        node_count = max(packed, min_nodes)
+        candidate_score = score(node_count, node_cost)
+        if best is None or candidate_score < best[0]:
+            plan = CapacityPlan(
+                shape=shape.name,
+                ocpus=ocpus,
+                memory_in_gbs=memory_gbs,
+                node_count=node_count,
+                hourly_cost=round(node_count * node_cost, 4),
+                cpu_utilization=round(total_cpu / (node_count * node_cpu), 4),
+                memory_utilization=round(total_memory / (node_count * node_memory), 4),
+                max_pods_per_node=max_pods,
+            )
+            best = (candidate_score, plan)
+
+    if best is None:
+        raise ValueError('워크로드의 가장 큰 파드를 수용할 수 있는 모양/크기 후보가 없습니다.')
+    return best[1]
@@ -0,0 +1,188 @@
+"""
+OKE 노드 이미지 해석
+`oci.containerengine.get_node_pool_option`의 이미지 목록에서 Kubernetes 버전, 모양 아키텍처(ARM/x86),
+GPU 여부에 맞는 가장 최신 OKE 최적화 이미지를 고른다.
+
+조회 결과는 요청 파라미터의 해시를 이름으로 하는 캐시 파일에 저장하므로(content-addressed),
+같은 파라미터의 반복 preview는 API를 호출하지 않는다. 조회에 실패하거나 결과가 비면 만료된 캐시를 사용하고,
+캐시도 없으면 리전 기본 이미지를 사용한다. 리전 기본 이미지는 ARM 이미지이므로 x86/GPU 모양은 오류로 처리한다.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pulumi
+import pulumi_oci as oci
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'oke-infra' / 'node-images'
+DEFAULT_TTL_SECONDS = 24 * 3600
+DEFAULT_OS_TYPE = 'OL8'
+# 리전 기본 이미지(`RegionConfig.image_id`)의 아키텍처 (기본 노드 모양 VM.Standard.A1.Flex용)
+FALLBACK_ARCH = 'AARCH64'
+
+# 예: Oracle-Linux-8.10-aarch64-2025.01.31-0-OKE-1.32.1-765, Oracle-Linux-8.10-Gen2-GPU-2025.01.31-0-OKE-1.32.1-765
+_SOURCE_NAME_PATTERN = re.compile(
+    r'^Oracle-Linux-(?P<os_version>\d+(?:\.\d+)*)-(?P<variant>.*?)-?'
+    r'(?P<date>\d{4}\.\d{2}\.\d{2})-(?P<revision>\d+)-OKE-(?P<kubernetes_version>\d+\.\d+\.\d+)-(?P<build>\d+)$'
+)
+# Ampere(ARM) 모양: VM.Standard.A1.Flex, BM.Standard.A1.160, VM.Standard.A2.Flex ...
+_ARM_SHAPE_PATTERN = re.compile(r'\.Standard\.A\d+\.')
+
+
+@dataclass(frozen=True, slots=True)
+class NodeImage:
+    """OKE 최적화 노드 이미지"""
+
+    image_id: str
+    source_name: str
+    kubernetes_version: str
+    arch: str
+    gpu: bool
+    release: tuple[tuple[int, ...], str, int, int]  # (OS 버전, 날짜, 리비전, 빌드) 정렬 키
+
+    @classmethod
+    def parse(cls, image_id: str, source_name: str) -> 'NodeImage | None':
+        """이미지 이름 파싱 (OKE 이미지가 아니면 None)"""
+        match = _SOURCE_NAME_PATTERN.match(source_name)
+        if not match:
+            return None
+        variant = match['variant'].split('-')
+        return cls(
+            image_id=image_id,
+            source_name=source_name,
+            kubernetes_version=f'v{match["kubernetes_version"]}',
+            arch='AARCH64' if 'aarch64' in variant else 'X86_64',
+            gpu='GPU' in variant,
+            release=(
+                tuple(int(part) for part in match['os_version'].split('.')),
+                match['date'],
+                int(match['revision']),
+                int(match['build']),
+            ),
+        )
+
+
+def shape_architecture(shape: str) -> tuple[str, bool]:
+    """모양 이름으로 (아키텍처, GPU 여부) 판단 (VM.Standard.A1.Flex -> AARCH64, VM.GPU.A10.1 -> X86_64 GPU)"""
+    arch = 'AARCH64' if _ARM_SHAPE_PATTERN.search(shape) else 'X86_64'
+    return arch, any(part.startswith('GPU') for part in shape.split('.'))
+
+
+def select_image(sources: Iterable[dict[str, str]], kubernetes_version: str, arch: str, gpu: bool) -> NodeImage | None:
+    """조건에 맞는 이미지 중 가장 최신 이미지 (같은 릴리스라면 이미지 ID 순으로 결정적으로 선택)"""
+    candidates = [
+        image
+        for source in sources
+        if (image := NodeImage.parse(source['image_id'], source['source_name']))
+        and image.kubernetes_version == kubernetes_version
+        and image.arch == arch
+        and image.gpu == gpu
+    ]
+    return max(candidates, key=lambda image: (image.release, image.image_id), default=None)
+
+
+class NodeImageCache:
+    """
+    요청 파라미터 해시로 주소를 정하는 노드 이미지 목록 캐시
+    """
+
+    def __init__(self, cache_dir: str | Path = DEFAULT_CACHE_DIR, ttl: float = DEFAULT_TTL_SECONDS):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    @staticmethod
+    def key(params: dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+    def load(self, params: dict[str, Any]) -> tuple[list[dict[str, str]], bool] | None:
+        """(이미지 목록, TTL 안 여부) 또는 None"""
+        try:
+            raw = json.loads((self.cache_dir / f'{self.key(params)}.json').read_text())
+            return raw['sources'], time.time() - raw['fetched_at'] < self.ttl
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def store(self, params: dict[str, Any], sources: list[dict[str, str]]) -> None:
+        """임시 파일에 쓴 뒤 교체하여 저장"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f'{self.key(params)}.json'
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(json.dumps({'params': params, 'fetched_at': time.time(), 'sources': sources}, indent=2))
+        os.replace(tmp_path, path)
+
+
+def fetch_sources(params: dict[str, Any]) -> list[dict[str, str]]:
+    """`get_node_pool_option`으로 이미지 목록 조회"""
+    option = oci.containerengine.get_node_pool_option(
+        node_pool_option_id='all',
+        node_pool_k8s_version=params['kubernetes_version'],
+        node_pool_os_arch=params['arch'],
+        node_pool_os_type=params['os_type'],
+    )
+    return sorted(
+        (
+            {'image_id': source.image_id, 'source_name': source.source_name}
+            for source in option.sources or ()
+            if source.source_type == 'IMAGE'
+        ),
+        key=lambda source: source['source_name'],
+    )
+
+
+@functools.cache
+def resolve_node_image(
+    region: str,
+    kubernetes_version: str,
+    shape: str,
+    fallback_image_id: str,
+    cache_dir: str | Path = DEFAULT_CACHE_DIR,
+    ttl: float = DEFAULT_TTL_SECONDS,
+    offline: bool = False,
+) -> str:
+    """
+    모양과 Kubernetes 버전에 맞는 노드 이미지 ID
+    캐시(TTL 안) -> 조회 -> 만료된 캐시 -> 리전 기본 이미지(ARM 모양만) 순서로 결정한다.
+    """
+    arch, gpu = shape_architecture(shape)
+    label = f'{region} {kubernetes_version} {arch}{" GPU" if gpu else ""}'
+    params = {'region': region, 'kubernetes_version': kubernetes_version, 'arch': arch, 'os_type': DEFAULT_OS_TYPE}
+    cache = NodeImageCache(cache_dir, ttl)
+
+    cached = cache.load(params)
+    stale = cached[0] if cached else []
+    if cached and (cached[1] or offline):
+        sources = cached[0]
+    elif offline:
+        sources = []
+    else:
+        try:
+            sources = fetch_sources(params)
+        except Exception as e:
+            # 인증/네트워크/API 오류는 만료된 캐시로 대신한다
+            pulumi.log.warn(f'{label} 노드 이미지 조회 실패{", 만료된 캐시를 사용합니다" if stale else ""}: {e}')
+            sources = stale
+        else:
+            # 빈 결과는 저장하지 않는다 (다음 실행에서 다시 조회)
+            if sources:
+                cache.store(params, sources)
+            else:
+                sources = stale
+
+    image = select_image(sources, kubernetes_version, arch, gpu)
+    if image is not None:
+        return image.image_id
+    if (arch, gpu) != (FALLBACK_ARCH, False):
+        raise ValueError(
+            f'{label} OKE 이미지를 찾지 못했습니다. 리전 기본 이미지는 {FALLBACK_ARCH} 전용이므로 '
+            f'이미지 목록을 조회할 수 있는 상태(온라인, 캐시 {cache.cache_dir})에서 다시 실행하세요.'
+        )
+    pulumi.log.warn(f'{label} OKE 이미지를 찾지 못해 리전 기본 이미지를 사용합니다: {fallback_image_id}')
+    return fallback_image_id
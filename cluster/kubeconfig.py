@@ -0,0 +1,26 @@
+"""
+스택 출력용 kubeconfig
+`oci.containerengine.get_cluster_kube_config`가 돌려주는 kubeconfig의 exec 인증 명령(`oci ce cluster generate-token`)을
+토큰 캐시 헬퍼(`automation.kube_token`)로 감싸서, API 호출마다 OCI CLI를 시작하지 않고 캐시한 토큰을 사용하게 한다.
+"""
+
+from typing import Any
+
+# 토큰 캐시 헬퍼의 console script 이름 (setup.cfg의 entry point)
+HELPER_COMMAND = 'oke-kube-token'
+
+
+def wrap_exec(content: str, helper: str) -> str:
+    """kubeconfig의 모든 exec 사용자 명령을 `helper -- <원래 명령> <원래 인자>`로 바꾼 kubeconfig"""
+    # 토큰 헬퍼가 HELPER_COMMAND만 가져갈 때 yaml을 로드하지 않도록 (kubectl 호출마다 헬퍼가 시작됨)
+    import yaml
+
+    kubeconfig: dict[str, Any] = yaml.safe_load(content) or {}
+    for user in kubeconfig.get('users') or []:
+        exec_config = (user.get('user') or {}).get('exec')
+        # 이미 헬퍼를 사용하는 항목은 다시 감싸지 않는다
+        if not exec_config or exec_config.get('command') == helper:
+            continue
+        exec_config['args'] = ['--', exec_config['command'], *(exec_config.get('args') or [])]
+        exec_config['command'] = helper
+    return yaml.safe_dump(kubeconfig, sort_keys=False)
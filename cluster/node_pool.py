@@ -1,6 +1,16 @@
+import dataclasses
+
+import pulumi
 import pulumi_oci as oci
 
 import config as cfg
+from cluster.boot_volume import plan_boot_volume
+from cluster.capacity import plan_capacity
+from cluster.overprovisioning import POOL_LABEL
+from cluster.performance import encode_user_data, render_user_data
+from cluster.placement import create_placement_configs
+from cluster.pod_network import combine_pod_networks, plan_pod_network
+from cluster.upgrade import check_upgrade_plan, plan_upgrade
 
 
 class NodePoolManager:
@@ -8,52 +18,292 @@ class NodePoolManager:
     OKE 노드 풀 생성 및 관리 클래스
     """
 
-    def __init__(self, oke_cluster, node_subnet):
+    def __init__(self, oke_cluster, node_subnet, pod_subnet=None, network_security_groups=None):
         self.oke_cluster = oke_cluster
         self.node_subnet = node_subnet
+        self.pod_subnet = pod_subnet
+        self.network_security_groups = network_security_groups or {}
         self.node_pool = None
+        self.node_pools = {}
+        self.pool_specs = {}
+        self.previous_node_pools = {}
+        self.capacity_plan = None
+        self.upgrade_plans = {}
+        self.boot_volume_plans = {}
 
-    def create_node_config_details(self):
+    def plan_capacity(self):
+        """
+        워크로드 프로필이 설정된 경우 빈 패킹으로 노드 수와 모양 설정을 계산하는 메소드
         """
-        OKE 노드 풀의 구성 세부 정보를 생성하는 메소드
+        settings = cfg.get_config()
+        if not settings.workload_profile:
+            return None
+        # 기본 노드 풀에 노드당 파드 수를 따로 지정했으면 그 값으로 패킹
+        default = next((spec for spec in settings.node_pools if spec.name == settings.node_pool_name), None)
+        plan = plan_capacity(
+            settings.workload_profile,
+            settings.capacity_shapes,
+            settings.capacity_objective,
+            max_pods_per_node=default.max_pods_per_node if default else settings.max_pods_per_node,
+        )
+        pulumi.log.info(
+            f'용량 계획: {plan.shape} {plan.ocpus} OCPU / {plan.memory_in_gbs} GB x {plan.node_count}노드 '
+            f'(시간당 ${plan.hourly_cost}, CPU {plan.cpu_utilization:.0%}, 메모리 {plan.memory_utilization:.0%}, '
+            f'노드당 파드 {plan.max_pods_per_node}개)'
+        )
+        return plan
+
+    def resolve_pool_specs(self):
+        """
+        선언된 노드 풀 목록에 용량 계획을 적용하는 메소드
+        용량 계획은 기본 노드 풀(`node_pool_name`)의 크기, 모양, 노드당 파드 수에만 적용된다.
+        """
+        self.capacity_plan = self.plan_capacity()
+        specs = list(cfg.NODE_POOLS)
+        if not self.capacity_plan:
+            return specs
+        for i, spec in enumerate(specs):
+            if spec.name == cfg.NODE_POOL_NAME:
+                specs[i] = dataclasses.replace(
+                    spec,
+                    size=self.capacity_plan.node_count,
+                    shape=self.capacity_plan.shape,
+                    max_pods_per_node=self.capacity_plan.max_pods_per_node,
+                    **self.capacity_plan.shape_config(),
+                )
+                specs[i].validate()
+                return specs
+        pulumi.log.warn(f"용량 계획을 적용할 기본 노드 풀 '{cfg.NODE_POOL_NAME}'이 노드 풀 목록에 없습니다.")
+        return specs
+
+    def plan_upgrades(self, specs):
         """
+        노드 풀별 업그레이드 소요 시간과 용량 하한을 추정하고 `min_capacity`를 검증하는 메소드
+        """
+        upgrade = cfg.NODE_POOL_UPGRADE
+        for spec in specs:
+            plan = plan_upgrade(spec.name, spec.size, upgrade)
+            check_upgrade_plan(plan, upgrade)
+            if upgrade.strategy != 'default':
+                pulumi.log.info(plan.summary())
+            self.upgrade_plans[spec.name] = plan
+        return self.upgrade_plans
+
+    def check_pod_network(self, specs):
+        """
+        모든 노드 풀의 (최대 노드 수 + 서지 노드) x 노드 풀의 노드당 최대 파드 수 합이 파드 서브넷 IP를 넘지 않는지
+        검증하는 메소드
+        노드 풀마다 모양의 VNIC 한도를 검증하고, 서브넷을 공유하므로 IP는 전체 합으로 검증한다.
+        업그레이드 중 추가되는 노드(surge/blue_green)가 설정된 서지 노드보다 많으면 그 수를 사용한다.
+        """
+        shares_node_subnet = self.pod_subnet is None
+        plans = []
+        for spec in specs:
+            upgrade = self.upgrade_plans.get(spec.name)
+            surge_nodes = max(cfg.POD_SURGE_NODES, upgrade.surge_nodes if upgrade else 0)
+            # 오토스케일링 노드 풀은 최대 크기까지 늘어날 수 있으므로 상한으로 계산
+            plans.append(plan_pod_network(spec.bounds[1], spec.max_pods_per_node, surge_nodes, ocpus=int(spec.ocpus)))
+        plan = combine_pod_networks(plans, shares_node_subnet)
+        plan.check(cfg.NODE_SUBNET_CIDR_BLOCK if shares_node_subnet else cfg.POD_SUBNET_CIDR_BLOCK)
+        return plan
+
+    def check_performance_profiles(self, specs):
+        """
+        노드 풀별 성능 프로필의 예약 자원과 hugepage가 노드 모양(용량 계획 적용 후)에 들어가는지 검증하는 메소드
+        """
+        settings = cfg.get_config()
+        for spec in specs:
+            profile = settings.performance_profile(spec.performance_profile)
+            if profile:
+                profile.check_fits(spec.name, spec.ocpus, spec.memory_in_gbs)
+
+    def plan_boot_volumes(self, specs):
+        """
+        노드 풀별 부트 볼륨 크기를 계산하고 모양(용량 계획 적용 후)과의 조합을 검증하는 메소드
+        """
+        for spec in specs:
+            if spec.boot_volume:
+                plan = plan_boot_volume(spec.name, spec.boot_volume, spec.shape, spec.ocpus)
+                pulumi.log.info(plan.summary())
+                self.boot_volume_plans[spec.name] = plan
+        return self.boot_volume_plans
+
+    def create_node_metadata(self, spec):
+        """
+        성능 프로필, taint, 확장한 부트 볼륨이 있는 노드 풀의 cloud-init 메타데이터를 생성하는 메소드
+        """
+        profile = cfg.get_config().performance_profile(spec.performance_profile)
+        boot_volume = self.boot_volume_plans.get(spec.name)
+        user_data = render_user_data(
+            profile, spec.taints, grow_root_fs=bool(boot_volume and boot_volume.grows_root_fs)
+        )
+        if user_data is None:
+            return None
+        return {'user_data': encode_user_data(user_data)}
+
+    def create_node_config_details(self, spec, size=None):
+        """
+        OKE 노드 풀의 구성 세부 정보를 생성하는 메소드 (size를 주면 선언된 크기 대신 사용)
+        NSG 모드에서는 노드 VNIC에 워커 노드 NSG를, 파드 VNIC에 파드 NSG를 연결한다.
+        """
+        nsgs = self.network_security_groups
+        boot_volume = self.boot_volume_plans.get(spec.name)
         return oci.containerengine.NodePoolNodeConfigDetailsArgs(
-            freeform_tags={'oke_node_pool_name': cfg.NODE_POOL_NAME},
+            freeform_tags={'oke_node_pool_name': spec.name},
+            is_pv_encryption_in_transit_enabled=boot_volume.encrypt_in_transit if boot_volume else None,
             node_pool_pod_network_option_details=oci.containerengine.NodePoolNodeConfigDetailsNodePoolPodNetworkOptionDetailsArgs(
-                pod_subnet_ids=[self.node_subnet.id], cni_type='OCI_VCN_IP_NATIVE'
+                pod_subnet_ids=[(self.pod_subnet or self.node_subnet).id],
+                cni_type='OCI_VCN_IP_NATIVE',
+                max_pods_per_node=spec.max_pods_per_node,
+                pod_nsg_ids=[nsgs['pod'].id] if nsgs else None,
             ),
-            placement_configs=[
-                oci.containerengine.NodePoolNodeConfigDetailsPlacementConfigArgs(
-                    availability_domain=cfg.AVAILABILITY_DOMAIN,
-                    subnet_id=self.node_subnet.id,
-                )
-            ],
-            size=cfg.NODE_POOL_SIZE,  # 노드 풀 크기 (Node pool size)
+            nsg_ids=[nsgs['node'].id] if nsgs else None,
+            placement_configs=create_placement_configs(self.node_subnet.id),  # 모든 AD/장애 도메인에 분산
+            size=spec.size if size is None else size,  # 노드 풀 크기
         )
 
-    def create_node_pool(self):
+    def create_node_source_details(self, spec, image_id):
         """
-        OKE 노드 풀을 생성하는 메소드
+        노드 이미지와 부트 볼륨 크기(부트 볼륨 계획이 있는 경우)를 지정하는 메소드
+        """
+        boot_volume = self.boot_volume_plans.get(spec.name)
+        return oci.containerengine.NodePoolNodeSourceDetailsArgs(
+            image_id=image_id,
+            source_type='IMAGE',
+            boot_volume_size_in_gbs=str(boot_volume.size_in_gbs) if boot_volume else None,
+        )
+
+    def create_eviction_settings(self):
+        """
+        노드 제거(cordon/drain) 설정을 생성하는 메소드
         """
-        self.node_pool = oci.containerengine.NodePool(
-            'oke-node-pool',
+        upgrade = cfg.NODE_POOL_UPGRADE
+        return oci.containerengine.NodePoolNodeEvictionNodePoolSettingsArgs(
+            eviction_grace_duration=upgrade.eviction_grace_duration,  # 노드 제거 설정 (Node eviction settings)
+            is_force_delete_after_grace_duration=upgrade.force_delete_after_grace or None,
+        )
+
+    def create_cycling_details(self):
+        """
+        surge 업그레이드의 노드 풀 사이클링 설정을 생성하는 메소드 (다른 전략은 None)
+        """
+        upgrade = cfg.NODE_POOL_UPGRADE
+        if upgrade.strategy != 'surge':
+            return None
+        return oci.containerengine.NodePoolNodePoolCyclingDetailsArgs(
+            is_node_cycling_enabled=True,
+            maximum_surge=upgrade.max_surge,
+            maximum_unavailable=upgrade.max_unavailable,
+        )
+
+    @staticmethod
+    def pool_names(spec, color):
+        """
+        색상별 (리소스 이름, OKE 노드 풀 이름)을 반환하는 메소드
+        blue는 기존 이름을 그대로 사용하여 blue/green을 쓰지 않던 스택의 노드 풀이 교체되지 않도록 한다.
+        """
+        # 기본 노드 풀은 기존 리소스 이름을 유지하여 교체되지 않도록 한다
+        resource_name = 'oke-node-pool' if spec.name == cfg.NODE_POOL_NAME else f'oke-node-pool-{spec.name}'
+        if color == 'blue':
+            return resource_name, spec.name
+        return f'{resource_name}-{color}', f'{spec.name}-{color}'
+
+    def create_pool_resource(self, spec, color, kubernetes_version, image_id, size=None, opts=None):
+        """
+        색상/버전/이미지를 지정하여 OKE 노드 풀 리소스를 생성하는 메소드
+        """
+        resource_name, pool_name = self.pool_names(spec, color)
+        labels = list(spec.labels)
+        # placeholder 파드가 노드 풀을 고를 수 있도록 대상 노드 풀에만 레이블 추가 (blue/green 색상과 무관)
+        if cfg.OVERPROVISIONING.targets(spec.name):
+            labels.append((POOL_LABEL, spec.name))
+        return oci.containerengine.NodePool(
+            resource_name,
             cluster_id=self.oke_cluster.id,
             compartment_id=cfg.COMPARTMENT_ID,
-            freeform_tags={'OKEnodePoolName': cfg.NODE_POOL_NAME},
-            initial_node_labels=[oci.containerengine.NodePoolInitialNodeLabelArgs(key='name', value='mgmt')],
-            kubernetes_version=cfg.KUBERNETES_VERSION,
-            name=cfg.NODE_POOL_NAME,
-            node_config_details=self.create_node_config_details(),
-            node_eviction_node_pool_settings=oci.containerengine.NodePoolNodeEvictionNodePoolSettingsArgs(
-                eviction_grace_duration='PT60M'  # 노드 제거 설정 (Node eviction settings)
-            ),
-            node_shape=cfg.NODE_SHAPE,
-            node_shape_config=oci.containerengine.NodePoolNodeShapeConfigArgs(
-                memory_in_gbs=cfg.NODE_MEMORY_GBS, ocpus=cfg.NODE_OCPUS
-            ),
-            node_source_details=oci.containerengine.NodePoolNodeSourceDetailsArgs(
-                image_id=cfg.IMAGE_ID, source_type='IMAGE'
-            ),
+            freeform_tags={'OKEnodePoolName': pool_name},
+            initial_node_labels=[
+                oci.containerengine.NodePoolInitialNodeLabelArgs(key=key, value=value) for key, value in labels
+            ],
+            kubernetes_version=kubernetes_version,
+            name=pool_name,
+            node_config_details=self.create_node_config_details(spec, size),
+            node_eviction_node_pool_settings=self.create_eviction_settings(),
+            node_metadata=self.create_node_metadata(spec),
+            node_pool_cycling_details=self.create_cycling_details(),
+            node_shape=spec.shape,
+            node_shape_config=oci.containerengine.NodePoolNodeShapeConfigArgs(**spec.shape_config),
+            node_source_details=self.create_node_source_details(spec, image_id),
             ssh_public_key=cfg.SSH_PUBLIC_KEY,  # SSH 공개 키
+            opts=opts,
         )
-        return self.node_pool
+
+    def create_node_pool(self, spec):
+        """
+        OKE 노드 풀을 생성하는 메소드
+        blue/green 전환 중에는 이전 색상의 노드 풀도 이전 버전으로 함께 유지한다.
+        """
+        upgrade = cfg.NODE_POOL_UPGRADE
+        autoscaled = cfg.CLUSTER_AUTOSCALER.enabled and spec.autoscaled
+        node_pool = self.create_pool_resource(
+            spec,
+            upgrade.active_color,
+            cfg.KUBERNETES_VERSION,
+            cfg.get_config().image_for_shape(spec.shape),
+            # 오토스케일러가 관리하는 노드 수는 Pulumi가 되돌리지 않도록 한다
+            opts=pulumi.ResourceOptions(ignore_changes=['nodeConfigDetails.size']) if autoscaled else None,
+        )
+        self.node_pools[spec.name] = node_pool
+        self.pool_specs[spec.name] = spec
+        if upgrade.keeps_previous_pool:
+            self.previous_node_pools[spec.name] = self.create_previous_node_pool(spec, node_pool)
+        return node_pool
+
+    def drained_size(self, spec, node_pool):
+        """
+        새 노드 풀의 노드가 모두 ACTIVE이면 0(기존 풀 drain), 아니면 기존 크기를 유지하는 Output을 반환하는 메소드
+        """
+
+        def size(nodes):
+            ready = sum(1 for node in nodes or [] if node.state == 'ACTIVE')
+            if ready < spec.size:
+                pulumi.log.warn(
+                    f"노드 풀 '{spec.name}'의 새 노드가 {ready}/{spec.size}개만 ACTIVE입니다. "
+                    '기존 노드 풀을 drain하지 않습니다.'
+                )
+                return spec.size
+            return 0
+
+        return node_pool.nodes.apply(size)
+
+    def create_previous_node_pool(self, spec, node_pool):
+        """
+        blue/green 전환 중인 이전 색상의 노드 풀을 생성하는 메소드
+        rollout에서는 이전 버전으로 크기를 유지하고, cutover에서는 새 노드 풀이 준비되면 0으로 줄여
+        OKE가 eviction 설정에 따라 기존 노드를 cordon/drain한 뒤 삭제하도록 한다.
+        """
+        upgrade = cfg.NODE_POOL_UPGRADE
+        version = upgrade.previous_kubernetes_version
+        image_id = upgrade.previous_image_id or cfg.get_config().image_for_shape(spec.shape, version)
+        size = self.drained_size(spec, node_pool) if upgrade.phase == 'cutover' else None
+        return self.create_pool_resource(
+            spec,
+            upgrade.inactive_color,
+            version,
+            image_id,
+            size,
+            opts=pulumi.ResourceOptions(depends_on=[node_pool]),
+        )
+
+    def create_all_node_pools(self):
+        """
+        선언된 모든 노드 풀을 생성하는 메소드 (첫 번째 노드 풀을 기본 노드 풀로 사용)
+        """
+        specs = self.resolve_pool_specs()
+        self.plan_upgrades(specs)
+        self.check_pod_network(specs)
+        self.check_performance_profiles(specs)
+        self.plan_boot_volumes(specs)
+        node_pools = [self.create_node_pool(spec) for spec in specs]
+        self.node_pool = node_pools[0]
+        return node_pools
@@ -2,6 +2,7 @@ import pulumi
 import pulumi_oci as oci
 
 import config as cfg
+from cluster.kubeconfig import wrap_exec
 
 
 class OKEClusterManager:
@@ -9,11 +10,39 @@ class OKEClusterManager:
     OKE 클러스터 생성 및 관리 클래스
     """
 
-    def __init__(self, vcn, k8s_api_subnet, service_lb_subnet):
+    def __init__(self, vcn, k8s_api_subnet, service_lb_subnet, network_security_groups=None):
         self.vcn = vcn
         self.k8s_api_subnet = k8s_api_subnet
         self.service_lb_subnet = service_lb_subnet
+        self.network_security_groups = network_security_groups or {}
         self.cluster = None
+        self.kubeconfig = None
+
+    def create_cluster_options(self):
+        """
+        클러스터 옵션을 생성하는 메소드
+        NSG 모드에서는 로드 밸런서 백엔드(워커 노드) NSG를 지정하여 NSG 규칙 관리 모드의 서비스가 사용할 수 있게 한다.
+        듀얼 스택이면 IP 패밀리를 [IPv4, IPv6]으로 지정하여 파드와 서비스가 IPv6 주소도 받는다.
+        """
+        service_lb_config = None
+        if self.network_security_groups:
+            service_lb_config = oci.containerengine.ClusterOptionsServiceLbConfigArgs(
+                backend_nsg_ids=[self.network_security_groups['node'].id]
+            )
+        return oci.containerengine.ClusterOptionsArgs(
+            service_lb_subnet_ids=[self.service_lb_subnet.id],
+            service_lb_config=service_lb_config,
+            ip_families=list(cfg.IP_FAMILIES) if cfg.DUAL_STACK else None,
+        )
+
+    def create_endpoint_config(self):
+        """
+        Kubernetes API 엔드포인트 설정을 생성하는 메소드 (NSG 모드에서는 API 엔드포인트 NSG 연결)
+        """
+        nsg_ids = [self.network_security_groups['k8s_api'].id] if self.network_security_groups else None
+        return oci.containerengine.ClusterEndpointConfigArgs(
+            is_public_ip_enabled=True, subnet_id=self.k8s_api_subnet.id, nsg_ids=nsg_ids
+        )
 
     def create_cluster(self):
         """
@@ -25,18 +54,31 @@ class OKEClusterManager:
             name='mgmt-cluster',
             kubernetes_version=cfg.KUBERNETES_VERSION,
             vcn_id=self.vcn.id,
-            options=oci.containerengine.ClusterOptionsArgs(service_lb_subnet_ids=[self.service_lb_subnet.id]),
-            endpoint_config=oci.containerengine.ClusterEndpointConfigArgs(
-                is_public_ip_enabled=True, subnet_id=self.k8s_api_subnet.id
-            ),
+            options=self.create_cluster_options(),
+            endpoint_config=self.create_endpoint_config(),
             cluster_pod_network_options=[
                 oci.containerengine.ClusterClusterPodNetworkOptionArgs(cni_type='OCI_VCN_IP_NATIVE')
             ],
             freeform_tags={'OKEclusterName': 'mgmt'},
-            type='BASIC_CLUSTER',
+            type=cfg.CLUSTER_TYPE,  # 오토스케일러 애드온 사용 시 ENHANCED_CLUSTER
         )
 
         # 클러스터 ID를 Pulumi로 export
         pulumi.export('oke_cluster_id', self.cluster.id)
 
         return self.cluster
+
+    def create_kubeconfig(self):
+        """
+        클러스터 kubeconfig Output을 생성하는 메소드 (토큰 캐시 헬퍼가 설정되어 있으면 exec 명령을 헬퍼로 감쌈)
+        export와 Kubernetes provider가 같은 kubeconfig를 쓰도록 한 번만 조회한다.
+        """
+        if self.kubeconfig is None:
+            kubeconfig = oci.containerengine.get_cluster_kube_config_output(
+                cluster_id=self.cluster.id, token_version='2.0.0'
+            )
+            helper = cfg.KUBECONFIG_TOKEN_HELPER
+            self.kubeconfig = kubeconfig.content.apply(
+                lambda content: wrap_exec(content, helper) if content and helper else content
+            )
+        return self.kubeconfig
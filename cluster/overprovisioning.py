@@ -0,0 +1,211 @@
+"""
+노드 풀 오버프로비저닝 (placeholder 파드)
+새 OKE 노드가 클러스터에 합류하기까지 수 분이 걸리므로, 노드 풀 할당 가능 용량의 일정 비율만큼
+우선순위가 낮은 pause 파드를 미리 띄워 둔다. 트래픽이 몰리면 실제 워크로드가 placeholder를 즉시 선점(preempt)하고,
+Pending이 된 placeholder가 클러스터 오토스케일러의 노드 추가를 유발해 헤드룸을 다시 채운다.
+
+헤드룸 계산과 매니페스트 생성은 순수 함수이며, 리소스 생성은 `cluster.placeholders`에서 한다.
+
+설정 예:
+    pulumi config set --path 'overprovisioning.enabled' true
+    pulumi config set --path 'overprovisioning.fraction' 0.2
+    pulumi config set --path 'overprovisioning.pod_cpu' 500m
+"""
+
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from cluster.capacity import FLEX_SHAPES, kube_reserved, parse_cpu, parse_memory
+from cluster.pool_spec import NodePoolSpec
+
+# placeholder를 배치할 노드 풀을 고르는 노드 레이블 (대상 노드 풀에만 추가, 값은 노드 풀 이름)
+POOL_LABEL = 'oke-node-pool'
+NAMESPACE = 'overprovisioning'
+PRIORITY_CLASS = 'overprovisioning'
+# 클러스터 오토스케일러는 우선순위가 expendable 기준(기본 -10) 미만인 Pending 파드로는 노드를 늘리지 않으므로
+# 그보다 높고, 기본 우선순위(0)보다 낮은 값을 사용한다
+PRIORITY = -5
+PAUSE_IMAGE = 'registry.k8s.io/pause:3.10'
+DEFAULT_FRACTION = 0.1
+# 모양 정보가 없을 때의 OCPU당 vCPU 수 (x86)
+DEFAULT_VCPUS_PER_OCPU = 2
+# placeholder 파드 크기를 지정하지 않으면 노드 할당 가능량의 1/4 (100m, 64Mi 단위 내림)
+DEFAULT_PODS_PER_NODE = 4
+
+
+@dataclass(frozen=True, slots=True)
+class OverprovisioningSpec:
+    """오버프로비저닝 설정 (`overprovisioning` config 객체)"""
+
+    enabled: bool = False
+    # 노드 풀 할당 가능 용량(CPU, 메모리) 중 비워 둘 비율
+    fraction: float = DEFAULT_FRACTION
+    # 대상 노드 풀 이름 (비어 있으면 모든 노드 풀)
+    pools: tuple[str, ...] = ()
+    # placeholder 파드 하나의 요청 (Kubernetes 수량, 가장 큰 워크로드 파드 크기 권장)
+    pod_cpu: str | None = None
+    pod_memory: str | None = None
+    image: str = PAUSE_IMAGE
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> 'OverprovisioningSpec':
+        defaults = cls()
+        settings = cls(
+            enabled=bool(raw.get('enabled', defaults.enabled)),
+            fraction=float(raw.get('fraction', defaults.fraction)),
+            pools=tuple(str(name) for name in raw.get('pools') or ()),
+            pod_cpu=str(raw['pod_cpu']) if raw.get('pod_cpu') else None,
+            pod_memory=str(raw['pod_memory']) if raw.get('pod_memory') else None,
+            image=str(raw.get('image', defaults.image)),
+        )
+        settings.validate()
+        return settings
+
+    def validate(self) -> None:
+        if not 0 < self.fraction <= 1:
+            raise ValueError(f'overprovisioning fraction은 0 ~ 1 사이여야 합니다: {self.fraction}')
+        if self.pod_cpu:
+            parse_cpu(self.pod_cpu)
+        if self.pod_memory:
+            parse_memory(self.pod_memory)
+
+    def targets(self, pool: str) -> bool:
+        """노드 풀이 placeholder 대상인지"""
+        return self.enabled and (not self.pools or pool in self.pools)
+
+
+def node_allocatable(spec: NodePoolSpec) -> tuple[int, int]:
+    """노드 하나의 할당 가능 (밀리코어, MiB) - 용량 계획과 같은 kube-reserved 공식"""
+    shape = FLEX_SHAPES.get(spec.shape)
+    vcpus = spec.ocpus * (shape.vcpus_per_ocpu if shape else DEFAULT_VCPUS_PER_OCPU)
+    memory_mib = spec.memory_in_gbs * 1024
+    reserved_cpu, reserved_memory = kube_reserved(vcpus, memory_mib)
+    return vcpus * 1000 - reserved_cpu, memory_mib - reserved_memory
+
+
+@dataclass(frozen=True, slots=True)
+class HeadroomPlan:
+    """노드 풀 하나의 placeholder 계획"""
+
+    pool: str
+    nodes: int
+    node_cpu: int
+    node_memory: int
+    pod_cpu: int
+    pod_memory: int
+    replicas: int
+
+    @property
+    def cpu_share(self) -> float:
+        """노드 풀 할당 가능 CPU 중 placeholder가 차지하는 비율"""
+        return self.replicas * self.pod_cpu / (self.nodes * self.node_cpu) if self.nodes else 0.0
+
+    @property
+    def memory_share(self) -> float:
+        return self.replicas * self.pod_memory / (self.nodes * self.node_memory) if self.nodes else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"오버프로비저닝 '{self.pool}': placeholder {self.replicas}개 x ({self.pod_cpu}m, {self.pod_memory}Mi), "
+            f'노드 {self.nodes}개 용량의 CPU {self.cpu_share:.0%} / 메모리 {self.memory_share:.0%}'
+        )
+
+
+def plan_headroom(spec: NodePoolSpec, settings: OverprovisioningSpec) -> HeadroomPlan:
+    """
+    노드 풀 용량(노드 수 x 할당 가능량)의 `fraction`을 덮는 placeholder 파드 수
+    CPU와 메모리 중 더 많은 파드가 필요한 쪽에 맞춘다 (올림). 노드 수는 설정한 노드 풀 크기를 기준으로 하며,
+    그 노드들에 배치할 수 있는 수를 넘지 않는다.
+    """
+    node_cpu, node_memory = node_allocatable(spec)
+    if node_cpu <= 0 or node_memory <= 0:
+        raise ValueError(f"노드 풀 '{spec.name}'의 노드에 할당 가능한 용량이 없습니다.")
+    pod_cpu = (
+        parse_cpu(settings.pod_cpu) if settings.pod_cpu else max(100, node_cpu // DEFAULT_PODS_PER_NODE // 100 * 100)
+    )
+    pod_memory = (
+        parse_memory(settings.pod_memory)
+        if settings.pod_memory
+        else max(64, node_memory // DEFAULT_PODS_PER_NODE // 64 * 64)
+    )
+    if pod_cpu > node_cpu or pod_memory > node_memory:
+        raise ValueError(
+            f"placeholder 파드({pod_cpu}m, {pod_memory}Mi)가 노드 풀 '{spec.name}'의 노드 "
+            f'할당 가능량({node_cpu}m, {node_memory}Mi)보다 큽니다.'
+        )
+    # 부동소수점 오차로 한 개가 더 생기지 않도록 목표 헤드룸은 반올림한 정수로 계산
+    headroom_cpu = round(settings.fraction * spec.size * node_cpu)
+    headroom_memory = round(settings.fraction * spec.size * node_memory)
+    replicas = max(math.ceil(headroom_cpu / pod_cpu), math.ceil(headroom_memory / pod_memory))
+    # 설정한 노드 수에 들어가지 않는 placeholder는 노드 추가만 계속 유발하므로 배치 가능한 수로 제한
+    replicas = min(replicas, spec.size * min(node_cpu // pod_cpu, node_memory // pod_memory))
+    return HeadroomPlan(spec.name, spec.size, node_cpu, node_memory, pod_cpu, pod_memory, replicas)
+
+
+# =============================================================================
+# 매니페스트
+# =============================================================================
+
+
+def toleration(taint: str) -> dict[str, str]:
+    """노드 풀 taint('key=value:Effect' 또는 'key:Effect')를 견디는 toleration"""
+    key_value, effect = taint.rsplit(':', 1)
+    key, _, value = key_value.partition('=')
+    if value:
+        return {'key': key, 'operator': 'Equal', 'value': value, 'effect': effect}
+    return {'key': key, 'operator': 'Exists', 'effect': effect}
+
+
+def render_manifests(
+    plans: Iterable[HeadroomPlan], pool_specs: Mapping[str, NodePoolSpec], settings: OverprovisioningSpec
+) -> list[dict[str, Any]]:
+    """네임스페이스, PriorityClass, 노드 풀별 pause Deployment 매니페스트 (placeholder가 없는 노드 풀은 제외)"""
+    manifests: list[dict[str, Any]] = [
+        {'apiVersion': 'v1', 'kind': 'Namespace', 'metadata': {'name': NAMESPACE}},
+        {
+            'apiVersion': 'scheduling.k8s.io/v1',
+            'kind': 'PriorityClass',
+            'metadata': {'name': PRIORITY_CLASS},
+            'value': PRIORITY,
+            'globalDefault': False,
+            # placeholder는 다른 파드를 선점하지 않고, 다른 모든 파드에 선점된다
+            'preemptionPolicy': 'Never',
+            'description': '노드 풀 헤드룸을 위한 placeholder 파드 (실제 워크로드가 선점)',
+        },
+    ]
+    for plan in plans:
+        if not plan.replicas:
+            continue
+        labels = {'app.kubernetes.io/name': 'overprovisioning', POOL_LABEL: plan.pool}
+        resources = {'cpu': f'{plan.pod_cpu}m', 'memory': f'{plan.pod_memory}Mi'}
+        manifests.append(
+            {
+                'apiVersion': 'apps/v1',
+                'kind': 'Deployment',
+                'metadata': {'name': f'overprovisioning-{plan.pool}', 'namespace': NAMESPACE, 'labels': labels},
+                'spec': {
+                    'replicas': plan.replicas,
+                    'selector': {'matchLabels': labels},
+                    'template': {
+                        'metadata': {'labels': labels},
+                        'spec': {
+                            'priorityClassName': PRIORITY_CLASS,
+                            'terminationGracePeriodSeconds': 0,
+                            'automountServiceAccountToken': False,
+                            'nodeSelector': {POOL_LABEL: plan.pool},
+                            'tolerations': [toleration(taint) for taint in pool_specs[plan.pool].taints],
+                            'containers': [
+                                {
+                                    'name': 'pause',
+                                    'image': settings.image,
+                                    'resources': {'requests': resources, 'limits': resources},
+                                }
+                            ],
+                        },
+                    },
+                },
+            }
+        )
+    return manifests
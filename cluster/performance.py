@@ -0,0 +1,312 @@
+"""
+노드 성능 프로필
+노드 풀마다 이름 있는 프로필(throughput, low-latency, batch)을 골라 kubelet 설정(CPU/토폴로지 매니저, 예약 자원)과
+커널 설정(sysctl, hugepages, THP)을 적용한다. 프로필은 OKE 노드 초기화 스크립트를 감싸는 cloud-init 스크립트로
+렌더링되어 노드 풀의 `node_metadata.user_data`로 전달된다.
+
+설정 예:
+    pulumi config set --path 'node_pools[0].performance_profile' low-latency
+    pulumi config set --path 'performance_profiles.latency-hp.base' low-latency
+    pulumi config set --path 'performance_profiles.latency-hp.hugepages_2mi' 1024
+"""
+
+import base64
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, replace
+from typing import Any
+
+CPU_MANAGER_POLICIES = ('none', 'static')
+TOPOLOGY_MANAGER_POLICIES = ('none', 'best-effort', 'restricted', 'single-numa-node')
+THP_MODES = ('always', 'madvise', 'never')
+RESERVED_RESOURCES = ('cpu', 'memory', 'ephemeral-storage', 'pid')
+# 프로필 필드로 설정하는 kubelet 인자 (kubelet_args에서 중복 지정 불가)
+MANAGED_KUBELET_FLAGS = (
+    '--cpu-manager-policy',
+    '--topology-manager-policy',
+    '--kube-reserved',
+    '--system-reserved',
+    '--register-with-taints',
+)
+# OCI 인스턴스 메타데이터 전체 크기 한도 (base64 인코딩된 user_data 기준)
+MAX_USER_DATA_BYTES = 32000
+HUGEPAGE_MI = 2
+
+_SYSCTL_KEY_PATTERN = re.compile(r'^[a-z0-9_]+(\.[a-z0-9_-]+)+$')
+_SYSCTL_VALUE_PATTERN = re.compile(r'^[A-Za-z0-9._-]+( [A-Za-z0-9._-]+)*$')
+_QUANTITY_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)(m|Ki|Mi|Gi|Ti)?$')
+_KUBELET_ARG_PATTERN = re.compile(r'^(--[a-z0-9-]+)(=[A-Za-z0-9.,:=/_-]*)?$')
+_QUANTITY_UNITS = {None: 1, 'm': 0.001, 'Ki': 2**10, 'Mi': 2**20, 'Gi': 2**30, 'Ti': 2**40}
+
+# OKE 노드 초기화 스크립트 (kubelet 추가 인자를 넘기기 위한 cloud-init)
+OKE_INIT_SCRIPT = """#!/bin/bash
+curl --fail -H "Authorization: Bearer Oracle" -L0 \\
+  http://169.254.169.254/opc/v2/instance/metadata/oke_init_script | base64 --decode >/var/run/oke-init.sh
+bash /var/run/oke-init.sh --kubelet-extra-args "{kubelet_extra_args}"
+"""
+
+
+def parse_quantity(value: str) -> float:
+    """Kubernetes 자원 수량('500m', '1Gi')을 숫자로 변환 (CPU는 코어, 메모리는 바이트)"""
+    match = _QUANTITY_PATTERN.match(value)
+    if not match:
+        raise ValueError(f"자원 수량 형식이 올바르지 않습니다: {value} (예: '500m', '1Gi')")
+    return float(match.group(1)) * _QUANTITY_UNITS[match.group(2)]
+
+
+def _pairs(raw: Mapping[str, Any] | None) -> tuple[tuple[str, str], ...]:
+    return tuple((str(key), str(value)) for key, value in (raw or {}).items())
+
+
+def _merge(base: tuple[tuple[str, str], ...], raw: Mapping[str, Any] | None) -> tuple[tuple[str, str], ...]:
+    """기본 프로필의 키-값 목록에 설정 값을 덮어쓴다 (순서는 기본 프로필 먼저)"""
+    merged = dict(base)
+    merged.update(_pairs(raw))
+    return tuple(merged.items())
+
+
+@dataclass(frozen=True, slots=True)
+class PerformanceProfile:
+    """노드 성능 프로필 하나 (키-값 설정은 해시 가능한 튜플로 보관)"""
+
+    name: str
+    cpu_manager_policy: str = 'none'
+    topology_manager_policy: str = 'none'
+    kube_reserved: tuple[tuple[str, str], ...] = ()
+    system_reserved: tuple[tuple[str, str], ...] = ()
+    sysctls: tuple[tuple[str, str], ...] = ()
+    # 2 MiB hugepage 수 (0이면 설정하지 않음), THP 모드 (None이면 OS 기본값 유지)
+    hugepages_2mi: int = 0
+    transparent_hugepages: str | None = None
+    kubelet_args: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, name: str, raw: Mapping[str, Any], base: 'PerformanceProfile') -> 'PerformanceProfile':
+        """설정 항목을 파싱하고, 지정하지 않은 값은 기본 프로필(`base`)에서 상속 (키-값 설정은 병합)"""
+        thp = raw.get('transparent_hugepages', base.transparent_hugepages)
+        profile = replace(
+            base,
+            name=name,
+            cpu_manager_policy=str(raw.get('cpu_manager_policy', base.cpu_manager_policy)),
+            topology_manager_policy=str(raw.get('topology_manager_policy', base.topology_manager_policy)),
+            kube_reserved=_merge(base.kube_reserved, raw.get('kube_reserved')),
+            system_reserved=_merge(base.system_reserved, raw.get('system_reserved')),
+            sysctls=_merge(base.sysctls, raw.get('sysctls')),
+            hugepages_2mi=int(raw.get('hugepages_2mi', base.hugepages_2mi)),
+            transparent_hugepages=str(thp) if thp else None,
+            kubelet_args=base.kubelet_args + tuple(str(arg) for arg in raw.get('kubelet_args') or ()),
+        )
+        profile.validate()
+        return profile
+
+    def reserved(self, resource: str) -> float:
+        """kube/system 예약 합계 (CPU는 코어, 메모리는 바이트)"""
+        return sum(
+            parse_quantity(value) for key, value in self.kube_reserved + self.system_reserved if key == resource
+        )
+
+    def validate(self) -> None:
+        if self.cpu_manager_policy not in CPU_MANAGER_POLICIES:
+            raise ValueError(
+                f"프로필 '{self.name}'의 cpu_manager_policy는 {', '.join(CPU_MANAGER_POLICIES)} 중 하나여야 합니다: "
+                f'{self.cpu_manager_policy}'
+            )
+        if self.topology_manager_policy not in TOPOLOGY_MANAGER_POLICIES:
+            raise ValueError(
+                f"프로필 '{self.name}'의 topology_manager_policy는 {', '.join(TOPOLOGY_MANAGER_POLICIES)} 중 "
+                f'하나여야 합니다: {self.topology_manager_policy}'
+            )
+        for key, value in self.kube_reserved + self.system_reserved:
+            if key not in RESERVED_RESOURCES:
+                raise ValueError(
+                    f"프로필 '{self.name}'의 예약 자원은 {', '.join(RESERVED_RESOURCES)}만 가능합니다: {key}"
+                )
+            parse_quantity(value)
+        # kubelet은 예약 CPU가 0이면 static CPU 매니저로 시작하지 않는다
+        if self.cpu_manager_policy == 'static' and self.reserved('cpu') <= 0:
+            raise ValueError(f"프로필 '{self.name}'의 static CPU 매니저에는 kube/system 예약 CPU가 필요합니다.")
+        for key, value in self.sysctls:
+            if not _SYSCTL_KEY_PATTERN.match(key) or not _SYSCTL_VALUE_PATTERN.match(value):
+                raise ValueError(f"프로필 '{self.name}'의 sysctl 형식이 올바르지 않습니다: {key} = {value}")
+            if key == 'vm.nr_hugepages':
+                raise ValueError(f"프로필 '{self.name}'의 hugepage 수는 sysctls 대신 hugepages_2mi로 지정하세요.")
+        if self.hugepages_2mi < 0:
+            raise ValueError(f"프로필 '{self.name}'의 hugepages_2mi는 0 이상이어야 합니다.")
+        if self.transparent_hugepages is not None and self.transparent_hugepages not in THP_MODES:
+            raise ValueError(
+                f"프로필 '{self.name}'의 transparent_hugepages는 {', '.join(THP_MODES)} 중 하나여야 합니다: "
+                f'{self.transparent_hugepages}'
+            )
+        for arg in self.kubelet_args:
+            match = _KUBELET_ARG_PATTERN.match(arg)
+            if not match:
+                raise ValueError(f"프로필 '{self.name}'의 kubelet 인자 형식이 올바르지 않습니다: {arg}")
+            if match.group(1) in MANAGED_KUBELET_FLAGS:
+                raise ValueError(
+                    f"프로필 '{self.name}'의 {match.group(1)}은 kubelet_args 대신 프로필 필드로 지정하세요."
+                )
+
+    def check_fits(self, pool: str, ocpus: float, memory_in_gbs: float) -> None:
+        """예약 자원과 hugepage가 노드 모양의 CPU/메모리 안에 들어가는지 검증 (OCPU당 vCPU는 최소 1개로 계산)"""
+        if self.reserved('cpu') >= ocpus:
+            raise ValueError(
+                f"노드 풀 '{pool}'의 프로필 '{self.name}' 예약 CPU {self.reserved('cpu'):g}코어가 "
+                f'노드 OCPU {ocpus:g}개 이상입니다.'
+            )
+        pinned = self.reserved('memory') + self.hugepages_2mi * HUGEPAGE_MI * 2**20
+        if pinned >= memory_in_gbs * 2**30:
+            raise ValueError(
+                f"노드 풀 '{pool}'의 프로필 '{self.name}' 예약 메모리와 hugepage 합계 {pinned / 2**30:.1f}GiB가 "
+                f'노드 메모리 {memory_in_gbs:g}GB 이상입니다.'
+            )
+
+    def kubelet_extra_args(self) -> list[str]:
+        args = []
+        if self.cpu_manager_policy != 'none':
+            args.append(f'--cpu-manager-policy={self.cpu_manager_policy}')
+        if self.topology_manager_policy != 'none':
+            args.append(f'--topology-manager-policy={self.topology_manager_policy}')
+        for flag, reserved in (('--kube-reserved', self.kube_reserved), ('--system-reserved', self.system_reserved)):
+            if reserved:
+                args.append(f'{flag}={",".join(f"{key}={value}" for key, value in reserved)}')
+        return args + list(self.kubelet_args)
+
+
+# =============================================================================
+# 기본 프로필
+# =============================================================================
+
+_NETWORK_SYSCTLS = (
+    ('net.core.somaxconn', '32768'),
+    ('net.ipv4.tcp_max_syn_backlog', '16384'),
+    ('net.core.netdev_max_backlog', '16384'),
+    ('net.netfilter.nf_conntrack_max', '1048576'),
+    ('net.ipv4.ip_local_port_range', '10240 65535'),
+)
+
+BUILTIN_PROFILES = {
+    profile.name: profile
+    for profile in (
+        # 연결 수가 많은 서비스: 네트워크 큐/conntrack 한도 상향, CPU는 공유
+        PerformanceProfile(
+            'throughput',
+            kube_reserved=(('cpu', '200m'), ('memory', '1Gi')),
+            system_reserved=(('cpu', '100m'), ('memory', '512Mi')),
+            sysctls=_NETWORK_SYSCTLS,
+            transparent_hugepages='madvise',
+        ),
+        # 지연 민감 서비스: Guaranteed 파드에 전용 코어와 같은 NUMA 노드의 자원 할당, THP 비활성화
+        PerformanceProfile(
+            'low-latency',
+            cpu_manager_policy='static',
+            topology_manager_policy='single-numa-node',
+            kube_reserved=(('cpu', '500m'), ('memory', '1Gi')),
+            system_reserved=(('cpu', '500m'), ('memory', '1Gi')),
+            sysctls=(*_NETWORK_SYSCTLS, ('net.core.busy_read', '50'), ('net.core.busy_poll', '50')),
+            transparent_hugepages='never',
+        ),
+        # 배치/데이터 처리: 메모리 맵/파일 한도 상향, 이미지 병렬 풀, THP 항상 사용
+        PerformanceProfile(
+            'batch',
+            kube_reserved=(('cpu', '200m'), ('memory', '1Gi')),
+            system_reserved=(('cpu', '100m'), ('memory', '512Mi')),
+            sysctls=(
+                ('vm.max_map_count', '262144'),
+                ('fs.file-max', '2097152'),
+                ('fs.inotify.max_user_watches', '524288'),
+            ),
+            transparent_hugepages='always',
+            kubelet_args=('--serialize-image-pulls=false',),
+        ),
+    )
+}
+
+
+def parse_performance_profiles(raw: Mapping[str, Mapping[str, Any]]) -> dict[str, PerformanceProfile]:
+    """
+    `{name: {base, cpu_manager_policy, ..., sysctls, hugepages_2mi}}` 형식의 사용자 프로필을 기본 프로필에 더한다.
+    `base`를 지정하면 그 프로필을 상속하고, 기본 프로필과 같은 이름이면 그 프로필을 덮어쓴다.
+    """
+    profiles = dict(BUILTIN_PROFILES)
+    for name, item in raw.items():
+        base_name = str(item.get('base', name))
+        base = profiles.get(base_name) or (PerformanceProfile(name) if base_name == name else None)
+        if base is None:
+            raise ValueError(f"프로필 '{name}'의 base '{base_name}'를 찾을 수 없습니다.")
+        profiles[name] = PerformanceProfile.from_dict(name, item, base)
+    return profiles
+
+
+# =============================================================================
+# cloud-init 렌더링
+# =============================================================================
+
+
+def _heredoc(path: str, lines: Iterable[str]) -> str:
+    return f"cat >{path} <<'EOF'\n" + ''.join(f'{line}\n' for line in lines) + 'EOF\n'
+
+
+def _kernel_sections(profile: PerformanceProfile) -> list[str]:
+    """프로필의 커널 설정 (재부팅 후에도 유지되도록 sysctl.d/tmpfiles.d/modules-load.d에 쓰고 바로 적용)"""
+    sections = []
+    sysctls = list(profile.sysctls)
+    if profile.hugepages_2mi:
+        sysctls.append(('vm.nr_hugepages', str(profile.hugepages_2mi)))
+    if any(key.startswith('net.netfilter.nf_conntrack') for key, _ in sysctls):
+        # conntrack sysctl은 모듈이 로드되어야 존재한다
+        sections.append(
+            _heredoc('/etc/modules-load.d/90-oke-performance.conf', ['nf_conntrack']) + 'modprobe nf_conntrack\n'
+        )
+    if sysctls:
+        sections.append(
+            _heredoc('/etc/sysctl.d/90-oke-performance.conf', (f'{key} = {value}' for key, value in sysctls))
+            + 'sysctl --system >/dev/null\n'
+        )
+    if profile.transparent_hugepages:
+        sections.append(
+            _heredoc(
+                '/etc/tmpfiles.d/90-oke-thp.conf',
+                (
+                    f'w /sys/kernel/mm/transparent_hugepage/{setting} - - - - {profile.transparent_hugepages}'
+                    for setting in ('enabled', 'defrag')
+                ),
+            )
+            + 'systemd-tmpfiles --create /etc/tmpfiles.d/90-oke-thp.conf\n'
+        )
+    return sections
+
+
+def render_user_data(
+    profile: PerformanceProfile | None, taints: Iterable[str] = (), grow_root_fs: bool = False
+) -> str | None:
+    """
+    프로필과 taint로 cloud-init 스크립트를 렌더링 (적용할 설정이 없으면 None)
+    부트 볼륨을 이미지 기본 크기보다 크게 만든 경우(`grow_root_fs`) 남는 공간을 루트 파일 시스템에 붙이고,
+    커널 설정을 적용한 뒤 OKE 초기화 스크립트를 실행한다.
+    """
+    taints = list(taints)
+    args = profile.kubelet_extra_args() if profile else []
+    if taints:
+        args.append(f'--register-with-taints={",".join(taints)}')
+    if profile is None and not grow_root_fs:
+        return OKE_INIT_SCRIPT.format(kubelet_extra_args=' '.join(args)) if args else None
+
+    header = f'# OKE 성능 프로필: {profile.name}\n' if profile else ''
+    sections = [f'#!/bin/bash\n{header}set -o errexit -o pipefail\n']
+    if grow_root_fs:
+        sections.append('/usr/libexec/oci-growfs -y >/dev/null\n')
+    if profile:
+        sections.extend(_kernel_sections(profile))
+    init = OKE_INIT_SCRIPT.format(kubelet_extra_args=' '.join(args))
+    sections.append(init.removeprefix('#!/bin/bash\n'))
+    return '\n'.join(sections)
+
+
+def encode_user_data(script: str) -> str:
+    """cloud-init 스크립트를 base64로 인코딩하고 인스턴스 메타데이터 크기 한도를 검증"""
+    encoded = base64.b64encode(script.encode()).decode()
+    if len(encoded) > MAX_USER_DATA_BYTES:
+        raise ValueError(
+            f'user_data가 인스턴스 메타데이터 한도 {MAX_USER_DATA_BYTES}바이트를 넘습니다: {len(encoded)}바이트'
+        )
+    return encoded
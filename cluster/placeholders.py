@@ -0,0 +1,76 @@
+"""
+오버프로비저닝 placeholder 파드 배포
+스택이 export하는 kubeconfig(`OKEClusterManager.create_kubeconfig`)와 같은 Output으로 만든 Kubernetes provider로
+`cluster.overprovisioning`이 생성한 매니페스트를 적용한다.
+pulumi_kubernetes는 기능을 켠 경우에만 import한다 (콜드 스타트에 provider 모듈을 더하지 않도록).
+kubeconfig의 exec 인증은 토큰 캐시 헬퍼(`kubeconfig_token_helper`)가 감싼 `oci ce cluster generate-token`이므로
+preview/up을 실행하는 곳에 헬퍼와 OCI CLI가 필요하다.
+"""
+
+import pulumi
+
+import config as cfg
+from cluster.overprovisioning import plan_headroom, render_manifests
+
+
+class OverprovisioningManager:
+    """
+    노드 풀 헤드룸용 placeholder 파드 생성 및 관리 클래스
+    """
+
+    def __init__(self, kubeconfig, node_pools, pool_specs, autoscaler_addon=None):
+        self.kubeconfig = kubeconfig
+        self.node_pools = node_pools
+        self.pool_specs = pool_specs
+        self.autoscaler_addon = autoscaler_addon
+        self.plans = []
+        self.provider = None
+        self.placeholders = None
+
+    def plan_headroom(self):
+        """
+        대상 노드 풀마다 placeholder 파드 수와 크기를 계산하는 메소드
+        """
+        settings = cfg.OVERPROVISIONING
+        self.plans = [
+            plan_headroom(spec, settings) for name, spec in self.pool_specs.items() if settings.targets(name)
+        ]
+        for plan in self.plans:
+            pulumi.log.info(plan.summary())
+        return self.plans
+
+    def create_provider(self):
+        """
+        클러스터 kubeconfig로 Kubernetes provider를 생성하는 메소드 (노드 풀이 만들어진 뒤 사용)
+        """
+        import pulumi_kubernetes as k8s
+
+        self.provider = k8s.Provider(
+            'oke-kubernetes',
+            kubeconfig=self.kubeconfig,
+            opts=pulumi.ResourceOptions(depends_on=list(self.node_pools.values())),
+        )
+        return self.provider
+
+    def create_placeholders(self):
+        """
+        PriorityClass와 노드 풀별 pause Deployment를 생성하는 메소드 (기능을 켜지 않으면 생성하지 않음)
+        """
+        settings = cfg.OVERPROVISIONING
+        if not settings.enabled:
+            return None
+        if not self.autoscaler_addon:
+            pulumi.log.warn(
+                'Cluster Autoscaler 애드온이 없어 선점된 placeholder를 위한 노드가 추가되지 않습니다. '
+                'placeholder는 용량을 예약만 합니다.'
+            )
+        import pulumi_kubernetes as k8s
+
+        manifests = render_manifests(self.plan_headroom(), self.pool_specs, settings)
+        depends_on = [*self.node_pools.values(), *([self.autoscaler_addon] if self.autoscaler_addon else [])]
+        self.placeholders = k8s.yaml.v2.ConfigGroup(
+            'oke-overprovisioning',
+            objs=manifests,
+            opts=pulumi.ResourceOptions(provider=self.create_provider(), depends_on=depends_on),
+        )
+        return self.placeholders
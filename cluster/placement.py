@@ -0,0 +1,62 @@
+"""
+노드 배치(placement) 계산
+리전의 모든 가용성 도메인(AD)과 장애 도메인(FD)에 노드 풀 배치를 분산한다.
+AD 목록 조회(invoke)는 설정 스냅샷마다 한 번만 수행하고 모든 노드 풀이 결과를 공유한다.
+`oci.identity` 패키지는 처음 접근할 때 수백 개의 모듈을 한꺼번에 로드하므로(콜드 스타트 약 1초),
+AD 목록 하나만 필요한 이 모듈은 같은 invoke 토큰을 직접 호출한다.
+"""
+
+import functools
+import importlib.metadata
+
+import pulumi
+import pulumi_oci as oci
+from pulumi import Output
+
+import config as cfg
+
+# OCI 리전의 각 AD는 세 개의 장애 도메인을 가진다
+FAULT_DOMAINS = ('FAULT-DOMAIN-1', 'FAULT-DOMAIN-2', 'FAULT-DOMAIN-3')
+
+# `oci.identity.get_availability_domains_output`이 호출하는 invoke
+GET_AVAILABILITY_DOMAINS_TOKEN = 'oci:Identity/getAvailabilityDomains:getAvailabilityDomains'
+
+
+def get_availability_domains() -> Output[list[str]]:
+    """현재 설정의 모든 가용성 도메인 이름 (캐시됨)"""
+    return _availability_domains(pulumi.get_stack(), cfg.get_config())
+
+
+@functools.cache
+def _availability_domains(stack: str, settings: cfg.OCIConfig) -> Output[list[str]]:
+    """
+    스택과 설정 스냅샷을 키로 AD 목록을 조회 (Output은 실행 중인 스택의 엔진에 속하므로 스택 간에 공유하지 않음)
+    조회 결과가 비어 있으면 리전 설정의 기본 AD 하나로 대체한다.
+    AD 이름은 민감 정보가 아니므로, 컴파트먼트 ID(secret)에서 전파된 secret 표시는 제거한다.
+    """
+    result = pulumi.runtime.invoke_output(
+        GET_AVAILABILITY_DOMAINS_TOKEN,
+        {'compartmentId': settings.compartment_id},
+        # 생성된 SDK 함수처럼 설치된 pulumi_oci와 같은 버전의 provider로 조회
+        opts=pulumi.InvokeOutputOptions(version=importlib.metadata.version('pulumi_oci')),
+    )
+    names = result.apply(
+        lambda domains: (
+            sorted(ad['name'] for ad in domains.get('availabilityDomains') or ()) or [settings.availability_domain]
+        )
+    )
+    return Output.unsecret(names)
+
+
+def create_placement_configs(subnet_id) -> Output[list]:
+    """모든 AD에 대해 모든 장애 도메인을 사용하는 배치 설정 목록"""
+    return get_availability_domains().apply(
+        lambda names: [
+            oci.containerengine.NodePoolNodeConfigDetailsPlacementConfigArgs(
+                availability_domain=name,
+                fault_domains=list(FAULT_DOMAINS),
+                subnet_id=subnet_id,
+            )
+            for name in names
+        ]
+    )
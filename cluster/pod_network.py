@@ -0,0 +1,115 @@
+"""
+OCI_VCN_IP_NATIVE 파드 IP 밀도 계획
+VCN-native CNI에서는 파드마다 서브넷 IP를 하나씩 사용하므로,
+노드 수 x 노드당 최대 파드 수(+ 업그레이드/스케일 서지)로 파드 서브넷 크기를 계산하고
+IP가 고갈되는 계획은 미리 거부한다.
+"""
+
+import ipaddress
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+# OCI는 서브넷마다 첫 두 주소와 마지막 주소를 예약한다
+OCI_RESERVED_IPS_PER_SUBNET = 3
+# VNIC 하나당 보조 IP(파드) 수와 노드당 최대 파드 수 (OKE VCN-native CNI 한도)
+PODS_PER_VNIC = 31
+MAX_PODS_PER_NODE_LIMIT = 110
+DEFAULT_MAX_PODS_PER_NODE = 31
+
+
+def max_vnics(ocpus: int) -> int:
+    """Flex VM 모양의 OCPU 수에 따른 최대 VNIC 수 (최소 2, 최대 24)"""
+    return min(max(ocpus, 2), 24)
+
+
+def max_pods_for_shape(ocpus: int) -> int:
+    """주 VNIC를 제외한 VNIC마다 31개 파드 IP, 노드당 110개 상한"""
+    return min((max_vnics(ocpus) - 1) * PODS_PER_VNIC, MAX_PODS_PER_NODE_LIMIT)
+
+
+def usable_ips(cidr_block: str) -> int:
+    """서브넷에서 실제로 할당 가능한 IP 수"""
+    return max(ipaddress.ip_network(cidr_block).num_addresses - OCI_RESERVED_IPS_PER_SUBNET, 0)
+
+
+@dataclass(frozen=True, slots=True)
+class PoolPodDemand:
+    """노드 풀 하나의 파드 IP 수요 (노드 풀마다 노드당 최대 파드 수가 다를 수 있다)"""
+
+    nodes: int
+    surge_nodes: int
+    max_pods_per_node: int
+
+    def ips(self, shares_node_subnet: bool) -> int:
+        return (self.nodes + self.surge_nodes) * (self.max_pods_per_node + (1 if shares_node_subnet else 0))
+
+    def describe(self, shares_node_subnet: bool) -> str:
+        node_ip = ' + 노드 IP' if shares_node_subnet else ''
+        return f'(노드 {self.nodes} + 서지 {self.surge_nodes}) x 노드당 {self.max_pods_per_node}파드{node_ip}'
+
+
+@dataclass(frozen=True, slots=True)
+class PodNetworkPlan:
+    """파드 서브넷 IP 계획 (서브넷을 공유하는 노드 풀별 수요의 합)"""
+
+    pools: tuple[PoolPodDemand, ...]
+    shares_node_subnet: bool
+
+    @property
+    def nodes(self) -> int:
+        return sum(pool.nodes for pool in self.pools)
+
+    @property
+    def surge_nodes(self) -> int:
+        return sum(pool.surge_nodes for pool in self.pools)
+
+    @property
+    def required_ips(self) -> int:
+        """서지까지 포함해 동시에 존재할 수 있는 최대 노드의 파드(+노드 자신) IP 수"""
+        return sum(pool.ips(self.shares_node_subnet) for pool in self.pools)
+
+    @property
+    def prefix_length(self) -> int:
+        """필요한 IP를 담을 수 있는 가장 작은 IPv4 서브넷의 prefix 길이"""
+        total = self.required_ips + OCI_RESERVED_IPS_PER_SUBNET
+        return 32 - max(math.ceil(math.log2(total)), 0)
+
+    def check(self, cidr_block: str) -> None:
+        """주어진 서브넷이 계획을 수용하지 못하면 ValueError"""
+        available = usable_ips(cidr_block)
+        if self.required_ips > available:
+            subnet_kind = '노드/파드 공용' if self.shares_node_subnet else '파드'
+            demands = ' + '.join(pool.describe(self.shares_node_subnet) for pool in self.pools)
+            raise ValueError(
+                f'{subnet_kind} 서브넷 {cidr_block}의 IP가 부족합니다: 필요 {self.required_ips}개 '
+                f'({demands}), 사용 가능 {available}개. /{self.prefix_length} 이상의 서브넷이 필요합니다.'
+            )
+
+
+def plan_pod_network(
+    nodes: int,
+    max_pods_per_node: int,
+    surge_nodes: int = 0,
+    ocpus: int | None = None,
+    shares_node_subnet: bool = False,
+) -> PodNetworkPlan:
+    """
+    파드 IP 계획 생성
+    `ocpus`가 주어지면 모양의 VNIC 한도로 노드당 파드 수를 검증한다.
+    """
+    if nodes < 0 or surge_nodes < 0:
+        raise ValueError('노드 수와 서지 노드 수는 0 이상이어야 합니다.')
+    if not 1 <= max_pods_per_node <= MAX_PODS_PER_NODE_LIMIT:
+        raise ValueError(f'노드당 최대 파드 수는 1 ~ {MAX_PODS_PER_NODE_LIMIT} 사이여야 합니다: {max_pods_per_node}')
+    if ocpus is not None and max_pods_per_node > max_pods_for_shape(ocpus):
+        raise ValueError(
+            f'{ocpus} OCPU 노드는 VNIC {max_vnics(ocpus)}개로 최대 {max_pods_for_shape(ocpus)}개 파드만 '
+            f'지원합니다 (요청: {max_pods_per_node}).'
+        )
+    return PodNetworkPlan((PoolPodDemand(nodes, surge_nodes, max_pods_per_node),), shares_node_subnet)
+
+
+def combine_pod_networks(plans: Iterable[PodNetworkPlan], shares_node_subnet: bool = False) -> PodNetworkPlan:
+    """같은 파드 서브넷을 사용하는 노드 풀 계획의 합"""
+    return PodNetworkPlan(tuple(pool for plan in plans for pool in plan.pools), shares_node_subnet)
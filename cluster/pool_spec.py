@@ -0,0 +1,133 @@
+"""
+선언적 노드 풀 목록
+시스템 풀과 taint가 걸린 워크로드 풀처럼 모양/크기/레이블이 다른 여러 노드 풀을 설정으로 정의한다.
+"""
+
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, replace
+from typing import Any
+
+from cluster.boot_volume import BootVolumeSpec
+from cluster.pod_network import DEFAULT_MAX_PODS_PER_NODE, MAX_PODS_PER_NODE_LIMIT
+
+_TAINT_PATTERN = re.compile(r'^[A-Za-z0-9./_-]+(=[A-Za-z0-9._-]*)?:(NoSchedule|PreferNoSchedule|NoExecute)$')
+_NAME_PATTERN = re.compile(r'^[a-z0-9]([a-z0-9-]*[a-z0-9])?$')
+
+
+@dataclass(frozen=True, slots=True)
+class NodePoolSpec:
+    """노드 풀 하나의 선언 (레이블/taint는 해시 가능한 튜플로 보관)"""
+
+    name: str
+    size: int
+    shape: str
+    ocpus: int
+    memory_in_gbs: int
+    labels: tuple[tuple[str, str], ...] = ()
+    taints: tuple[str, ...] = ()
+    # 클러스터 오토스케일러 범위 (지정하지 않으면 size로 고정)
+    min_size: int | None = None
+    max_size: int | None = None
+    # 노드 성능 프로필 이름 (cluster.performance, 지정하지 않으면 기본 kubelet/커널 설정)
+    performance_profile: str | None = None
+    # 부트 볼륨 크기/성능 목표 (cluster.boot_volume, 지정하지 않으면 이미지 기본 크기)
+    boot_volume: BootVolumeSpec | None = None
+    # VCN-native CNI 노드당 최대 파드 수 (지정하지 않으면 전역 max_pods_per_node)
+    max_pods_per_node: int = DEFAULT_MAX_PODS_PER_NODE
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any], defaults: 'NodePoolSpec') -> 'NodePoolSpec':
+        """
+        설정 항목을 파싱하는 메소드
+        크기/모양/OCPU/메모리/노드당 최대 파드 수는 지정하지 않으면 기본 풀에서 상속하고, 레이블/taint/오토스케일러
+        범위/성능 프로필/부트 볼륨은 풀마다 지정한 값만 사용한다 (기본 풀의 단일 노드 풀 설정은 상속하지 않음).
+        """
+        if 'name' not in raw:
+            raise ValueError('노드 풀에는 name이 필요합니다.')
+        spec = replace(
+            defaults,
+            name=str(raw['name']),
+            size=int(raw.get('size', defaults.size)),
+            shape=str(raw.get('shape', defaults.shape)),
+            ocpus=int(raw.get('ocpus', defaults.ocpus)),
+            memory_in_gbs=int(raw.get('memory_in_gbs', defaults.memory_in_gbs)),
+            labels=tuple(sorted((str(k), str(v)) for k, v in (raw.get('labels') or {}).items())),
+            taints=tuple(str(taint) for taint in raw.get('taints') or ()),
+            min_size=int(raw['min_size']) if 'min_size' in raw else None,
+            max_size=int(raw['max_size']) if 'max_size' in raw else None,
+            performance_profile=str(raw['performance_profile']) if raw.get('performance_profile') else None,
+            boot_volume=BootVolumeSpec.from_dict(raw['boot_volume']) if raw.get('boot_volume') else None,
+            max_pods_per_node=int(raw.get('max_pods_per_node', defaults.max_pods_per_node)),
+        )
+        spec.validate()
+        return spec
+
+    @property
+    def shape_config(self) -> dict[str, int]:
+        return {'ocpus': self.ocpus, 'memory_in_gbs': self.memory_in_gbs}
+
+    @property
+    def bounds(self) -> tuple[int, int]:
+        """오토스케일러 노드 수 범위 (min, max)"""
+        return (
+            self.size if self.min_size is None else self.min_size,
+            self.size if self.max_size is None else self.max_size,
+        )
+
+    @property
+    def autoscaled(self) -> bool:
+        low, high = self.bounds
+        return low != high
+
+    def validate(self) -> None:
+        if not _NAME_PATTERN.match(self.name):
+            raise ValueError(f"노드 풀 이름 '{self.name}'은 소문자, 숫자, '-'만 사용할 수 있습니다.")
+        if self.size < 0 or self.ocpus <= 0 or self.memory_in_gbs <= 0:
+            raise ValueError(f"노드 풀 '{self.name}'의 크기/OCPU/메모리 값이 올바르지 않습니다.")
+        if not 1 <= self.max_pods_per_node <= MAX_PODS_PER_NODE_LIMIT:
+            raise ValueError(
+                f"노드 풀 '{self.name}'의 노드당 최대 파드 수는 1 ~ {MAX_PODS_PER_NODE_LIMIT} 사이여야 합니다: "
+                f'{self.max_pods_per_node}'
+            )
+        low, high = self.bounds
+        if not 0 <= low <= self.size <= high:
+            raise ValueError(
+                f"노드 풀 '{self.name}'의 크기 {self.size}가 오토스케일러 범위 {low} ~ {high}를 벗어났습니다."
+            )
+        for taint in self.taints:
+            if not _TAINT_PATTERN.match(taint):
+                raise ValueError(f"노드 풀 '{self.name}'의 taint 형식이 올바르지 않습니다: {taint} (key=value:Effect)")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'name': self.name,
+            'size': self.size,
+            'shape': self.shape,
+            'ocpus': self.ocpus,
+            'memory_in_gbs': self.memory_in_gbs,
+            'labels': dict(self.labels),
+            'taints': list(self.taints),
+            'min_size': self.bounds[0],
+            'max_size': self.bounds[1],
+            'performance_profile': self.performance_profile,
+            'boot_volume': self.boot_volume.to_dict() if self.boot_volume else None,
+            'max_pods_per_node': self.max_pods_per_node,
+        }
+
+
+def parse_node_pools(raw: Iterable[Mapping[str, Any]], defaults: NodePoolSpec) -> tuple[NodePoolSpec, ...]:
+    """
+    `[{name, size, shape, ocpus, memory_in_gbs, labels, taints, min_size, max_size, performance_profile,
+    boot_volume, max_pods_per_node}, ...]` 형식의 노드 풀 목록 파싱
+    목록이 비어 있으면 기존 단일 노드 풀 설정(`defaults`)만 사용한다.
+    """
+    pools = tuple(NodePoolSpec.from_dict(item, defaults) for item in raw)
+    if not pools:
+        defaults.validate()
+        pools = (defaults,)
+    names = [pool.name for pool in pools]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f'노드 풀 이름이 중복되었습니다: {", ".join(duplicates)}')
+    return pools
@@ -0,0 +1,210 @@
+"""
+노드 풀 업그레이드 전략
+`kubernetes_version`이나 노드 이미지를 바꿀 때 기존 노드를 교체하는 방법을 정하고,
+실행 전에 소요 시간과 용량 하한을 추정한다.
+
+- default: OCI 기본 동작 (노드 풀 설정만 바뀌고 기존 노드는 교체되지 않음)
+- surge: 노드 풀 사이클링 (`max_surge`개를 먼저 추가하고 `max_unavailable`개까지 동시에 cordon/drain 후 교체)
+- blue_green: 새 버전의 병렬 노드 풀을 만들고, 모든 노드가 ACTIVE가 되면 기존 풀을 0으로 줄여 cordon/drain한 뒤 제거
+  (rollout: 두 풀 유지 -> cutover: 기존 풀 drain -> complete: 기존 풀 삭제)
+
+설정 예:
+    pulumi config set --path 'node_pool_upgrade.strategy' surge
+    pulumi config set --path 'node_pool_upgrade.max_surge' '25%'
+"""
+
+import math
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+UPGRADE_STRATEGIES = ('default', 'surge', 'blue_green')
+BLUE_GREEN_PHASES = ('rollout', 'cutover', 'complete')
+COLORS = ('blue', 'green')
+
+_COUNT_PATTERN = re.compile(r'^(\d+)(%?)$')
+_DURATION_PATTERN = re.compile(r'^PT(?:(\d+)H)?(?:(\d+)M)?$')
+MAX_EVICTION_GRACE_MINUTES = 60
+
+
+def parse_grace_minutes(value: str) -> int:
+    """ISO 8601 기간('PT60M', 'PT1H')을 분으로 변환 (OKE 허용 범위 0 ~ 60분)"""
+    match = _DURATION_PATTERN.match(value)
+    if not match or value == 'PT':
+        raise ValueError(f'eviction_grace_duration은 ISO 8601 기간이어야 합니다 (예: PT30M): {value}')
+    minutes = int(match.group(1) or 0) * 60 + int(match.group(2) or 0)
+    if minutes > MAX_EVICTION_GRACE_MINUTES:
+        raise ValueError(f'eviction_grace_duration은 최대 PT60M입니다: {value}')
+    return minutes
+
+
+def resolve_count(value: str, size: int, round_up: bool) -> int:
+    """노드 수 또는 비율('25%')을 노드 수로 변환 (서지는 올림, 동시 중단은 내림 - Kubernetes 롤링 업데이트와 동일)"""
+    match = _COUNT_PATTERN.match(value)
+    if not match:
+        raise ValueError(f"노드 수는 정수 또는 비율('25%')이어야 합니다: {value}")
+    number = int(match.group(1))
+    if not match.group(2):
+        return min(number, size)
+    if number > 100:
+        raise ValueError(f'비율은 0% ~ 100% 사이여야 합니다: {value}')
+    nodes = size * number / 100
+    return math.ceil(nodes) if round_up else math.floor(nodes)
+
+
+@dataclass(frozen=True, slots=True)
+class UpgradeStrategy:
+    """노드 풀 업그레이드 설정 (`node_pool_upgrade` config 객체)"""
+
+    strategy: str = 'default'
+    # surge: OKE 노드 풀 사이클링 (정수 또는 비율)
+    max_surge: str = '1'
+    max_unavailable: str = '0'
+    # 노드 제거 시 파드 eviction 대기 시간 (지나면 강제 삭제 여부)
+    eviction_grace_duration: str = 'PT60M'
+    force_delete_after_grace: bool = False
+    # blue_green: 새 버전을 받는 색상, 진행 단계, 기존 풀에 고정할 버전/이미지
+    active_color: str = 'blue'
+    phase: str = 'complete'
+    previous_kubernetes_version: str | None = None
+    previous_image_id: str | None = None
+    # 계획용 추정치 (분)와 허용하는 최소 용량 비율
+    node_boot_minutes: float = 10.0
+    drain_minutes: float = 5.0
+    min_capacity: float = 0.0
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> 'UpgradeStrategy':
+        defaults = cls()
+        previous_version = raw.get('previous_kubernetes_version')
+        previous_image = raw.get('previous_image_id')
+        settings = cls(
+            strategy=str(raw.get('strategy', defaults.strategy)),
+            max_surge=str(raw.get('max_surge', defaults.max_surge)),
+            max_unavailable=str(raw.get('max_unavailable', defaults.max_unavailable)),
+            eviction_grace_duration=str(raw.get('eviction_grace_duration', defaults.eviction_grace_duration)),
+            force_delete_after_grace=bool(raw.get('force_delete_after_grace', defaults.force_delete_after_grace)),
+            active_color=str(raw.get('active_color', defaults.active_color)),
+            phase=str(raw.get('phase', defaults.phase)),
+            previous_kubernetes_version=str(previous_version) if previous_version else None,
+            previous_image_id=str(previous_image) if previous_image else None,
+            node_boot_minutes=float(raw.get('node_boot_minutes', defaults.node_boot_minutes)),
+            drain_minutes=float(raw.get('drain_minutes', defaults.drain_minutes)),
+            min_capacity=float(raw.get('min_capacity', defaults.min_capacity)),
+        )
+        settings.validate()
+        return settings
+
+    @property
+    def grace_minutes(self) -> int:
+        return parse_grace_minutes(self.eviction_grace_duration)
+
+    @property
+    def inactive_color(self) -> str:
+        return COLORS[1 - COLORS.index(self.active_color)]
+
+    @property
+    def keeps_previous_pool(self) -> bool:
+        """blue/green 전환 중이라 이전 색상의 노드 풀을 유지하는지 여부"""
+        return self.strategy == 'blue_green' and self.phase != 'complete'
+
+    def validate(self) -> None:
+        if self.strategy not in UPGRADE_STRATEGIES:
+            raise ValueError(
+                f'업그레이드 strategy는 {", ".join(UPGRADE_STRATEGIES)} 중 하나여야 합니다: {self.strategy}'
+            )
+        if self.active_color not in COLORS:
+            raise ValueError(f'active_color는 {", ".join(COLORS)} 중 하나여야 합니다: {self.active_color}')
+        if self.phase not in BLUE_GREEN_PHASES:
+            raise ValueError(f'phase는 {", ".join(BLUE_GREEN_PHASES)} 중 하나여야 합니다: {self.phase}')
+        parse_grace_minutes(self.eviction_grace_duration)
+        for value in (self.max_surge, self.max_unavailable):
+            resolve_count(value, 100, round_up=True)
+        if self.strategy == 'surge' and self.max_surge in ('0', '0%') and self.max_unavailable in ('0', '0%'):
+            raise ValueError('surge 업그레이드에는 max_surge 또는 max_unavailable 중 하나가 0보다 커야 합니다.')
+        if self.keeps_previous_pool and not self.previous_kubernetes_version:
+            raise ValueError(f'blue_green {self.phase} 단계에는 기존 풀의 previous_kubernetes_version이 필요합니다.')
+        if self.node_boot_minutes < 0 or self.drain_minutes < 0:
+            raise ValueError('node_boot_minutes/drain_minutes는 0 이상이어야 합니다.')
+        if not 0 <= self.min_capacity <= 1:
+            raise ValueError('min_capacity는 0 ~ 1 사이여야 합니다.')
+
+
+# =============================================================================
+# 업그레이드 계획
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class UpgradePlan:
+    """노드 풀 하나의 업그레이드 추정치"""
+
+    pool: str
+    strategy: str
+    size: int
+    batches: int  # 순차로 교체하는 묶음 수
+    batch_size: int  # 묶음당 교체하는 노드 수
+    surge_nodes: int  # 업그레이드 중 추가로 늘어나는 노드 수
+    min_available: int  # 업그레이드 중 Ready 상태로 남는 최소 노드 수
+    expected_minutes: float  # 예상 소요 시간 (drain_minutes 기준)
+    worst_case_minutes: float  # eviction 유예 시간을 모두 쓰는 경우
+
+    @property
+    def capacity_floor(self) -> float:
+        return self.min_available / self.size if self.size else 1.0
+
+    @property
+    def peak_nodes(self) -> int:
+        return self.size + self.surge_nodes
+
+    def summary(self) -> str:
+        if self.strategy == 'default':
+            return f"노드 풀 '{self.pool}': 기본 업그레이드 (기존 노드 {self.size}개는 교체되지 않음)"
+        return (
+            f"노드 풀 '{self.pool}' {self.strategy} 업그레이드: {self.size}노드, "
+            f'{self.batches}회 x {self.batch_size}노드, 예상 {self.expected_minutes:.0f}분 '
+            f'(최대 {self.worst_case_minutes:.0f}분), 최소 용량 {self.min_available}노드 ({self.capacity_floor:.0%}), '
+            f'최대 {self.peak_nodes}노드'
+        )
+
+
+def plan_upgrade(pool: str, size: int, strategy: UpgradeStrategy) -> UpgradePlan:
+    """
+    노드 풀 크기와 전략으로 업그레이드 소요 시간과 용량 하한을 추정
+    - surge: 묶음마다 (서지 + 동시 중단) 노드를 교체하며, 새 노드 부팅 후 기존 노드를 drain한다.
+    - blue_green: 새 풀 전체를 동시에 부팅한 뒤 기존 풀을 한 번에 drain하므로 용량은 줄지 않고 노드 수가 두 배가 된다.
+    """
+    boot, drain, grace = strategy.node_boot_minutes, strategy.drain_minutes, strategy.grace_minutes
+    if strategy.strategy == 'surge' and size:
+        surge = resolve_count(strategy.max_surge, size, round_up=True)
+        unavailable = resolve_count(strategy.max_unavailable, size, round_up=False)
+        if surge + unavailable == 0:
+            # 비율이 내림되어 0이 되면 OKE는 한 번에 한 노드씩 교체한다
+            surge = 1
+        batch_size = surge + unavailable
+        batches = math.ceil(size / batch_size)
+        # 묶음마다 새 노드 부팅과 기존 노드 drain이 한 번씩 (서지가 없으면 drain 후 부팅)
+        return UpgradePlan(
+            pool,
+            'surge',
+            size,
+            batches,
+            batch_size,
+            surge,
+            size - unavailable,
+            batches * (boot + drain),
+            batches * (boot + grace),
+        )
+    if strategy.strategy == 'blue_green':
+        return UpgradePlan(pool, 'blue_green', size, 1 if size else 0, size, size, size, boot + drain, boot + grace)
+    return UpgradePlan(pool, strategy.strategy, size, 0, 0, 0, size, 0.0, 0.0)
+
+
+def check_upgrade_plan(plan: UpgradePlan, strategy: UpgradeStrategy) -> None:
+    """업그레이드 중 용량이 `min_capacity` 아래로 내려가면 오류"""
+    if plan.capacity_floor < strategy.min_capacity:
+        raise ValueError(
+            f"노드 풀 '{plan.pool}' 업그레이드 중 용량이 {plan.capacity_floor:.0%}까지 줄어 "
+            f'min_capacity {strategy.min_capacity:.0%}보다 낮습니다. max_unavailable을 줄이세요.'
+        )
@@ -1,33 +1,451 @@
-# ruff: noqa: E501
 """
 개선된 OCI 설정 관리
 민감한 정보는 Pulumi config에서, 나머지는 여기서 관리
+
+설정은 `get_config()`가 처음 호출될 때 한 번만 읽고 검증하여 불변 스냅샷(`OCIConfig`)으로 보관한다.
+모듈 import 자체는 아무런 부수 효과가 없으며, 기존 대문자 상수(`cfg.COMPARTMENT_ID` 등)는
+모듈 `__getattr__`를 통해 스냅샷에서 지연 조회된다.
 """
 
+import functools
+from dataclasses import dataclass
 from typing import Any
 
 import pulumi
 from pulumi import Output
 
-
+from cluster.boot_volume import BootVolumeSpec
+from cluster.capacity import PodRequest, parse_workload_profile
+from cluster.images import (
+    DEFAULT_CACHE_DIR as IMAGE_CACHE_DIR,
+    DEFAULT_TTL_SECONDS as IMAGE_CACHE_TTL_SECONDS,
+    resolve_node_image,
+)
+from cluster.kubeconfig import HELPER_COMMAND
+from cluster.overprovisioning import OverprovisioningSpec
+from cluster.performance import PerformanceProfile, parse_performance_profiles
+from cluster.pod_network import DEFAULT_MAX_PODS_PER_NODE, combine_pod_networks, plan_pod_network
+from cluster.pool_spec import NodePoolSpec, parse_node_pools
+from cluster.upgrade import UpgradeStrategy
+from network.cidr import find_overlaps, plan_subnets, validate_cidrs
+from network.service_catalog import DEFAULT_CACHE_PATH, DEFAULT_TTL_SECONDS, ServiceEntry, resolve_service
+
+# =============================================================================
+# 리전별 정적 설정 (모듈 로드 시 한 번만 생성)
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class RegionConfig:
+    """리전별 설정 (service_id는 서비스 카탈로그를 조회할 수 없을 때의 기본값)"""
+
+    availability_domain: str
+    service_id: str
+    # 노드 이미지를 조회할 수 없을 때 ARM 모양(VM.Standard.A1.Flex)에 사용하는 이미지
+    image_id: str
+
+
+DEFAULT_REGION = 'ap-osaka-1'
+
+REGION_CONFIGS: dict[str, RegionConfig] = {
+    'ap-osaka-1': RegionConfig(
+        availability_domain='PCHh:AP-OSAKA-1-AD-1',
+        service_id='ocid1.service.oc1.ap-osaka-1.aaaaaaaanpw2x646vasmcdktlznzhf7mwmcgf4hhmw5zepgspmseokxjyj4q',
+        image_id='ocid1.image.oc1.ap-osaka-1.aaaaaaaa4xyxytwqlwbxp5rp5qvhi5snlomtjgyavitu3m36bp4neknjsloa',
+    ),
+    'ap-seoul-1': RegionConfig(
+        availability_domain='YnyK:AP-SEOUL-1-AD-1',
+        service_id='ocid1.service.oc1.ap-seoul-1.aaaaaaaac4kj7ddh5y7kfqbfzc6hzxfazezmvr4n6k7rqt7ifrfcjxnb2y4q',
+        image_id='ocid1.image.oc1.ap-seoul-1.aaaaaaaas5x3bpjnktaajrr7mvqjr3kh4zegqlqeqe5wbql4dqq4q2qj2o5a',
+    ),
+    'ap-tokyo-1': RegionConfig(
+        availability_domain='bJmJ:AP-TOKYO-1-AD-1',
+        service_id='ocid1.service.oc1.ap-tokyo-1.aaaaaaaanp2x646vasmcdktlznzhf7mwmcgf4hhmw5zepgspmseokxjyj4q',
+        image_id='ocid1.image.oc1.ap-tokyo-1.aaaaaaaa4xyxytwqlwbxp5rp5qvhi5snlomtjgyavitu3m36bp4neknjsloa',
+    ),
+    'us-ashburn-1': RegionConfig(
+        availability_domain='ZwDO:US-ASHBURN-1-AD-1',
+        service_id='ocid1.service.oc1.us-ashburn-1.aaaaaaaanp2x646vasmcdktlznzhf7mwmcgf4hhmw5zepgspmseokxjyj4q',
+        image_id='ocid1.image.oc1.us-ashburn-1.aaaaaaaa4xyxytwqlwbxp5rp5qvhi5snlomtjgyavitu3m36bp4neknjsloa',
+    ),
+    'us-phoenix-1': RegionConfig(
+        availability_domain='RWDJ:US-PHOENIX-1-AD-1',
+        service_id='ocid1.service.oc1.us-phoenix-1.aaaaaaaanp2x646vasmcdktlznzhf7mwmcgf4hhmw5zepgspmseokxjyj4q',
+        image_id='ocid1.image.oc1.us-phoenix-1.aaaaaaaa4xyxytwqlwbxp5rp5qvhi5snlomtjgyavitu3m36bp4neknjsloa',
+    ),
+}
+
+
+CLUSTER_TYPES = ('BASIC_CLUSTER', 'ENHANCED_CLUSTER')
+
+# 단계별 트레이스 파일 형식 (Chrome trace event / OpenTelemetry OTLP JSON)
+TRACE_FORMATS = ('chrome', 'otel')
+SECURITY_MODES = ('security_list', 'nsg')
+# 스택 계층: all(한 스택), network(VCN~서브넷), cluster(클러스터~노드 풀, 네트워크는 StackReference로 참조)
+LAYERS = ('all', 'network', 'cluster')
+# OCI Logging 서비스 로그 보존 기간으로 허용되는 값 (일)
+FLOW_LOG_RETENTION_OPTIONS = (30, 60, 90, 120, 150, 180)
+
+
+@dataclass(frozen=True, slots=True)
+class AutoscalerConfig:
+    """Cluster Autoscaler 애드온 설정 (`cluster_autoscaler` config 객체)"""
+
+    enabled: bool = False
+    auth_type: str = 'instance'  # 'instance'(인스턴스 주체) 또는 'workload'(워크로드 아이덴티티)
+    scale_down_delay_after_add: str = '10m'
+    scale_down_unneeded_time: str = '10m'
+    scale_down_utilization_threshold: float = 0.5
+    max_node_provision_time: str = '15m'
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> 'AutoscalerConfig':
+        defaults = cls()
+        settings = cls(
+            enabled=bool(raw.get('enabled', defaults.enabled)),
+            auth_type=str(raw.get('auth_type', defaults.auth_type)),
+            scale_down_delay_after_add=str(raw.get('scale_down_delay_after_add', defaults.scale_down_delay_after_add)),
+            scale_down_unneeded_time=str(raw.get('scale_down_unneeded_time', defaults.scale_down_unneeded_time)),
+            scale_down_utilization_threshold=float(
+                raw.get('scale_down_utilization_threshold', defaults.scale_down_utilization_threshold)
+            ),
+            max_node_provision_time=str(raw.get('max_node_provision_time', defaults.max_node_provision_time)),
+        )
+        if settings.auth_type not in ('instance', 'workload'):
+            raise ValueError(f"오토스케일러 auth_type은 'instance' 또는 'workload'여야 합니다: {settings.auth_type}")
+        if not 0 < settings.scale_down_utilization_threshold <= 1:
+            raise ValueError('오토스케일러 scale_down_utilization_threshold는 0 ~ 1 사이여야 합니다.')
+        return settings
+
+
+# 서브넷 역할 -> CIDR 설정 키
+SUBNET_CONFIG_KEYS = {
+    'service_lb': 'service_lb_subnet_cidr',
+    'node': 'node_subnet_cidr',
+    'k8s_api': 'k8s_api_subnet_cidr',
+    'pod': 'pod_subnet_cidr',
+}
+
+DEFAULT_SUBNET_CIDRS = {
+    'service_lb': '10.0.20.0/24',
+    'node': '10.0.10.0/24',
+    'k8s_api': '10.0.0.0/28',
+}
+
+# 듀얼 스택: VCN ULA(사설 IPv6) prefix와 서브넷 역할 -> IPv6 /64 설정 키 (설정하지 않은 역할은 자동 할당)
+DEFAULT_VCN_IPV6_CIDR_BLOCK = 'fd00:10::/48'
+SUBNET_IPV6_PREFIX_LENGTH = 64
+SUBNET_IPV6_CONFIG_KEYS = {
+    'service_lb': 'service_lb_subnet_ipv6_cidr',
+    'node': 'node_subnet_ipv6_cidr',
+    'k8s_api': 'k8s_api_subnet_ipv6_cidr',
+    'pod': 'pod_subnet_ipv6_cidr',
+}
+# OKE가 사용하는 Kubernetes IPv6 서비스 대역 (VCN IPv6 prefix와 겹치면 안 됨)
+KUBERNETES_IPV6_SERVICES_CIDR = 'fd00:eeee:eeee:1::/108'
+
+
+@dataclass(frozen=True, slots=True)
 class OCIConfig:
-    """OCI 설정을 관리하는 클래스"""
+    """OCI 설정 스냅샷 (불변)"""
+
+    # Pulumi config에서 가져오는 민감한 정보
+    compartment_id: Output[str]
+    ssh_public_key: Output[str]
+
+    # 리전
+    region: str
+    profile: str
+    region_config: RegionConfig
+
+    # 네트워크 설정
+    vcn_cidr_block: str
+    kubernetes_version: str
+    # IPv4/IPv6 듀얼 스택 (비활성이면 vcn_ipv6_cidr_block은 None)
+    dual_stack: bool
+    vcn_ipv6_cidr_block: str | None
+
+    # 보안 규칙 방식: 'security_list'(서브넷 공유 보안 리스트) 또는 'nsg'(역할별 네트워크 보안 그룹)
+    security_mode: str
+    load_balancer_ports: tuple[int, ...]
+
+    # 서브넷 VCN 흐름 로그 (OCI Logging)
+    flow_logs: bool
+    flow_log_group_name: str
+    flow_log_retention_days: int
+
+    # 스택 계층 (cluster 계층은 network_stack의 export를 StackReference로 읽음)
+    layer: str
+    network_stack: str | None
+
+    # 클러스터 설정
+    cluster_type: str
+    cluster_autoscaler: AutoscalerConfig
+    overprovisioning: OverprovisioningSpec
+    # kubeconfig 출력의 exec 인증 명령을 감싸는 토큰 캐시 헬퍼 (빈 문자열이면 OCI CLI를 직접 호출)
+    kubeconfig_token_helper: str
+
+    # VCN 리소스 이름
+    vcn_display_name: str
+    internet_gateway_display_name: str
+    nat_gateway_display_name: str
+    service_gateway_display_name: str
+
+    # 조회 결과 캐시 (서비스 카탈로그, 노드 이미지). offline이면 API를 호출하지 않고 캐시/기본값만 사용
+    offline: bool
+    service_catalog_path: str
+    service_catalog_ttl: float
+    service_catalog_offline: bool
+    image_cache_dir: str
+    image_cache_ttl: float
+
+    # 서브넷 설정
+    service_lb_subnet_cidr_block: str
+    node_subnet_cidr_block: str
+    k8s_api_subnet_cidr_block: str
+    pod_subnet_cidr_block: str | None
+    # 역할별 서브넷 IPv6 /64 ((역할, prefix), 듀얼 스택에서만)
+    subnet_ipv6_cidr_blocks: tuple[tuple[str, str], ...]
 
-    def __init__(self):
-        self.config = pulumi.Config()
-        self._validate_required_configs()
+    # 노드 풀 설정
+    node_pool_name: str
+    node_pool_size: int
+    node_shape: str
+    node_memory_gbs: int
+    node_ocpus: int
+    node_pools: tuple[NodePoolSpec, ...]
+    node_pool_upgrade: UpgradeStrategy
+    # 노드 성능 프로필 (기본 프로필 + `performance_profiles` 사용자 정의)
+    performance_profiles: tuple[PerformanceProfile, ...]
+
+    # 파드 네트워크 (OCI_VCN_IP_NATIVE)
+    max_pods_per_node: int
+    pod_surge_nodes: int
+
+    # 워크로드 기반 용량 계획 (프로필이 비어 있으면 위의 고정 노드 풀 설정 사용)
+    workload_profile: tuple[PodRequest, ...]
+    capacity_shapes: tuple[str, ...]
+    capacity_objective: str
+
+    # 단계별 타이밍/트레이싱 (trace_file이 없으면 비활성, 경로의 {stack}은 스택 이름으로 치환)
+    trace_file: str | None
+    trace_format: str
+
+    @classmethod
+    def load(cls, config: pulumi.Config | None = None) -> 'OCIConfig':
+        """Pulumi config를 한 번 읽어 스냅샷 생성"""
+        config = config or pulumi.Config()
+        compartment_id, ssh_public_key = cls._require_secrets(config, 'compartment_id', 'ssh_public_key')
+
+        region = config.get('region') or DEFAULT_REGION
+        region_config = REGION_CONFIGS.get(region)
+        if region_config is None:
+            pulumi.log.warn(f"리전 '{region}'에 대한 설정을 찾을 수 없습니다. 기본값을 사용합니다.")
+            region_config = REGION_CONFIGS[DEFAULT_REGION]
+
+        vcn_cidr_block = config.get('vcn_cidr_block') or '10.0.0.0/16'
+        offline = config.get_bool('offline') or False
+        node_pool_name = config.get('node_pool_name') or 'pool1'
+        node_pool_size = config.get_int('node_pool_size') or 2
+        node_shape = config.get('node_shape') or 'VM.Standard.A1.Flex'
+        node_memory_gbs = config.get_int('node_memory_gbs') or 12
+        node_ocpus = config.get_int('node_ocpus') or 2
+        node_boot_volume = config.get_object('node_boot_volume')
+        max_pods_per_node = config.get_int('max_pods_per_node') or DEFAULT_MAX_PODS_PER_NODE
+        node_pools = parse_node_pools(
+            config.get_object('node_pools') or [],
+            NodePoolSpec(
+                name=node_pool_name,
+                size=node_pool_size,
+                shape=node_shape,
+                ocpus=node_ocpus,
+                memory_in_gbs=node_memory_gbs,
+                labels=(('name', 'mgmt'),),
+                min_size=config.get_int('node_pool_min_size'),
+                max_size=config.get_int('node_pool_max_size'),
+                performance_profile=config.get('node_performance_profile'),
+                boot_volume=BootVolumeSpec.from_dict(node_boot_volume) if node_boot_volume else None,
+                max_pods_per_node=max_pods_per_node,
+            ),
+        )
+        performance_profiles = parse_performance_profiles(config.get_object('performance_profiles') or {})
+        for pool in node_pools:
+            if pool.performance_profile and pool.performance_profile not in performance_profiles:
+                raise ValueError(
+                    f"노드 풀 '{pool.name}'의 성능 프로필 '{pool.performance_profile}'을 찾을 수 없습니다 "
+                    f'(가능한 값: {", ".join(sorted(performance_profiles))})'
+                )
+
+        node_pool_upgrade = UpgradeStrategy.from_dict(config.get_object('node_pool_upgrade') or {})
+
+        # 애드온(Cluster Autoscaler)은 ENHANCED_CLUSTER에서만 사용할 수 있다
+        cluster_autoscaler = AutoscalerConfig.from_dict(config.get_object('cluster_autoscaler') or {})
+        cluster_type = config.get('cluster_type') or (
+            'ENHANCED_CLUSTER' if cluster_autoscaler.enabled else 'BASIC_CLUSTER'
+        )
+        if cluster_type not in CLUSTER_TYPES:
+            raise ValueError(f'cluster_type은 {", ".join(CLUSTER_TYPES)} 중 하나여야 합니다: {cluster_type}')
+        if cluster_autoscaler.enabled and cluster_type != 'ENHANCED_CLUSTER':
+            raise ValueError('Cluster Autoscaler 애드온은 ENHANCED_CLUSTER에서만 사용할 수 있습니다.')
+
+        kubeconfig_token_helper = config.get('kubeconfig_token_helper')
+        if kubeconfig_token_helper is None:
+            kubeconfig_token_helper = HELPER_COMMAND
+
+        # 오버프로비저닝 (placeholder 파드) - 대상 노드 풀은 설정된 노드 풀이어야 한다
+        overprovisioning = OverprovisioningSpec.from_dict(config.get_object('overprovisioning') or {})
+        unknown_pools = sorted(set(overprovisioning.pools) - {pool.name for pool in node_pools})
+        if unknown_pools:
+            raise ValueError(f'overprovisioning pools에 없는 노드 풀이 있습니다: {", ".join(unknown_pools)}')
+
+        pod_surge_nodes = config.get_int('pod_surge_nodes')
+        pod_surge_nodes = 1 if pod_surge_nodes is None else pod_surge_nodes
+        # 노드 풀마다 (최대 노드 수 + 서지 노드) x 노드 풀의 노드당 파드 수
+        pod_prefix_length = combine_pod_networks(
+            plan_pod_network(pool.bounds[1], pool.max_pods_per_node, pod_surge_nodes) for pool in node_pools
+        ).prefix_length
+        subnet_cidrs = cls._resolve_subnet_cidrs(config, vcn_cidr_block, pod_prefix_length)
+
+        dual_stack = config.get_bool('dual_stack') or False
+        vcn_ipv6_cidr_block = None
+        subnet_ipv6_cidrs: dict[str, str] = {}
+        if dual_stack:
+            vcn_ipv6_cidr_block = config.get('vcn_ipv6_cidr_block') or DEFAULT_VCN_IPV6_CIDR_BLOCK
+            subnet_ipv6_cidrs = cls._resolve_subnet_ipv6_cidrs(config, vcn_ipv6_cidr_block, list(subnet_cidrs))
+
+        security_mode = config.get('security_mode') or 'security_list'
+        if security_mode not in SECURITY_MODES:
+            raise ValueError(f'security_mode는 {", ".join(SECURITY_MODES)} 중 하나여야 합니다: {security_mode}')
+
+        flow_log_retention_days = config.get_int('flow_log_retention_days') or 30
+        if flow_log_retention_days not in FLOW_LOG_RETENTION_OPTIONS:
+            raise ValueError(
+                f'flow_log_retention_days는 {", ".join(map(str, FLOW_LOG_RETENTION_OPTIONS))} 중 하나여야 합니다: '
+                f'{flow_log_retention_days}'
+            )
+
+        layer = config.get('layer') or 'all'
+        if layer not in LAYERS:
+            raise ValueError(f'layer는 {", ".join(LAYERS)} 중 하나여야 합니다: {layer}')
+        network_stack = config.get('network_stack')
+        if layer == 'cluster' and not network_stack:
+            raise ValueError(
+                "layer가 'cluster'이면 네트워크 계층 스택 이름이 필요합니다 "
+                "(network_stack, 예: 'organization/oke-single/dev-network')."
+            )
 
-    def _validate_required_configs(self) -> None:
-        """필수 설정값 검증"""
-        required_secrets = ['compartment_id', 'ssh_public_key']
+        trace_format = config.get('trace_format') or 'chrome'
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(f'trace_format은 {", ".join(TRACE_FORMATS)} 중 하나여야 합니다: {trace_format}')
+
+        return cls(
+            compartment_id=compartment_id,
+            ssh_public_key=ssh_public_key,
+            region=region,
+            profile=config.get('profile') or 'DEFAULT',
+            region_config=region_config,
+            vcn_cidr_block=vcn_cidr_block,
+            kubernetes_version=config.get('kubernetes_version') or 'v1.32.1',
+            dual_stack=dual_stack,
+            vcn_ipv6_cidr_block=vcn_ipv6_cidr_block,
+            security_mode=security_mode,
+            load_balancer_ports=tuple(int(port) for port in config.get_object('load_balancer_ports') or (80, 443)),
+            flow_logs=config.get_bool('flow_logs') or False,
+            flow_log_group_name=config.get('flow_log_group_name') or 'oke-flow-logs',
+            flow_log_retention_days=flow_log_retention_days,
+            layer=layer,
+            network_stack=network_stack,
+            cluster_type=cluster_type,
+            cluster_autoscaler=cluster_autoscaler,
+            overprovisioning=overprovisioning,
+            kubeconfig_token_helper=kubeconfig_token_helper,
+            vcn_display_name=config.get('vcn_display_name') or 'oke-vcn-mgmt',
+            internet_gateway_display_name=config.get('igw_display_name') or 'oke-igw-mgmt',
+            nat_gateway_display_name=config.get('ngw_display_name') or 'oke-ngw-mgmt',
+            service_gateway_display_name=config.get('sgw_display_name') or 'oke-sgw-mgmt',
+            service_catalog_path=config.get('service_catalog_cache') or str(DEFAULT_CACHE_PATH),
+            service_catalog_ttl=(config.get_float('service_catalog_ttl_hours') or DEFAULT_TTL_SECONDS / 3600) * 3600,
+            offline=offline,
+            service_catalog_offline=config.get_bool('service_catalog_offline') or offline,
+            image_cache_dir=config.get('image_cache_dir') or str(IMAGE_CACHE_DIR),
+            image_cache_ttl=(config.get_float('image_cache_ttl_hours') or IMAGE_CACHE_TTL_SECONDS / 3600) * 3600,
+            service_lb_subnet_cidr_block=subnet_cidrs['service_lb'],
+            node_subnet_cidr_block=subnet_cidrs['node'],
+            k8s_api_subnet_cidr_block=subnet_cidrs['k8s_api'],
+            pod_subnet_cidr_block=subnet_cidrs.get('pod'),
+            subnet_ipv6_cidr_blocks=tuple(subnet_ipv6_cidrs.items()),
+            node_pool_name=node_pool_name,
+            node_pool_size=node_pool_size,
+            node_shape=node_shape,
+            node_memory_gbs=node_memory_gbs,
+            node_ocpus=node_ocpus,
+            node_pools=node_pools,
+            node_pool_upgrade=node_pool_upgrade,
+            performance_profiles=tuple(performance_profiles.values()),
+            max_pods_per_node=max_pods_per_node,
+            pod_surge_nodes=pod_surge_nodes,
+            workload_profile=parse_workload_profile(config.get_object('workload_profile') or []),
+            capacity_shapes=tuple(config.get_object('capacity_shapes') or [node_shape]),
+            capacity_objective=config.get('capacity_objective') or 'cost',
+            trace_file=config.get('trace_file'),
+            trace_format=trace_format,
+        )
+
+    @staticmethod
+    def _resolve_subnet_cidrs(config: pulumi.Config, vcn_cidr_block: str, pod_prefix_length: int) -> dict[str, str]:
+        """
+        역할별 서브넷 CIDR 결정
+        명시적으로 설정된 CIDR이 우선이며, `subnet_prefix_lengths`에 크기만 지정된 역할은
+        나머지 블록을 피해 VCN CIDR 안에서 자동 할당한다.
+        파드 서브넷 크기를 'auto'로 지정하면 노드 수/노드당 파드 수/서지로 계산한 크기를 사용한다.
+        (예: pulumi config set --path 'subnet_prefix_lengths.pod' 19)
+        """
+        prefix_lengths: dict[str, int] = {
+            role: pod_prefix_length if role == 'pod' and prefixlen == 'auto' else int(prefixlen)
+            for role, prefixlen in (config.get_object('subnet_prefix_lengths') or {}).items()
+        }
+        unknown = set(prefix_lengths) - set(SUBNET_CONFIG_KEYS)
+        if unknown:
+            raise ValueError(f'알 수 없는 서브넷 역할입니다: {", ".join(sorted(unknown))}')
+
+        reserved: dict[str, str] = {}
+        for role, key in SUBNET_CONFIG_KEYS.items():
+            cidr_block = config.get(key)
+            if cidr_block:
+                prefix_lengths.pop(role, None)
+            elif role not in prefix_lengths:
+                cidr_block = DEFAULT_SUBNET_CIDRS.get(role)
+            if cidr_block:
+                reserved[role] = cidr_block
+
+        if not prefix_lengths:
+            return reserved
+        return {**reserved, **plan_subnets(vcn_cidr_block, prefix_lengths, reserved)}
+
+    @staticmethod
+    def _resolve_subnet_ipv6_cidrs(
+        config: pulumi.Config, vcn_ipv6_cidr_block: str, roles: list[str]
+    ) -> dict[str, str]:
+        """
+        역할별 서브넷 IPv6 /64 결정 (OCI 서브넷 IPv6 prefix는 항상 /64)
+        명시적으로 설정된 prefix가 우선이며, 나머지 역할은 VCN IPv6 prefix 안에서 순서대로 자동 할당한다.
+        """
+        reserved = {role: config.get(SUBNET_IPV6_CONFIG_KEYS[role]) for role in roles}
+        reserved = {role: cidr_block for role, cidr_block in reserved.items() if cidr_block}
+        validate_cidrs(reserved, vcn_ipv6_cidr_block, prefixlen=SUBNET_IPV6_PREFIX_LENGTH)
+        prefix_lengths = {role: SUBNET_IPV6_PREFIX_LENGTH for role in roles if role not in reserved}
+        planned = {**reserved, **plan_subnets(vcn_ipv6_cidr_block, prefix_lengths, reserved)}
+        return {role: planned[role] for role in roles}
+
+    @staticmethod
+    def _require_secrets(config: pulumi.Config, *keys: str) -> list[Output[str]]:
+        """필수 민감 설정값을 한 번씩만 조회하고 누락 여부 검증"""
+        values: list[Output[str]] = []
         missing_configs = []
 
-        for key in required_secrets:
+        for key in keys:
             try:
-                value: Output[str] = self.config.require_secret(key)
-                # Output 객체는 bool 평가를 직접 할 수 없으므로, None 체크만 수행
-                if value is None:
-                    missing_configs.append(key)
+                values.append(config.require_secret(key))
             except Exception:
                 missing_configs.append(key)
 
@@ -36,186 +454,82 @@ class OCIConfig:
                 f'다음 필수 설정이 누락되었습니다: {", ".join(missing_configs)}\n'
                 'setup_config.sh 스크립트를 실행하여 설정하세요.'
             )
-
-    # =============================================================================
-    # Pulumi config에서 가져오는 민감한 정보
-    # =============================================================================
-
-    @property
-    def compartment_id(self) -> Output[str]:
-        """OCI 구획 ID (민감한 정보)"""
-        result: Output[str] = self.config.require_secret('compartment_id')
-        return result
-
-    @property
-    def ssh_public_key(self) -> Output[str]:
-        """SSH 공개 키 (민감한 정보)"""
-        result: Output[str] = self.config.require_secret('ssh_public_key')
-        return result
-
-    @property
-    def region(self) -> str:
-        """OCI 리전"""
-        return self.config.get('region') or 'ap-osaka-1'
-
-    @property
-    def profile(self) -> str:
-        """OCI CLI 프로필"""
-        return self.config.get('profile') or 'DEFAULT'
+        return values
 
     # =============================================================================
     # 리전별 동적 설정
     # =============================================================================
 
-    @property
-    def region_config(self) -> dict[str, Any]:
-        """리전별 설정 반환"""
-        region_configs = {
-            'ap-osaka-1': {
-                'availability_domain': 'PCHh:AP-OSAKA-1-AD-1',
-                'service_id': 'ocid1.service.oc1.ap-osaka-1.aaaaaaaanpw2x646vasmcdktlznzhf7mwmcgf4hhmw5zepgspmseokxjyj4q',
-                'image_id': 'ocid1.image.oc1.ap-osaka-1.aaaaaaaa4xyxytwqlwbxp5rp5qvhi5snlomtjgyavitu3m36bp4neknjsloa',
-            },
-            'ap-seoul-1': {
-                'availability_domain': 'YnyK:AP-SEOUL-1-AD-1',
-                'service_id': 'ocid1.service.oc1.ap-seoul-1.aaaaaaaac4kj7ddh5y7kfqbfzc6hzxfazezmvr4n6k7rqt7ifrfcjxnb2y4q',
-                'image_id': 'ocid1.image.oc1.ap-seoul-1.aaaaaaaas5x3bpjnktaajrr7mvqjr3kh4zegqlqeqe5wbql4dqq4q2qj2o5a',
-            },
-            'ap-tokyo-1': {
-                'availability_domain': 'bJmJ:AP-TOKYO-1-AD-1',
-                'service_id': 'ocid1.service.oc1.ap-tokyo-1.aaaaaaaanp2x646vasmcdktlznzhf7mwmcgf4hhmw5zepgspmseokxjyj4q',
-                'image_id': 'ocid1.image.oc1.ap-tokyo-1.aaaaaaaa4xyxytwqlwbxp5rp5qvhi5snlomtjgyavitu3m36bp4neknjsloa',
-            },
-            'us-ashburn-1': {
-                'availability_domain': 'ZwDO:US-ASHBURN-1-AD-1',
-                'service_id': 'ocid1.service.oc1.us-ashburn-1.aaaaaaaanp2x646vasmcdktlznzhf7mwmcgf4hhmw5zepgspmseokxjyj4q',
-                'image_id': 'ocid1.image.oc1.us-ashburn-1.aaaaaaaa4xyxytwqlwbxp5rp5qvhi5snlomtjgyavitu3m36bp4neknjsloa',
-            },
-            'us-phoenix-1': {
-                'availability_domain': 'RWDJ:US-PHOENIX-1-AD-1',
-                'service_id': 'ocid1.service.oc1.us-phoenix-1.aaaaaaaanp2x646vasmcdktlznzhf7mwmcgf4hhmw5zepgspmseokxjyj4q',
-                'image_id': 'ocid1.image.oc1.us-phoenix-1.aaaaaaaa4xyxytwqlwbxp5rp5qvhi5snlomtjgyavitu3m36bp4neknjsloa',
-            },
-        }
-
-        config = region_configs.get(self.region)
-        if not config:
-            pulumi.log.warn(f"리전 '{self.region}'에 대한 설정을 찾을 수 없습니다. 기본값을 사용합니다.")
-            return region_configs['ap-osaka-1']
-
-        return config
-
     @property
     def availability_domain(self) -> str:
         """현재 리전의 가용성 도메인"""
-        domain = self.region_config['availability_domain']
-        assert isinstance(domain, str), 'availability_domain must be a string'
-        return domain
+        return self.region_config.availability_domain
+
+    @property
+    def service(self) -> ServiceEntry:
+        """현재 리전의 'All Services' 항목 (서비스 카탈로그에서 한 번만 해석)"""
+        return resolve_service(
+            self.region,
+            self.region_config.service_id,
+            self.service_catalog_path,
+            self.service_catalog_ttl,
+            self.service_catalog_offline,
+        )
 
     @property
     def service_id(self) -> str:
         """현재 리전의 서비스 ID"""
-        service_id = self.region_config['service_id']
-        assert isinstance(service_id, str), 'service_id must be a string'
-        return service_id
+        return self.service.service_id
 
     @property
     def image_id(self) -> str:
-        """현재 리전의 이미지 ID"""
-        image_id = self.region_config['image_id']
-        assert isinstance(image_id, str), 'image_id must be a string'
-        return image_id
-
-    # =============================================================================
-    # 네트워크 설정
-    # =============================================================================
-
-    @property
-    def vcn_cidr_block(self) -> str:
-        """VCN CIDR 블록"""
-        return self.config.get('vcn_cidr_block') or '10.0.0.0/16'
-
-    @property
-    def kubernetes_version(self) -> str:
-        """Kubernetes 버전"""
-        return self.config.get('kubernetes_version') or 'v1.32.1'
+        """기본 노드 모양에 맞는 현재 리전의 이미지 ID"""
+        return self.image_for_shape(self.node_shape)
+
+    def image_for_shape(self, shape: str, kubernetes_version: str | None = None) -> str:
+        """Kubernetes 버전(기본: 현재 설정)과 모양 아키텍처(ARM/x86, GPU)에 맞는 최신 OKE 노드 이미지 ID"""
+        return resolve_node_image(
+            self.region,
+            kubernetes_version or self.kubernetes_version,
+            shape,
+            self.region_config.image_id,
+            self.image_cache_dir,
+            self.image_cache_ttl,
+            self.offline,
+        )
+
+    def performance_profile(self, name: str | None) -> PerformanceProfile | None:
+        """이름으로 노드 성능 프로필 조회 (이름이 없으면 None)"""
+        if not name:
+            return None
+        return next(profile for profile in self.performance_profiles if profile.name == name)
 
     @property
     def service_cidr(self) -> str:
-        """서비스 CIDR"""
-        return 'all-kix-services-in-oracle-services-network'
-
-    # =============================================================================
-    # VCN 리소스 이름
-    # =============================================================================
-
-    @property
-    def vcn_display_name(self) -> str:
-        """VCN 표시 이름"""
-        return self.config.get('vcn_display_name') or 'oke-vcn-mgmt'
-
-    @property
-    def internet_gateway_display_name(self) -> str:
-        """인터넷 게이트웨이 표시 이름"""
-        return self.config.get('igw_display_name') or 'oke-igw-mgmt'
-
-    @property
-    def nat_gateway_display_name(self) -> str:
-        """NAT 게이트웨이 표시 이름"""
-        return self.config.get('ngw_display_name') or 'oke-ngw-mgmt'
+        """현재 리전의 서비스 CIDR 레이블"""
+        return self.service.cidr_block
 
     @property
-    def service_gateway_display_name(self) -> str:
-        """서비스 게이트웨이 표시 이름"""
-        return self.config.get('sgw_display_name') or 'oke-sgw-mgmt'
-
-    # =============================================================================
-    # 서브넷 설정
-    # =============================================================================
+    def ip_families(self) -> tuple[str, ...]:
+        """클러스터 IP 패밀리 (듀얼 스택은 IPv4 우선)"""
+        return ('IPv4', 'IPv6') if self.dual_stack else ('IPv4',)
 
-    @property
-    def service_lb_subnet_cidr_block(self) -> str:
-        """서비스 로드밸런서 서브넷 CIDR"""
-        return self.config.get('service_lb_subnet_cidr') or '10.0.20.0/24'
+    def subnet_ipv6_cidr(self, role: str) -> str | None:
+        """서브넷 역할의 IPv6 /64 (듀얼 스택이 아니거나 없는 역할이면 None)"""
+        return dict(self.subnet_ipv6_cidr_blocks).get(role)
 
     @property
-    def node_subnet_cidr_block(self) -> str:
-        """노드 서브넷 CIDR"""
-        return self.config.get('node_subnet_cidr') or '10.0.10.0/24'
-
-    @property
-    def k8s_api_subnet_cidr_block(self) -> str:
-        """Kubernetes API 서브넷 CIDR"""
-        return self.config.get('k8s_api_subnet_cidr') or '10.0.0.0/28'
-
-    # =============================================================================
-    # 노드 풀 설정
-    # =============================================================================
-
-    @property
-    def node_pool_name(self) -> str:
-        """노드 풀 이름"""
-        return self.config.get('node_pool_name') or 'pool1'
-
-    @property
-    def node_pool_size(self) -> int:
-        """노드 풀 크기"""
-        return self.config.get_int('node_pool_size') or 2
-
-    @property
-    def node_shape(self) -> str:
-        """노드 인스턴스 모양"""
-        return self.config.get('node_shape') or 'VM.Standard.A1.Flex'
-
-    @property
-    def node_memory_gbs(self) -> int:
-        """노드 메모리 GB"""
-        return self.config.get_int('node_memory_gbs') or 12
-
-    @property
-    def node_ocpus(self) -> int:
-        """노드 OCPU 수"""
-        return self.config.get_int('node_ocpus') or 2
+    def ipv6_counterparts(self) -> dict[str, str]:
+        """
+        IPv4 CIDR -> 대응 IPv6 prefix (보안 규칙의 IPv6 규칙 생성용, 듀얼 스택이 아니면 빈 딕셔너리)
+        ULA prefix에는 IPv6 기본 라우트(인터넷 게이트웨이)가 없으므로 0.0.0.0/0은 ::/0으로 옮기지 않는다.
+        """
+        if not self.vcn_ipv6_cidr_block:
+            return {}
+        counterparts = {self.vcn_cidr_block: self.vcn_ipv6_cidr_block}
+        for role, cidr_block in self.subnet_cidr_blocks.items():
+            counterparts[cidr_block] = self.subnet_ipv6_cidr(role)
+        return counterparts
 
     # =============================================================================
     # 유틸리티 메서드
@@ -229,40 +543,69 @@ class OCIConfig:
             'availability_domain': self.availability_domain,
             'vcn_cidr_block': self.vcn_cidr_block,
             'kubernetes_version': self.kubernetes_version,
+            'dual_stack': self.dual_stack,
+            'vcn_ipv6_cidr_block': self.vcn_ipv6_cidr_block,
+            'security_mode': self.security_mode,
+            'load_balancer_ports': list(self.load_balancer_ports),
+            'flow_logs': self.flow_logs,
+            'flow_log_retention_days': self.flow_log_retention_days,
+            'layer': self.layer,
+            'network_stack': self.network_stack,
+            'cluster_type': self.cluster_type,
+            'cluster_autoscaler_enabled': self.cluster_autoscaler.enabled,
+            'overprovisioning_enabled': self.overprovisioning.enabled,
+            'kubeconfig_token_helper': self.kubeconfig_token_helper,
             'vcn_display_name': self.vcn_display_name,
             'service_lb_subnet_cidr_block': self.service_lb_subnet_cidr_block,
             'node_subnet_cidr_block': self.node_subnet_cidr_block,
             'k8s_api_subnet_cidr_block': self.k8s_api_subnet_cidr_block,
+            'pod_subnet_cidr_block': self.pod_subnet_cidr_block,
+            'subnet_ipv6_cidr_blocks': dict(self.subnet_ipv6_cidr_blocks),
             'node_pool_name': self.node_pool_name,
             'node_pool_size': self.node_pool_size,
             'node_shape': self.node_shape,
             'node_memory_gbs': self.node_memory_gbs,
             'node_ocpus': self.node_ocpus,
+            'node_pools': [pool.to_dict() for pool in self.node_pools],
+            'node_pool_upgrade_strategy': self.node_pool_upgrade.strategy,
+            'performance_profiles': [profile.name for profile in self.performance_profiles],
+            'max_pods_per_node': self.max_pods_per_node,
+            'pod_surge_nodes': self.pod_surge_nodes,
+            'capacity_shapes': list(self.capacity_shapes),
+            'capacity_objective': self.capacity_objective,
+            'trace_file': self.trace_file,
+            'trace_format': self.trace_format,
         }
 
-    def validate_cidr_blocks(self) -> None:
-        """CIDR 블록들이 겹치지 않는지 검증"""
-        import ipaddress
+    @property
+    def subnet_cidr_blocks(self) -> dict[str, str]:
+        """역할별 서브넷 CIDR (설정되지 않은 파드 서브넷 제외)"""
+        blocks = {
+            'service_lb': self.service_lb_subnet_cidr_block,
+            'node': self.node_subnet_cidr_block,
+            'k8s_api': self.k8s_api_subnet_cidr_block,
+        }
+        if self.pod_subnet_cidr_block:
+            blocks['pod'] = self.pod_subnet_cidr_block
+        return blocks
 
+    def validate_cidr_blocks(self) -> None:
+        """
+        CIDR 블록들이 VCN 안에 있고 서로 겹치지 않는지 검증
+        듀얼 스택이면 서브넷 IPv6 prefix도 VCN IPv6 prefix 안의 겹치지 않는 /64인지, VCN IPv6 prefix가
+        Kubernetes IPv6 서비스 대역과 겹치지 않는지 검증한다.
+        """
         try:
-            vcn_network = ipaddress.IPv4Network(self.vcn_cidr_block)
-            service_lb_network = ipaddress.IPv4Network(self.service_lb_subnet_cidr_block)
-            node_network = ipaddress.IPv4Network(self.node_subnet_cidr_block)
-            k8s_api_network = ipaddress.IPv4Network(self.k8s_api_subnet_cidr_block)
-
-            # VCN 내에 모든 서브넷이 포함되는지 확인
-            subnets = [service_lb_network, node_network, k8s_api_network]
-
-            for subnet in subnets:
-                if not subnet.subnet_of(vcn_network):
-                    raise ValueError(f'서브넷 {subnet}이 VCN {vcn_network} 범위를 벗어났습니다.')
-
-            # 서브넷들이 서로 겹치지 않는지 확인
-            for i, subnet1 in enumerate(subnets):
-                for subnet2 in subnets[i + 1 :]:
-                    if subnet1.overlaps(subnet2):
-                        raise ValueError(f'서브넷 {subnet1}과 {subnet2}가 겹칩니다.')
-
+            validate_cidrs(self.subnet_cidr_blocks, self.vcn_cidr_block)
+            if self.vcn_ipv6_cidr_block:
+                validate_cidrs(
+                    dict(self.subnet_ipv6_cidr_blocks), self.vcn_ipv6_cidr_block, prefixlen=SUBNET_IPV6_PREFIX_LENGTH
+                )
+                if find_overlaps({'vcn': self.vcn_ipv6_cidr_block, 'services': KUBERNETES_IPV6_SERVICES_CIDR}):
+                    raise ValueError(
+                        f'VCN IPv6 prefix {self.vcn_ipv6_cidr_block}가 Kubernetes 서비스 대역 '
+                        f'{KUBERNETES_IPV6_SERVICES_CIDR}과 겹칩니다.'
+                    )
             pulumi.log.info('모든 CIDR 블록 검증이 완료되었습니다.')
 
         except ValueError as e:
@@ -270,36 +613,85 @@ class OCIConfig:
             raise
 
 
-# 전역 설정 인스턴스 생성
-cfg = OCIConfig()
-
-# 하위 호환성을 위한 기존 변수들 (deprecated)
-COMPARTMENT_ID = cfg.compartment_id
-SSH_PUBLIC_KEY = cfg.ssh_public_key
-REGION = cfg.region
-PROFILE = cfg.profile
-VCN_CIDR_BLOCK = cfg.vcn_cidr_block
-KUBERNETES_VERSION = cfg.kubernetes_version
-SERVICE_CIDR = cfg.service_cidr
-AVAILABILITY_DOMAIN = cfg.availability_domain
-SERVICE_ID = cfg.service_id
-IMAGE_ID = cfg.image_id
-VCN_DISPLAY_NAME = cfg.vcn_display_name
-INTERNET_GATEWAY_DISPLAY_NAME = cfg.internet_gateway_display_name
-NAT_GATEWAY_DISPLAY_NAME = cfg.nat_gateway_display_name
-SERVICE_GATEWAY_DISPLAY_NAME = cfg.service_gateway_display_name
-SERVICE_LB_SUBNET_CIDR_BLOCK = cfg.service_lb_subnet_cidr_block
-NODE_SUBNET_CIDR_BLOCK = cfg.node_subnet_cidr_block
-K8S_API_SUBNET_CIDR_BLOCK = cfg.k8s_api_subnet_cidr_block
-NODE_POOL_NAME = cfg.node_pool_name
-NODE_POOL_SIZE = cfg.node_pool_size
-NODE_SHAPE = cfg.node_shape
-NODE_MEMORY_GBS = cfg.node_memory_gbs
-NODE_OCPUS = cfg.node_ocpus
-
-# 설정 검증 실행
-if __name__ != '__main__':
+def get_config() -> OCIConfig:
+    """현재 스택의 설정 스냅샷을 반환 (스택마다 한 번만 로드하고 검증)"""
+    return _load_config(pulumi.get_project(), pulumi.get_stack())
+
+
+@functools.cache
+def _load_config(project: str, stack: str) -> OCIConfig:
+    """
+    설정 스냅샷 로드 및 검증
+    Automation API로 한 프로세스에서 여러 스택을 동시에 실행하므로 스냅샷은 스택별로 캐시한다.
+    """
+    settings = OCIConfig.load()
     try:
-        cfg.validate_cidr_blocks()
+        settings.validate_cidr_blocks()
     except Exception as e:
         pulumi.log.warn(f'설정 검증 중 경고: {e}')
+    return settings
+
+
+def reset_config() -> None:
+    """캐시된 설정 스냅샷 제거 (스택/설정이 바뀌는 벤치마크, 자동화 실행용)"""
+    _load_config.cache_clear()
+    resolve_service.cache_clear()
+    resolve_node_image.cache_clear()
+
+
+# 하위 호환성을 위한 기존 변수들 (deprecated) -> OCIConfig 속성 이름
+_LEGACY_NAMES = {
+    'COMPARTMENT_ID': 'compartment_id',
+    'SSH_PUBLIC_KEY': 'ssh_public_key',
+    'REGION': 'region',
+    'PROFILE': 'profile',
+    'VCN_CIDR_BLOCK': 'vcn_cidr_block',
+    'DUAL_STACK': 'dual_stack',
+    'VCN_IPV6_CIDR_BLOCK': 'vcn_ipv6_cidr_block',
+    'IP_FAMILIES': 'ip_families',
+    'IPV6_COUNTERPARTS': 'ipv6_counterparts',
+    'KUBERNETES_VERSION': 'kubernetes_version',
+    'CLUSTER_TYPE': 'cluster_type',
+    'SECURITY_MODE': 'security_mode',
+    'LAYER': 'layer',
+    'NETWORK_STACK': 'network_stack',
+    'FLOW_LOGS': 'flow_logs',
+    'FLOW_LOG_GROUP_NAME': 'flow_log_group_name',
+    'FLOW_LOG_RETENTION_DAYS': 'flow_log_retention_days',
+    'LOAD_BALANCER_PORTS': 'load_balancer_ports',
+    'CLUSTER_AUTOSCALER': 'cluster_autoscaler',
+    'OVERPROVISIONING': 'overprovisioning',
+    'KUBECONFIG_TOKEN_HELPER': 'kubeconfig_token_helper',
+    'SERVICE_CIDR': 'service_cidr',
+    'AVAILABILITY_DOMAIN': 'availability_domain',
+    'SERVICE_ID': 'service_id',
+    'IMAGE_ID': 'image_id',
+    'VCN_DISPLAY_NAME': 'vcn_display_name',
+    'INTERNET_GATEWAY_DISPLAY_NAME': 'internet_gateway_display_name',
+    'NAT_GATEWAY_DISPLAY_NAME': 'nat_gateway_display_name',
+    'SERVICE_GATEWAY_DISPLAY_NAME': 'service_gateway_display_name',
+    'SERVICE_LB_SUBNET_CIDR_BLOCK': 'service_lb_subnet_cidr_block',
+    'NODE_SUBNET_CIDR_BLOCK': 'node_subnet_cidr_block',
+    'K8S_API_SUBNET_CIDR_BLOCK': 'k8s_api_subnet_cidr_block',
+    'POD_SUBNET_CIDR_BLOCK': 'pod_subnet_cidr_block',
+    'NODE_POOL_NAME': 'node_pool_name',
+    'NODE_POOL_SIZE': 'node_pool_size',
+    'NODE_SHAPE': 'node_shape',
+    'NODE_MEMORY_GBS': 'node_memory_gbs',
+    'NODE_OCPUS': 'node_ocpus',
+    'NODE_POOLS': 'node_pools',
+    'NODE_POOL_UPGRADE': 'node_pool_upgrade',
+    'PERFORMANCE_PROFILES': 'performance_profiles',
+    'MAX_PODS_PER_NODE': 'max_pods_per_node',
+    'POD_SURGE_NODES': 'pod_surge_nodes',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """`cfg` 및 기존 대문자 상수를 스냅샷에서 지연 조회"""
+    if name == 'cfg':
+        return get_config()
+    attr = _LEGACY_NAMES.get(name)
+    if attr is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return getattr(get_config(), attr)
@@ -0,0 +1,247 @@
+"""
+CIDR 계획 및 할당 모듈
+정수 주소 구간을 정렬된 인덱스로 관리하여 겹침 검사, 빈 공간 계산, 서브넷 자동 할당을 수행
+"""
+
+import bisect
+import ipaddress
+import socket
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+@dataclass(frozen=True, slots=True)
+class CidrBlock:
+    """인덱스에 등록된 CIDR 블록 (정수 구간 [start, end])"""
+
+    label: str
+    version: int
+    start: int
+    end: int
+    prefixlen: int
+
+    @classmethod
+    def of(cls, label: str, cidr: str | IPNetwork) -> 'CidrBlock':
+        version, start, prefixlen = parse_cidr(cidr)
+        return cls(label, version, start, start + (1 << (_max_prefixlen(version) - prefixlen)) - 1, prefixlen)
+
+    @property
+    def network(self) -> IPNetwork:
+        network_class = ipaddress.IPv4Network if self.version == 4 else ipaddress.IPv6Network
+        return network_class((self.start, self.prefixlen))
+
+    @property
+    def sort_key(self) -> tuple[int, int, int]:
+        # 같은 시작 주소라면 큰 블록(작은 prefixlen)이 먼저 오도록 정렬
+        return self.version, self.start, self.prefixlen
+
+
+def parse_network(cidr: str | IPNetwork) -> IPNetwork:
+    """문자열 CIDR을 네트워크 객체로 변환 (호스트 비트가 켜져 있으면 ValueError)"""
+    if isinstance(cidr, ipaddress.IPv4Network | ipaddress.IPv6Network):
+        return cidr
+    return ipaddress.ip_network(cidr)
+
+
+def parse_cidr(cidr: str | IPNetwork) -> tuple[int, int, int]:
+    """
+    CIDR을 (version, 시작 정수 주소, prefixlen)으로 변환
+    대량 검사 시 ipaddress 객체 생성 비용을 피하기 위해 IPv4 문자열은 직접 파싱한다.
+    """
+    if isinstance(cidr, str) and ':' not in cidr:
+        address, _, prefix = cidr.partition('/')
+        try:
+            start = int.from_bytes(socket.inet_pton(socket.AF_INET, address), 'big')
+            prefixlen = int(prefix) if prefix else 32
+        except (OSError, ValueError):
+            raise ValueError(f'올바르지 않은 CIDR입니다: {cidr}') from None
+        if not 0 <= prefixlen <= 32:
+            raise ValueError(f'올바르지 않은 CIDR입니다: {cidr}')
+        if start & ((1 << (32 - prefixlen)) - 1):
+            raise ValueError(f'{cidr}에 호스트 비트가 설정되어 있습니다.')
+        return 4, start, prefixlen
+
+    network = parse_network(cidr)
+    return network.version, int(network.network_address), network.prefixlen
+
+
+def _max_prefixlen(version: int) -> int:
+    return 32 if version == 4 else 128
+
+
+def _to_networks(version: int, start: int, end: int) -> list[IPNetwork]:
+    """정수 구간을 최소 개수의 CIDR 목록으로 변환"""
+    address = ipaddress.IPv4Address if version == 4 else ipaddress.IPv6Address
+    return list(ipaddress.summarize_address_range(address(start), address(end)))
+
+
+class CidrIndex:
+    """
+    정렬된 구간 인덱스
+    CIDR 블록은 서로 분리되어 있거나 한쪽이 다른 쪽을 포함하므로,
+    (version, start, prefixlen) 정렬과 스택 스윕만으로 O(n log n)에 모든 겹침을 찾을 수 있다.
+    """
+
+    def __init__(self, blocks: Iterable[tuple[str, str | IPNetwork]] = ()):
+        self._keys: list[tuple[int, int, int]] = []
+        self._blocks: list[CidrBlock] = []
+        self._exact: dict[tuple[int, int, int], list[CidrBlock]] = {}
+
+        items = sorted(
+            (CidrBlock.of(label, cidr) for label, cidr in blocks),
+            key=lambda block: block.sort_key,
+        )
+        for block in items:
+            self._keys.append(block.sort_key)
+            self._blocks.append(block)
+            self._exact.setdefault(block.sort_key, []).append(block)
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def __iter__(self):
+        return iter(self._blocks)
+
+    def add(self, label: str, cidr: str | IPNetwork) -> CidrBlock:
+        """블록 추가 (정렬 위치에 삽입)"""
+        block = CidrBlock.of(label, cidr)
+        position = bisect.bisect_right(self._keys, block.sort_key)
+        self._keys.insert(position, block.sort_key)
+        self._blocks.insert(position, block)
+        self._exact.setdefault(block.sort_key, []).append(block)
+        return block
+
+    def overlapping(self, cidr: str | IPNetwork) -> list[CidrBlock]:
+        """주어진 CIDR과 겹치는 블록 목록"""
+        network = parse_network(cidr)
+        version = network.version
+        start = int(network.network_address)
+        end = int(network.broadcast_address)
+
+        # 1) 질의 블록보다 크거나 같은 블록(상위 prefix)은 최대 prefixlen+1개뿐이므로 직접 조회
+        result: list[CidrBlock] = []
+        for prefixlen in range(network.prefixlen + 1):
+            supernet = network.supernet(new_prefix=prefixlen) if prefixlen < network.prefixlen else network
+            result.extend(self._exact.get((version, int(supernet.network_address), prefixlen), ()))
+
+        # 2) 질의 구간 안에서 시작하는 더 작은 블록은 이분 탐색 범위로 조회
+        lo = bisect.bisect_left(self._keys, (version, start, network.prefixlen + 1))
+        hi = bisect.bisect_right(self._keys, (version, end, _max_prefixlen(version)))
+        result.extend(block for block in self._blocks[lo:hi] if block.prefixlen > network.prefixlen)
+        return result
+
+    def find_overlaps(self) -> list[tuple[CidrBlock, CidrBlock]]:
+        """
+        겹치는 모든 블록 쌍을 O(n log n + k)로 탐색
+        정렬된 순서로 훑으면서 현재 블록을 포함하는 블록만 스택에 남긴다.
+        """
+        overlaps: list[tuple[CidrBlock, CidrBlock]] = []
+        stack: list[CidrBlock] = []
+        for block in self._blocks:
+            while stack and (stack[-1].version != block.version or stack[-1].end < block.start):
+                stack.pop()
+            overlaps.extend((outer, block) for outer in stack)
+            stack.append(block)
+        return overlaps
+
+    def _occupied(self, container: IPNetwork) -> list[tuple[int, int]]:
+        """컨테이너 안에서 사용 중인 구간을 병합하여 반환"""
+        version = container.version
+        start = int(container.network_address)
+        end = int(container.broadcast_address)
+        lo = bisect.bisect_left(self._keys, (version, start, 0))
+        hi = bisect.bisect_right(self._keys, (version, end, _max_prefixlen(version)))
+
+        merged: list[tuple[int, int]] = []
+        for block in self._blocks[lo:hi]:
+            if block.prefixlen <= container.prefixlen:
+                # 컨테이너 자신(또는 이를 포함하는 블록)은 점유 구간으로 보지 않는다
+                continue
+            if merged and block.start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], block.end))
+            else:
+                merged.append((block.start, block.end))
+        return merged
+
+    def free_space(self, container: str | IPNetwork) -> list[IPNetwork]:
+        """컨테이너 안의 빈 공간을 최소 개수의 CIDR 목록으로 반환"""
+        network = parse_network(container)
+        cursor = int(network.network_address)
+        last = int(network.broadcast_address)
+
+        free: list[IPNetwork] = []
+        for start, end in self._occupied(network):
+            if start > cursor:
+                free.extend(_to_networks(network.version, cursor, start - 1))
+            cursor = max(cursor, end + 1)
+        if cursor <= last:
+            free.extend(_to_networks(network.version, cursor, last))
+        return free
+
+    def allocate(self, label: str, prefixlen: int, container: str | IPNetwork) -> CidrBlock:
+        """컨테이너 안에서 정렬(aligned)된 첫 번째 빈 /prefixlen 블록을 할당"""
+        network = parse_network(container)
+        if not network.prefixlen <= prefixlen <= network.max_prefixlen:
+            raise ValueError(f'/{prefixlen} 블록은 {network} 안에 할당할 수 없습니다.')
+
+        size = 1 << (network.max_prefixlen - prefixlen)
+        cursor = int(network.network_address)
+        last = int(network.broadcast_address)
+        for start, end in [*self._occupied(network), (last + 1, last + 1)]:
+            candidate = -(-cursor // size) * size  # size 단위로 올림 정렬
+            if candidate + size - 1 < start:
+                return self.add(label, network.__class__((candidate, prefixlen)))
+            cursor = max(cursor, end + 1)
+        raise ValueError(f'{network} 안에 /{prefixlen} 크기의 빈 공간이 없습니다. (요청: {label})')
+
+
+def find_overlaps(blocks: Mapping[str, str | IPNetwork]) -> list[tuple[str, str]]:
+    """레이블별 CIDR 중 서로 겹치는 레이블 쌍 목록 (여러 스택의 CIDR 일괄 검사용)"""
+    return [(outer.label, inner.label) for outer, inner in CidrIndex(blocks.items()).find_overlaps()]
+
+
+def validate_cidrs(
+    blocks: Mapping[str, str | IPNetwork], container: str | IPNetwork | None = None, prefixlen: int | None = None
+) -> None:
+    """
+    모든 블록이 컨테이너 안에 있고 서로 겹치지 않는지 검증 (실패 시 ValueError)
+    `prefixlen`을 지정하면 모든 블록이 그 크기여야 한다 (예: OCI 서브넷 IPv6 prefix는 /64).
+    """
+    index = CidrIndex(blocks.items())
+
+    if prefixlen is not None:
+        for block in index:
+            if block.prefixlen != prefixlen:
+                raise ValueError(f'{block.label} 블록 {block.network}은 /{prefixlen}이어야 합니다.')
+
+    if container is not None:
+        parent = CidrBlock.of('container', container)
+        for block in index:
+            if block.version != parent.version or block.start < parent.start or block.end > parent.end:
+                raise ValueError(f'서브넷 {block.network}이 VCN {parent.network} 범위를 벗어났습니다.')
+
+    overlaps = index.find_overlaps()
+    if overlaps:
+        outer, inner = overlaps[0]
+        raise ValueError(f'서브넷 {outer.network}과 {inner.network}가 겹칩니다.')
+
+
+def plan_subnets(
+    container: str | IPNetwork,
+    prefix_lengths: Mapping[str, int],
+    reserved: Mapping[str, str | IPNetwork] | None = None,
+) -> dict[str, str]:
+    """
+    예약된 블록을 피해 역할별 서브넷 CIDR을 자동 할당
+    단편화를 줄이기 위해 큰 블록부터 할당하고, 결과는 요청 순서대로 반환한다.
+    """
+    reserved = reserved or {}
+    validate_cidrs(reserved, container)
+
+    index = CidrIndex(reserved.items())
+    allocated: dict[str, str] = {}
+    for label in sorted(prefix_lengths, key=lambda name: prefix_lengths[name]):
+        allocated[label] = str(index.allocate(label, prefix_lengths[label], container).network)
+    return {label: allocated[label] for label in prefix_lengths}
@@ -0,0 +1,56 @@
+import pulumi_oci as oci
+
+import config as cfg
+
+
+class FlowLogManager:
+    """
+    VCN 흐름 로그 생성 및 관리 클래스
+    서브넷마다 OCI Logging 서비스 로그(`flowlogs` 서비스, 전체 트래픽)를 하나의 로그 그룹에 만든다.
+    """
+
+    def __init__(self, subnets):
+        self.subnets = subnets
+        self.log_group = None
+        self.flow_logs = {}
+
+    def create_log_group(self):
+        """
+        흐름 로그를 모으는 로그 그룹을 생성하는 메소드
+        """
+        return oci.logging.LogGroup(
+            'oke-flow-log-group',
+            compartment_id=cfg.COMPARTMENT_ID,
+            description='OKE VCN subnet flow logs',
+            display_name=cfg.FLOW_LOG_GROUP_NAME,
+        )
+
+    def create_flow_log(self, role, subnet):
+        """
+        서브넷 하나의 흐름 로그를 생성하는 메소드
+        """
+        return oci.logging.Log(
+            f'oke-{role}-flow-log',
+            display_name=f'oke-{role}-subnet-flow-log',
+            configuration=oci.logging.LogConfigurationArgs(
+                compartment_id=cfg.COMPARTMENT_ID,
+                source=oci.logging.LogConfigurationSourceArgs(
+                    category='all',
+                    resource=subnet.id,
+                    service='flowlogs',
+                    source_type='OCISERVICE',
+                ),
+            ),
+            is_enabled=True,
+            log_group_id=self.log_group.id,
+            log_type='SERVICE',
+            retention_duration=cfg.FLOW_LOG_RETENTION_DAYS,
+        )
+
+    def create_all_flow_logs(self):
+        """
+        로그 그룹과 모든 서브넷의 흐름 로그를 생성하는 메소드
+        """
+        self.log_group = self.create_log_group()
+        self.flow_logs = {role: self.create_flow_log(role, subnet) for role, subnet in self.subnets.items() if subnet}
+        return self.log_group, self.flow_logs
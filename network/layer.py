@@ -0,0 +1,83 @@
+"""
+네트워크 계층 참조
+`layer`가 'cluster'인 스택은 네트워크 리소스를 만들지 않고 네트워크 계층 스택(`network_stack`)의 export를
+`pulumi.StackReference`로 읽는다.
+클러스터/노드 풀 매니저는 네트워크 리소스의 `.id`만 사용하므로 ID만 가진 참조를 넘긴다.
+두 계층은 서브넷 CIDR, 보안 모드 같은 설정을 각자 읽으므로, 네트워크 계층이 export한 설정(`network_settings`)이
+클러스터 계층의 설정과 다르면 클러스터 계층 preview가 실패한다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import pulumi
+
+import config as cfg
+from network.nsg import NSG_ROLES
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceRef:
+    """다른 스택에서 만든 리소스 (ID만 사용)"""
+
+    id: pulumi.Output[str]
+
+
+def network_settings() -> dict[str, Any]:
+    """두 계층에서 같아야 하는 네트워크 설정 (네트워크 계층이 export)"""
+    settings = cfg.get_config()
+    return {
+        'security_mode': settings.security_mode,
+        'subnet_cidr_blocks': settings.subnet_cidr_blocks,
+        'dual_stack': settings.dual_stack,
+    }
+
+
+def check_network_settings(exported: dict[str, Any]) -> bool:
+    """네트워크 계층이 export한 설정이 현재 스택 설정과 같은지 검증 (다르면 ValueError)"""
+    expected = network_settings()
+    mismatched = sorted(key for key, value in expected.items() if exported.get(key) != value)
+    if mismatched:
+        raise ValueError(
+            f"네트워크 계층 스택 '{cfg.NETWORK_STACK}'의 설정이 이 스택과 다릅니다: {', '.join(mismatched)} "
+            f'(네트워크 계층: { ({key: exported.get(key) for key in mismatched}) }, '
+            f'이 스택: { ({key: expected[key] for key in mismatched}) })'
+        )
+    return True
+
+
+@dataclass
+class NetworkLayer:
+    """클러스터 계층이 사용하는 네트워크 리소스 (같은 스택에서 만든 리소스 또는 StackReference 참조)"""
+
+    vcn: Any
+    service_lb_subnet: Any
+    node_subnet: Any
+    k8s_api_subnet: Any
+    pod_subnet: Any = None
+    network_security_groups: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_stack_reference(cls, stack_name: str) -> 'NetworkLayer':
+        """
+        네트워크 계층 스택의 export로 참조 생성
+        모든 ID는 설정 검증 결과를 거쳐 나오므로 설정이 다르면 이 ID를 쓰는 리소스가 만들어지지 않는다.
+        """
+        reference = pulumi.StackReference('network-layer', stack_name=stack_name)
+        checked = reference.require_output('network_settings').apply(check_network_settings)
+
+        def ref(output: pulumi.Output) -> ResourceRef:
+            return ResourceRef(pulumi.Output.all(checked, output).apply(lambda values: values[1]))
+
+        network_security_groups = {}
+        if cfg.SECURITY_MODE == 'nsg':
+            ids = reference.require_output('network_security_group_ids')
+            network_security_groups = {role: ref(ids[role]) for role in NSG_ROLES}
+        return cls(
+            vcn=ref(reference.require_output('vcn_id')),
+            service_lb_subnet=ref(reference.require_output('service_lb_subnet_id')),
+            node_subnet=ref(reference.require_output('node_subnet_id')),
+            k8s_api_subnet=ref(reference.require_output('k8s_api_subnet_id')),
+            pod_subnet=ref(reference.require_output('pod_subnet_id')) if cfg.POD_SUBNET_CIDR_BLOCK else None,
+            network_security_groups=network_security_groups,
+        )
@@ -0,0 +1,302 @@
+"""
+역할별 네트워크 보안 그룹(NSG)
+`security_mode`가 'nsg'이면 서브넷 전체에 붙는 공유 보안 리스트 대신 VNIC 역할(API 엔드포인트, 워커 노드, 파드,
+로드 밸런서)마다 NSG를 만들고, 규칙은 CIDR 대신 상대 역할의 NSG를 대상으로 한다.
+각 VNIC는 자기 역할의 작은 규칙 집합만 평가하며, 한 역할의 규칙을 바꿔도 다른 역할의 규칙은 바뀌지 않는다.
+"""
+
+import hashlib
+import json
+
+import pulumi_oci as oci
+
+import config as cfg
+from network.rules import TARGET_KEYS, add_ipv6_rules, compile_rules
+
+# OCI NSG당 최대 보안 규칙 수 (Ingress + Egress)
+MAX_RULES_PER_NSG = 120
+NSG_ROLES = ('k8s_api', 'node', 'pod', 'service_lb')
+NSG_TARGET_TYPE = 'NETWORK_SECURITY_GROUP'
+NODE_PORT_RANGE = (30000, 32767)
+KUBE_PROXY_HEALTH_PORT = 10256
+
+
+def nsg_member_roles(subnet_role):
+    """
+    서브넷 역할의 VNIC가 속하는 NSG 역할 목록
+    파드 서브넷이 없으면 파드 VNIC도 노드 서브넷에 생기므로 노드 서브넷은 파드 NSG도 포함한다.
+    """
+    if subnet_role == 'node' and not cfg.POD_SUBNET_CIDR_BLOCK:
+        return ['node', 'pod']
+    return [subnet_role]
+
+
+def nsg_role_cidrs():
+    """NSG 역할 -> 구성원 VNIC가 있는 서브넷 CIDR (도달성 모델용)"""
+    return {
+        'k8s_api': cfg.K8S_API_SUBNET_CIDR_BLOCK,
+        'node': cfg.NODE_SUBNET_CIDR_BLOCK,
+        'pod': cfg.POD_SUBNET_CIDR_BLOCK or cfg.NODE_SUBNET_CIDR_BLOCK,
+        'service_lb': cfg.SERVICE_LB_SUBNET_CIDR_BLOCK,
+    }
+
+
+class NetworkSecurityGroupManager:
+    """
+    역할별 네트워크 보안 그룹 생성 및 관리 클래스
+    """
+
+    def __init__(self, vcn):
+        self.vcn = vcn
+        self.network_security_groups = {}
+        self.security_rules = {}
+
+    # 규칙 생성 메소드 (대상이 NSG인 규칙은 대상에 역할 이름을 사용)
+    @staticmethod
+    def nsg_rule(direction, role, description, protocol='all', ports=None, icmp=None):
+        """
+        다른 역할의 NSG를 대상으로 하는 규칙 생성 메소드
+        """
+        return NetworkSecurityGroupManager.rule(direction, role, description, protocol, ports, icmp, NSG_TARGET_TYPE)
+
+    @staticmethod
+    def rule(direction, target, description, protocol='all', ports=None, icmp=None, target_type='CIDR_BLOCK'):
+        """
+        보안 리스트와 같은 형식의 규칙 딕셔너리 생성 메소드 (ports: (min, max), icmp: (type, code))
+        """
+        target_key, target_type_key = TARGET_KEYS[direction]
+        rule = {
+            'description': description,
+            'protocol': protocol,
+            target_key: target,
+            target_type_key: target_type,
+            'stateless': False,
+        }
+        if ports:
+            rule['tcp_options'] = {'min': ports[0], 'max': ports[1]}
+        if icmp:
+            rule['icmp_options'] = {'type': icmp[0], 'code': icmp[1]}
+        return rule
+
+    def path_discovery_rules(self, direction, role):
+        """
+        Path MTU discovery (ICMP 3/4) 규칙 생성 메소드
+        """
+        return [self.nsg_rule(direction, role, 'Path discovery', '1', icmp=(3, 4))]
+
+    def get_k8s_api_rules(self):
+        """
+        Kubernetes API 엔드포인트 NSG (Ingress, Egress) 규칙 생성
+        """
+        ingress = [
+            self.rule('ingress', '0.0.0.0/0', 'External access to Kubernetes API endpoint', '6', (6443, 6443)),
+            self.nsg_rule('ingress', 'node', 'Kubernetes worker to Kubernetes API endpoint', '6', (6443, 6443)),
+            self.nsg_rule('ingress', 'node', 'Kubernetes worker to control plane (proxymux)', '6', (12250, 12250)),
+            self.nsg_rule('ingress', 'pod', 'Pod to Kubernetes API endpoint', '6', (6443, 6443)),
+            self.nsg_rule('ingress', 'pod', 'Pod to control plane (proxymux)', '6', (12250, 12250)),
+            *self.path_discovery_rules('ingress', 'node'),
+        ]
+        egress = [
+            self.rule(
+                'egress',
+                cfg.SERVICE_CIDR,
+                'Allow Kubernetes Control Plane to communicate with OKE',
+                '6',
+                target_type='SERVICE_CIDR_BLOCK',
+            ),
+            self.nsg_rule('egress', 'node', 'Kubernetes API endpoint to kubelet', '6', (10250, 10250)),
+            self.nsg_rule('egress', 'pod', 'Kubernetes API endpoint to pod communication (webhooks)', '6'),
+            *self.path_discovery_rules('egress', 'node'),
+        ]
+        return ingress, egress
+
+    def get_node_rules(self):
+        """
+        워커 노드 NSG (Ingress, Egress) 규칙 생성
+        """
+        ingress = [
+            self.nsg_rule('ingress', 'k8s_api', 'Kubernetes API endpoint to kubelet', '6', (10250, 10250)),
+            *self.path_discovery_rules('ingress', 'k8s_api'),
+            self.nsg_rule('ingress', 'node', 'Allow worker nodes to communicate with each other'),
+            self.nsg_rule('ingress', 'pod', 'Allow pods to communicate with worker nodes'),
+            self.nsg_rule('ingress', 'service_lb', 'Load balancer to NodePort services', '6', NODE_PORT_RANGE),
+            self.nsg_rule(
+                'ingress',
+                'service_lb',
+                'Load balancer to kube-proxy health check',
+                '6',
+                (KUBE_PROXY_HEALTH_PORT, KUBE_PROXY_HEALTH_PORT),
+            ),
+            self.rule('ingress', '0.0.0.0/0', 'Inbound SSH traffic to worker nodes', '6', (22, 22)),
+        ]
+        egress = [
+            self.nsg_rule('egress', 'node', 'Allow worker nodes to communicate with each other'),
+            self.nsg_rule('egress', 'pod', 'Allow worker nodes to communicate with pods'),
+            self.nsg_rule('egress', 'k8s_api', 'Access to Kubernetes API endpoint', '6', (6443, 6443)),
+            self.nsg_rule('egress', 'k8s_api', 'Kubernetes worker to control plane (proxymux)', '6', (12250, 12250)),
+            *self.path_discovery_rules('egress', 'k8s_api'),
+            self.rule(
+                'egress',
+                cfg.SERVICE_CIDR,
+                'Allow nodes to communicate with OKE',
+                '6',
+                target_type='SERVICE_CIDR_BLOCK',
+            ),
+            self.rule('egress', '0.0.0.0/0', 'Worker Nodes access to Internet'),
+        ]
+        return ingress, egress
+
+    def get_pod_rules(self):
+        """
+        파드 NSG (Ingress, Egress) 규칙 생성
+        """
+        ingress = [
+            self.nsg_rule('ingress', 'node', 'Allow worker nodes to communicate with pods'),
+            self.nsg_rule('ingress', 'pod', 'Allow pods to communicate with other pods'),
+            self.nsg_rule('ingress', 'k8s_api', 'Kubernetes API endpoint to pod communication (webhooks)', '6'),
+        ]
+        egress = [
+            self.nsg_rule('egress', 'pod', 'Allow pods to communicate with other pods'),
+            self.nsg_rule('egress', 'node', 'Allow pods to communicate with worker nodes'),
+            self.nsg_rule('egress', 'k8s_api', 'Pod to Kubernetes API endpoint', '6', (6443, 6443)),
+            self.nsg_rule('egress', 'k8s_api', 'Pod to control plane (proxymux)', '6', (12250, 12250)),
+            self.rule(
+                'egress',
+                cfg.SERVICE_CIDR,
+                'Allow pods to communicate with OCI services',
+                '6',
+                target_type='SERVICE_CIDR_BLOCK',
+            ),
+            self.rule('egress', '0.0.0.0/0', 'Pods access to Internet'),
+        ]
+        return ingress, egress
+
+    def get_service_lb_rules(self):
+        """
+        서비스 로드 밸런서 NSG (Ingress, Egress) 규칙 생성
+        """
+        ingress = [
+            self.rule('ingress', '0.0.0.0/0', f'Load balancer listener port {port}', '6', (port, port))
+            for port in cfg.LOAD_BALANCER_PORTS
+        ]
+        egress = [
+            self.nsg_rule('egress', 'node', 'Load balancer to NodePort services', '6', NODE_PORT_RANGE),
+            self.nsg_rule(
+                'egress',
+                'node',
+                'Load balancer to kube-proxy health check',
+                '6',
+                (KUBE_PROXY_HEALTH_PORT, KUBE_PROXY_HEALTH_PORT),
+            ),
+        ]
+        return ingress, egress
+
+    def get_all_nsg_rules(self):
+        """
+        NSG 역할별 (Ingress, Egress) 규칙을 생성하는 메소드 (리소스를 만들지 않음)
+        """
+        return {
+            'k8s_api': self.get_k8s_api_rules(),
+            'node': self.get_node_rules(),
+            'pod': self.get_pod_rules(),
+            'service_lb': self.get_service_lb_rules(),
+        }
+
+    def get_model_rules(self):
+        """
+        도달성 모델용 규칙: NSG 대상을 구성원 VNIC가 있는 서브넷 CIDR로 바꾼 `nsg:<역할>` 규칙 집합
+        """
+        cidrs = nsg_role_cidrs()
+        model = {}
+        for role, rule_sets in self.get_all_nsg_rules().items():
+            translated = []
+            for direction, rules in zip(('ingress', 'egress'), rule_sets, strict=True):
+                target_key, target_type_key = TARGET_KEYS[direction]
+                translated.append(
+                    [
+                        {**rule, target_key: cidrs[rule[target_key]], target_type_key: 'CIDR_BLOCK'}
+                        if rule[target_type_key] == NSG_TARGET_TYPE
+                        else rule
+                        for rule in rules
+                    ]
+                )
+            model[f'nsg:{role}'] = tuple(translated)
+        return model
+
+    # =============================================================================
+    # 리소스 생성
+    # =============================================================================
+
+    def create_network_security_group(self, role):
+        """
+        NSG 생성 메소드
+        """
+        name = f'oke-{role.replace("_", "-")}-nsg'
+        return oci.core.NetworkSecurityGroup(
+            name,
+            compartment_id=cfg.COMPARTMENT_ID,
+            vcn_id=self.vcn.id,
+            display_name=name,
+        )
+
+    def create_security_rule(self, role, direction, rule):
+        """
+        NSG 보안 규칙 생성 메소드
+        리소스 이름은 규칙 내용의 해시이므로 다른 규칙이 추가/삭제되어도 기존 규칙 리소스는 바뀌지 않는다.
+        """
+        target_key, target_type_key = TARGET_KEYS[direction]
+        target_type = rule.get(target_type_key) or 'CIDR_BLOCK'
+        target = rule[target_key]
+        if target_type == NSG_TARGET_TYPE:
+            target = self.network_security_groups[target].id
+        digest = hashlib.sha1(json.dumps(rule, sort_keys=True).encode()).hexdigest()[:10]
+
+        tcp_options = None
+        if rule.get('tcp_options', {}).get('min') is not None:
+            tcp_options = oci.core.NetworkSecurityGroupSecurityRuleTcpOptionsArgs(
+                destination_port_range=oci.core.NetworkSecurityGroupSecurityRuleTcpOptionsDestinationPortRangeArgs(
+                    min=rule['tcp_options']['min'], max=rule['tcp_options']['max']
+                )
+            )
+        icmp_options = None
+        if rule.get('icmp_options'):
+            icmp_options = oci.core.NetworkSecurityGroupSecurityRuleIcmpOptionsArgs(**rule['icmp_options'])
+
+        return oci.core.NetworkSecurityGroupSecurityRule(
+            f'oke-{role.replace("_", "-")}-nsg-{direction}-{digest}',
+            network_security_group_id=self.network_security_groups[role].id,
+            direction=direction.upper(),
+            protocol=rule['protocol'],
+            description=rule.get('description') or None,
+            stateless=rule.get('stateless', False),
+            tcp_options=tcp_options,
+            icmp_options=icmp_options,
+            **{target_key: target, target_type_key: target_type},
+        )
+
+    def create_security_rules(self, role, ingress_rules, egress_rules):
+        """
+        NSG 하나의 규칙을 컴파일(중복/가려진 규칙 제거, 병합)하여 생성하는 메소드
+        NSG 대상 규칙은 IP 패밀리와 무관하므로 듀얼 스택에서는 CIDR 대상 규칙에만 IPv6 규칙을 덧붙인다.
+        """
+        counterparts = cfg.IPV6_COUNTERPARTS
+        compiled = {
+            'ingress': compile_rules(add_ipv6_rules(ingress_rules, 'ingress', counterparts), 'ingress'),
+            'egress': compile_rules(add_ipv6_rules(egress_rules, 'egress', counterparts), 'egress'),
+        }
+        total = sum(len(rules) for rules in compiled.values())
+        if total > MAX_RULES_PER_NSG:
+            raise ValueError(f"NSG '{role}'의 규칙이 {total}개로 OCI NSG 한도({MAX_RULES_PER_NSG}개)를 초과합니다.")
+        return [
+            self.create_security_rule(role, direction, rule) for direction, rules in compiled.items() for rule in rules
+        ]
+
+    def create_all_network_security_groups(self):
+        """
+        모든 역할의 NSG와 규칙을 생성하는 메소드 (규칙이 다른 NSG를 참조하므로 NSG를 먼저 모두 만든다)
+        """
+        for role in NSG_ROLES:
+            self.network_security_groups[role] = self.create_network_security_group(role)
+        for role, (ingress_rules, egress_rules) in self.get_all_nsg_rules().items():
+            self.security_rules[role] = self.create_security_rules(role, ingress_rules, egress_rules)
+        return self.network_security_groups
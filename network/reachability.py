@@ -0,0 +1,465 @@
+"""
+오프라인 흐름 도달성 시뮬레이터
+매니저들이 생성하는 라우트 규칙/보안 리스트 규칙/서브넷 구성만으로, 클라우드 호출 없이
+(출발지, 목적지, 프로토콜, 포트) 흐름이 허용되는지와 이를 결정한 규칙/라우트를 계산한다.
+
+평가 순서 (VCN 안에서 출발한 흐름):
+1. 라우팅: 목적지가 VCN 안이면 로컬 라우트, 아니면 출발 서브넷 라우트 테이블의 최장 접두사 일치(LPM)
+2. 출발 서브넷 보안 리스트의 Egress 규칙
+3. 목적지가 VCN 서브넷이면 해당 보안 리스트의 Ingress 규칙
+4. 일치한 규칙이 stateless이면 반대 방향(응답) 규칙도 필요 (stateful이면 응답은 자동 허용)
+
+VCN 밖(인터넷)에서 들어오는 흐름은 공인 IP를 허용하고 인터넷 게이트웨이로 응답 경로가 있는
+서브넷에만 도달할 수 있다. 서비스 CIDR 레이블(SERVICE_CIDR_BLOCK)은 시뮬레이터 안에서
+가상 대역 `SERVICE_NETWORK_CIDR`로 표현하며, 흐름의 목적지로 레이블 문자열을 그대로 쓸 수 있다.
+ICMP 흐름은 `port`에 ICMP type, `src_port`에 ICMP code를 넣는다.
+
+모든 판정은 NumPy 정수 마스크로 벡터화되어 있어 백만 개 흐름도 수 초 안에 평가한다.
+"""
+
+import ipaddress
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+import numpy as np
+
+from network.rules import PROTOCOL_ALL, Rule, compile_rules, normalize_rule
+
+# Oracle Services Network를 나타내는 가상 대역 (예약된 240.0.0.0/8)
+SERVICE_NETWORK_CIDR = '240.0.0.0/8'
+SERVICE_NETWORK_ADDRESS = '240.0.0.1'
+
+PROTOCOL_NUMBERS = {'icmp': 1, 'tcp': 6, 'udp': 17}
+EPHEMERAL_PORT = 49152
+
+
+class Verdict(IntEnum):
+    """흐름 판정 결과"""
+
+    ALLOWED = 0
+    NO_ROUTE = 1
+    NO_PUBLIC_IP = 2
+    EGRESS_DENIED = 3
+    INGRESS_DENIED = 4
+    RETURN_DENIED = 5
+
+
+# =============================================================================
+# 흐름 행렬
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class Flow:
+    """평가할 흐름 하나 (출발지/목적지는 IP, CIDR 또는 서비스 CIDR 레이블)"""
+
+    src: str
+    dst: str
+    protocol: str | int
+    port: int | None = None
+    src_port: int | None = None
+    name: str = ''
+
+
+def _address(value: str, service_label: str | None) -> int:
+    """IP/CIDR/서비스 레이블을 대표 IPv4 정수 주소로 변환 (CIDR은 첫 번째 호스트 주소)"""
+    if value == service_label or value.endswith('-services-in-oracle-services-network'):
+        return int(ipaddress.IPv4Address(SERVICE_NETWORK_ADDRESS))
+    network = ipaddress.IPv4Network(value, strict=False)
+    offset = 1 if network.prefixlen < 31 else 0
+    return int(network.network_address) + offset
+
+
+def _protocol(value: str | int) -> int:
+    if isinstance(value, int):
+        return value
+    return PROTOCOL_NUMBERS.get(value.lower()) or int(value)
+
+
+def _src_port(flow: Flow) -> int:
+    """출발지 포트 (지정하지 않으면 임시 포트, ICMP는 code 0)"""
+    if flow.src_port is not None:
+        return flow.src_port
+    return 0 if _protocol(flow.protocol) == 1 else EPHEMERAL_PORT
+
+
+@dataclass(slots=True)
+class FlowMatrix:
+    """흐름을 열(column) 단위 정수 배열로 보관"""
+
+    src: np.ndarray
+    dst: np.ndarray
+    protocol: np.ndarray
+    port: np.ndarray
+    src_port: np.ndarray
+    names: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.src)
+
+    @classmethod
+    def from_flows(cls, flows: Iterable[Flow], service_label: str | None = None) -> 'FlowMatrix':
+        flows = list(flows)
+        return cls(
+            src=np.array([_address(flow.src, service_label) for flow in flows], dtype=np.int64),
+            dst=np.array([_address(flow.dst, service_label) for flow in flows], dtype=np.int64),
+            protocol=np.array([_protocol(flow.protocol) for flow in flows], dtype=np.int64),
+            port=np.array([0 if flow.port is None else flow.port for flow in flows], dtype=np.int64),
+            src_port=np.array([_src_port(flow) for flow in flows], dtype=np.int64),
+            names=[flow.name for flow in flows],
+        )
+
+
+# =============================================================================
+# 네트워크 모델
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class SubnetModel:
+    role: str
+    cidr_block: str
+    start: int
+    end: int
+    route_table: str
+    public: bool
+    security_lists: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class RouteModel:
+    route_table: str
+    start: int
+    end: int
+    prefixlen: int
+    target: str
+    label: str
+
+
+@dataclass(frozen=True, slots=True)
+class RuleModel:
+    security_list: str
+    direction: str
+    index: int
+    rule: Rule
+    start: int
+    end: int
+
+    @property
+    def label(self) -> str:
+        return f'{self.security_list}/{self.direction}[{self.index}] {self.rule.description}'.rstrip()
+
+
+def _block(cidr: str) -> tuple[int, int, int]:
+    network = ipaddress.IPv4Network(cidr)
+    return int(network.network_address), int(network.broadcast_address), network.prefixlen
+
+
+def _target_block(target_type: str, target: str, service_label: str) -> tuple[int, int, int]:
+    """규칙/라우트 대상의 정수 구간. 다른 리전의 서비스 레이블은 어떤 주소와도 일치하지 않는다."""
+    if target_type == 'CIDR_BLOCK':
+        return _block(target)
+    if target == service_label:
+        return _block(SERVICE_NETWORK_CIDR)
+    return 1, 0, 33
+
+
+@dataclass
+class FlowReport:
+    """흐름별 판정과 결정 근거 (인덱스는 `labels`를 가리키며 -1은 해당 없음)"""
+
+    flows: FlowMatrix
+    verdict: np.ndarray
+    route: np.ndarray
+    egress: np.ndarray
+    ingress: np.ndarray
+    gateway: np.ndarray
+    labels: list[str]
+
+    @property
+    def allowed(self) -> np.ndarray:
+        return self.verdict == Verdict.ALLOWED
+
+    def summary(self) -> Counter:
+        values, counts = np.unique(self.verdict, return_counts=True)
+        return Counter({Verdict(int(value)).name: int(count) for value, count in zip(values, counts, strict=True)})
+
+    def explain(self, index: int) -> str:
+        """흐름 하나의 판정과 이를 결정한 라우트/규칙"""
+        verdict = Verdict(int(self.verdict[index]))
+        reasons = [
+            f'{stage}: {self.labels[value]}'
+            for stage, value in (
+                ('route', self.route[index]),
+                ('egress', self.egress[index]),
+                ('ingress', self.ingress[index]),
+            )
+            if value >= 0
+        ]
+        return f'{verdict.name} ({", ".join(reasons) or "일치하는 라우트/규칙 없음"})'
+
+
+class NetworkModel:
+    """
+    서브넷/라우트/보안 리스트 데이터로 구성한 VCN 모델
+    """
+
+    def __init__(
+        self,
+        vcn_cidr_block: str,
+        service_label: str,
+        subnets: Sequence[Mapping[str, Any]],
+        route_tables: Mapping[str, Sequence[Mapping[str, Any]]],
+        security_lists: Mapping[str, tuple[Sequence[Mapping[str, Any]], Sequence[Mapping[str, Any]]]],
+    ):
+        self.vcn = _block(vcn_cidr_block)
+        self.service_label = service_label
+        self.labels: list[str] = ['local (VCN)']
+
+        self.subnets = [
+            SubnetModel(
+                role=subnet['role'],
+                cidr_block=subnet['cidr_block'],
+                start=_block(subnet['cidr_block'])[0],
+                end=_block(subnet['cidr_block'])[1],
+                route_table=subnet['route_table'],
+                public=not subnet['prohibit_public_ip_on_vnic'],
+                security_lists=tuple(subnet['security_lists']),
+            )
+            for subnet in subnets
+        ]
+
+        self.routes: list[RouteModel] = []
+        for name, rules in route_tables.items():
+            for rule in rules:
+                start, end, prefixlen = _target_block(rule['destination_type'], rule['destination'], service_label)
+                self.routes.append(
+                    RouteModel(name, start, end, prefixlen, rule['network_entity'], f'{name}: {rule["description"]}')
+                )
+        # 최장 접두사 일치: 긴 prefix부터 평가
+        self.routes.sort(key=lambda route: -route.prefixlen)
+
+        self.rules: list[RuleModel] = []
+        for name, (ingress, egress) in security_lists.items():
+            for direction, raw_rules in (('ingress', ingress), ('egress', egress)):
+                # 실제로 배포되는 컴파일된 규칙으로 평가
+                for index, raw in enumerate(compile_rules(raw_rules, direction, verify=False) or []):
+                    rule = normalize_rule(raw, direction)
+                    start, end, _ = _target_block(rule.target_type, rule.target, service_label)
+                    self.rules.append(RuleModel(name, direction, index, rule, start, end))
+
+    @property
+    def roles(self) -> dict[str, str]:
+        """서브넷 역할 -> CIDR"""
+        return {subnet.role: subnet.cidr_block for subnet in self.subnets}
+
+    @classmethod
+    def from_config(cls) -> 'NetworkModel':
+        """현재 설정으로 매니저들이 생성할 네트워크 구성을 모델링 (리소스를 만들지 않음)"""
+        import config as cfg
+        from network.nsg import NetworkSecurityGroupManager, nsg_member_roles
+        from network.routing import RouteTableManager
+        from network.security import SecurityListManager
+        from network.subnets import SubnetManager
+
+        subnets = SubnetManager.get_subnet_layout()
+        security_lists = SecurityListManager(None).get_all_security_list_rules()
+        if cfg.SECURITY_MODE == 'nsg':
+            # NSG는 구성원 VNIC가 있는 서브넷에 붙은 보안 리스트처럼 모델링한다
+            security_lists.update(NetworkSecurityGroupManager(None).get_model_rules())
+            for subnet in subnets:
+                subnet['security_lists'] += [f'nsg:{role}' for role in nsg_member_roles(subnet['role'])]
+        return cls(
+            vcn_cidr_block=cfg.VCN_CIDR_BLOCK,
+            service_label=cfg.SERVICE_CIDR,
+            subnets=subnets,
+            route_tables={
+                'private': RouteTableManager.get_private_route_rules(),
+                'public': RouteTableManager.get_public_route_rules(),
+            },
+            security_lists=security_lists,
+        )
+
+    def _label(self, text: str) -> int:
+        self.labels.append(text)
+        return len(self.labels) - 1
+
+    def locate(self, addresses: np.ndarray) -> np.ndarray:
+        """주소가 속한 서브넷 인덱스 (VCN 서브넷 밖이면 -1)"""
+        located = np.full(len(addresses), -1, dtype=np.int64)
+        for index, subnet in enumerate(self.subnets):
+            located[(addresses >= subnet.start) & (addresses <= subnet.end)] = index
+        return located
+
+    @staticmethod
+    def _traffic_mask(rule: Rule, protocol: np.ndarray, port: np.ndarray, src_port: np.ndarray) -> np.ndarray:
+        """프로토콜/포트/ICMP 조건 마스크"""
+        if rule.protocol == PROTOCOL_ALL:
+            return np.ones(len(protocol), dtype=bool)
+        number = int(rule.protocol)
+        mask = protocol == number
+        if rule.dst_ports:
+            mask &= (port >= rule.dst_ports[0]) & (port <= rule.dst_ports[1])
+        if rule.src_ports:
+            mask &= (src_port >= rule.src_ports[0]) & (src_port <= rule.src_ports[1])
+        if rule.icmp_type is not None:
+            mask &= port == rule.icmp_type
+        if rule.icmp_code is not None:
+            mask &= src_port == rule.icmp_code
+        return mask
+
+    def _admit(
+        self,
+        direction: str,
+        subnet: np.ndarray,
+        peer: np.ndarray,
+        protocol: np.ndarray,
+        port: np.ndarray,
+        src_port: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        보안 리스트 판정: (허용 여부, 결정한 규칙 레이블 인덱스, stateless 여부)
+        stateless 규칙이 일치하면 stateful 규칙보다 우선한다.
+        """
+        count = len(subnet)
+        decided = np.full(count, -1, dtype=np.int64)
+        stateless = np.zeros(count, dtype=bool)
+        for rule in self.rules:
+            if rule.direction != direction:
+                continue
+            attached = np.array([rule.security_list in item.security_lists for item in self.subnets] + [False])
+            mask = attached[subnet]  # subnet == -1이면 마지막(False) 항목
+            if not mask.any():
+                continue
+            mask &= (peer >= rule.start) & (peer <= rule.end)
+            mask &= self._traffic_mask(rule.rule, protocol, port, src_port)
+            if rule.rule.stateless:
+                take = mask & ~stateless
+                stateless |= mask
+            else:
+                take = mask & (decided < 0)
+            if take.any():
+                decided[take] = self._label(rule.label)
+        return decided >= 0, decided, stateless
+
+    def evaluate(self, flows: FlowMatrix | Iterable[Flow]) -> FlowReport:
+        """흐름 행렬 평가"""
+        if not isinstance(flows, FlowMatrix):
+            flows = FlowMatrix.from_flows(flows, self.service_label)
+        self.labels = self.labels[:1]
+        count = len(flows)
+        src, dst = flows.src, flows.dst
+        src_subnet, dst_subnet = self.locate(src), self.locate(dst)
+        vcn_start, vcn_end, _ = self.vcn
+        src_in_vcn = (src >= vcn_start) & (src <= vcn_end)
+        dst_in_vcn = (dst >= vcn_start) & (dst <= vcn_end)
+
+        verdict = np.full(count, Verdict.ALLOWED, dtype=np.int8)
+        route = np.full(count, -1, dtype=np.int64)
+
+        # 1) 라우팅
+        route[src_in_vcn & dst_in_vcn] = 0
+        target = np.full(count, '', dtype=object)
+        tables = np.array([subnet.route_table for subnet in self.subnets] + [''], dtype=object)[src_subnet]
+        pending = src_in_vcn & ~dst_in_vcn
+        for item in self.routes:
+            mask = pending & (tables == item.route_table) & (dst >= item.start) & (dst <= item.end)
+            if mask.any():
+                route[mask] = self._label(item.label)
+                target[mask] = item.target
+                pending &= ~mask
+        verdict[pending | (src_in_vcn & ~dst_in_vcn & (src_subnet < 0))] = Verdict.NO_ROUTE
+        public = np.array([subnet.public for subnet in self.subnets] + [False])
+        verdict[(target == 'internet_gateway') & ~public[src_subnet]] = Verdict.NO_PUBLIC_IP
+
+        # 인터넷에서 들어오는 흐름: 공인 IP 서브넷이고 인터넷 게이트웨이로 응답할 수 있어야 함
+        inbound = ~src_in_vcn
+        if inbound.any():
+            reachable = np.zeros(len(self.subnets) + 1, dtype=bool)
+            for index, subnet in enumerate(self.subnets):
+                for item in self.routes:
+                    if item.route_table == subnet.route_table and item.target == 'internet_gateway':
+                        reachable[index] = subnet.public
+                        route[inbound & (dst_subnet == index)] = self._label(f'return via {item.label}')
+                        break
+            verdict[inbound & ~reachable[dst_subnet]] = Verdict.NO_ROUTE
+
+        # 2) Egress (VCN 안에서 출발한 흐름)
+        ok, egress, egress_stateless = self._admit(
+            'egress', src_subnet, dst, flows.protocol, flows.port, flows.src_port
+        )
+        verdict[(verdict == Verdict.ALLOWED) & src_in_vcn & ~ok] = Verdict.EGRESS_DENIED
+
+        # 3) Ingress (목적지가 VCN 서브넷인 흐름)
+        ok, ingress, ingress_stateless = self._admit(
+            'ingress', dst_subnet, src, flows.protocol, flows.port, flows.src_port
+        )
+        verdict[(verdict == Verdict.ALLOWED) & (dst_subnet >= 0) & ~ok] = Verdict.INGRESS_DENIED
+        verdict[(verdict == Verdict.ALLOWED) & dst_in_vcn & (dst_subnet < 0)] = Verdict.INGRESS_DENIED
+
+        # 4) stateless 규칙으로 허용된 흐름은 응답 방향 규칙도 필요
+        needs_return = (verdict == Verdict.ALLOWED) & (egress_stateless | ingress_stateless)
+        if needs_return.any():
+            returned_in, _, _ = self._admit('ingress', src_subnet, dst, flows.protocol, flows.src_port, flows.port)
+            returned_out, _, _ = self._admit('egress', dst_subnet, src, flows.protocol, flows.src_port, flows.port)
+            returned = np.where(src_in_vcn, returned_in, True) & np.where(dst_subnet >= 0, returned_out, True)
+            verdict[needs_return & ~returned] = Verdict.RETURN_DENIED
+
+        return FlowReport(flows, verdict, route, egress, ingress, target, list(self.labels))
+
+
+# =============================================================================
+# 필수 OKE 흐름 회귀 검사
+# =============================================================================
+
+
+def required_flows(model: NetworkModel) -> list[tuple[Flow, bool, str]]:
+    """
+    OKE가 동작하는 데 필요한(또는 막혀 있어야 하는) 흐름 목록과 기대 결과
+    세 번째 값은 거쳐야 하는 게이트웨이 (VCN 내부 흐름은 빈 문자열)
+    """
+    roles = model.roles
+    node, api = roles['node'], roles['k8s_api']
+    pod = roles.get('pod', node)
+    service = model.service_label
+    flows = [
+        (Flow(node, api, 'tcp', 6443, name='node -> API server'), True, ''),
+        (Flow(node, api, 'tcp', 12250, name='node -> API (kubelet proxymux)'), True, ''),
+        (Flow(node, api, 'icmp', 3, 4, name='node -> API path MTU discovery'), True, ''),
+        (Flow(api, node, 'tcp', 10250, name='API -> kubelet'), True, ''),
+        (Flow(api, node, 'icmp', 3, 4, name='API -> node path MTU discovery'), True, ''),
+        (Flow(node, node, 'udp', 8472, name='node <-> node'), True, ''),
+        (Flow(node, service, 'tcp', 443, name='node -> OCI services (SGW)'), True, 'service_gateway'),
+        (Flow(api, service, 'tcp', 443, name='API -> OCI services'), True, 'internet_gateway'),
+        (Flow(node, '203.0.113.10', 'tcp', 443, name='node -> internet (NAT)'), True, 'nat_gateway'),
+        (Flow('198.51.100.7', api, 'tcp', 6443, name='internet -> public API endpoint'), True, ''),
+        (Flow('198.51.100.7', node, 'tcp', 22, name='internet -> private node (blocked)'), False, ''),
+    ]
+    if 'pod' in roles:
+        flows += [
+            (Flow(pod, pod, 'tcp', 8080, name='pod <-> pod'), True, ''),
+            (Flow(node, pod, 'tcp', 8080, name='node -> pod'), True, ''),
+            (Flow(pod, node, 'tcp', 10250, name='pod -> node'), True, ''),
+            (Flow(pod, api, 'tcp', 6443, name='pod -> API server'), True, ''),
+            (Flow(api, pod, 'tcp', 8443, name='API -> pod (webhooks)'), True, ''),
+            (Flow(pod, service, 'tcp', 443, name='pod -> OCI services (SGW)'), True, 'service_gateway'),
+            (Flow(pod, '203.0.113.10', 'tcp', 443, name='pod -> internet (NAT)'), True, 'nat_gateway'),
+        ]
+    return flows
+
+
+def check_required_flows(model: NetworkModel) -> list[str]:
+    """기대와 다르게 판정된 필수 흐름의 설명 목록 (비어 있으면 통과)"""
+    cases = required_flows(model)
+    report = model.evaluate(flow for flow, _, _ in cases)
+    failures = []
+    for index, (flow, expected, gateway) in enumerate(cases):
+        if bool(report.allowed[index]) != expected:
+            expected_text = '허용' if expected else '차단'
+            failures.append(f'{flow.name}: {expected_text}되어야 하지만 {report.explain(index)}')
+        elif expected and report.gateway[index] != gateway:
+            failures.append(f'{flow.name}: {gateway or "로컬 라우트"}를 거쳐야 하지만 {report.explain(index)}')
+    return failures
@@ -28,38 +28,70 @@ class RouteTableManager:
             vcn_id=self.vcn.id,
         )
 
-    def create_route_table_private(self, nat_gateway, service_gateway):
+    @staticmethod
+    def get_private_route_rules():
         """
-        프라이빗 라우트 테이블 생성 메소드
+        프라이빗 라우트 규칙 생성 메소드 (network_entity는 게이트웨이 이름)
         """
-        route_rules = [
-            oci.core.RouteTableRouteRuleArgs(
-                description='인터넷으로의 트래픽',
-                destination='0.0.0.0/0',
-                destination_type='CIDR_BLOCK',
-                network_entity_id=nat_gateway.id,
-            ),
+        return [
+            {
+                'description': '인터넷으로의 트래픽',
+                'destination': '0.0.0.0/0',
+                'destination_type': 'CIDR_BLOCK',
+                'network_entity': 'nat_gateway',
+            },
+            {
+                'description': 'OCI 서비스로의 트래픽',
+                'destination': cfg.SERVICE_CIDR,
+                'destination_type': 'SERVICE_CIDR_BLOCK',
+                'network_entity': 'service_gateway',
+            },
+        ]
+
+    @staticmethod
+    def get_public_route_rules():
+        """
+        퍼블릭 라우트 규칙 생성 메소드 (network_entity는 게이트웨이 이름)
+        """
+        return [
+            {
+                'description': '퍼블릭 인터넷 트래픽',
+                'destination': '0.0.0.0/0',
+                'destination_type': 'CIDR_BLOCK',
+                'network_entity': 'internet_gateway',
+            }
+        ]
+
+    @staticmethod
+    def _to_route_rule_args(route_rules, gateways):
+        """
+        라우트 규칙 딕셔너리를 게이트웨이 ID가 포함된 RouteTableRouteRuleArgs로 변환하는 메소드
+        """
+        return [
             oci.core.RouteTableRouteRuleArgs(
-                description='OCI 서비스로의 트래픽',
-                destination=cfg.SERVICE_CIDR,
-                destination_type='SERVICE_CIDR_BLOCK',
-                network_entity_id=service_gateway.id,
-            ),
+                description=rule['description'],
+                destination=rule['destination'],
+                destination_type=rule['destination_type'],
+                network_entity_id=gateways[rule['network_entity']].id,
+            )
+            for rule in route_rules
         ]
+
+    def create_route_table_private(self, nat_gateway, service_gateway):
+        """
+        프라이빗 라우트 테이블 생성 메소드
+        """
+        route_rules = self._to_route_rule_args(
+            self.get_private_route_rules(),
+            {'nat_gateway': nat_gateway, 'service_gateway': service_gateway},
+        )
         return self._create_route_table('oke-route-table-private', route_rules)
 
     def create_route_table_public(self, internet_gateway):
         """
         퍼블릭 라우트 테이블 생성 메소드
         """
-        route_rules = [
-            oci.core.RouteTableRouteRuleArgs(
-                description='퍼블릭 인터넷 트래픽',
-                destination='0.0.0.0/0',
-                destination_type='CIDR_BLOCK',
-                network_entity_id=internet_gateway.id,
-            )
-        ]
+        route_rules = self._to_route_rule_args(self.get_public_route_rules(), {'internet_gateway': internet_gateway})
         return self._create_route_table('oke-route-table-public', route_rules)
 
     def create_all_route_tables(self):
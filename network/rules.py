@@ -0,0 +1,453 @@
+"""
+보안 규칙 컴파일러
+`SecurityListManager.get_*_rules`가 만든 규칙 딕셔너리를 정규화한 뒤
+중복/가려진(shadowed) 규칙을 제거하고 포트 범위와 CIDR을 병합한다.
+컴파일 결과는 원본 규칙과 허용하는 트래픽 집합이 정확히 같은지 셀 단위로 검증한다.
+"""
+
+import functools
+import ipaddress
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+from network.cidr import CidrBlock
+
+# OCI 보안 리스트당 방향별 최대 규칙 수
+MAX_RULES_PER_DIRECTION = 200
+# OCI 규칙 설명 최대 길이
+MAX_DESCRIPTION_LENGTH = 255
+
+PROTOCOL_ALL = 'all'
+PORT_PROTOCOLS = {6: 'tcp_options', 17: 'udp_options'}
+ICMP_PROTOCOLS = (1, 58)
+PORT_MIN, PORT_MAX = 1, 65535
+
+TARGET_KEYS = {
+    'ingress': ('source', 'source_type'),
+    'egress': ('destination', 'destination_type'),
+}
+
+PortRange = tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """정규화된 보안 규칙 (포트/ICMP 값이 None이면 전체 허용)"""
+
+    direction: str
+    stateless: bool
+    target_type: str
+    target: str
+    protocol: str
+    dst_ports: PortRange | None = None
+    src_ports: PortRange | None = None
+    icmp_type: int | None = None
+    icmp_code: int | None = None
+    description: str = ''
+
+    @property
+    def key(self) -> tuple:
+        """설명을 제외한 규칙 동일성 키"""
+        return (
+            self.direction,
+            self.stateless,
+            self.target_type,
+            self.target,
+            self.protocol,
+            self.dst_ports,
+            self.src_ports,
+            self.icmp_type,
+            self.icmp_code,
+        )
+
+    @property
+    def block(self) -> CidrBlock | None:
+        """CIDR 대상이면 정수 구간, 서비스 CIDR 레이블이면 None"""
+        return _cidr_block(self.target) if self.target_type == 'CIDR_BLOCK' else None
+
+
+@functools.cache
+def _cidr_block(cidr: str) -> CidrBlock:
+    return CidrBlock.of(cidr, cidr)
+
+
+# =============================================================================
+# 정규화 / 역변환
+# =============================================================================
+
+
+def _port_range(options: dict[str, Any] | None) -> PortRange | None:
+    if not options or options.get('min') is None:
+        return None
+    port_range = (int(options['min']), int(options.get('max', options['min'])))
+    return None if port_range == (PORT_MIN, PORT_MAX) else port_range
+
+
+def normalize_rule(raw: dict[str, Any], direction: str) -> Rule:
+    """규칙 딕셔너리를 정규화된 `Rule`로 변환"""
+    target_key, target_type_key = TARGET_KEYS[direction]
+    protocol = str(raw['protocol']).lower()
+    target_type = raw.get(target_type_key) or 'CIDR_BLOCK'
+    target = raw[target_key]
+    if target_type == 'CIDR_BLOCK':
+        target = str(ipaddress.ip_network(target))
+
+    rule = Rule(
+        direction=direction,
+        stateless=bool(raw.get('stateless', False)),
+        target_type=target_type,
+        target=target,
+        protocol=protocol,
+        description=raw.get('description') or '',
+    )
+    if protocol == PROTOCOL_ALL:
+        return rule
+
+    number = int(protocol)
+    if number in PORT_PROTOCOLS:
+        options = raw.get(PORT_PROTOCOLS[number]) or {}
+        return replace(
+            rule,
+            dst_ports=_port_range(options),
+            src_ports=_port_range(options.get('source_port_range')),
+        )
+    if number in ICMP_PROTOCOLS and raw.get('icmp_options'):
+        icmp = raw['icmp_options']
+        code = icmp.get('code')
+        return replace(rule, icmp_type=int(icmp['type']), icmp_code=None if code is None else int(code))
+    return rule
+
+
+def to_dict(rule: Rule) -> dict[str, Any]:
+    """정규화된 규칙을 `oci.core.SecurityList`에 넘길 딕셔너리로 변환"""
+    target_key, target_type_key = TARGET_KEYS[rule.direction]
+    result: dict[str, Any] = {
+        'description': rule.description,
+        'protocol': rule.protocol,
+        target_key: rule.target,
+        'stateless': rule.stateless,
+    }
+    if rule.target_type != 'CIDR_BLOCK' or rule.direction == 'egress':
+        result[target_type_key] = rule.target_type
+    if rule.protocol != PROTOCOL_ALL:
+        number = int(rule.protocol)
+        if number in PORT_PROTOCOLS and (rule.dst_ports or rule.src_ports):
+            options: dict[str, Any] = {}
+            if rule.dst_ports:
+                options.update(min=rule.dst_ports[0], max=rule.dst_ports[1])
+            if rule.src_ports:
+                options['source_port_range'] = {'min': rule.src_ports[0], 'max': rule.src_ports[1]}
+            result[PORT_PROTOCOLS[number]] = options
+        if number in ICMP_PROTOCOLS and rule.icmp_type is not None:
+            icmp: dict[str, int] = {'type': rule.icmp_type}
+            if rule.icmp_code is not None:
+                icmp['code'] = rule.icmp_code
+            result['icmp_options'] = icmp
+    return result
+
+
+# =============================================================================
+# 포함 관계 / 병합
+# =============================================================================
+
+
+def _range_covers(outer: PortRange | None, inner: PortRange | None) -> bool:
+    if outer is None:
+        return True
+    if inner is None:
+        return False
+    return outer[0] <= inner[0] and inner[1] <= outer[1]
+
+
+def covers(outer: Rule, inner: Rule) -> bool:
+    """`outer`가 허용하는 트래픽이 `inner`가 허용하는 트래픽을 모두 포함하는지"""
+    if (outer.direction, outer.stateless, outer.target_type) != (inner.direction, inner.stateless, inner.target_type):
+        return False
+
+    if outer.target_type == 'CIDR_BLOCK':
+        outer_block, inner_block = outer.block, inner.block
+        assert outer_block is not None and inner_block is not None
+        if outer_block.version != inner_block.version or not (
+            outer_block.start <= inner_block.start and inner_block.end <= outer_block.end
+        ):
+            return False
+    elif outer.target != inner.target:
+        return False
+
+    if outer.protocol == PROTOCOL_ALL:
+        return True
+    if outer.protocol != inner.protocol:
+        return False
+    return (
+        _range_covers(outer.dst_ports, inner.dst_ports)
+        and _range_covers(outer.src_ports, inner.src_ports)
+        and (outer.icmp_type is None or outer.icmp_type == inner.icmp_type)
+        and (outer.icmp_code is None or outer.icmp_code == inner.icmp_code)
+    )
+
+
+def _join_descriptions(rules: Iterable[Rule]) -> str:
+    descriptions = list(dict.fromkeys(rule.description for rule in rules if rule.description))
+    return ' / '.join(descriptions)[:MAX_DESCRIPTION_LENGTH]
+
+
+def _merge_port_ranges(rules: list[Rule]) -> list[Rule]:
+    """포트 범위만 다른 규칙들의 겹치거나 인접한 범위를 병합"""
+    groups: dict[tuple, list[Rule]] = defaultdict(list)
+    for rule in rules:
+        if rule.dst_ports:
+            groups[('ports', replace(rule, dst_ports=None).key)].append(rule)
+        else:
+            groups[('plain', rule.key)].append(rule)
+
+    merged: list[Rule] = []
+    for group in groups.values():
+        if group[0].dst_ports is None:
+            merged.extend(group)
+            continue
+        current: list[Rule] = []
+        low, high = 0, -1
+        for rule in sorted(group, key=lambda item: item.dst_ports or (0, 0)):
+            start, end = rule.dst_ports or (PORT_MIN, PORT_MAX)
+            if current and start <= high + 1:
+                high = max(high, end)
+                current[-1] = replace(
+                    current[-1],
+                    dst_ports=_port_range({'min': low, 'max': high}),
+                    description=_join_descriptions([current[-1], rule]),
+                )
+            else:
+                low, high = start, end
+                current.append(rule)
+        merged.extend(current)
+    return merged
+
+
+def _merge_cidrs(rules: list[Rule]) -> list[Rule]:
+    """대상 CIDR만 다른 규칙들을 가능한 가장 적은 CIDR로 병합"""
+    groups: dict[tuple, list[Rule]] = defaultdict(list)
+    for rule in rules:
+        if rule.target_type == 'CIDR_BLOCK':
+            block = rule.block
+            assert block is not None
+            groups[(block.version, replace(rule, target='').key)].append(rule)
+        else:
+            groups[rule.key].append(rule)
+
+    merged: list[Rule] = []
+    for group in groups.values():
+        if len(group) == 1 or group[0].target_type != 'CIDR_BLOCK':
+            merged.extend(group)
+            continue
+        networks = list(ipaddress.collapse_addresses(ipaddress.ip_network(rule.target) for rule in group))
+        if len(networks) == len(group):
+            merged.extend(group)
+            continue
+        for network in networks:
+            members = [rule for rule in group if ipaddress.ip_network(rule.target).subnet_of(network)]  # type: ignore[arg-type]
+            merged.append(replace(members[0], target=str(network), description=_join_descriptions(members)))
+    return merged
+
+
+def _drop_shadowed(rules: list[Rule]) -> list[Rule]:
+    """다른 규칙에 완전히 포함되는 규칙 제거 (동일 규칙은 먼저 나온 것만 유지)"""
+    kept: list[Rule] = []
+    for index, rule in enumerate(rules):
+        shadowed = any(
+            other.key != rule.key and covers(other, rule)
+            for other_index, other in enumerate(rules)
+            if other_index != index
+        )
+        if not shadowed:
+            kept.append(rule)
+    return kept
+
+
+def _dedupe(rules: Iterable[Rule]) -> list[Rule]:
+    unique: dict[tuple, Rule] = {}
+    for rule in rules:
+        if rule.key in unique:
+            unique[rule.key] = replace(unique[rule.key], description=_join_descriptions([unique[rule.key], rule]))
+        else:
+            unique[rule.key] = rule
+    return list(unique.values())
+
+
+def compile_rules(
+    rules: Sequence[dict[str, Any]] | None,
+    direction: str,
+    limit: int = MAX_RULES_PER_DIRECTION,
+    verify: bool = True,
+) -> list[dict[str, Any]] | None:
+    """
+    보안 규칙 목록을 정규화/중복 제거/병합/가림 검사하여 최소화된 규칙 목록 반환
+    `verify`가 참이면 원본과 결과가 허용하는 트래픽이 같은지 검증한다.
+    """
+    if rules is None:
+        return None
+
+    original = [normalize_rule(rule, direction) for rule in rules]
+    compiled = _dedupe(original)
+    while True:
+        previous = [rule.key for rule in compiled]
+        compiled = _drop_shadowed(_merge_cidrs(_merge_port_ranges(compiled)))
+        compiled = _dedupe(compiled)
+        if [rule.key for rule in compiled] == previous:
+            break
+
+    if verify:
+        mismatch = find_mismatch(original, compiled)
+        if mismatch is not None:
+            raise ValueError(f'보안 규칙 컴파일 결과가 원본과 다릅니다 ({direction}): {mismatch}')
+    if len(compiled) > limit:
+        raise ValueError(f'{direction} 보안 규칙이 {len(compiled)}개로 OCI 보안 리스트 한도({limit}개)를 초과합니다.')
+    return [to_dict(rule) for rule in compiled]
+
+
+# =============================================================================
+# 듀얼 스택 (IPv6 대응 규칙)
+# =============================================================================
+
+# IPv4 Path MTU discovery(ICMP 3/4, Fragmentation needed)에 대응하는 ICMPv6 Packet Too Big
+ICMPV6_PROTOCOL = '58'
+ICMPV6_PACKET_TOO_BIG = {'type': 2, 'code': 0}
+# VCN은 ULA prefix만 쓰고 IPv6 기본 라우트가 없으므로 ::/0 대응 규칙은 만들지 않는다
+IPV6_ANYWHERE = '::/0'
+
+
+def add_ipv6_rules(
+    rules: Sequence[dict[str, Any]] | None, direction: str, counterparts: Mapping[str, str]
+) -> list[dict[str, Any]] | None:
+    """
+    IPv4 CIDR 대상 규칙마다 같은 트래픽을 허용하는 IPv6 규칙을 덧붙인다
+    `counterparts`는 IPv4 CIDR -> IPv6 prefix (예: VCN -> VCN prefix, 서브넷 -> 서브넷 /64)이며, 대응 prefix가 없는
+    대상과 서비스 CIDR/NSG 대상 규칙은 그대로 둔다. ICMP 규칙은 ICMPv6로 바꾼다 (Path discovery는 Packet Too Big).
+    ::/0 대상 규칙은 IPv6 라우트가 없어 트래픽이 오가지 않으므로 대응 prefix로 받더라도 만들지 않는다.
+    """
+    if not rules or not counterparts:
+        return rules
+    target_key, target_type_key = TARGET_KEYS[direction]
+    result = list(rules)
+    for rule in rules:
+        if (rule.get(target_type_key) or 'CIDR_BLOCK') != 'CIDR_BLOCK' or rule[target_key] not in counterparts:
+            continue
+        if counterparts[rule[target_key]] == IPV6_ANYWHERE:
+            continue
+        twin = {**rule, target_key: counterparts[rule[target_key]]}
+        if str(rule['protocol']) == '1':
+            twin['protocol'] = ICMPV6_PROTOCOL
+            if rule.get('icmp_options') == {'code': 4, 'type': 3}:
+                twin['icmp_options'] = ICMPV6_PACKET_TOO_BIG
+            else:
+                twin.pop('icmp_options', None)
+        result.append(twin)
+    return result
+
+
+# =============================================================================
+# 동치 검증
+# =============================================================================
+
+
+def _segments(bounds: Iterable[PortRange], low: int, high: int) -> list[int]:
+    """구간 경계로 [low, high]를 나눈 각 조각의 대표값(시작점)"""
+    points = {low}
+    for start, end in bounds:
+        points.add(start)
+        if end + 1 <= high:
+            points.add(end + 1)
+    return sorted(point for point in points if low <= point <= high)
+
+
+def _unused(values: Iterable[int], high: int) -> int | None:
+    used = set(values)
+    return next((value for value in range(high + 1) if value not in used), None)
+
+
+def _target_matches(rule: Rule, target: Any) -> bool:
+    if rule.target_type == 'CIDR_BLOCK':
+        block = rule.block
+        assert block is not None
+        version, address = target
+        return block.version == version and block.start <= address <= block.end
+    return rule.target == target
+
+
+def _traffic_matches(rule: Rule, protocol: int, fields: tuple[int | None, ...]) -> bool:
+    if rule.protocol == PROTOCOL_ALL:
+        return True
+    if int(rule.protocol) != protocol:
+        return False
+    if protocol in PORT_PROTOCOLS:
+        dst_port, src_port = fields
+        return _range_covers(rule.dst_ports, (dst_port, dst_port)) and _range_covers(  # type: ignore[arg-type]
+            rule.src_ports,
+            (src_port, src_port),  # type: ignore[arg-type]
+        )
+    if protocol in ICMP_PROTOCOLS:
+        icmp_type, icmp_code = fields
+        return (rule.icmp_type is None or rule.icmp_type == icmp_type) and (
+            rule.icmp_code is None or rule.icmp_code == icmp_code
+        )
+    return True
+
+
+def _field_cells(rules: list[Rule], protocol: int) -> list[tuple[int | None, ...]]:
+    """프로토콜별 옵션 공간을 규칙 경계로 나눈 셀의 대표값"""
+    relevant = [rule for rule in rules if rule.protocol != PROTOCOL_ALL and int(rule.protocol) == protocol]
+    if protocol in PORT_PROTOCOLS:
+        dst = _segments((rule.dst_ports for rule in relevant if rule.dst_ports), PORT_MIN, PORT_MAX)
+        src = _segments((rule.src_ports for rule in relevant if rule.src_ports), PORT_MIN, PORT_MAX)
+        return [(dst_port, src_port) for dst_port in dst for src_port in src]
+    if protocol in ICMP_PROTOCOLS:
+        types = {rule.icmp_type for rule in relevant if rule.icmp_type is not None}
+        codes = {rule.icmp_code for rule in relevant if rule.icmp_code is not None}
+        type_cells = [*types, _unused(types, 255)]
+        code_cells = [*codes, _unused(codes, 255)]
+        return [(icmp_type, icmp_code) for icmp_type in type_cells for icmp_code in code_cells]
+    return [()]
+
+
+def find_mismatch(original: Sequence[Rule], compiled: Sequence[Rule]) -> tuple | None:
+    """
+    두 규칙 집합이 허용하는 트래픽이 다른 지점을 찾는다 (같으면 None)
+    모든 규칙 경계(주소, 프로토콜, 포트, ICMP 값)로 공간을 셀로 나누면 각 셀 안에서는
+    두 집합의 허용 여부가 일정하므로, 셀마다 대표값 하나만 검사해도 완전한 증명이 된다.
+    """
+    rules = [*original, *compiled]
+    groups: dict[tuple, list[Rule]] = defaultdict(list)
+    for rule in rules:
+        groups[(rule.direction, rule.stateless, rule.target_type)].append(rule)
+
+    for group_key, group in groups.items():
+        group_original = [rule for rule in original if (rule.direction, rule.stateless, rule.target_type) == group_key]
+        group_compiled = [rule for rule in compiled if (rule.direction, rule.stateless, rule.target_type) == group_key]
+
+        targets: list[Any]
+        if group_key[2] == 'CIDR_BLOCK':
+            blocks = [rule.block for rule in group if rule.block is not None]
+            targets = []
+            for version in sorted({block.version for block in blocks}):
+                high = (1 << (32 if version == 4 else 128)) - 1
+                bounds = [(block.start, block.end) for block in blocks if block.version == version]
+                targets.extend((version, address) for address in _segments(bounds, 0, high))
+        else:
+            targets = sorted({rule.target for rule in group})
+
+        for target in targets:
+            # 대상 주소에 걸리는 규칙만 남긴 뒤, 그 규칙들의 경계로 프로토콜/옵션 공간을 나눈다
+            target_original = [rule for rule in group_original if _target_matches(rule, target)]
+            target_compiled = [rule for rule in group_compiled if _target_matches(rule, target)]
+            target_rules = [*target_original, *target_compiled]
+            numbers = {int(rule.protocol) for rule in target_rules if rule.protocol != PROTOCOL_ALL}
+            protocols = sorted({*numbers, _unused(numbers, 255) or 0})
+
+            for protocol in protocols:
+                for fields in _field_cells(target_rules, protocol):
+                    before = any(_traffic_matches(rule, protocol, fields) for rule in target_original)
+                    after = any(_traffic_matches(rule, protocol, fields) for rule in target_compiled)
+                    if before != after:
+                        return (*group_key, target, protocol, *fields, before, after)
+    return None
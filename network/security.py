@@ -1,6 +1,7 @@
 import pulumi_oci as oci
 
 import config as cfg
+from network.rules import add_ipv6_rules, compile_rules
 
 
 class SecurityListManager:
@@ -13,17 +14,22 @@ class SecurityListManager:
         self.node_security_list = None
         self.k8s_api_security_list = None
         self.service_lb_security_list = None
+        self.pod_security_list = None
+        self.baseline_security_list = None
 
     def create_security_list(self, name, ingress_rules=None, egress_rules=None):
         """
         보안 리스트 생성 메소드
+        규칙은 컴파일러를 거쳐 중복/가려진 규칙이 제거되고 병합된 뒤 전달된다.
+        듀얼 스택이면 IPv4 CIDR 대상 규칙마다 대응하는 IPv6 규칙을 덧붙인다.
         """
+        counterparts = cfg.IPV6_COUNTERPARTS
         return oci.core.SecurityList(
             resource_name=name,
             compartment_id=cfg.COMPARTMENT_ID,
             vcn_id=self.vcn.id,
-            ingress_security_rules=ingress_rules,
-            egress_security_rules=egress_rules,
+            ingress_security_rules=compile_rules(add_ipv6_rules(ingress_rules, 'ingress', counterparts), 'ingress'),
+            egress_security_rules=compile_rules(add_ipv6_rules(egress_rules, 'egress', counterparts), 'egress'),
             display_name=name,
         )
 
@@ -53,6 +59,25 @@ class SecurityListManager:
         """
         return self.create_security_list(name='oke-service-lb-security-list')
 
+    def create_baseline_security_list(self):
+        """
+        NSG 모드에서 모든 서브넷에 붙이는 기본 보안 리스트 생성 메소드 (VCN 안의 Path discovery만 허용)
+        """
+        ingress_rules, egress_rules = self.get_baseline_rules()
+        return self.create_security_list(
+            name='oke-baseline-security-list', ingress_rules=ingress_rules, egress_rules=egress_rules
+        )
+
+    def create_pod_security_list(self):
+        """
+        파드 서브넷 보안 리스트 생성 메소드
+        """
+        return self.create_security_list(
+            name='oke-pod-security-list',
+            ingress_rules=self.get_pod_ingress_rules(),
+            egress_rules=self.get_pod_egress_rules(),
+        )
+
     # 공통 규칙 생성 메소드
     def path_discovery_rule(self, source_or_dest, cidr_block):
         """
@@ -66,6 +91,22 @@ class SecurityListManager:
             'stateless': False,
         }
 
+    def pod_subnet_rule(self, source_or_dest, description, protocol='all'):
+        """
+        파드 서브넷과의 통신 규칙 생성 메소드 (파드 서브넷이 없으면 빈 목록)
+        """
+        if not cfg.POD_SUBNET_CIDR_BLOCK:
+            return []
+        rule = {
+            'description': description,
+            'protocol': protocol,
+            source_or_dest: cfg.POD_SUBNET_CIDR_BLOCK,
+            'stateless': False,
+        }
+        if source_or_dest == 'destination':
+            rule['destination_type'] = 'CIDR_BLOCK'
+        return [rule]
+
     def node_tcp_rule(self):
         """
         노드 TCP 규칙 생성 메소드
@@ -97,6 +138,7 @@ class SecurityListManager:
                 'source': cfg.NODE_SUBNET_CIDR_BLOCK,
                 'stateless': False,
             },
+            *self.pod_subnet_rule('source', 'Allow pods to communicate with worker nodes'),
         ]
 
     # 노드용 Egress 규칙 생성 메소드
@@ -134,6 +176,7 @@ class SecurityListManager:
                 'protocol': 'all',
                 'stateless': False,
             },
+            *self.pod_subnet_rule('destination', 'Allow worker nodes to communicate with pods'),
         ]
 
     # Kubernetes API Ingress 규칙 생성 메소드
@@ -155,6 +198,7 @@ class SecurityListManager:
                 'source': cfg.NODE_SUBNET_CIDR_BLOCK,
                 'stateless': False,
             },
+            *self.pod_subnet_rule('source', 'Pod to Kubernetes API endpoint communication', '6'),
         ]
 
     # Kubernetes API Egress 규칙 생성 메소드
@@ -178,15 +222,99 @@ class SecurityListManager:
                 'protocol': '6',
                 'stateless': False,
             },
+            *self.pod_subnet_rule('destination', 'Kubernetes API endpoint to pod communication', '6'),
         ]
 
+    # 파드용 Ingress 규칙 생성 메소드
+    def get_pod_ingress_rules(self):
+        """
+        파드용 Ingress 규칙 생성
+        """
+        return [
+            self.path_discovery_rule('source', cfg.NODE_SUBNET_CIDR_BLOCK),
+            {
+                'description': 'Allow worker nodes to communicate with pods',
+                'protocol': 'all',
+                'source': cfg.NODE_SUBNET_CIDR_BLOCK,
+                'stateless': False,
+            },
+            {
+                'description': 'Kubernetes API endpoint to pod communication',
+                'protocol': '6',
+                'source': cfg.K8S_API_SUBNET_CIDR_BLOCK,
+                'stateless': False,
+            },
+            *self.pod_subnet_rule('source', 'Allow pods to communicate with other pods'),
+        ]
+
+    # 파드용 Egress 규칙 생성 메소드
+    def get_pod_egress_rules(self):
+        """
+        파드용 Egress 규칙 생성
+        """
+        return [
+            self.path_discovery_rule('destination', cfg.NODE_SUBNET_CIDR_BLOCK),
+            *self.pod_subnet_rule('destination', 'Allow pods to communicate with other pods'),
+            {
+                'description': 'Allow pods to communicate with OCI services',
+                'destination': cfg.SERVICE_CIDR,
+                'destination_type': 'SERVICE_CIDR_BLOCK',
+                'protocol': '6',
+                'stateless': False,
+            },
+            {
+                'description': 'Pod to Kubernetes API endpoint communication',
+                'destination': cfg.K8S_API_SUBNET_CIDR_BLOCK,
+                'destination_type': 'CIDR_BLOCK',
+                'protocol': '6',
+                'stateless': False,
+            },
+            {
+                'description': 'Pods access to Internet',
+                'destination': '0.0.0.0/0',
+                'destination_type': 'CIDR_BLOCK',
+                'protocol': 'all',
+                'stateless': False,
+            },
+        ]
+
+    # NSG 모드 기본 보안 리스트 규칙 생성 메소드
+    def get_baseline_rules(self):
+        """
+        기본 보안 리스트 (Ingress, Egress) 규칙 생성
+        """
+        egress = self.path_discovery_rule('destination', cfg.VCN_CIDR_BLOCK)
+        egress['destination_type'] = 'CIDR_BLOCK'
+        return [self.path_discovery_rule('source', cfg.VCN_CIDR_BLOCK)], [egress]
+
+    def get_all_security_list_rules(self):
+        """
+        보안 리스트 이름별 (Ingress, Egress) 규칙을 생성하는 메소드 (리소스를 만들지 않음)
+        """
+        if cfg.SECURITY_MODE == 'nsg':
+            return {'baseline': self.get_baseline_rules()}
+        rules = {
+            'node': (self.get_node_ingress_rules(), self.get_node_egress_rules()),
+            'k8s_api': (self.get_k8s_api_ingress_rules(), self.get_k8s_api_egress_rules()),
+            'service_lb': ([], []),
+        }
+        if cfg.POD_SUBNET_CIDR_BLOCK:
+            rules['pod'] = (self.get_pod_ingress_rules(), self.get_pod_egress_rules())
+        return rules
+
     def create_all_security_lists(self):
         """
         모든 보안 리스트를 생성하는 메소드
+        NSG 모드에서는 역할별 규칙을 NSG가 담당하므로 기본 보안 리스트만 생성하고 (None, None, None)을 반환한다.
         """
+        if cfg.SECURITY_MODE == 'nsg':
+            self.baseline_security_list = self.create_baseline_security_list()
+            return None, None, None
         self.node_security_list = self.create_node_security_list()
         self.k8s_api_security_list = self.create_k8s_api_security_list()
         self.service_lb_security_list = self.create_service_lb_security_list()
+        if cfg.POD_SUBNET_CIDR_BLOCK:
+            self.pod_security_list = self.create_pod_security_list()
         return (
             self.node_security_list,
             self.k8s_api_security_list,
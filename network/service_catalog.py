@@ -0,0 +1,150 @@
+"""
+OCI 서비스 카탈로그 해석
+리전별 "All <리전> Services In Oracle Services Network" 서비스의 OCID와 CIDR 레이블을 찾는다.
+
+조회 순서:
+1. TTL 안의 디스크 캐시 항목
+2. `oci.core.get_services` 조회 결과 (캐시에 저장)
+3. 오프라인 모드이거나 조회 결과를 쓸 수 없으면 만료된 캐시 항목
+4. 캐시도 없으면 리전 키로 만든 내장 기본값
+
+Pulumi는 실패한 invoke를 프로그램 종료 시 다시 던지므로, 네트워크가 없는 환경에서는
+조회 자체를 건너뛰도록 오프라인 모드(`service_catalog_offline`)를 사용한다.
+"""
+
+import functools
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import pulumi
+import pulumi_oci as oci
+
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'oke-infra' / 'service_catalog.json'
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+# 리전 식별자 -> 리전 키(공항 코드). 서비스 CIDR 레이블은 'all-<키>-services-in-oracle-services-network'
+REGION_KEYS = {
+    'ap-chuncheon-1': 'yny',
+    'ap-osaka-1': 'kix',
+    'ap-seoul-1': 'icn',
+    'ap-singapore-1': 'sin',
+    'ap-sydney-1': 'syd',
+    'ap-tokyo-1': 'nrt',
+    'eu-frankfurt-1': 'fra',
+    'uk-london-1': 'lhr',
+    'us-ashburn-1': 'iad',
+    'us-phoenix-1': 'phx',
+}
+
+_ALL_SERVICES_PREFIX = 'all-'
+_ALL_SERVICES_SUFFIX = '-services-in-oracle-services-network'
+
+
+def service_cidr_label(region: str) -> str:
+    """리전의 'All Services' CIDR 레이블"""
+    key = REGION_KEYS.get(region)
+    if key is None:
+        raise ValueError(f"리전 '{region}'의 리전 키를 알 수 없습니다. 서비스 카탈로그를 갱신하세요.")
+    return f'{_ALL_SERVICES_PREFIX}{key}{_ALL_SERVICES_SUFFIX}'
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceEntry:
+    """리전의 'All Services' 항목"""
+
+    region: str
+    service_id: str
+    cidr_block: str
+    fetched_at: float = 0.0
+
+    def is_fresh(self, ttl: float, now: float | None = None) -> bool:
+        return (now if now is not None else time.time()) - self.fetched_at < ttl
+
+
+class ServiceCatalog:
+    """
+    리전별 서비스 항목의 JSON 디스크 캐시
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL_SECONDS, offline: bool = False):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.offline = offline
+
+    def load(self) -> dict[str, ServiceEntry]:
+        """캐시 파일 읽기 (없거나 손상된 경우 빈 카탈로그)"""
+        try:
+            raw = json.loads(self.path.read_text())
+            return {region: ServiceEntry(**entry) for region, entry in raw.get('regions', {}).items()}
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    def get(self, region: str) -> ServiceEntry | None:
+        return self.load().get(region)
+
+    def put(self, entry: ServiceEntry) -> None:
+        """항목 저장 (임시 파일에 쓴 뒤 교체하여 동시 실행에도 파일이 깨지지 않도록 함)"""
+        entries = self.load()
+        entries[entry.region] = entry
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(
+            json.dumps({'regions': {region: asdict(item) for region, item in sorted(entries.items())}}, indent=2)
+        )
+        os.replace(tmp_path, self.path)
+
+    def refresh(self, region: str) -> ServiceEntry:
+        """
+        `oci.core.get_services`로 'All Services' 항목을 조회하여 캐시에 저장
+        조회 결과는 OCI provider의 리전 기준이므로, 다른 리전의 서비스가 돌아오면 저장하지 않는다.
+        """
+        services = oci.core.get_services().services or []
+        for service in services:
+            if not (
+                service.cidr_block.startswith(_ALL_SERVICES_PREFIX)
+                and service.cidr_block.endswith(_ALL_SERVICES_SUFFIX)
+            ):
+                continue
+            if f'.{region}.' not in service.id:
+                raise ValueError(
+                    f"조회된 서비스 {service.id}가 리전 '{region}'의 것이 아닙니다. OCI provider 리전을 확인하세요."
+                )
+            entry = ServiceEntry(region, service.id, service.cidr_block, time.time())
+            self.put(entry)
+            return entry
+        raise ValueError(f"리전 '{region}'에서 'All Services' 서비스를 찾을 수 없습니다.")
+
+    def resolve(self, region: str, fallback_service_id: str | None = None) -> ServiceEntry:
+        """캐시 -> 조회 -> 만료된 캐시 -> 내장 기본값 순서로 서비스 항목 해석"""
+        cached = self.get(region)
+        if cached and cached.is_fresh(self.ttl):
+            return cached
+
+        try:
+            if self.offline:
+                raise ValueError('오프라인 모드')
+            return self.refresh(region)
+        except Exception as e:
+            # 인증/네트워크/API 오류도 만료된 캐시나 내장 기본값으로 대신한다
+            if cached:
+                pulumi.log.warn(f'서비스 카탈로그 갱신 실패, 만료된 캐시를 사용합니다 ({region}): {e}')
+                return cached
+            if fallback_service_id is None:
+                raise
+            pulumi.log.warn(f'서비스 카탈로그 조회 실패, 내장 기본값을 사용합니다 ({region}): {e}')
+            return ServiceEntry(region, fallback_service_id, service_cidr_label(region))
+
+
+@functools.cache
+def resolve_service(
+    region: str,
+    fallback_service_id: str | None = None,
+    cache_path: str | Path = DEFAULT_CACHE_PATH,
+    ttl: float = DEFAULT_TTL_SECONDS,
+    offline: bool = False,
+) -> ServiceEntry:
+    """프로세스 안에서는 리전별로 한 번만 해석"""
+    return ServiceCatalog(cache_path, ttl, offline).resolve(region, fallback_service_id)
@@ -15,15 +15,20 @@ class SubnetManager:
         route_table_public,
         node_security_list,
         k8s_api_security_list,
+        pod_security_list=None,
+        baseline_security_list=None,
     ):
         self.vcn = vcn
         self.route_table_private = route_table_private
         self.route_table_public = route_table_public
         self.node_security_list = node_security_list
         self.k8s_api_security_list = k8s_api_security_list
+        self.pod_security_list = pod_security_list
+        self.baseline_security_list = baseline_security_list
         self.service_lb_subnet = None
         self.node_subnet = None
         self.k8s_api_subnet = None
+        self.pod_subnet = None
 
     def create_subnet(
         self,
@@ -33,13 +38,15 @@ class SubnetManager:
         route_table,
         prohibit_public_ip_on_vnic,
         security_lists,
+        ipv6_cidr_block=None,
     ):
         """
-        서브넷 생성 메소드
+        서브넷 생성 메소드 (ipv6_cidr_block이 있으면 듀얼 스택 서브넷)
         """
         subnet = oci.core.Subnet(
             f'{display_name}-subnet',
             cidr_block=cidr_block,
+            ipv6cidr_block=ipv6_cidr_block,
             compartment_id=cfg.COMPARTMENT_ID,
             display_name=display_name,
             dns_label=dns_label,
@@ -50,32 +57,87 @@ class SubnetManager:
         )
         return subnet
 
+    @staticmethod
+    def get_subnet_layout():
+        """
+        역할별 서브넷 구성 생성 메소드 (라우트 테이블/보안 리스트는 이름으로 표시)
+        """
+        layout = [
+            {
+                'role': 'service_lb',
+                'cidr_block': cfg.SERVICE_LB_SUBNET_CIDR_BLOCK,
+                'display_name': 'oke-svc',
+                'dns_label': 'lbsub',
+                'route_table': 'private',
+                'prohibit_public_ip_on_vnic': False,
+                'security_lists': ['node'],
+            },
+            {
+                'role': 'node',
+                'cidr_block': cfg.NODE_SUBNET_CIDR_BLOCK,
+                'display_name': 'oke-node',
+                'dns_label': 'nodesub',
+                'route_table': 'private',
+                'prohibit_public_ip_on_vnic': True,
+                'security_lists': ['node'],
+            },
+            {
+                'role': 'k8s_api',
+                'cidr_block': cfg.K8S_API_SUBNET_CIDR_BLOCK,
+                'display_name': 'oke-api',
+                'dns_label': 'apisub',
+                'route_table': 'public',
+                'prohibit_public_ip_on_vnic': False,
+                'security_lists': ['node', 'k8s_api'],
+            },
+        ]
+        if cfg.POD_SUBNET_CIDR_BLOCK:
+            # 파드 서브넷이 설정된 경우에만 생성 (없으면 파드는 노드 서브넷의 IP를 사용)
+            layout.append(
+                {
+                    'role': 'pod',
+                    'cidr_block': cfg.POD_SUBNET_CIDR_BLOCK,
+                    'display_name': 'oke-pod',
+                    'dns_label': 'podsub',
+                    'route_table': 'private',
+                    'prohibit_public_ip_on_vnic': True,
+                    'security_lists': ['pod'],
+                }
+            )
+        if cfg.SECURITY_MODE == 'nsg':
+            # 역할별 규칙은 VNIC의 NSG가 담당하므로 모든 서브넷은 기본 보안 리스트만 사용
+            for subnet in layout:
+                subnet['security_lists'] = ['baseline']
+        if cfg.DUAL_STACK:
+            for subnet in layout:
+                subnet['ipv6_cidr_block'] = cfg.get_config().subnet_ipv6_cidr(subnet['role'])
+        return layout
+
     def create_all_subnets(self):
         """
         모든 서브넷을 생성하는 메소드
         """
-        self.service_lb_subnet = self.create_subnet(
-            cfg.SERVICE_LB_SUBNET_CIDR_BLOCK,
-            'oke-svc',
-            'lbsub',
-            self.route_table_private,
-            False,
-            [self.node_security_list],
-        )
-        self.node_subnet = self.create_subnet(
-            cfg.NODE_SUBNET_CIDR_BLOCK,
-            'oke-node',
-            'nodesub',
-            self.route_table_private,
-            True,
-            [self.node_security_list],
-        )
-        self.k8s_api_subnet = self.create_subnet(
-            cfg.K8S_API_SUBNET_CIDR_BLOCK,
-            'oke-api',
-            'apisub',
-            self.route_table_public,
-            False,
-            [self.node_security_list, self.k8s_api_security_list],
-        )
+        route_tables = {'private': self.route_table_private, 'public': self.route_table_public}
+        security_lists = {
+            'node': self.node_security_list,
+            'k8s_api': self.k8s_api_security_list,
+            'pod': self.pod_security_list or self.node_security_list,
+            'baseline': self.baseline_security_list,
+        }
+        subnets = {
+            subnet['role']: self.create_subnet(
+                subnet['cidr_block'],
+                subnet['display_name'],
+                subnet['dns_label'],
+                route_tables[subnet['route_table']],
+                subnet['prohibit_public_ip_on_vnic'],
+                [security_lists[name] for name in subnet['security_lists']],
+                subnet.get('ipv6_cidr_block'),
+            )
+            for subnet in self.get_subnet_layout()
+        }
+        self.service_lb_subnet = subnets['service_lb']
+        self.node_subnet = subnets['node']
+        self.k8s_api_subnet = subnets['k8s_api']
+        self.pod_subnet = subnets.get('pod')
         return self.service_lb_subnet, self.node_subnet, self.k8s_api_subnet
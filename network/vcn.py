@@ -8,11 +8,16 @@ class VCNManager:
         self.vcn = None
 
     def create_vcn(self):
+        ipv6 = {}
+        if cfg.DUAL_STACK:
+            # ULA(사설 IPv6) prefix를 쓰므로 서브넷 /64와 보안 규칙을 preview 시점에 정할 수 있다
+            ipv6 = {'is_ipv6enabled': True, 'ipv6private_cidr_blocks': [cfg.VCN_IPV6_CIDR_BLOCK]}
         self.vpn = oci.core.Vcn(
             'vcn',
             cidr_block=cfg.VCN_CIDR_BLOCK,
             compartment_id=cfg.COMPARTMENT_ID,
             display_name=cfg.VCN_DISPLAY_NAME,
             dns_label='mgmt',
+            **ipv6,
         )
         return self.vpn
@@ -34,6 +34,9 @@ if [ ! -f "Pulumi.yaml" ]; then
     exit 1
 fi
 
+# 수집한 설정 (마지막에 `pulumi config set-all` 한 번으로 적용)
+CONFIG_ARGS=()
+
 # 스택 확인 및 선택/생성
 setup_stack() {
     log_info "Pulumi 스택을 확인합니다..."
@@ -108,7 +111,7 @@ setup_secrets() {
         fi
     fi
 
-    pulumi config set --secret compartment_id "$COMPARTMENT_ID"
+    CONFIG_ARGS+=(--secret "compartment_id=$COMPARTMENT_ID")
     log_success "구획 ID 설정 완료"
 
     # SSH 키 설정
@@ -178,7 +181,7 @@ setup_secrets() {
         echo "   코멘트: ${key_parts[2]}"
     fi
 
-    pulumi config set --secret ssh_public_key "$SSH_KEY"
+    CONFIG_ARGS+=(--secret "ssh_public_key=$SSH_KEY")
     log_success "SSH 키 설정 완료"
     echo ""
 }
@@ -200,7 +203,7 @@ setup_general_config() {
     echo -n "리전 입력 [ap-osaka-1]: "
     read -r REGION
     REGION=${REGION:-ap-osaka-1}
-    pulumi config set region "$REGION"
+    CONFIG_ARGS+=(--plaintext "region=$REGION")
     log_success "리전 설정: $REGION"
 
     # OCI 프로필 설정
@@ -208,11 +211,19 @@ setup_general_config() {
     echo -n "OCI CLI 프로필 이름 입력 [DEFAULT]: "
     read -r PROFILE
     PROFILE=${PROFILE:-DEFAULT}
-    pulumi config set profile "$PROFILE"
+    CONFIG_ARGS+=(--plaintext "profile=$PROFILE")
     log_success "프로필 설정: $PROFILE"
     echo ""
 }
 
+# 수집한 설정을 한 번의 CLI 호출로 적용
+apply_config() {
+    log_info "설정 $(( ${#CONFIG_ARGS[@]} / 2 ))개를 한 번에 적용합니다..."
+    pulumi config set-all "${CONFIG_ARGS[@]}"
+    log_success "설정 적용 완료"
+    echo ""
+}
+
 # 설정 확인
 verify_config() {
     log_info "설정 내용을 확인합니다..."
@@ -270,6 +281,7 @@ main() {
     setup_stack
     setup_secrets
     setup_general_config
+    apply_config
     verify_config
     log_success "모든 설정이 완료되었습니다! 🎉"
     echo ""
@@ -0,0 +1,295 @@
+"""
+배포 파이프라인 단계별 타이밍/트레이싱 (선택 기능)
+`trace_file` 설정이 있을 때만 매니저의 `create_*` 메소드와 조회(invoke) 함수를 감싸 스팬을 기록한다.
+
+- evaluate: 메소드 안의 Python 평가 + 리소스 등록 시간 (중첩 호출은 부모/자식 스팬)
+- invoke: 동기 조회 시간, 또는 Output을 반환하는 조회는 결과가 확정될 때까지의 시간
+- resolve: 리소스 등록부터 `id` Output이 확정될 때까지의 시간 (preview에서도 확정 시점을 기록)
+
+결과는 Chrome trace event 형식(Perfetto/chrome://tracing) 또는 OpenTelemetry OTLP JSON으로 저장한다.
+설정이 없으면 아무것도 감싸지 않으므로 오버헤드가 없다.
+
+사용 예:
+    pulumi config set trace_file 'traces/{stack}.json'
+    pulumi config set trace_format otel   # 기본값: chrome
+"""
+
+import contextlib
+import functools
+import json
+import secrets
+import time
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pulumi
+from pulumi import Output
+
+import config as cfg
+
+SERVICE_NAME = 'oke-infra'
+CATEGORIES = ('evaluate', 'invoke', 'resolve')
+
+_TRACER: ContextVar['Tracer | None'] = ContextVar('oke_tracer', default=None)
+_PARENT: ContextVar['Span | None'] = ContextVar('oke_trace_parent', default=None)
+
+
+@dataclass(slots=True)
+class Span:
+    """타이밍 구간 하나 (시각은 Unix epoch 나노초)"""
+
+    name: str
+    category: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.end_ns or self.start_ns) - self.start_ns
+
+
+class Tracer:
+    """
+    스택 하나의 스팬을 모아 파일로 저장하는 클래스
+    """
+
+    def __init__(self, path: str | Path, trace_format: str = 'chrome', stack: str = ''):
+        self.path = Path(path)
+        self.trace_format = trace_format
+        self.stack = stack
+        self.trace_id = secrets.token_hex(16)
+        self.spans: list[Span] = []
+        self.pending: list[Output] = []
+        self.tracked: set[int] = set()
+        # perf_counter의 단조 증가 시간을 epoch 기준으로 변환
+        self.epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+        self.root = self.start_span('pulumi program', 'evaluate', parent=None, stack=stack)
+
+    def now(self) -> int:
+        return self.epoch_offset_ns + time.perf_counter_ns()
+
+    def start_span(self, name: str, category: str, parent: Span | None = None, **attributes: Any) -> Span:
+        span = Span(
+            name, category, secrets.token_hex(8), parent.span_id if parent else None, self.now(), None, attributes
+        )
+        self.spans.append(span)
+        return span
+
+    def end_span(self, span: Span) -> None:
+        span.end_ns = self.now()
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str = 'evaluate', **attributes: Any) -> Iterator[Span]:
+        """현재 스팬의 자식 스팬 구간"""
+        span = self.start_span(name, category, _PARENT.get() or self.root, **attributes)
+        token = _PARENT.set(span)
+        try:
+            yield span
+        finally:
+            _PARENT.reset(token)
+            self.end_span(span)
+
+    def track(self, value: Any, parent: Span) -> None:
+        """
+        반환값 안의 리소스(`id`)와 Output이 확정되는 시점을 스팬으로 기록
+        preview에서는 값이 unknown이어도 확정 시점을 알 수 있도록 `run_with_unknowns`로 기다린다.
+        """
+        if isinstance(value, tuple | list):
+            for item in value:
+                self.track(item, parent)
+        elif isinstance(value, dict):
+            for item in value.values():
+                self.track(item, parent)
+        elif isinstance(value, pulumi.CustomResource | Output) and id(value) not in self.tracked:
+            self.tracked.add(id(value))
+            if isinstance(value, Output):
+                span = self.start_span(f'{parent.name} (result)', parent.category, parent)
+                output = value
+            else:
+                resource_name = getattr(value, '_name', '')
+                span = self.start_span(f'{type(value).__name__} {resource_name}', 'resolve', parent)
+                output = value.id
+            self.pending.append(output.apply(lambda _, span=span: self.end_span(span), run_with_unknowns=True))
+
+    def finish(self) -> Output:
+        """프로그램 평가 종료를 기록하고, 추적 중인 Output이 모두 확정되면 파일로 저장"""
+        self.end_span(self.root)
+        return Output.all(*self.pending).apply(lambda _: self.write(), run_with_unknowns=True)
+
+    # =============================================================================
+    # 내보내기
+    # =============================================================================
+
+    def summary(self) -> dict[str, float]:
+        """카테고리별 합계(초). evaluate는 최상위 스팬만 합산하여 중첩을 중복 집계하지 않는다."""
+        totals = dict.fromkeys(('program', *CATEGORIES), 0.0)
+        totals['program'] = self.root.duration_ns / 1e9
+        last_resolved = self.root.start_ns
+        for span in self.spans:
+            if span is self.root or (span.category == 'evaluate' and span.parent_id != self.root.span_id):
+                continue
+            if span.category == 'resolve':
+                last_resolved = max(last_resolved, span.end_ns or span.start_ns)
+            else:
+                totals[span.category] += span.duration_ns / 1e9
+        totals['resolve'] = (last_resolved - self.root.start_ns) / 1e9
+        return totals
+
+    def to_chrome(self) -> dict[str, Any]:
+        """Chrome trace event 형식 (카테고리마다 별도 트랙)"""
+        tracks = {category: index + 1 for index, category in enumerate(CATEGORIES)}
+        events: list[dict[str, Any]] = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid, 'args': {'name': category}}
+            for category, tid in tracks.items()
+        ]
+        events.append({'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': f'{SERVICE_NAME} {self.stack}'}})
+        for span in self.spans:
+            events.append(
+                {
+                    'name': span.name,
+                    'cat': span.category,
+                    'ph': 'X',
+                    'ts': span.start_ns / 1000,
+                    'dur': span.duration_ns / 1000,
+                    'pid': 1,
+                    'tid': tracks[span.category],
+                    'args': {**span.attributes, 'span_id': span.span_id, 'parent_id': span.parent_id},
+                }
+            )
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def to_otel(self) -> dict[str, Any]:
+        """OpenTelemetry OTLP/JSON (ExportTraceServiceRequest) 형식"""
+
+        def attributes(values: dict[str, Any]) -> list[dict[str, Any]]:
+            return [{'key': key, 'value': {'stringValue': str(value)}} for key, value in values.items()]
+
+        spans = [
+            {
+                'traceId': self.trace_id,
+                'spanId': span.span_id,
+                **({'parentSpanId': span.parent_id} if span.parent_id else {}),
+                'name': span.name,
+                'kind': 1,  # SPAN_KIND_INTERNAL
+                'startTimeUnixNano': str(span.start_ns),
+                'endTimeUnixNano': str(span.end_ns or span.start_ns),
+                'attributes': attributes({'oke.category': span.category, **span.attributes}),
+            }
+            for span in self.spans
+        ]
+        return {
+            'resourceSpans': [
+                {
+                    'resource': {'attributes': attributes({'service.name': SERVICE_NAME, 'pulumi.stack': self.stack})},
+                    'scopeSpans': [{'scope': {'name': f'{SERVICE_NAME}.tracing'}, 'spans': spans}],
+                }
+            ]
+        }
+
+    def write(self) -> None:
+        payload = self.to_otel() if self.trace_format == 'otel' else self.to_chrome()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(payload))
+        totals = self.summary()
+        pulumi.log.info(
+            f'트레이스 저장: {self.path} (스팬 {len(self.spans)}개, 평가 {totals["evaluate"]:.2f}s, '
+            f'invoke {totals["invoke"]:.2f}s, 리소스 ID 확정까지 {totals["resolve"]:.2f}s)'
+        )
+
+
+# =============================================================================
+# 계측
+# =============================================================================
+
+
+def _traced(name: str, func: Callable, category: str) -> Callable:
+    """트레이서가 활성화된 컨텍스트에서만 스팬을 기록하는 래퍼"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        tracer = _TRACER.get()
+        if tracer is None:
+            return func(*args, **kwargs)
+        with tracer.span(name, category) as span:
+            result = func(*args, **kwargs)
+        tracer.track(result, span)
+        return result
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def instrument(owner: Any, names: list[str] | None = None, category: str = 'evaluate') -> None:
+    """
+    클래스/모듈의 함수를 스팬을 기록하는 래퍼로 교체 (기본: `create_*` 메소드, 여러 번 호출해도 한 번만 감쌈)
+    """
+    owner_name = getattr(owner, '__name__', str(owner)).rsplit('.', 1)[-1]
+    for name in names or [name for name in vars(owner) if name.startswith('create_')]:
+        value = vars(owner)[name]
+        wrapper_type = type(value) if isinstance(value, staticmethod | classmethod) else None
+        func = value.__func__ if wrapper_type else value
+        if not callable(func) or getattr(func, '__traced__', False):
+            continue
+        traced = _traced(f'{owner_name}.{name}', func, category)
+        setattr(owner, name, wrapper_type(traced) if wrapper_type else traced)
+
+
+def instrument_pipeline() -> None:
+    """`main()`이 사용하는 모든 매니저와 조회 함수 계측"""
+    from cluster import images, placement
+    from cluster.autoscaler import ClusterAutoscalerManager
+    from cluster.node_pool import NodePoolManager
+    from cluster.oke import OKEClusterManager
+    from cluster.placeholders import OverprovisioningManager
+    from network.flow_logs import FlowLogManager
+    from network.gateways import GatewayManager
+    from network.nsg import NetworkSecurityGroupManager
+    from network.routing import RouteTableManager
+    from network.security import SecurityListManager
+    from network.service_catalog import ServiceCatalog
+    from network.subnets import SubnetManager
+    from network.vcn import VCNManager
+
+    for manager in (
+        VCNManager,
+        GatewayManager,
+        RouteTableManager,
+        SecurityListManager,
+        NetworkSecurityGroupManager,
+        SubnetManager,
+        FlowLogManager,
+        OKEClusterManager,
+        NodePoolManager,
+        ClusterAutoscalerManager,
+        OverprovisioningManager,
+    ):
+        instrument(manager)
+    instrument(ServiceCatalog, ['refresh'], 'invoke')
+    instrument(images, ['fetch_sources'], 'invoke')
+    instrument(placement, ['get_availability_domains'], 'invoke')
+
+
+def start() -> Tracer | None:
+    """`trace_file`이 설정된 경우 계측을 켜고 현재 스택의 트레이서를 반환 (아니면 None)"""
+    settings = cfg.get_config()
+    if not settings.trace_file:
+        # 같은 컨텍스트에서 이전에 실행한 프로그램의 트레이서가 남아 있지 않도록 비운다
+        _TRACER.set(None)
+        return None
+    instrument_pipeline()
+    stack = pulumi.get_stack()
+    tracer = Tracer(settings.trace_file.format(stack=stack), settings.trace_format, stack)
+    _TRACER.set(tracer)
+    return tracer
+
+
+def finish(tracer: Tracer | None) -> None:
+    """프로그램 끝에서 호출: 모든 리소스 ID가 확정되면 트레이스를 저장"""
+    if tracer is not None:
+        tracer.finish()